@@ -302,7 +302,12 @@ struct PricingArgvScan {
     return out;
 }
 
+/// `NUMERAIRE_BATCH_RUN_ID` when set (a sharded daily run shares one id across its dev_main
+/// processes so the merge step can verify the batch), else `run-<UTC timestamp>`.
 [[nodiscard]] std::string MakeBatchRunId() {
+    if (const char* id = std::getenv("NUMERAIRE_BATCH_RUN_ID"); id != nullptr && id[0] != '\0') {
+        return std::string(id);
+    }
     const auto now = std::chrono::system_clock::now();
     const std::time_t t = std::chrono::system_clock::to_time_t(now);
     std::tm tm_buf{};
@@ -1,11 +1,16 @@
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
 #include <algorithm>
+#include <array>
 #include <cctype>
 #include <cmath>
 #include <cstdint>
+#include <initializer_list>
+#include <limits>
 #include <memory>
+#include <optional>
 #include <numeraire/core/imarket_data.hpp>
 #include <numeraire/core/ipricer.hpp>
 #include <numeraire/core/pricing_result.hpp>
@@ -146,6 +151,44 @@ void RequireNonNegVol(const double vol) {
     }
 }
 
+/// `"crr"` (Cox–Ross–Rubinstein) or `"leisen_reimer"`; `richardson` extrapolates over (n, 2n).
+[[nodiscard]] numeraire::quant::BinomialTreeSettings ParseTreeSettings(const std::string& tree, const bool richardson) {
+    numeraire::quant::BinomialTreeSettings settings;
+    settings.richardson = richardson;
+    if (tree == "leisen_reimer") {
+        settings.method = numeraire::quant::BinomialTreeMethod::kLeisenReimer;
+    } else if (tree != "crr") {
+        throw py::value_error("unknown tree '" + tree + "' (supported: crr, leisen_reimer)");
+    }
+    return settings;
+}
+
+[[nodiscard]] py::dict PriceWithBinomial(const numeraire::core::IProduct& product,
+                                         const FlatMarket& market,
+                                         const LabDates& dates,
+                                         const std::size_t n_steps,
+                                         const numeraire::quant::BinomialTreeSettings& settings) {
+    const bool lr = settings.method == numeraire::quant::BinomialTreeMethod::kLeisenReimer;
+    std::string engine = lr ? "c++_binomial_lr" : "c++_binomial_crr";
+    if (settings.richardson) {
+        engine += "_richardson";
+    }
+    try {
+        const std::size_t steps =
+                n_steps == 0 ? numeraire::pricers::BinomialBlackScholesEquityPricer::kFallbackSteps : n_steps;
+        const auto pricer = std::make_unique<numeraire::pricers::BinomialBlackScholesEquityPricer>(steps, settings);
+        py::dict out = ResultToDict(pricer->Price(product, market), engine, dates);
+        out["n_steps"] = static_cast<int>(pricer->NSteps());
+        out["tree"] = lr ? "leisen_reimer" : "crr";
+        out["richardson"] = settings.richardson;
+        return out;
+    } catch (const numeraire::ValidationError& e) {
+        throw py::value_error(e.what());
+    } catch (const numeraire::NumeraireException& e) {
+        throw std::runtime_error(e.what());
+    }
+}
+
 [[nodiscard]] py::dict PriceVanilla(const double spot,
                                     const double strike,
                                     const double vol,
@@ -154,7 +197,9 @@ void RequireNonNegVol(const double vol) {
                                     const double tau_years,
                                     const bool is_call,
                                     const std::string& exercise,
-                                    const std::size_t n_steps) {
+                                    const std::size_t n_steps,
+                                    const std::string& tree,
+                                    const bool richardson) {
     RequirePositiveSpotStrike(spot, strike);
     RequireNonNegVol(vol);
 
@@ -185,18 +230,7 @@ void RequireNonNegVol(const double vol) {
     const FlatMarket market(dates.valuation, spot, rate, div, vol);
 
     if (style == numeraire::ExerciseStyle::kAmerican) {
-        try {
-            const std::size_t steps =
-                    n_steps == 0 ? numeraire::pricers::BinomialBlackScholesEquityPricer::kFallbackSteps : n_steps;
-            const auto pricer = std::make_unique<numeraire::pricers::BinomialBlackScholesEquityPricer>(steps);
-            py::dict out = ResultToDict(pricer->Price(product, market), "c++_binomial_crr", dates);
-            out["n_steps"] = static_cast<int>(pricer->NSteps());
-            return out;
-        } catch (const numeraire::ValidationError& e) {
-            throw py::value_error(e.what());
-        } catch (const numeraire::NumeraireException& e) {
-            throw std::runtime_error(e.what());
-        }
+        return PriceWithBinomial(product, market, dates, n_steps, ParseTreeSettings(tree, richardson));
     }
     return PriceWithAnalytic(product, market, dates, "c++_analytic_bs");
 }
@@ -209,7 +243,9 @@ void RequireNonNegVol(const double vol) {
                                             const double tau_years,
                                             const bool is_call,
                                             const std::string& exercise,
-                                            const std::size_t n_steps) {
+                                            const std::size_t n_steps,
+                                            const std::string& tree,
+                                            const bool richardson) {
     RequirePositiveSpotStrike(spot, strike);
     RequireNonNegVol(vol);
 
@@ -237,18 +273,18 @@ void RequireNonNegVol(const double vol) {
             dates.expiry);
     const FlatMarket market(dates.valuation, spot, rate, div, vol);
 
-    try {
-        const std::size_t steps =
-                n_steps == 0 ? numeraire::pricers::BinomialBlackScholesEquityPricer::kFallbackSteps : n_steps;
-        const auto pricer = std::make_unique<numeraire::pricers::BinomialBlackScholesEquityPricer>(steps);
-        py::dict out = ResultToDict(pricer->Price(product, market), "c++_binomial_crr", dates);
-        out["n_steps"] = static_cast<int>(pricer->NSteps());
-        return out;
-    } catch (const numeraire::ValidationError& e) {
-        throw py::value_error(e.what());
-    } catch (const numeraire::NumeraireException& e) {
-        throw std::runtime_error(e.what());
+    return PriceWithBinomial(product, market, dates, n_steps, ParseTreeSettings(tree, richardson));
+}
+
+/// `"pseudo"` (Mersenne Twister + Box–Muller) or `"sobol"` (randomised QMC).
+[[nodiscard]] numeraire::pricers::MonteCarloSampler ParseSampler(const std::string& sampler) {
+    if (sampler == "pseudo") {
+        return numeraire::pricers::MonteCarloSampler::kPseudoRandom;
+    }
+    if (sampler == "sobol") {
+        return numeraire::pricers::MonteCarloSampler::kSobol;
     }
+    throw py::value_error("unknown sampler '" + sampler + "' (supported: pseudo, sobol)");
 }
 
 [[nodiscard]] py::dict PriceVanillaMonteCarlo(const double spot,
@@ -259,12 +295,15 @@ void RequireNonNegVol(const double vol) {
                                               const double tau_years,
                                               const bool is_call,
                                               const std::size_t num_paths,
-                                              const std::uint64_t seed) {
+                                              const std::uint64_t seed,
+                                              const std::string& sampler,
+                                              const std::size_t qmc_replications) {
     RequirePositiveSpotStrike(spot, strike);
     RequireNonNegVol(vol);
     if (num_paths == 0) {
         throw py::value_error("num_paths must be positive");
     }
+    const numeraire::pricers::MonteCarloSampler sampler_kind = ParseSampler(sampler);
 
     const LabDates dates = MakeLabDates(tau_years);
     const numeraire::products::VanillaEquityOptionProduct product(
@@ -277,11 +316,15 @@ void RequireNonNegVol(const double vol) {
     const FlatMarket market(dates.valuation, spot, rate, div, vol);
 
     try {
-        const auto pricer =
-                std::make_unique<numeraire::pricers::MonteCarloGbmEuropeanPricer>(num_paths, seed);
+        const auto pricer = std::make_unique<numeraire::pricers::MonteCarloGbmEuropeanPricer>(
+                num_paths, seed, sampler_kind, qmc_replications);
         py::dict out = ResultToDict(pricer->Price(product, market), "c++_monte_carlo_gbm", dates);
-        out["mc_paths"] = static_cast<int>(pricer->NumPaths());
+        out["mc_paths"] = static_cast<int>(pricer->SimulatedPaths());
         out["mc_seed"] = static_cast<long long>(pricer->Seed());
+        out["mc_sampler"] = sampler;
+        if (sampler_kind == numeraire::pricers::MonteCarloSampler::kSobol) {
+            out["mc_qmc_replications"] = static_cast<int>(pricer->QmcReplications());
+        }
         return out;
     } catch (const numeraire::ValidationError& e) {
         throw py::value_error(e.what());
@@ -546,6 +589,230 @@ constexpr int kMaxLabHorizonDays = 730;
     }
 }
 
+// --- Batch entry points ------------------------------------------------------
+//
+// Same products / pricers as the scalar calls above, one C++ loop per batch. Inputs are
+// 1-D float64 (or bool) arrays; a length-1 input broadcasts across the batch. NumPy
+// outputs are allocated under the GIL, then the loop runs with the GIL released so
+// several Django threads can price at once.
+
+constexpr auto kBatchArrayFlags = py::array::c_style | py::array::forcecast;
+using BatchDoubles = py::array_t<double, kBatchArrayFlags>;
+using BatchBools = py::array_t<bool, kBatchArrayFlags>;
+
+/// Read-only view over one batch input (raw pointer so it is usable without the GIL).
+template <typename T>
+struct BatchColumn {
+    const T* data{nullptr};
+    std::size_t size{0};
+
+    [[nodiscard]] T operator[](const std::size_t i) const { return data[size == 1 ? 0 : i]; }
+};
+
+template <typename T>
+[[nodiscard]] BatchColumn<T> Column(const py::array_t<T, kBatchArrayFlags>& values, const char* name) {
+    if (values.ndim() > 1) {
+        throw py::value_error(std::string(name) + " must be a scalar or 1-D array");
+    }
+    return BatchColumn<T>{values.data(), static_cast<std::size_t>(values.size())};
+}
+
+/// Common batch length; every input must have that length or length 1.
+[[nodiscard]] std::size_t BatchSize(const std::initializer_list<std::size_t> sizes) {
+    std::size_t n = 1;
+    for (const std::size_t size : sizes) {
+        if (size != 1) {
+            n = size;
+        }
+    }
+    for (const std::size_t size : sizes) {
+        if (size != 1 && size != n) {
+            throw py::value_error("batch inputs must share one length (or have length 1)");
+        }
+    }
+    return n;
+}
+
+/// NumPy result columns. Greek slots the scalar call would omit are NaN.
+class BatchOutputs {
+public:
+    BatchOutputs(const std::size_t n, const bool with_greeks) : with_greeks_(with_greeks) {
+        npv_ = BatchDoubles(static_cast<py::ssize_t>(n));
+        npv_data_ = npv_.mutable_data();
+        if (with_greeks_) {
+            for (std::size_t g = 0; g < kGreekNames.size(); ++g) {
+                greeks_[g] = BatchDoubles(static_cast<py::ssize_t>(n));
+                greek_data_[g] = greeks_[g].mutable_data();
+            }
+        }
+    }
+
+    void Store(const std::size_t i, const numeraire::core::PricingResult& result) {
+        if (!result.Npv().has_value()) {
+            throw std::runtime_error("pricer returned empty NPV");
+        }
+        npv_data_[i] = *result.Npv();
+        if (!with_greeks_) {
+            return;
+        }
+        constexpr double kMissing = std::numeric_limits<double>::quiet_NaN();
+        std::array<std::optional<double>, 5> values{};
+        if (result.Greeks().has_value()) {
+            const auto& g = *result.Greeks();
+            values = {g.delta, g.gamma, g.vega, g.theta, g.rho};
+        }
+        for (std::size_t g = 0; g < kGreekNames.size(); ++g) {
+            greek_data_[g][i] = values[g].value_or(kMissing);
+        }
+    }
+
+    [[nodiscard]] py::dict ToDict(const std::string& engine_label) const {
+        py::dict out;
+        out["ok"] = true;
+        out["engine"] = engine_label;
+        out["n"] = npv_.size();
+        out["npv"] = npv_;
+        if (with_greeks_) {
+            for (std::size_t g = 0; g < kGreekNames.size(); ++g) {
+                out[kGreekNames[g]] = greeks_[g];
+            }
+        }
+        return out;
+    }
+
+private:
+    static constexpr std::array<const char*, 5> kGreekNames{"delta", "gamma", "vega", "theta", "rho"};
+
+    bool with_greeks_;
+    BatchDoubles npv_;
+    double* npv_data_{nullptr};
+    std::array<BatchDoubles, 5> greeks_;
+    std::array<double*, 5> greek_data_{};
+};
+
+/// Run `price_one(i)` for every batch lane without the GIL; errors name the failing lane.
+template <typename PriceOne>
+void RunBatch(const std::size_t n, BatchOutputs& outputs, const PriceOne& price_one) {
+    const py::gil_scoped_release release;
+    for (std::size_t i = 0; i < n; ++i) {
+        try {
+            outputs.Store(i, price_one(i));
+        } catch (const py::value_error& e) {
+            throw py::value_error("batch index " + std::to_string(i) + ": " + e.what());
+        } catch (const numeraire::ValidationError& e) {
+            throw py::value_error("batch index " + std::to_string(i) + ": " + e.what());
+        } catch (const numeraire::NumeraireException& e) {
+            throw std::runtime_error("batch index " + std::to_string(i) + ": " + e.what());
+        }
+    }
+}
+
+[[nodiscard]] py::dict PriceVanillaBatch(const BatchDoubles& spot,
+                                         const BatchDoubles& strike,
+                                         const BatchDoubles& vol,
+                                         const BatchDoubles& rate,
+                                         const BatchDoubles& div,
+                                         const BatchDoubles& tau_years,
+                                         const BatchBools& is_call) {
+    const auto s = Column(spot, "spot");
+    const auto k = Column(strike, "strike");
+    const auto v = Column(vol, "vol");
+    const auto r = Column(rate, "rate");
+    const auto q = Column(div, "div");
+    const auto t = Column(tau_years, "tau_years");
+    const auto c = Column(is_call, "is_call");
+    const std::size_t n = BatchSize({s.size, k.size, v.size, r.size, q.size, t.size, c.size});
+
+    BatchOutputs outputs(n, /*with_greeks=*/true);
+    const auto pricer = MakeAnalyticPricer();
+    RunBatch(n, outputs, [&](const std::size_t i) {
+        RequirePositiveSpotStrike(s[i], k[i]);
+        RequireNonNegVol(v[i]);
+        const LabDates dates = MakeLabDates(t[i]);
+        const numeraire::products::VanillaEquityOptionProduct product(
+                "LAB",
+                c[i] ? numeraire::OptionType::kCall : numeraire::OptionType::kPut,
+                numeraire::ExerciseStyle::kEuropean,
+                k[i],
+                dates.valuation,
+                dates.expiry);
+        return pricer->Price(product, FlatMarket(dates.valuation, s[i], r[i], q[i], v[i]));
+    });
+    return outputs.ToDict("c++_analytic_bs");
+}
+
+[[nodiscard]] py::dict PriceBinaryBatch(const BatchDoubles& spot,
+                                        const BatchDoubles& strike,
+                                        const BatchDoubles& vol,
+                                        const BatchDoubles& rate,
+                                        const BatchDoubles& div,
+                                        const BatchDoubles& tau_years,
+                                        const BatchBools& is_call,
+                                        const std::string& kind,
+                                        const BatchDoubles& cash_payout) {
+    const std::string kind_key = NormalizeModel(kind);
+    const bool is_cash = kind_key == "cash_or_nothing" || kind_key == "con";
+    if (!is_cash && kind_key != "asset_or_nothing" && kind_key != "aon") {
+        throw py::value_error("kind must be 'cash_or_nothing' or 'asset_or_nothing'");
+    }
+
+    const auto s = Column(spot, "spot");
+    const auto k = Column(strike, "strike");
+    const auto v = Column(vol, "vol");
+    const auto r = Column(rate, "rate");
+    const auto q = Column(div, "div");
+    const auto t = Column(tau_years, "tau_years");
+    const auto c = Column(is_call, "is_call");
+    const auto cash = Column(cash_payout, "cash_payout");
+    const std::size_t n = BatchSize({s.size, k.size, v.size, r.size, q.size, t.size, c.size, cash.size});
+
+    BatchOutputs outputs(n, /*with_greeks=*/false);
+    const auto pricer = MakeAnalyticPricer();
+    RunBatch(n, outputs, [&](const std::size_t i) {
+        RequirePositiveSpotStrike(s[i], k[i]);
+        RequireNonNegVol(v[i]);
+        const LabDates dates = MakeLabDates(t[i]);
+        const FlatMarket market(dates.valuation, s[i], r[i], q[i], v[i]);
+        const auto option_type = c[i] ? numeraire::OptionType::kCall : numeraire::OptionType::kPut;
+        if (is_cash) {
+            if (!(cash[i] > 0.0)) {
+                throw py::value_error("cash_payout must be positive");
+            }
+            const numeraire::products::EquityCashOrNothingProduct product(
+                    "LAB", option_type, numeraire::ExerciseStyle::kEuropean, k[i], cash[i], dates.valuation,
+                    dates.expiry);
+            return pricer->Price(product, market);
+        }
+        const numeraire::products::EquityAssetOrNothingProduct product(
+                "LAB", option_type, numeraire::ExerciseStyle::kEuropean, k[i], dates.valuation, dates.expiry);
+        return pricer->Price(product, market);
+    });
+    return outputs.ToDict(is_cash ? "c++_analytic_con" : "c++_analytic_aon");
+}
+
+[[nodiscard]] py::dict PriceForwardBatch(const BatchDoubles& spot,
+                                         const BatchDoubles& forward_price,
+                                         const BatchDoubles& rate,
+                                         const BatchDoubles& div,
+                                         const BatchDoubles& tau_years) {
+    const auto s = Column(spot, "spot");
+    const auto f = Column(forward_price, "forward_price");
+    const auto r = Column(rate, "rate");
+    const auto q = Column(div, "div");
+    const auto t = Column(tau_years, "tau_years");
+    const std::size_t n = BatchSize({s.size, f.size, r.size, q.size, t.size});
+
+    BatchOutputs outputs(n, /*with_greeks=*/false);
+    const auto pricer = MakeAnalyticPricer();
+    RunBatch(n, outputs, [&](const std::size_t i) {
+        RequirePositiveSpotStrike(s[i], f[i]);
+        const LabDates dates = MakeLabDates(t[i]);
+        const numeraire::products::EquityForwardProduct product("LAB", f[i], dates.valuation, dates.expiry);
+        return pricer->Price(product, FlatMarket(dates.valuation, s[i], r[i], q[i], 0.0));
+    });
+    return outputs.ToDict("c++_analytic_forward");
+}
+
 }  // namespace
 
 PYBIND11_MODULE(numeraire_cpp, m) {
@@ -561,10 +828,14 @@ PYBIND11_MODULE(numeraire_cpp, m) {
           py::arg("is_call") = true,
           py::arg("exercise") = "european",
           py::arg("n_steps") = 0,
+          py::arg("tree") = "crr",
+          py::arg("richardson") = false,
           R"pbdoc(
 Price a vanilla equity option with the production C++ pricers.
 
-European → analytic Black–Scholes. American → CRR binomial.
+European → analytic Black–Scholes. American → binomial tree: CRR by default;
+``tree='leisen_reimer', richardson=True`` is the accelerated engine (trees of
+n and 2n+1 steps, delta/gamma/theta read off the tree).
 )pbdoc");
     m.def("price_vanilla_binomial",
           &PriceVanillaBinomial,
@@ -577,10 +848,13 @@ European → analytic Black–Scholes. American → CRR binomial.
           py::arg("is_call") = true,
           py::arg("exercise") = "european",
           py::arg("n_steps") = 200,
+          py::arg("tree") = "crr",
+          py::arg("richardson") = false,
           R"pbdoc(
-Price a vanilla equity option with the C++ Cox–Ross–Rubinstein tree.
+Price a vanilla equity option with the C++ binomial tree.
 
 Works for European and American exercise (Quant Lab comparison engine).
+tree: 'crr' | 'leisen_reimer'; richardson extrapolates over (n, 2n).
 )pbdoc");
     m.def("price_vanilla_mc",
           &PriceVanillaMonteCarlo,
@@ -593,9 +867,14 @@ Works for European and American exercise (Quant Lab comparison engine).
           py::arg("is_call") = true,
           py::arg("num_paths") = 10000,
           py::arg("seed") = 42,
+          py::arg("sampler") = "pseudo",
+          py::arg("qmc_replications") = numeraire::pricers::MonteCarloGbmEuropeanPricer::kDefaultQmcReplications,
           R"pbdoc(
 European vanilla via Monte Carlo GBM (single exact step to T).
 
+``sampler='sobol'`` uses scrambled Sobol points split over ``qmc_replications``
+independent scrambles, each share rounded down to a power of two (``mc_paths`` is the
+total actually drawn); ``mc_std_err`` is then the spread of those estimates.
 Returns NPV and diagnostics (mc_paths, mc_seed, mc_std_err). No greeks.
 )pbdoc");
     m.def("price_asset_or_nothing",
@@ -627,6 +906,45 @@ Returns NPV and diagnostics (mc_paths, mc_seed, mc_std_err). No greeks.
           py::arg("div"),
           py::arg("tau_years"),
           R"pbdoc(Equity forward NPV: S e^{-qτ} − K e^{-rτ}.)pbdoc");
+    m.def("price_vanilla_batch",
+          &PriceVanillaBatch,
+          py::arg("spot"),
+          py::arg("strike"),
+          py::arg("vol"),
+          py::arg("rate"),
+          py::arg("div"),
+          py::arg("tau_years"),
+          py::arg("is_call") = true,
+          R"pbdoc(
+European vanilla over 1-D arrays via analytic Black–Scholes (GIL released).
+
+Length-1 inputs broadcast. Returns npv, delta, gamma, vega, theta, rho as
+float64 arrays; greeks are NaN where price_vanilla would omit them (τ≤0, σ=0).
+)pbdoc");
+    m.def("price_binary_batch",
+          &PriceBinaryBatch,
+          py::arg("spot"),
+          py::arg("strike"),
+          py::arg("vol"),
+          py::arg("rate"),
+          py::arg("div"),
+          py::arg("tau_years"),
+          py::arg("is_call") = true,
+          py::arg("kind") = "cash_or_nothing",
+          py::arg("cash_payout") = 1.0,
+          R"pbdoc(
+Cash-or-nothing / asset-or-nothing over 1-D arrays (GIL released).
+
+kind: 'cash_or_nothing' | 'asset_or_nothing'. Returns npv as a float64 array.
+)pbdoc");
+    m.def("price_forward_batch",
+          &PriceForwardBatch,
+          py::arg("spot"),
+          py::arg("forward_price"),
+          py::arg("rate"),
+          py::arg("div"),
+          py::arg("tau_years"),
+          R"pbdoc(Equity forward NPV over 1-D arrays (GIL released). Returns npv.)pbdoc");
     m.def("dump_crr_tree",
           &DumpCrrTree,
           py::arg("spot"),
@@ -4,6 +4,11 @@
 
 namespace numeraire::database {
 
+/// Busy timeout for every read-write connection. The daily prep runner starts several
+/// dev_main ingest steps at once; with a timeout a second writer waits for the lock
+/// (WAL keeps readers unblocked) instead of failing with "database is locked".
+inline constexpr int kSqliteWriterBusyTimeoutMs = 30000;
+
 /// Opens (creates if needed) `database_path`, ensures parent directories exist,
 /// and executes the full SQL script from `schema_sql_path` (e.g.
 /// `sql/schema_v1.sql`). Safe to call repeatedly (`CREATE TABLE IF NOT EXISTS`).
@@ -1,6 +1,7 @@
 #pragma once
 
 #include <numeraire/core/ipricer.hpp>
+#include <numeraire/quant/cox_ross_rubinstein.hpp>
 
 #include <cstddef>
 
@@ -10,6 +11,12 @@ namespace numeraire::pricers {
 /// Same `IMarketData` quotes as the analytic BS pricer; American early exercise supported.
 /// Greeks are **bump-and-reprice** (no closed form on the tree).
 ///
+/// Optional `quant::BinomialTreeSettings` select a Leisen–Reimer lattice and/or Richardson
+/// extrapolation over \((n, 2n)\); any non-default setting also reads delta, gamma and theta
+/// off the tree (vega and rho are still bumped, on the same accelerated tree). Leisen–Reimer
+/// with Richardson at `kAcceleratedSteps` is at least as accurate as plain CRR at 200 steps
+/// for American puts and calls, at a fraction of the work.
+///
 /// Expects `VanillaEquityOptionProduct` (European or American). Flat tree state in
 /// `quant::CoxRossRubinsteinVanillaPrice`.
 ///
@@ -20,12 +27,18 @@ class BinomialBlackScholesEquityPricer final : public core::IPricer {
     /// Last-resort fallback if env and `configs/default.json` are unavailable.
     static constexpr std::size_t kFallbackSteps = 200;
 
+    /// Base step count for Leisen–Reimer + Richardson (trees of 25 and 51 steps).
+    static constexpr std::size_t kAcceleratedSteps = 25;
+
     /// Resolve step count from env / committed config (see class note).
     BinomialBlackScholesEquityPricer();
 
     /// Explicit step count (unit tests / callers that already resolved settings).
     explicit BinomialBlackScholesEquityPricer(std::size_t n_steps);
 
+    /// Explicit step count and lattice / extrapolation choice.
+    BinomialBlackScholesEquityPricer(std::size_t n_steps, quant::BinomialTreeSettings settings);
+
     [[nodiscard]] numeraire::PricingEngineType EngineKind() const override;
 
     [[nodiscard]] core::PricingResult Price(const core::IProduct& product,
@@ -33,8 +46,11 @@ class BinomialBlackScholesEquityPricer final : public core::IPricer {
 
     [[nodiscard]] std::size_t NSteps() const { return n_steps_; }
 
+    [[nodiscard]] const quant::BinomialTreeSettings& Settings() const { return settings_; }
+
    private:
     std::size_t n_steps_;
+    quant::BinomialTreeSettings settings_{};
 };
 
 }  // namespace numeraire::pricers
@@ -7,6 +7,11 @@
 
 namespace numeraire::pricers {
 
+/// How terminal normals are drawn. `kSobol` is randomised QMC: scrambled Sobol points
+/// through the inverse normal CDF, repeated over independent scrambles so the standard
+/// error is still an honest sampling error.
+enum class MonteCarloSampler : std::uint8_t { kPseudoRandom, kSobol };
+
 /// European equity vanilla by Monte Carlo under GBM (`PricingEngineType::kMonteCarlo`).
 /// Same `IMarketData` quotes as the analytic BS pricer.
 ///
@@ -14,7 +19,8 @@ namespace numeraire::pricers {
 /// **single exact GBM step** — independent Wiener increments make intermediate points
 /// irrelevant here. There is therefore no discretisation bias: the only error is
 /// sampling noise, reported as the standard error in `PricingMetadata::diagnostics`.
-/// Path-dependent payoffs (Asian, barrier) will need a real time grid instead.
+/// Path-dependent payoffs (Asian, barrier) will need a real time grid instead; with one
+/// step there is nothing for a Brownian bridge to reorder, so Sobol needs one dimension.
 ///
 /// Expects a European `VanillaEquityOptionProduct`; American exercise belongs to the
 /// tree. Greeks are **not** computed — this engine is informational next to the
@@ -29,12 +35,18 @@ class MonteCarloGbmEuropeanPricer final : public core::IPricer {
     /// Last-resort fallbacks if env and `configs/default.json` are unavailable.
     static constexpr std::size_t kFallbackPaths = 10000;
     static constexpr std::uint64_t kFallbackSeed = 42;
+    /// Independent scrambles behind the Sobol standard error (path budget is split evenly,
+    /// each share rounded down to a power of two).
+    static constexpr std::size_t kDefaultQmcReplications = 16;
 
     /// Resolve path count and seed from env / committed config (see class note).
     MonteCarloGbmEuropeanPricer();
 
     /// Explicit settings (unit tests / callers that already resolved them).
-    MonteCarloGbmEuropeanPricer(std::size_t num_paths, std::uint64_t seed);
+    MonteCarloGbmEuropeanPricer(std::size_t num_paths,
+                                std::uint64_t seed,
+                                MonteCarloSampler sampler = MonteCarloSampler::kPseudoRandom,
+                                std::size_t qmc_replications = kDefaultQmcReplications);
 
     [[nodiscard]] numeraire::PricingEngineType EngineKind() const override;
 
@@ -44,10 +56,17 @@ class MonteCarloGbmEuropeanPricer final : public core::IPricer {
     /// Recorded per mark so a stored price can be reproduced exactly.
     [[nodiscard]] std::size_t NumPaths() const { return num_paths_; }
     [[nodiscard]] std::uint64_t Seed() const { return seed_; }
+    [[nodiscard]] MonteCarloSampler Sampler() const { return sampler_; }
+    [[nodiscard]] std::size_t QmcReplications() const { return qmc_replications_; }
+    /// Paths a price actually draws: `NumPaths()`, or for `kSobol` each scramble's share
+    /// rounded down to a power of two, times the scrambles (the `mc_paths` diagnostic).
+    [[nodiscard]] std::size_t SimulatedPaths() const;
 
    private:
     std::size_t num_paths_;
     std::uint64_t seed_;
+    MonteCarloSampler sampler_{MonteCarloSampler::kPseudoRandom};
+    std::size_t qmc_replications_{kDefaultQmcReplications};
 };
 
 }  // namespace numeraire::pricers
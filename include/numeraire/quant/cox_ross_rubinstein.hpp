@@ -4,6 +4,7 @@
 #include <numeraire/enums/option_type.hpp>
 
 #include <cstddef>
+#include <cstdint>
 #include <vector>
 
 namespace numeraire::quant {
@@ -60,4 +61,51 @@ struct CrrTreeDump {
                                                        double time_to_expiry_years,
                                                        std::size_t n_steps);
 
+/// Lattice parameterisation for `BinomialVanillaValuation`.
+/// - `kCoxRossRubinstein`: \(u = e^{\sigma\sqrt{\Delta t}}\), \(d = 1/u\); first-order, oscillating in \(n\).
+/// - `kLeisenReimer`: Peizer–Pratt inversion of \(d_1, d_2\) (odd \(n\) only — even requests are
+///   bumped to \(n+1\)); smooth second-order convergence for Europeans, so it extrapolates well.
+enum class BinomialTreeMethod : std::uint8_t {
+    kCoxRossRubinstein,
+    kLeisenReimer,
+};
+
+/// Tree choice plus optional two-point Richardson extrapolation over \((n, 2n)\)
+/// (\((n, 2n+1)\) for Leisen–Reimer, which needs odd step counts).
+struct BinomialTreeSettings {
+    BinomialTreeMethod method = BinomialTreeMethod::kCoxRossRubinstein;
+    bool richardson = false;
+};
+
+/// Root value and the greeks available from the lattice itself: delta and gamma from the
+/// step-1 / step-2 nodes, theta from the step-2 middle node (spot drift removed to second
+/// order, since the Leisen–Reimer middle node does not sit on \(S_0\)). Theta is
+/// \(\partial V/\partial t\) per year (same sign convention as the bump pricer).
+/// `n_steps` is the finest tree actually rolled back. `has_greeks` is false when no proper
+/// tree is built (\(\tau \le 0\), \(\sigma \le 0\), \(n < 2\)); greeks are then zero.
+struct BinomialVanillaResult {
+    double npv = 0.0;
+    double delta = 0.0;
+    double gamma = 0.0;
+    double theta = 0.0;
+    std::size_t n_steps = 0;
+    bool has_greeks = false;
+};
+
+/// Vanilla on a CRR or Leisen–Reimer lattice, rolled back over a single flat buffer of size
+/// `n_steps + 1` (no per-step allocation), with greeks read off the tree instead of bumping.
+/// With `settings.richardson`, prices and greeks from the coarse and fine trees are combined
+/// as \(x_{2n} + (x_{2n} - x_n) / ((n_2/n_1)^k - 1)\) with \(k = 1\) — the leading error
+/// order for American exercise on either lattice.
+[[nodiscard]] BinomialVanillaResult BinomialVanillaValuation(OptionType option_type,
+                                                             ExerciseStyle exercise,
+                                                             double spot,
+                                                             double strike,
+                                                             double risk_free_rate,
+                                                             double dividend_yield,
+                                                             double volatility,
+                                                             double time_to_expiry_years,
+                                                             std::size_t n_steps,
+                                                             BinomialTreeSettings settings);
+
 }  // namespace numeraire::quant
@@ -6,6 +6,11 @@
 
 namespace numeraire::simulation {
 
+/// Standard normal quantile \(\Phi^{-1}(u)\) for `u` in `(0, 1)`: Acklam's rational
+/// approximation plus one Halley step (double precision). This is the normal map for
+/// quasi-random uniforms, which must stay one uniform → one normal.
+[[nodiscard]] double InverseCumulativeNormal(double u);
+
 /// Draws independent standard normals `N(0, 1)` from an `IRandomEngine` via the
 /// Box–Muller transform (two uniforms per pair). Caches one spare value so odd
 /// batch sizes and sequential `Next()` calls stay consistent.
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <array>
 #include <cstdint>
 #include <random>
 #include <span>
@@ -7,9 +8,9 @@
 namespace numeraire::simulation {
 
 /// Abstraction over a source of uniform variates in `[0, 1)`. This is the swap
-/// point between a pseudo-random engine (Mersenne Twister today) and a
-/// quasi-random sequence (Sobol later) -- both ultimately produce points in
-/// `[0, 1)`, so normal generation and correlation layer on top of this seam.
+/// point between a pseudo-random engine (Mersenne Twister) and a quasi-random
+/// sequence (scrambled Sobol) -- both ultimately produce points in `[0, 1)`, so
+/// normal generation and correlation layer on top of this seam.
 class IRandomEngine {
    protected:
     IRandomEngine() = default;
@@ -50,4 +51,30 @@ class MersenneTwisterEngine final : public IRandomEngine {
     std::mt19937 engine_;
 };
 
+/// First Sobol dimension (base-2 van der Corput, Gray-code order) under a random
+/// linear matrix scramble plus digital shift (Matoušek). Each `(seed, replication)`
+/// pair is an independent randomisation of the same low-discrepancy points, so the
+/// spread of per-replication estimates gives an honest standard error (randomised QMC).
+///
+/// One dimension is all a single exact GBM step to maturity needs. Uniforms are
+/// mid-cell, i.e. strictly inside `(0, 1)`, so an inverse normal CDF never sees 0.
+/// Map them with `InverseCumulativeNormal` -- Box–Muller pairs consecutive points and
+/// destroys the stratification.
+class ScrambledSobolEngine final : public IRandomEngine {
+   public:
+    static constexpr int kBits = 32;
+
+    ScrambledSobolEngine(std::uint64_t seed, std::uint64_t replication);
+
+    [[nodiscard]] double NextUniform() override;
+    void FillUniform(std::span<double> out) override;
+
+   private:
+    /// Row masks of the lower-triangular scramble matrix (unit diagonal), MSB first.
+    std::array<std::uint32_t, kBits> scramble_rows_{};
+    std::uint32_t digital_shift_{0};
+    std::uint32_t state_{0};  // unscrambled Sobol integer of the current point
+    std::uint32_t index_{0};
+};
+
 }  // namespace numeraire::simulation
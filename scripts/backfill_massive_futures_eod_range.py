@@ -6,11 +6,21 @@ Strategy (maximize tenors, minimize HTTP):
   1. Snapshot `futures_contract` on monthly listing dates in [--from, --to].
   2. Union distinct single-contract tickers across those snapshots (+ optional
      extra listing dates).
-  3. For each ticker, one ranged `1session` aggs call:
-       window_start.gte = from-1 day, window_start.lte = to-1 day
-     then upsert every bar whose session_end_date is in [from, to].
-
-Requires POLYGON_API_KEY. Default sleep 0 (Futures Starter+).
+  3. Split [from, to] into `--window-days` windows; for each (ticker, window) unit, one
+     ranged `1session` aggs call:
+       window_start.gte = window_from-1 day, window_start.lte = window_to-1 day
+     then upsert every bar whose session_end_date is in the window. Windows entirely
+     outside a contract's first/last trade date are not requested.
+
+Checkpointing: every finished unit (listing snapshot or ticker window) is recorded in
+`ingest_checkpoint` in the same transaction as its rows. After a crash or kill,
+`--resume` skips every unit already covered, so the rerun costs only the missing work.
+Failed units are never recorded and are retried on resume.
+
+Requires POLYGON_API_KEY. Unthrottled by default (Futures Starter+); see `--rate-per-min`.
+Contract snapshots (listing date x product) and per-ticker range pulls run on
+`--workers` threads over one keep-alive pool (`ingest_http`) behind a shared rate limit
+(`ingest_ratelimit`); DB writes stay serial.
 
 Examples:
   python3 scripts/backfill_massive_futures_eod_range.py \\
@@ -18,31 +28,43 @@ Examples:
 
   python3 scripts/backfill_massive_futures_eod_range.py \\
       --from 2025-01-01 --to 2026-08-11 --product-code CL --dry-run
+
+  # pick up where a killed run stopped
+  python3 scripts/backfill_massive_futures_eod_range.py \\
+      --from 2025-01-01 --to 2026-08-11 --resume
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import re
 import sqlite3
 import sys
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
+from itertools import groupby
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from ingest_cache import CACHE_MODES, response_cache
+from ingest_http import IngestHttpClient, default_workers
+from ingest_ratelimit import polygon_futures_bucket
+from ingest_sqlite import WriteStats, bulk_write, bump_data_generation, connect_writer
+
 _OUTRIGHT_TICKER_RE = re.compile(r"^[A-Z]{1,4}[FGHJKMNQUVXZ]\d{1,2}$")
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_POLYGON_BASE = "https://api.polygon.io"
 SOURCE = "massive"
-DEFAULT_SLEEP_SEC = 0.0
+CHECKPOINT_JOB = "futures_eod_range"
+DEFAULT_WINDOW_DAYS = 92
+# Flush bars + their checkpoints once this many bars are pending, or this long after the
+# last flush — bounds the finished work a crash can throw away.
+_FLUSH_BARS = 2000
+_FLUSH_SEC = 5.0
 
 
 def _load_dotenv(path: Path) -> None:
@@ -82,38 +104,6 @@ def _url_with_api_key(url: str, api_key: str) -> str:
     return f"{url}{sep}apiKey={urllib.parse.quote(api_key)}"
 
 
-def _http_get_json(url: str, timeout_sec: float = 90.0) -> Mapping[str, Any]:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "numeraire-backfill-futures-eod/1.0",
-            "Accept": "application/json",
-        },
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout_sec) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:800]
-        raise RuntimeError(f"HTTP {e.code} for {url.split('?', 1)[0]}: {body}") from e
-    except urllib.error.URLError as e:
-        raise RuntimeError(f"request failed: {e}") from e
-
-
-def _default_sleep_sec() -> float:
-    for env in (
-        "NUMERAIRE_POLYGON_FUTURES_SLEEP_SEC",
-        "NUMERAIRE_POLYGON_SLEEP_SEC_AFTER_CALL",
-    ):
-        raw = os.environ.get(env, "").strip()
-        if raw:
-            try:
-                return max(0.0, float(raw))
-            except ValueError:
-                continue
-    return DEFAULT_SLEEP_SEC
-
-
 def _universe_product_codes(conn: sqlite3.Connection) -> list[str]:
     cols = {r[1] for r in conn.execute("PRAGMA table_info(universe_instrument)")}
     if "ingest_futures_eod" in cols and "ingest_futures_product" in cols:
@@ -162,6 +152,99 @@ def _month_listing_dates(start: date, end: date) -> list[str]:
     return out
 
 
+def _range_windows(start: date, end: date, window_days: int) -> list[tuple[str, str]]:
+    """Split [start, end] into consecutive inclusive windows of `window_days` (0 = one window)."""
+    if window_days <= 0:
+        return [(start.isoformat(), end.isoformat())]
+    out: list[tuple[str, str]] = []
+    lo = start
+    while lo <= end:
+        hi = min(end, lo + timedelta(days=window_days - 1))
+        out.append((lo.isoformat(), hi.isoformat()))
+        lo = hi + timedelta(days=1)
+    return out
+
+
+def _merge_windows(windows: Sequence[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Union of inclusive date windows; adjacent windows (hi + 1 day == next lo) merge."""
+    out: list[tuple[str, str]] = []
+    for lo, hi in sorted(windows):
+        if out:
+            prev_lo, prev_hi = out[-1]
+            if date.fromisoformat(lo) <= date.fromisoformat(prev_hi) + timedelta(days=1):
+                out[-1] = (prev_lo, max(prev_hi, hi))
+                continue
+        out.append((lo, hi))
+    return out
+
+
+def _load_checkpoints(conn: sqlite3.Connection, unit_kind: str) -> dict[str, list[tuple[str, str]]]:
+    """unit_key -> merged (window_start, window_end) ranges already completed for this job."""
+    raw: dict[str, list[tuple[str, str]]] = {}
+    for key, lo, hi in conn.execute(
+        """
+        SELECT unit_key, window_start, window_end FROM ingest_checkpoint
+        WHERE job = ? AND unit_kind = ?
+        """,
+        (CHECKPOINT_JOB, unit_kind),
+    ):
+        raw.setdefault(str(key), []).append((str(lo), str(hi)))
+    return {key: _merge_windows(ws) for key, ws in raw.items()}
+
+
+def _is_checkpointed(
+    done: Mapping[str, Sequence[tuple[str, str]]], key: str, lo: str, hi: str
+) -> bool:
+    """True when completed windows cover [lo, hi] (so a new --window-days still resumes)."""
+    return any(d_lo <= lo and hi <= d_hi for d_lo, d_hi in done.get(key, ()))
+
+
+def _record_checkpoints(conn: sqlite3.Connection, units: Sequence[tuple[Any, ...]]) -> None:
+    """Stage (unit_kind, unit_key, window_start, window_end, rows) rows; the caller commits."""
+    completed_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    conn.executemany(
+        """
+        INSERT INTO ingest_checkpoint (
+            job, unit_kind, unit_key, window_start, window_end, rows_written, completed_at
+        ) VALUES (?,?,?,?,?,?,?)
+        ON CONFLICT (job, unit_kind, unit_key, window_start, window_end) DO UPDATE SET
+            rows_written = excluded.rows_written,
+            completed_at = excluded.completed_at
+        """,
+        [(CHECKPOINT_JOB, *u, completed_at) for u in units],
+    )
+
+
+def _contract_trade_bounds(
+    conn: sqlite3.Connection, codes: Sequence[str]
+) -> dict[str, tuple[str | None, str | None]]:
+    """ticker -> (first_trade_date, last_trade_date) from the listing snapshots (NULL = unknown)."""
+    placeholders = ",".join("?" * len(codes))
+    out: dict[str, tuple[str | None, str | None]] = {}
+    for t, first, last in conn.execute(
+        f"""
+        SELECT ticker, MIN(first_trade_date), MAX(COALESCE(last_trade_date, settlement_date))
+        FROM futures_contract
+        WHERE UPPER(product_code) IN ({placeholders})
+        GROUP BY ticker
+        """,
+        codes,
+    ):
+        out[str(t)] = (first or None, last or None)
+    return out
+
+
+def _window_may_trade(bounds: tuple[str | None, str | None] | None, lo: str, hi: str) -> bool:
+    if bounds is None:
+        return True
+    first, last = bounds
+    if first and hi < first[:10]:
+        return False
+    if last and lo > last[:10]:
+        return False
+    return True
+
+
 def _as_int01(value: Any) -> int | None:
     if value is None:
         return None
@@ -220,12 +303,12 @@ def _ns_to_ms(value: Any) -> int | None:
 
 
 def _fetch_contracts_page(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     *,
     product_code: str,
     as_of: str,
-    sleep_sec: float,
 ) -> list[dict[str, Any]]:
     params = {
         "product_code": product_code,
@@ -241,7 +324,7 @@ def _fetch_contracts_page(
     )
     out: list[dict[str, Any]] = []
     while url:
-        payload = _http_get_json(url)
+        payload = client.get_json(url)
         results = payload.get("results") or []
         if isinstance(results, list):
             for row in results:
@@ -251,8 +334,6 @@ def _fetch_contracts_page(
         if not next_url:
             break
         url = _url_with_api_key(str(next_url), api_key)
-        if sleep_sec > 0:
-            time.sleep(sleep_sec)
     return out
 
 
@@ -290,7 +371,9 @@ def _contract_row(
     )
 
 
-def _upsert_contracts(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> int:
+def _upsert_contracts(
+    conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]], stats: WriteStats | None = None
+) -> int:
     sql = """
         INSERT INTO futures_contract (
             ticker, listing_as_of, product_code, name, active, type, trading_venue,
@@ -317,14 +400,11 @@ def _upsert_contracts(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]])
             source = excluded.source,
             ingested_at = excluded.ingested_at
     """
-    cur = conn.cursor()
-    for row in rows:
-        cur.execute(sql, row)
-    conn.commit()
-    return len(rows)
+    return bulk_write(conn, sql, rows, stats=stats)
 
 
 def _fetch_session_bars_range(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     ticker: str,
@@ -346,7 +426,7 @@ def _fetch_session_bars_range(
     )
     out: list[dict[str, Any]] = []
     while url:
-        payload = _http_get_json(url)
+        payload = client.get_json(url)
         results = payload.get("results") or []
         if isinstance(results, list):
             for row in results:
@@ -413,7 +493,9 @@ def _bar_to_row(
     )
 
 
-def _upsert_bars(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> int:
+def _upsert_bars(
+    conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]], stats: WriteStats | None = None
+) -> int:
     sql = """
         INSERT INTO futures_daily_eod (
             ticker, product_code, as_of, session_calendar, open, high, low, close,
@@ -437,11 +519,9 @@ def _upsert_bars(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> i
             provider_timestamp_utc_ms = excluded.provider_timestamp_utc_ms,
             ingested_at = excluded.ingested_at
     """
-    cur = conn.cursor()
-    for row in rows:
-        cur.execute(sql, row)
-    conn.commit()
-    return len(rows)
+    if rows:
+        bump_data_generation(conn, "futures_daily_eod", commit=False)
+    return bulk_write(conn, sql, rows, stats=stats)
 
 
 def main() -> None:
@@ -462,11 +542,18 @@ def main() -> None:
         default=os.environ.get("NUMERAIRE_DB_PATH", "db.sqlite3"),
         help="SQLite path",
     )
+    parser.add_argument(
+        "--rate-per-min",
+        type=float,
+        default=None,
+        help="Max HTTP calls per minute across all workers (0 = unlimited; default from "
+        "NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN / _PLAN, see ingest_ratelimit)",
+    )
     parser.add_argument(
         "--sleep-sec",
         type=float,
         default=None,
-        help=f"Sleep after HTTP calls (default {_default_sleep_sec()})",
+        help="Deprecated: at most one call per N seconds (same as --rate-per-min 60/N)",
     )
     parser.add_argument(
         "--skip-contracts",
@@ -479,6 +566,31 @@ def main() -> None:
         default=0,
         help="Optional cap for probing (0 = all)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Concurrent HTTP calls (default {default_workers()} / NUMERAIRE_INGEST_WORKERS)",
+    )
+    parser.add_argument(
+        "--window-days",
+        type=int,
+        default=DEFAULT_WINDOW_DAYS,
+        help=f"Split the range into windows of N days, one aggs call per ticker and window "
+        f"(default {DEFAULT_WINDOW_DAYS}; 0 = one call per ticker for the whole range)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip listing snapshots and ticker windows already recorded in ingest_checkpoint",
+    )
+    parser.add_argument(
+        "--http-cache",
+        choices=CACHE_MODES,
+        default=None,
+        help="Response cache: on | off | refresh | record | offline (default "
+        "NUMERAIRE_HTTP_CACHE or on; see ingest_cache)",
+    )
     parser.add_argument("--dry-run", action="store_true")
     args = parser.parse_args()
 
@@ -492,7 +604,12 @@ def main() -> None:
         _die("POLYGON_API_KEY is not set")
 
     base_url = os.environ.get("POLYGON_BASE_URL", DEFAULT_POLYGON_BASE).strip() or DEFAULT_POLYGON_BASE
-    sleep_sec = _default_sleep_sec() if args.sleep_sec is None else max(0.0, float(args.sleep_sec))
+    bucket = polygon_futures_bucket(args.rate_per_min, args.sleep_sec)
+    try:
+        cache = response_cache(args.http_cache)
+    except ValueError as e:
+        _die(str(e))
+    workers = default_workers() if args.workers is None else max(1, int(args.workers))
 
     db_path = Path(args.db_path)
     if not db_path.is_absolute():
@@ -506,10 +623,18 @@ def main() -> None:
     window_gte = (d0 - timedelta(days=1)).isoformat()
     window_lte = (d1 - timedelta(days=1)).isoformat()
     listing_dates = _month_listing_dates(d0, d1)
-
-    conn = sqlite3.connect(db_path)
+    windows = _range_windows(d0, d1, max(0, int(args.window_days)))
+
+    client = IngestHttpClient(
+        user_agent="numeraire-backfill-futures-eod/1.2",
+        timeout_sec=90.0,
+        workers=workers,
+        bucket=bucket,
+        cache=cache,
+    )
+    writes = WriteStats()
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         conn.executescript((REPO_ROOT / "sql" / "schema_v1.sql").read_text(encoding="utf-8"))
 
         if args.product_code.strip():
@@ -523,7 +648,8 @@ def main() -> None:
             f"backfill futures EOD {base_url}\n"
             f"  products={','.join(codes)}  as_of=[{date_from} .. {date_to}]\n"
             f"  window_start=[{window_gte} .. {window_lte}]  listing_dates={len(listing_dates)}  "
-            f"sleep_sec={sleep_sec}"
+            f"windows={len(windows)}  rate={bucket.describe()}  workers={workers}  "
+            f"resume={args.resume}"
         )
 
         ingested_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -531,21 +657,39 @@ def main() -> None:
 
         if not args.skip_contracts:
             contract_rows: list[tuple[Any, ...]] = []
+            contract_units: list[tuple[Any, ...]] = []
             empty_listings = 0
-            for li, listing_as_of in enumerate(listing_dates, start=1):
+
+            def fetch_listing(unit: tuple[str, str]) -> list[dict[str, Any]]:
+                listing_as_of, code = unit
+                return _fetch_contracts_page(
+                    client, base_url, api_key, product_code=code, as_of=listing_as_of
+                )
+
+            listing_units = [(day, code) for day in listing_dates for code in codes]
+            if args.resume:
+                done = _load_checkpoints(conn, "contracts")
+                listing_units = [
+                    (day, code)
+                    for day, code in listing_units
+                    if not _is_checkpointed(done, code, day, day)
+                ]
+                print(
+                    f"  resume: {len(listing_dates) * len(codes) - len(listing_units)} listing "
+                    f"snapshots already checkpointed, {len(listing_units)} to fetch"
+                )
+            n_days = len({day for day, _ in listing_units})
+            fetched = client.fan_out(fetch_listing, listing_units)
+            by_day = groupby(fetched, key=lambda r: r[0][0])
+            for li, (listing_as_of, results) in enumerate(by_day, start=1):
                 day_n = 0
-                for code in codes:
-                    try:
-                        items = _fetch_contracts_page(
-                            base_url,
-                            api_key,
-                            product_code=code,
-                            as_of=listing_as_of,
-                            sleep_sec=sleep_sec,
-                        )
-                    except RuntimeError as e:
-                        print(f"  contracts {listing_as_of} {code}: ERROR {e}", file=sys.stderr)
+                for (_, code), items, err in results:
+                    if err is not None:
+                        if not isinstance(err, RuntimeError):
+                            raise err
+                        print(f"  contracts {listing_as_of} {code}: ERROR {err}", file=sys.stderr)
                         continue
+                    unit_n = 0
                     for it in items:
                         row = _contract_row(
                             it,
@@ -559,17 +703,20 @@ def main() -> None:
                             continue
                         contract_rows.append(row)
                         ticker_product[str(row[0])] = str(row[2]).upper()
-                        day_n += 1
-                    if sleep_sec > 0:
-                        time.sleep(sleep_sec)
-                print(f"  [{li}/{len(listing_dates)}] listing {listing_as_of}: {day_n} singles")
+                        unit_n += 1
+                    contract_units.append(("contracts", code, listing_as_of, listing_as_of, unit_n))
+                    day_n += unit_n
+                print(f"  [{li}/{n_days}] listing {listing_as_of}: {day_n} singles")
                 if day_n == 0:
                     empty_listings += 1
                 if not args.dry_run and len(contract_rows) >= 500:
-                    _upsert_contracts(conn, contract_rows)
+                    _record_checkpoints(conn, contract_units)
+                    _upsert_contracts(conn, contract_rows, writes)
                     contract_rows.clear()
-            if not args.dry_run and contract_rows:
-                _upsert_contracts(conn, contract_rows)
+                    contract_units.clear()
+            if not args.dry_run and (contract_rows or contract_units):
+                _record_checkpoints(conn, contract_units)
+                _upsert_contracts(conn, contract_rows, writes)
             print(f"  contract snapshots done (empty listing days={empty_listings})")
         else:
             print("  skip-contracts: loading tickers from existing futures_contract")
@@ -602,76 +749,114 @@ def main() -> None:
             print("dry-run: stop before aggs")
             return
 
+        bounds = _contract_trade_bounds(conn, codes)
+        done_windows = _load_checkpoints(conn, "aggs") if args.resume else {}
+        units: list[tuple[str, str, str, str]] = []
+        untradeable = 0
+        checkpointed = 0
+        for ticker, product_code in tickers:
+            for lo, hi in windows:
+                if not _window_may_trade(bounds.get(ticker), lo, hi):
+                    untradeable += 1
+                elif _is_checkpointed(done_windows, ticker, lo, hi):
+                    checkpointed += 1
+                else:
+                    units.append((ticker, product_code, lo, hi))
+        print(
+            f"  aggs units: {len(units)} to fetch (tickers={len(tickers)} x "
+            f"windows={len(windows)}; outside trade dates={untradeable}, "
+            f"already checkpointed={checkpointed})"
+        )
+
         ok_bars = 0
         with_settle = 0
-        empty_tickers = 0
+        empty_units = 0
         errors = 0
         by_product_bars: dict[str, int] = {}
         pending: list[tuple[Any, ...]] = []
+        pending_units: list[tuple[Any, ...]] = []
+
+        last_flush = time.monotonic()
+
+        def flush() -> None:
+            nonlocal last_flush
+            # Checkpoints and bars share one transaction (`_upsert_bars` commits both).
+            _record_checkpoints(conn, pending_units)
+            _upsert_bars(conn, pending, writes)
+            pending.clear()
+            pending_units.clear()
+            last_flush = time.monotonic()
+
+        def fetch_range(unit: tuple[str, str, str, str]) -> list[dict[str, Any]]:
+            ticker, _, lo, hi = unit
+            return _fetch_session_bars_range(
+                client,
+                base_url,
+                api_key,
+                ticker,
+                window_start_gte=(date.fromisoformat(lo) - timedelta(days=1)).isoformat(),
+                window_start_lte=(date.fromisoformat(hi) - timedelta(days=1)).isoformat(),
+            )
 
-        for i, (ticker, product_code) in enumerate(tickers, start=1):
-            try:
-                bars = _fetch_session_bars_range(
-                    base_url,
-                    api_key,
-                    ticker,
-                    window_start_gte=window_gte,
-                    window_start_lte=window_lte,
-                )
-            except RuntimeError as e:
-                errors += 1
-                print(f"  [{i}/{len(tickers)}] {ticker}: ERROR {e}", file=sys.stderr)
-                if sleep_sec > 0:
-                    time.sleep(sleep_sec)
-                continue
-
-            n_ok = 0
-            n_settle = 0
-            for bar in bars:
-                row = _bar_to_row(
-                    bar,
-                    ticker=ticker,
-                    product_code=product_code,
-                    as_of_min=date_from,
-                    as_of_max=date_to,
-                    ingested_at=ingested_at,
-                )
-                if row is None:
+        fetched_bars = client.fan_out(fetch_range, units)
+        try:
+            for i, ((ticker, product_code, lo, hi), bars, err) in enumerate(fetched_bars, start=1):
+                label = f"[{i}/{len(units)}] {ticker} {lo}..{hi}"
+                if err is not None:
+                    if not isinstance(err, RuntimeError):
+                        raise err
+                    errors += 1
+                    print(f"  {label}: ERROR {err}", file=sys.stderr)
                     continue
-                pending.append(row)
-                n_ok += 1
-                if row[8] is not None:
-                    n_settle += 1
-
-            if n_ok == 0:
-                empty_tickers += 1
-                print(f"  [{i}/{len(tickers)}] {ticker}: no bars in range")
-            else:
-                ok_bars += n_ok
-                with_settle += n_settle
-                by_product_bars[product_code] = by_product_bars.get(product_code, 0) + n_ok
-                print(
-                    f"  [{i}/{len(tickers)}] {ticker}: bars={n_ok} with_settle={n_settle} "
-                    f"(raw_api={len(bars)})"
-                )
-
-            if len(pending) >= 2000:
-                _upsert_bars(conn, pending)
-                pending.clear()
 
-            if sleep_sec > 0 and i < len(tickers):
-                time.sleep(sleep_sec)
-
-        if pending:
-            _upsert_bars(conn, pending)
+                n_ok = 0
+                n_settle = 0
+                for bar in bars:
+                    row = _bar_to_row(
+                        bar,
+                        ticker=ticker,
+                        product_code=product_code,
+                        as_of_min=lo,
+                        as_of_max=hi,
+                        ingested_at=ingested_at,
+                    )
+                    if row is None:
+                        continue
+                    pending.append(row)
+                    n_ok += 1
+                    if row[8] is not None:
+                        n_settle += 1
+                pending_units.append(("aggs", ticker, lo, hi, n_ok))
+
+                if n_ok == 0:
+                    empty_units += 1
+                    print(f"  {label}: no bars in range")
+                else:
+                    ok_bars += n_ok
+                    with_settle += n_settle
+                    by_product_bars[product_code] = by_product_bars.get(product_code, 0) + n_ok
+                    print(f"  {label}: bars={n_ok} with_settle={n_settle} (raw_api={len(bars)})")
+
+                if len(pending) >= _FLUSH_BARS or time.monotonic() - last_flush >= _FLUSH_SEC:
+                    flush()
+        except KeyboardInterrupt:
+            flush()  # keep what finished so --resume starts after it
+            print("interrupted: checkpointed finished units; rerun with --resume", file=sys.stderr)
+            raise
+
+        if pending or pending_units:
+            flush()
 
         print("summary bars by product:")
         for code in sorted(by_product_bars):
             print(f"  {code}: {by_product_bars[code]}")
         print(
-            f"ok: backfill -> {db_path}  tickers={len(tickers)}  bars={ok_bars}  "
-            f"with_settle={with_settle}  empty_tickers={empty_tickers}  errors={errors}"
+            f"ok: backfill -> {db_path}  tickers={len(tickers)}  units={len(units)}  "
+            f"bars={ok_bars}  with_settle={with_settle}  empty_units={empty_units}  "
+            f"errors={errors}"
         )
+        print(f"  {client.stats_line()}")
+        print(f"  {writes.line()}")
 
         # Coverage snapshot
         print("coverage (DB):")
@@ -696,6 +881,7 @@ def main() -> None:
                 f"settle={row[4]} range={row[5]}..{row[6]}"
             )
     finally:
+        client.close()
         conn.close()
 
 
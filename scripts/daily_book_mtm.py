@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Daily book MTM + CCR exposure (Hetzner / cron) — sharded, concurrent runner.
+
+End-of-day mark-to-market for LIVE trades, then EE / PFE exposure per LIVE portfolio, as
+`daily_book_mtm.sh` + `daily_book_exposure.sh` did — but no longer one `dev_main` for the
+whole book followed by one portfolio after another:
+
+  * MTM — `--shards N` splits the LIVE book into N shards balanced by leg count (largest
+    trade first onto the lightest shard) and prices them in N concurrent `dev_main`
+    processes. Every shard writes under one `NUMERAIRE_BATCH_RUN_ID`. The DB is in WAL mode
+    and writers queue on a busy timeout, so shards never see "database is locked".
+  * verify — after the shards, one pass over `trade_leg_mtm_eod` / `_archive` for the batch:
+    every LIVE leg has exactly one official mark and no leg was priced twice.
+  * exposure — one `dev_main --simulate … --persist-exposure` per portfolio, up to
+    `--exposure-parallel` at a time.
+  * summary — `refresh_book_summary.py` rebuilds the dashboard snapshot for as_of and
+    `refresh_exposure_rollup.py` the per-portfolio exposure rollups.
+
+Uses the step runner from `daily_market_prep.py` (timeouts, per-step log prefixes, timing
+report). Failed shards or a failed verification skip exposure and exit 1, like the old
+`set -e` script did when MTM failed.
+
+Usage:
+  python3 scripts/daily_book_mtm.py --shards 4
+  python3 scripts/daily_book_mtm.py --exposure-only      # was daily_book_exposure.sh
+
+Environment:
+  NUMERAIRE_AS_OF=YYYY-MM-DD       session date (default: last Mon–Fri, UTC lag)
+  NUMERAIRE_AS_OF_LAG_DAYS=1
+  NUMERAIRE_DB_PATH=db.sqlite3
+  NUMERAIRE_MTM_SHARDS=1           MTM processes (0 = one per CPU)
+  NUMERAIRE_EXPOSURE_PARALLEL=4    portfolios simulated at once
+  NUMERAIRE_MTM_STEP_TIMEOUT_SEC=0 kill a shard / portfolio after N seconds (0 = never)
+  NUMERAIRE_SKIP_EXPOSURE=1        MTM only (skip simulate / EE-PFE persist)
+  NUMERAIRE_SIM_BOOK=BOOK_1        single book for exposure (optional)
+  NUMERAIRE_SIM_BOOKS=BOOK_1,BOOK_2  comma/space list (optional; else distinct LIVE portfolios)
+  NUMERAIRE_DRY_RUN=1
+  NUMERAIRE_MC_PATHS / NUMERAIRE_MC_SEED — passed through to dev_main
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from daily_market_prep import (
+    Plan,
+    RunnerConfig,
+    Step,
+    log,
+    print_plan,
+    resolve_as_of,
+    run_plan,
+    timing_report,
+)
+from ingest_sqlite import connect_writer
+from refresh_book_summary import refresh_book_summary
+from refresh_exposure_rollup import refresh_exposure_rollup
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SHARDS = 1
+DEFAULT_EXPOSURE_PARALLEL = 4
+# Spot / vol / rates from SQLite, as the FO MTM and exposure runs always used.
+_DB_MARKET_ENV = (
+    "NUMERAIRE_DEV_SPOT_SOURCE=db",
+    "NUMERAIRE_DEV_VOL_SOURCE=db",
+    "NUMERAIRE_DEV_RATE_SOURCE=db",
+)
+
+
+def _die(msg: str) -> None:
+    log(f"ERROR: {msg}")
+    sys.exit(1)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "0").strip() == "1"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if raw:
+        try:
+            return int(raw)
+        except ValueError:
+            pass
+    return default
+
+
+@dataclass(frozen=True)
+class LiveTrade:
+    trade_id: str
+    portfolio_id: str
+    legs: int
+
+
+def read_live_trades(conn: sqlite3.Connection) -> list[LiveTrade]:
+    """LIVE trades only (PENDING excluded — booking is manual), with their leg counts."""
+    rows = conn.execute(
+        """
+        SELECT t.trade_id, trim(IFNULL(t.portfolio_id, '')), COUNT(l.leg_id)
+        FROM trades t
+        LEFT JOIN trade_legs l ON l.trade_id = t.trade_id
+        WHERE upper(trim(t.status)) = 'LIVE'
+        GROUP BY t.trade_id
+        ORDER BY t.trade_id
+        """
+    )
+    return [LiveTrade(str(r[0]), str(r[1]), int(r[2])) for r in rows]
+
+
+def balance_shards(trades: Sequence[LiveTrade], shards: int) -> list[list[LiveTrade]]:
+    """Split `trades` into up to `shards` groups of near-equal leg count (LPT greedy).
+
+    Pricing cost scales with legs, not trades, so a 40-leg strip and forty 1-leg options
+    weigh the same. Each shard keeps trade_id order so logs read like the unsharded run.
+    """
+    n = max(1, min(shards, len(trades)))
+    heap: list[tuple[int, int]] = [(0, i) for i in range(n)]
+    out: list[list[LiveTrade]] = [[] for _ in range(n)]
+    for trade in sorted(trades, key=lambda t: (-max(1, t.legs), t.trade_id)):
+        load, i = heapq.heappop(heap)
+        out[i].append(trade)
+        heapq.heappush(heap, (load + max(1, trade.legs), i))
+    return [sorted(group, key=lambda t: t.trade_id) for group in out if group]
+
+
+def make_batch_run_id() -> str:
+    """dev_main's `run-<UTC timestamp>`, plus the pid so back-to-back reruns never share one."""
+    return datetime.now(timezone.utc).strftime("run-%Y%m%dT%H%M%SZ") + f"-{os.getpid()}"
+
+
+def verify_mtm(
+    conn: sqlite3.Connection, as_of: str, batch_run_id: str, trades: Sequence[LiveTrade]
+) -> list[str]:
+    """Problems with the batch's official marks (empty list = every LIVE leg marked once)."""
+    ids = json.dumps([t.trade_id for t in trades])
+    expected = {
+        str(r[0])
+        for r in conn.execute(
+            "SELECT leg_id FROM trade_legs WHERE trade_id IN (SELECT value FROM json_each(?))",
+            (ids,),
+        )
+    }
+    # Archive rows are append-only per batch: two shards pricing one leg shows up here.
+    archived = dict(
+        conn.execute(
+            """
+            SELECT leg_id, COUNT(*) FROM trade_leg_mtm_eod_archive
+            WHERE batch_run_id = ? AND as_of = ? AND is_official = 1
+            GROUP BY leg_id
+            """,
+            (batch_run_id, as_of),
+        ).fetchall()
+    )
+    current = dict(
+        conn.execute(
+            """
+            SELECT leg_id, COUNT(*) FROM trade_leg_mtm_eod
+            WHERE as_of = ? AND is_official = 1 AND batch_run_id = ?
+            GROUP BY leg_id
+            """,
+            (as_of, batch_run_id),
+        ).fetchall()
+    )
+    dup_official = [
+        str(r[0])
+        for r in conn.execute(
+            """
+            SELECT leg_id FROM trade_leg_mtm_eod
+            WHERE as_of = ? AND is_official = 1
+              AND trade_id IN (SELECT value FROM json_each(?))
+            GROUP BY leg_id HAVING COUNT(*) > 1
+            """,
+            (as_of, ids),
+        )
+    ]
+
+    def sample(legs: set[str] | list[str]) -> str:
+        items = sorted(legs)
+        more = f" (+{len(items) - 5} more)" if len(items) > 5 else ""
+        return ", ".join(items[:5]) + more
+
+    problems: list[str] = []
+    missing = expected - set(current)
+    if missing:
+        problems.append(f"{len(missing)} of {len(expected)} LIVE legs have no official mark "
+                        f"from {batch_run_id}: {sample(missing)}")
+    twice = {leg for leg, n in archived.items() if n > 1}
+    if twice:
+        problems.append(f"{len(twice)} legs priced more than once in {batch_run_id}: "
+                        f"{sample(twice)}")
+    unexpected = set(archived) - expected
+    if unexpected:
+        problems.append(f"{len(unexpected)} legs marked outside the LIVE book: "
+                        f"{sample(unexpected)}")
+    if dup_official:
+        problems.append(f"{len(dup_official)} legs with more than one official mark for "
+                        f"{as_of}: {sample(dup_official)}")
+    log(f"verify: legs expected={len(expected)} official={len(current)} "
+        f"archived={sum(archived.values())} problems={len(problems)}")
+    return problems
+
+
+def resolve_books(trades: Sequence[LiveTrade]) -> list[str]:
+    if os.environ.get("NUMERAIRE_SIM_BOOKS", "").strip():
+        raw = os.environ["NUMERAIRE_SIM_BOOKS"].replace(",", " ")
+        return [b for b in raw.split() if b]
+    if os.environ.get("NUMERAIRE_SIM_BOOK", "").strip():
+        return [os.environ["NUMERAIRE_SIM_BOOK"].strip()]
+    return sorted({t.portfolio_id for t in trades if t.portfolio_id})
+
+
+def _run_phase(plan: Plan, cfg: RunnerConfig, title: str, report: dict[str, Any]) -> bool:
+    if cfg.dry_run:
+        print_plan(plan)
+        return True
+    t0 = time.monotonic()
+    asyncio.run(run_plan(plan, cfg))
+    report[title] = timing_report(plan, t0, time.monotonic() - t0)
+    return all(s.status == "ok" for s in plan.steps.values())
+
+
+def run_mtm(
+    dev_main: str,
+    db_path: Path,
+    as_of: str,
+    trades: Sequence[LiveTrade],
+    shards: int,
+    cfg: RunnerConfig,
+    report: dict[str, Any],
+) -> bool:
+    groups = balance_shards(trades, shards)
+    batch_run_id = make_batch_run_id()
+    log(f"MTM EOD: spot/vol/rate from DB (run daily_market_prep first) batch_run_id="
+        f"{batch_run_id} shards={len(groups)}")
+    plan = Plan(as_of=as_of)
+    with tempfile.TemporaryDirectory(prefix="numeraire_live_trades.") as tmp:
+        for i, group in enumerate(groups, start=1):
+            path = Path(tmp) / f"shard_{i:02d}.json"
+            path.write_text(json.dumps([t.trade_id for t in group]) + "\n", encoding="utf-8")
+            legs = sum(t.legs for t in group)
+            log(f"  shard {i}/{len(groups)}: trades={len(group)} legs={legs}")
+            plan.add(Step(
+                f"mtm_shard_{i:02d}",
+                ["env", *_DB_MARKET_ENV, f"NUMERAIRE_BATCH_RUN_ID={batch_run_id}",
+                 dev_main, "--as-of", as_of, "--trades-json", str(path)],
+                group="mtm",
+            ))
+        # One concurrency slot per shard: the shard count *is* the parallelism knob.
+        shard_cfg = RunnerConfig(len(groups), 1, cfg.timeout_sec, 0, cfg.dry_run)
+        ok = _run_phase(plan, shard_cfg, "mtm", report)
+    if cfg.dry_run:
+        return True
+    if not ok:
+        log("ERROR: MTM shard(s) failed — see timing report")
+        return False
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30.0)
+    try:
+        problems = verify_mtm(conn, as_of, batch_run_id, trades)
+    finally:
+        conn.close()
+    report["verify"] = {"batch_run_id": batch_run_id, "problems": problems}
+    for p in problems:
+        log(f"ERROR: verify: {p}")
+    return not problems
+
+
+def run_exposure(
+    dev_main: str,
+    as_of: str,
+    books: Sequence[str],
+    cfg: RunnerConfig,
+    report: dict[str, Any],
+) -> bool:
+    log(f"books ({len(books)}): {' '.join(books)}")
+    plan = Plan(as_of=as_of)
+    for book in books:
+        # EE / PFE 95% / PFE 97.5% → trade_leg_exposure_eod, persisted via the CLI flag.
+        plan.add(Step(
+            f"exposure:{book}",
+            ["env", *_DB_MARKET_ENV, "NUMERAIRE_PERSIST_EXPOSURE=1",
+             dev_main, "--simulate", "--as-of", as_of, "--book", book,
+             "--price-paths", "--persist-exposure"],
+            group=book,
+        ))
+    return _run_phase(plan, cfg, "exposure", report)
+
+
+def refresh_summary(db_path: Path, as_of: str) -> None:
+    """Rebuild the Journal dashboard snapshot and exposure rollups; derived data, so a
+    failure only warns."""
+    conn = connect_writer(db_path)
+    try:
+        try:
+            ok = refresh_book_summary(conn, as_of)
+            log(f"book summary {'refreshed' if ok else 'cleared (no official marks)'} "
+                f"as_of={as_of}")
+        except sqlite3.Error as e:
+            log(f"WARN: book summary not refreshed ({e}) — run scripts/refresh_book_summary.py")
+        try:
+            n = refresh_exposure_rollup(conn, as_of)
+            log(f"exposure rollup: {n} portfolio(s) as_of={as_of}")
+        except sqlite3.Error as e:
+            log(f"WARN: exposure rollup not refreshed ({e}) — "
+                "run scripts/refresh_exposure_rollup.py")
+    finally:
+        conn.close()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Daily LIVE book MTM (sharded by leg count) + concurrent CCR exposure."
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=_env_int("NUMERAIRE_MTM_SHARDS", DEFAULT_SHARDS),
+        help=f"Concurrent MTM dev_main processes, balanced by leg count (0 = one per CPU; "
+        f"default {DEFAULT_SHARDS} / NUMERAIRE_MTM_SHARDS)",
+    )
+    parser.add_argument(
+        "--exposure-parallel",
+        type=int,
+        default=_env_int("NUMERAIRE_EXPOSURE_PARALLEL", DEFAULT_EXPOSURE_PARALLEL),
+        help=f"Portfolios simulated at once (default {DEFAULT_EXPOSURE_PARALLEL} / "
+        "NUMERAIRE_EXPOSURE_PARALLEL)",
+    )
+    parser.add_argument(
+        "--step-timeout-sec",
+        type=float,
+        default=float(_env_int("NUMERAIRE_MTM_STEP_TIMEOUT_SEC", 0)),
+        help="Kill a shard / portfolio run after N seconds (default 0 = never)",
+    )
+    parser.add_argument(
+        "--exposure-only",
+        action="store_true",
+        help="Skip MTM; simulate and persist exposure only (daily_book_exposure.sh)",
+    )
+    parser.add_argument("--report-json", default="", help="Write timing + verify report here")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=_env_flag("NUMERAIRE_DRY_RUN"),
+        help="Print the plan only (same as NUMERAIRE_DRY_RUN=1)",
+    )
+    args = parser.parse_args(argv)
+
+    name = "daily_book_exposure" if args.exposure_only else "daily_book_mtm"
+    log(f"{name} start repo={REPO_ROOT}")
+    skip_exposure = _env_flag("NUMERAIRE_SKIP_EXPOSURE")
+    if args.exposure_only and skip_exposure:
+        log("NUMERAIRE_SKIP_EXPOSURE=1 — skipping exposure (exit 0)")
+        return
+
+    dev_main = REPO_ROOT / os.environ.get("BUILD_DIR", "build") / "dev_main"
+    db_path = Path(os.environ.get("NUMERAIRE_DB_PATH", str(REPO_ROOT / "db.sqlite3")))
+    if not db_path.is_absolute():
+        db_path = REPO_ROOT / db_path
+    if not os.access(dev_main, os.X_OK) and not args.dry_run:
+        _die(f"dev_main not found: {dev_main} (run scripts/build.sh)")
+    if not db_path.is_file():
+        _die(f"database not found: {db_path}")
+
+    as_of = resolve_as_of()
+    log(f"as_of={as_of} db={db_path}")
+    # The writer connection also switches a pre-WAL file to WAL before the shards start.
+    conn = (
+        sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        if args.dry_run
+        else connect_writer(db_path)
+    )
+    try:
+        trades = read_live_trades(conn)
+    finally:
+        conn.close()
+
+    timeout = args.step_timeout_sec if args.step_timeout_sec > 0 else None
+    report: dict[str, Any] = {"as_of": as_of}
+    ok = True
+    if not args.exposure_only:
+        if not trades:
+            log("no LIVE trades — nothing to MTM (exit 0)")
+            return
+        shards = args.shards if args.shards > 0 else (os.cpu_count() or 1)
+        cfg = RunnerConfig(shards, 1, timeout, 0, args.dry_run)
+        ok = run_mtm(str(dev_main), db_path, as_of, trades, shards, cfg, report)
+        log(f"daily_book_mtm MTM {'finished' if ok else 'FAILED'} as_of={as_of} "
+            f"trades={len(trades)} legs={sum(t.legs for t in trades)}")
+
+    if ok and (args.exposure_only or not skip_exposure):
+        books = resolve_books(trades)
+        if not books:
+            log("no LIVE portfolios / SIM_BOOK — nothing to simulate")
+        else:
+            cfg = RunnerConfig(max(1, args.exposure_parallel), 1, timeout, 0, args.dry_run)
+            ok = run_exposure(str(dev_main), as_of, books, cfg, report)
+    elif skip_exposure:
+        log("NUMERAIRE_SKIP_EXPOSURE=1 — skipping exposure")
+    else:
+        log("exposure skipped: MTM did not complete cleanly")
+
+    if not args.dry_run:
+        refresh_summary(db_path, as_of)
+    if args.report_json and not args.dry_run:
+        Path(args.report_json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    log(f"{name} {'done' if ok else 'FAILED'} as_of={as_of} trades={len(trades)}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 # End-of-day mark-to-market for LIVE trades only, then CCR exposure
 # (scripts/daily_book_exposure.sh) for each LIVE portfolio. No Polygon ingest,
 # no booking (--price-booking is manual). Market data must already be in SQLite
-# from scripts/daily_market_prep.sh.
+# from scripts/daily_market_prep.sh. Implemented in daily_book_mtm.py.
 #
 # Usage:
 #   /opt/numeraire/dev/scripts/daily_book_mtm.sh
@@ -17,127 +17,15 @@
 #   NUMERAIRE_AS_OF=YYYY-MM-DD       session date (default: last Mon–Fri, UTC lag)
 #   NUMERAIRE_AS_OF_LAG_DAYS=1
 #   NUMERAIRE_DB_PATH=db.sqlite3
+#   NUMERAIRE_MTM_SHARDS=1           parallel MTM dev_main processes, balanced by leg count
+#                                    (0 = one per CPU); batch verified after the shards
+#   NUMERAIRE_EXPOSURE_PARALLEL=4    portfolios simulated at once
+#   NUMERAIRE_MTM_STEP_TIMEOUT_SEC=0 kill a shard / portfolio run after N seconds
 #   NUMERAIRE_SKIP_EXPOSURE=1        MTM only (skip simulate / EE-PFE persist)
 #   NUMERAIRE_DRY_RUN=1
 # ============================================================================
 set -euo pipefail
 
-_TRADES_JSON=""
-
 REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
-BUILD_DIR="${BUILD_DIR:-build}"
-DEV_MAIN="${REPO_ROOT}/${BUILD_DIR}/dev_main"
-DB_PATH="${NUMERAIRE_DB_PATH:-${REPO_ROOT}/db.sqlite3}"
-
-log() {
-    printf '[%s] %s\n' "$(date -u '+%Y-%m-%dT%H:%M:%SZ')" "$*"
-}
-
-die() {
-    log "ERROR: $*"
-    exit 1
-}
-
-run_cmd() {
-    log "+ $*"
-    if [[ "${NUMERAIRE_DRY_RUN:-0}" == "1" ]]; then
-        return 0
-    fi
-    (
-        cd "${REPO_ROOT}"
-        "$@"
-    )
-}
-
-resolve_as_of() {
-    if [[ -n "${NUMERAIRE_AS_OF:-}" ]]; then
-        echo "${NUMERAIRE_AS_OF}"
-        return
-    fi
-    local lag_days="${NUMERAIRE_AS_OF_LAG_DAYS:-1}"
-    local d
-    d="$(date -u -d "${lag_days} days ago" +%Y-%m-%d)"
-    while true; do
-        local dow
-        dow="$(date -d "${d}" +%u)"
-        if [[ "${dow}" -le 5 ]]; then
-            echo "${d}"
-            return
-        fi
-        d="$(date -I -d "${d} - 1 day")"
-    done
-}
-
-# LIVE trades only (PENDING excluded — booking is manual).
-read_live_trade_ids() {
-    sqlite3 "${DB_PATH}" "
-        SELECT trade_id
-        FROM trades
-        WHERE upper(trim(status)) = 'LIVE'
-        ORDER BY trade_id;
-    "
-}
-
-write_live_trades_json() {
-    local out_path="$1"
-    shift
-    local -a ids=("$@")
-    {
-        printf '['
-        local i
-        for i in "${!ids[@]}"; do
-            if [[ "${i}" -gt 0 ]]; then
-                printf ','
-            fi
-            # JSON string escape: ids are TRD_* alphanumeric
-            printf '"%s"' "${ids[$i]}"
-        done
-        printf ']\n'
-    } >"${out_path}"
-}
-
-main() {
-    log "daily_book_mtm start repo=${REPO_ROOT}"
-
-    if [[ ! -x "${DEV_MAIN}" ]]; then
-        die "dev_main not found: ${DEV_MAIN} (run scripts/build.sh)"
-    fi
-    if [[ ! -f "${DB_PATH}" ]]; then
-        die "database not found: ${DB_PATH}"
-    fi
-
-    local as_of
-    as_of="$(resolve_as_of)"
-    log "as_of=${as_of} db=${DB_PATH}"
-
-    local -a live_ids=()
-    while IFS= read -r line; do
-        [[ -n "${line}" ]] && live_ids+=("${line}")
-    done < <(read_live_trade_ids)
-
-    if [[ "${#live_ids[@]}" -eq 0 ]]; then
-        log "no LIVE trades — nothing to MTM (exit 0)"
-        exit 0
-    fi
-
-    log "LIVE trades (${#live_ids[@]}): ${live_ids[*]}"
-
-    _TRADES_JSON="$(mktemp "${TMPDIR:-/tmp}/numeraire_live_trades.XXXXXX.json")"
-    trap 'rm -f "${_TRADES_JSON}"' EXIT
-    write_live_trades_json "${_TRADES_JSON}" "${live_ids[@]}"
-
-    log "MTM EOD: spot/vol/rate from DB (run daily_market_prep first)"
-    run_cmd env NUMERAIRE_DEV_SPOT_SOURCE=db NUMERAIRE_DEV_VOL_SOURCE=db NUMERAIRE_DEV_RATE_SOURCE=db \
-        "${DEV_MAIN}" --as-of "${as_of}" --trades-json "${_TRADES_JSON}"
-
-    log "daily_book_mtm MTM finished as_of=${as_of} trades=${#live_ids[@]}"
-
-    # Same as_of: EE / PFE into trade_leg_exposure_eod (not raw MC paths).
-    export NUMERAIRE_AS_OF="${as_of}"
-    export NUMERAIRE_DB_PATH="${DB_PATH}"
-    "${REPO_ROOT}/scripts/daily_book_exposure.sh"
-
-    log "daily_book_mtm done as_of=${as_of} trades=${#live_ids[@]}"
-}
-
-main "$@"
+cd "${REPO_ROOT}"
+exec python3 "${REPO_ROOT}/scripts/daily_book_mtm.py" "$@"
@@ -0,0 +1,729 @@
+#!/usr/bin/env python3
+"""
+Daily market data prep (Hetzner / cron) — asyncio DAG runner.
+
+Same work as the old serial `daily_market_prep.sh` loop: FRED par yields + discount curve,
+per-scope index / equity EOD and the option pipeline, book equity catch-up, commodity
+futures. Each step is now a node with explicit dependencies, and independent branches run
+concurrently (FRED vs. index EOD vs. futures contracts, one scope vs. the next). Every step
+is a subprocess (`dev_main …` or `python3 scripts/…`) with a timeout and retries, so a hung
+vendor call can no longer eat the cron window.
+
+Dependencies (within a scope, each step waits for the ones before it):
+
+    fred_par_yields ─► discount_curve
+    <scope>:index_eod / equity_eod ─► option_contracts ─► option_universe
+                                   ─► option_prices ─► vol_surface (also after spot)
+    futures_contracts ─► futures_eod
+    book_equity_catchup
+
+A failed step marks its scope failed and skips everything downstream of it. Steps that call
+a vendor take a slot from that vendor's pool (`--polygon-parallel`, FRED one at a time) so
+concurrency never multiplies the plan's rate; DB-only builds just take a `--max-parallel`
+slot. The run ends with a per-step timing report (wall clock, critical path); `--report-json`
+writes the same data for dashboards.
+
+Usage:
+  python3 scripts/daily_market_prep.py
+  NUMERAIRE_DRY_RUN=1 python3 scripts/daily_market_prep.py     # print the plan only
+
+Environment (unchanged from the shell script):
+  NUMERAIRE_AS_OF=YYYY-MM-DD       session date (default: last Mon–Fri, UTC lag)
+  NUMERAIRE_AS_OF_LAG_DAYS=1        lag for scope ingest / vol (default 1)
+  NUMERAIRE_FRED_AS_OF_LAG_DAYS=2   lag for FRED par yields + discount bootstrap (default 2)
+  NUMERAIRE_FRED_AS_OF=YYYY-MM-DD   override FRED curve as_of (optional)
+  NUMERAIRE_DISCOUNT_CURVE_ID=USD_TREASURY_PAR_FRED
+  NUMERAIRE_PREP_SKIP_FRED_CURVE=1  skip FRED fetch + discount-curve build
+  NUMERAIRE_DB_PATH=db.sqlite3
+  NUMERAIRE_GRID_CONFIG=configs/option_universe_grid.json
+  NUMERAIRE_EQUITY_OPTION_STRIKE_BAND=80
+  NUMERAIRE_PREP_SKIP_BOOK_EQUITY=1   skip equity fetch for book underlyings not in scope
+  NUMERAIRE_PREP_SKIP_FUTURES=1       skip commodity futures contracts + session EOD
+  NUMERAIRE_DRY_RUN=1
+  BUILD_DIR=build
+Runner knobs (flags override):
+  NUMERAIRE_PREP_MAX_PARALLEL=4       steps running at once
+  NUMERAIRE_PREP_POLYGON_PARALLEL=2   Polygon-calling steps at once
+  NUMERAIRE_PREP_STEP_TIMEOUT_SEC=1800
+  NUMERAIRE_PREP_STEP_RETRIES=1       extra attempts after a failure or timeout
+  NUMERAIRE_PREP_REPORT_JSON=path
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from ingest_sqlite import bump_data_generation, connect_writer
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_POLYGON_PARALLEL = 2
+DEFAULT_STEP_TIMEOUT_SEC = 1800.0
+DEFAULT_STEP_RETRIES = 1
+_RETRY_BASE_SEC = 5.0
+_KILL_GRACE_SEC = 10.0
+
+# Vendor pools: steps tagged with one of these share its slots (the rate limit is per plan).
+POLYGON = "polygon"
+FRED = "fred"
+LOCAL = "local"
+
+# EOD tables the prep steps write; their `data_generation` is bumped once the plan ran.
+MARKET_DATA_TABLES = (
+    "equity_daily_eod",
+    "index_daily_eod",
+    "discount_curve_eod",
+    "vol_surface_eod",
+    "futures_daily_eod",
+)
+
+
+def log(msg: str) -> None:
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    print(f"[{ts}] {msg}", flush=True)
+
+
+def _die(msg: str) -> None:
+    log(f"ERROR: {msg}")
+    sys.exit(1)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "0").strip() == "1"
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            pass
+    return default
+
+
+def resolve_as_of_with_lag(lag_days: int, today: date | None = None) -> str:
+    """`lag_days` before today (UTC), stepped back to the nearest Mon–Fri."""
+    d = (today or datetime.now(timezone.utc).date()) - timedelta(days=lag_days)
+    while d.isoweekday() > 5:
+        d -= timedelta(days=1)
+    return d.isoformat()
+
+
+def resolve_as_of() -> str:
+    explicit = os.environ.get("NUMERAIRE_AS_OF", "").strip()
+    if explicit:
+        return explicit
+    return resolve_as_of_with_lag(int(_env_number("NUMERAIRE_AS_OF_LAG_DAYS", 1)))
+
+
+def resolve_fred_as_of() -> str:
+    explicit = os.environ.get("NUMERAIRE_FRED_AS_OF", "").strip()
+    if explicit:
+        return explicit
+    return resolve_as_of_with_lag(int(_env_number("NUMERAIRE_FRED_AS_OF_LAG_DAYS", 2)))
+
+
+# -- plan ------------------------------------------------------------------------
+
+
+@dataclass
+class Step:
+    name: str
+    argv: list[str]
+    deps: tuple[str, ...] = ()
+    pool: str = LOCAL
+    # Scope id, or the branch name for non-scope work (fred_curve, book_equity, futures).
+    group: str = ""
+    status: str = "pending"  # pending | ok | failed | timeout | skipped
+    attempts: int = 0
+    started: float | None = None
+    finished: float | None = None
+    detail: str = ""
+
+    @property
+    def seconds(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+@dataclass
+class Plan:
+    as_of: str
+    steps: dict[str, Step] = field(default_factory=dict)
+    scopes: list[str] = field(default_factory=list)
+    # Scopes already failed while planning (option flags without option_underlying_id).
+    failed_scopes: set[str] = field(default_factory=set)
+
+    def add(self, step: Step) -> Step:
+        missing = [d for d in step.deps if d not in self.steps]
+        if missing:
+            raise ValueError(f"{step.name}: unknown dependencies {missing}")
+        self.steps[step.name] = step
+        return step
+
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30.0)
+
+
+def read_prep_scope_rows(conn: sqlite3.Connection, as_of: str) -> list[sqlite3.Row]:
+    conn.row_factory = sqlite3.Row
+    return list(
+        conn.execute(
+            """
+            SELECT scope_id, instrument_id, provider_symbol, asset_class,
+                   ingest_index_eod, ingest_equity_eod, ingest_option_contracts,
+                   build_option_universe, fetch_option_daily_price_eod, build_vol_surface_eod,
+                   IFNULL(option_underlying_id, '') AS option_underlying_id,
+                   option_grid_config_name, equity_eod_adjusted
+            FROM market_data_prep_scope
+            WHERE is_active = 1
+              AND ingest_from_date <= ?
+              AND (ingest_to_date IS NULL OR ingest_to_date >= ?)
+            ORDER BY ingest_priority, scope_id
+            """,
+            (as_of, as_of),
+        )
+    )
+
+
+def read_book_equity_tickers_outside_prep(conn: sqlite3.Connection, as_of: str) -> list[str]:
+    """Book underlyings not covered by an active scope row with ingest_equity_eod=1."""
+    rows = conn.execute(
+        """
+        SELECT DISTINCT p.underlying_id
+        FROM trade_legs tl
+        JOIN products p ON p.product_id = tl.product_id
+        WHERE p.underlying_id NOT IN (
+            SELECT instrument_id
+            FROM market_data_prep_scope
+            WHERE is_active = 1
+              AND ingest_equity_eod = 1
+              AND ingest_from_date <= ?
+              AND (ingest_to_date IS NULL OR ingest_to_date >= ?)
+        )
+        ORDER BY 1
+        """,
+        (as_of, as_of),
+    )
+    return [str(r[0]) for r in rows if r[0]]
+
+
+def count_futures_universe(conn: sqlite3.Connection) -> int:
+    # Date window (ingest_from_date / ingest_to_date) lives on market_data_prep_scope only —
+    # universe_instrument has no such columns; filter by active COMMODITY + futures flags.
+    row = conn.execute(
+        """
+        SELECT COUNT(*) FROM universe_instrument
+        WHERE is_active = 1
+          AND asset_class = 'COMMODITY'
+          AND (ingest_futures_eod = 1 OR ingest_futures_product = 1)
+        """
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _add_scope_steps(plan: Plan, row: sqlite3.Row, dev_main: str, grid_config: str) -> None:
+    as_of = plan.as_of
+    sid = str(row["scope_id"])
+    provider_symbol = str(row["provider_symbol"])
+    asset_class = str(row["asset_class"])
+    option_underlying = str(row["option_underlying_id"] or "")
+    plan.scopes.append(sid)
+    log(f"scope {sid}: instrument={row['instrument_id']} provider={provider_symbol} "
+        f"class={asset_class}")
+
+    # Index underlyings: Polygon I:NDX spot. Equities: spot from equity_daily_eod.
+    index_extra = ["--index-ticker", provider_symbol] if asset_class == "INDEX" else []
+    exercise_style = "european" if asset_class == "INDEX" else "american"
+    window = ["--from", as_of, "--to", as_of]
+
+    spot: list[str] = []
+    if row["ingest_index_eod"] == 1:
+        spot.append(plan.add(Step(
+            f"{sid}:index_eod",
+            [dev_main, "--fetch-index-eod-daily", *window, "--ticker", provider_symbol],
+            pool=POLYGON, group=sid,
+        )).name)
+    if row["ingest_equity_eod"] == 1:
+        equity_args = [dev_main, "--fetch-eod-daily", *window, "--ticker", provider_symbol]
+        if row["equity_eod_adjusted"] == 0:
+            equity_args.append("--raw")
+        spot.append(plan.add(Step(
+            f"{sid}:equity_eod", equity_args, pool=POLYGON, group=sid
+        )).name)
+
+    option_flags = (
+        row["ingest_option_contracts"], row["build_option_universe"],
+        row["fetch_option_daily_price_eod"], row["build_vol_surface_eod"],
+    )
+    if not option_underlying:
+        if any(flag == 1 for flag in option_flags):
+            log(f"WARN: {sid}: option pipeline flags set but option_underlying_id is empty "
+                "— skipped")
+            plan.failed_scopes.add(sid)
+        return
+
+    # The option chain runs in order; each stage waits for the last one that exists.
+    upstream: tuple[str, ...] = tuple(spot)
+    if row["ingest_option_contracts"] == 1:
+        contract_args = [
+            dev_main, "--fetch-option-contracts", *window,
+            "--underlying", option_underlying, "--exercise-style", exercise_style, *index_extra,
+        ]
+        # Equity: always band around spot to avoid full American chain bloat.
+        if asset_class == "EQUITY":
+            band = os.environ.get("NUMERAIRE_EQUITY_OPTION_STRIKE_BAND", "80")
+            contract_args += ["--strike-band", band]
+        upstream = (plan.add(Step(
+            f"{sid}:option_contracts", contract_args, upstream, POLYGON, sid
+        )).name,)
+    if row["build_option_universe"] == 1:
+        upstream = (plan.add(Step(
+            f"{sid}:option_universe",
+            [dev_main, "--build-option-universe", *window, "--underlying", option_underlying,
+             "--grid-config", grid_config, *index_extra],
+            upstream, LOCAL, sid,
+        )).name,)
+    if row["fetch_option_daily_price_eod"] == 1:
+        grid_for_fetch = str(row["option_grid_config_name"] or "") or (
+            "default_index_option_universe"
+        )
+        upstream = (plan.add(Step(
+            f"{sid}:option_prices",
+            [dev_main, "--fetch-option-daily-price-eod", *window, "--listing-as-of", as_of,
+             "--underlying", option_underlying, "--grid-config", grid_for_fetch],
+            upstream, POLYGON, sid,
+        )).name,)
+    if row["build_vol_surface_eod"] == 1:
+        plan.add(Step(
+            f"{sid}:vol_surface",
+            [dev_main, "--build-vol-surface-eod", *window, "--underlying", option_underlying,
+             *index_extra],
+            tuple(dict.fromkeys((*upstream, *spot))), LOCAL, sid,
+        ))
+
+
+def build_plan(db_path: Path, dev_main: str, grid_config: str) -> Plan:
+    as_of = resolve_as_of()
+    log(f"as_of={as_of} db={db_path} grid={grid_config}")
+    plan = Plan(as_of=as_of)
+
+    if _env_flag("NUMERAIRE_PREP_SKIP_FRED_CURVE"):
+        log("USD Treasury curve prep skipped (NUMERAIRE_PREP_SKIP_FRED_CURVE=1)")
+    else:
+        fred_as_of = resolve_fred_as_of()
+        curve_id = os.environ.get("NUMERAIRE_DISCOUNT_CURVE_ID", "USD_TREASURY_PAR_FRED")
+        log(f"USD Treasury curve prep fred_as_of={fred_as_of} curve_id={curve_id} "
+            f"(FRED lag={os.environ.get('NUMERAIRE_FRED_AS_OF_LAG_DAYS', '2')})")
+        plan.add(Step(
+            "fred_par_yields",
+            [sys.executable, "scripts/fetch_fred_treasury_par_yields.py",
+             "--as-of", fred_as_of, "--db-path", str(db_path)],
+            pool=FRED,
+            group="fred_curve",
+        ))
+        plan.add(Step(
+            "discount_curve",
+            [dev_main, "--build-discount-curve-eod", "--as-of", fred_as_of,
+             "--curve-id", curve_id],
+            deps=("fred_par_yields",),
+            group="fred_curve",
+        ))
+
+    conn = _connect_readonly(db_path)
+    try:
+        rows = read_prep_scope_rows(conn, as_of)
+        if not rows:
+            _die(f"no active market_data_prep_scope rows for as_of={as_of}")
+        for row in rows:
+            _add_scope_steps(plan, row, dev_main, grid_config)
+
+        if _env_flag("NUMERAIRE_PREP_SKIP_BOOK_EQUITY"):
+            log("book equity catch-up skipped (NUMERAIRE_PREP_SKIP_BOOK_EQUITY=1)")
+        else:
+            tickers = read_book_equity_tickers_outside_prep(conn, as_of)
+            if not tickers:
+                log("book equity catch-up: none (all book underlyings in prep scope or "
+                    "empty book)")
+            else:
+                log(f"book equity catch-up ({len(tickers)}): {' '.join(tickers)}")
+                argv = [dev_main, "--fetch-eod-daily", "--from", as_of, "--to", as_of]
+                for t in tickers:
+                    argv += ["--ticker", t]
+                plan.add(Step("book_equity_catchup", argv, pool=POLYGON, group="book_equity"))
+
+        if _env_flag("NUMERAIRE_PREP_SKIP_FUTURES"):
+            log("commodity futures ingest skipped (NUMERAIRE_PREP_SKIP_FUTURES=1)")
+        else:
+            count = count_futures_universe(conn)
+            if count == 0:
+                log("commodity futures ingest: no active COMMODITY universe rows")
+            else:
+                # Listing snapshot and session as_of share the prep as_of (typically T-1).
+                log(f"commodity futures ingest as_of={as_of} products={count}")
+                plan.add(Step(
+                    "futures_contracts",
+                    [dev_main, "--fetch-futures-contracts", "--as-of", as_of],
+                    pool=POLYGON,
+                    group="futures",
+                ))
+                plan.add(Step(
+                    "futures_eod",
+                    [dev_main, "--fetch-futures-eod-daily", "--from", as_of, "--to", as_of,
+                     "--listing-as-of", as_of],
+                    deps=("futures_contracts",),
+                    pool=POLYGON,
+                    group="futures",
+                ))
+    finally:
+        conn.close()
+    return plan
+
+
+# -- execution -------------------------------------------------------------------
+
+
+@dataclass
+class RunnerConfig:
+    max_parallel: int
+    polygon_parallel: int
+    timeout_sec: float | None
+    retries: int
+    dry_run: bool
+
+
+async def _stream_output(step: Step, stream: asyncio.StreamReader) -> None:
+    # Concurrent steps interleave; prefix every child line with its step.
+    while True:
+        line = await stream.readline()
+        if not line:
+            return
+        log(f"[{step.name}] {line.decode('utf-8', errors='replace').rstrip()}")
+
+
+def _signal_group(proc: asyncio.subprocess.Process, sig: signal.Signals) -> None:
+    # Each step leads its own process group: children it spawned (curl, sh -c …) go too.
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+async def _stop(proc: asyncio.subprocess.Process) -> None:
+    _signal_group(proc, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=_KILL_GRACE_SEC)
+    except asyncio.TimeoutError:
+        _signal_group(proc, signal.SIGKILL)
+        await proc.wait()
+
+
+async def _run_once(step: Step, timeout_sec: float | None) -> tuple[str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *step.argv,
+        cwd=str(REPO_ROOT),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,
+    )
+    assert proc.stdout is not None
+    reader = asyncio.create_task(_stream_output(step, proc.stdout))
+    try:
+        code = await asyncio.wait_for(proc.wait(), timeout=timeout_sec)
+    except asyncio.TimeoutError:
+        await _stop(proc)
+        _signal_group(proc, signal.SIGKILL)  # stragglers still holding the pipe
+        await reader
+        return "timeout", f"timed out after {timeout_sec:.0f}s"
+    except asyncio.CancelledError:
+        await _stop(proc)
+        reader.cancel()
+        raise
+    await reader
+    return ("ok", "") if code == 0 else ("failed", f"exit {code}")
+
+
+async def _run_step(
+    step: Step,
+    cfg: RunnerConfig,
+    slots: asyncio.Semaphore,
+    pools: dict[str, asyncio.Semaphore],
+) -> None:
+    attempts = 1 + max(0, cfg.retries)
+    # Vendor pool before the global slots: a step queued behind its provider must not
+    # hold a slot that a step for another provider (or a local step) could run in.
+    pool = pools.get(step.pool) or contextlib.nullcontext()
+    async with pool, slots:
+        step.started = time.monotonic()
+        for attempt in range(1, attempts + 1):
+            step.attempts = attempt
+            log(f"+ {step.name}: {' '.join(step.argv)}"
+                + (f" (attempt {attempt}/{attempts})" if attempt > 1 else ""))
+            try:
+                status, detail = await _run_once(step, cfg.timeout_sec)
+            except OSError as e:
+                status, detail = "failed", str(e)
+            step.status, step.detail = status, detail
+            if status == "ok":
+                break
+            if attempt < attempts:
+                wait = _RETRY_BASE_SEC * 2 ** (attempt - 1)
+                log(f"WARN: {step.name} {detail}; retry in {wait:.0f}s")
+                await asyncio.sleep(wait)
+        step.finished = time.monotonic()
+        log(f"{step.name}: {step.status} in {step.seconds:.1f}s"
+            + (f" ({step.detail})" if step.detail else ""))
+
+
+async def run_plan(plan: Plan, cfg: RunnerConfig) -> None:
+    """Start every step once its dependencies are ok; skip it if any of them failed."""
+    slots = asyncio.Semaphore(max(1, cfg.max_parallel))
+    pools = {
+        POLYGON: asyncio.Semaphore(max(1, cfg.polygon_parallel)),
+        FRED: asyncio.Semaphore(1),
+    }
+    running: dict[asyncio.Task[None], Step] = {}
+    pending = dict(plan.steps)
+
+    while pending or running:
+        progressed = False
+        for name, step in list(pending.items()):
+            deps = [plan.steps[d] for d in step.deps]
+            if any(d.status in ("failed", "timeout", "skipped") for d in deps):
+                blocked = next(d.name for d in deps if d.status != "ok")
+                step.status, step.detail = "skipped", f"upstream {blocked} did not succeed"
+                log(f"{name}: skipped ({step.detail})")
+                del pending[name]
+                progressed = True
+            elif all(d.status == "ok" for d in deps):
+                del pending[name]
+                progressed = True
+                running[asyncio.create_task(_run_step(step, cfg, slots, pools))] = step
+        if not running:
+            if pending and not progressed:
+                raise RuntimeError(f"steps can never start: {', '.join(pending)}")
+            continue  # only skips happened this pass; re-check what they unblocked
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            running.pop(task)
+            task.result()
+
+
+# -- reporting -------------------------------------------------------------------
+
+
+def _critical_path(plan: Plan) -> tuple[float, list[str]]:
+    """Longest chain of step durations through the DAG (the floor on wall clock)."""
+    best: dict[str, tuple[float, list[str]]] = {}
+
+    def visit(name: str) -> tuple[float, list[str]]:
+        if name not in best:
+            step = plan.steps[name]
+            head = max((visit(d) for d in step.deps), default=(0.0, []), key=lambda t: t[0])
+            best[name] = (head[0] + step.seconds, [*head[1], name])
+        return best[name]
+
+    return max((visit(n) for n in plan.steps), default=(0.0, []), key=lambda t: t[0])
+
+
+def timing_report(plan: Plan, t0: float, wall: float) -> dict[str, Any]:
+    steps = sorted(plan.steps.values(), key=lambda s: (s.started is None, s.started or 0.0))
+    serial = sum(s.seconds for s in steps)
+    crit_sec, crit_path = _critical_path(plan)
+    width = max((len(s.name) for s in steps), default=4)
+    log("timing report:")
+    print(f"  {'step':<{width}}  {'status':<8} {'tries':>5} {'start':>8} {'secs':>8}")
+    for s in steps:
+        start = f"+{s.started - t0:.1f}" if s.started is not None else "-"
+        print(f"  {s.name:<{width}}  {s.status:<8} {s.attempts:>5} {start:>8} {s.seconds:>8.1f}"
+              + (f"  {s.detail}" if s.detail and s.status != "ok" else ""))
+    speedup = serial / wall if wall > 0 else 0.0
+    print(f"  wall={wall:.1f}s  serial_sum={serial:.1f}s  speedup={speedup:.2f}x  "
+          f"critical_path={crit_sec:.1f}s ({' -> '.join(crit_path)})")
+    return {
+        "as_of": plan.as_of,
+        "wall_sec": round(wall, 3),
+        "serial_sum_sec": round(serial, 3),
+        "critical_path_sec": round(crit_sec, 3),
+        "critical_path": crit_path,
+        "steps": [
+            {
+                "name": s.name,
+                "group": s.group,
+                "pool": s.pool,
+                "deps": list(s.deps),
+                "status": s.status,
+                "attempts": s.attempts,
+                "start_offset_sec": None if s.started is None else round(s.started - t0, 3),
+                "seconds": round(s.seconds, 3),
+                "detail": s.detail,
+            }
+            for s in steps
+        ],
+    }
+
+
+def print_plan(plan: Plan) -> None:
+    """Dry run: steps grouped into waves that would start together."""
+    level: dict[str, int] = {}
+    for name, step in plan.steps.items():  # insertion order is already topological
+        level[name] = 1 + max((level[d] for d in step.deps), default=-1)
+    for wave in range(max(level.values(), default=-1) + 1):
+        log(f"wave {wave}:")
+        for name, step in plan.steps.items():
+            if level[name] == wave:
+                after = f"  (after {', '.join(step.deps)})" if step.deps else ""
+                log(f"  + {name} [{step.pool}]: {' '.join(step.argv)}{after}")
+
+
+def update_prep_status(db_path: Path, plan: Plan) -> int:
+    """Write last_prep_* per scope (ok only if every one of its steps succeeded)."""
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    failed = 0
+    updates: list[tuple[str, str, str, str]] = []
+    for sid in plan.scopes:
+        steps = [s for s in plan.steps.values() if s.group == sid]
+        ok = sid not in plan.failed_scopes and all(s.status == "ok" for s in steps)
+        failed += 0 if ok else 1
+        updates.append((plan.as_of, now, "ok" if ok else "failed", sid))
+    conn = connect_writer(db_path)
+    try:
+        conn.executemany(
+            """
+            UPDATE market_data_prep_scope
+            SET last_prep_as_of = ?, last_prep_at = ?, last_prep_status = ?
+            WHERE scope_id = ?
+            """,
+            updates,
+        )
+        # dev_main steps wrote these; the Journal's cached id / ticker lists recompute.
+        bump_data_generation(conn, *MARKET_DATA_TABLES, commit=False)
+        conn.commit()
+    finally:
+        conn.close()
+    return failed
+
+
+def _table_exists(db_path: Path, table: str) -> bool:
+    conn = _connect_readonly(db_path)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? LIMIT 1", (table,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row is not None
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Daily market data prep: dependency-aware, concurrent ingest steps."
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=int(_env_number("NUMERAIRE_PREP_MAX_PARALLEL", DEFAULT_MAX_PARALLEL)),
+        help=f"Steps running at once (default {DEFAULT_MAX_PARALLEL} / "
+        "NUMERAIRE_PREP_MAX_PARALLEL)",
+    )
+    parser.add_argument(
+        "--polygon-parallel",
+        type=int,
+        default=int(_env_number("NUMERAIRE_PREP_POLYGON_PARALLEL", DEFAULT_POLYGON_PARALLEL)),
+        help=f"Polygon-calling steps at once (default {DEFAULT_POLYGON_PARALLEL} / "
+        "NUMERAIRE_PREP_POLYGON_PARALLEL)",
+    )
+    parser.add_argument(
+        "--step-timeout-sec",
+        type=float,
+        default=_env_number("NUMERAIRE_PREP_STEP_TIMEOUT_SEC", DEFAULT_STEP_TIMEOUT_SEC),
+        help="Kill a step attempt after N seconds (0 = no timeout; default "
+        f"{DEFAULT_STEP_TIMEOUT_SEC:.0f} / NUMERAIRE_PREP_STEP_TIMEOUT_SEC)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=int(_env_number("NUMERAIRE_PREP_STEP_RETRIES", DEFAULT_STEP_RETRIES)),
+        help=f"Extra attempts per failed / timed-out step (default {DEFAULT_STEP_RETRIES} / "
+        "NUMERAIRE_PREP_STEP_RETRIES)",
+    )
+    parser.add_argument(
+        "--report-json",
+        default=os.environ.get("NUMERAIRE_PREP_REPORT_JSON", ""),
+        help="Also write the timing report as JSON to this path",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=_env_flag("NUMERAIRE_DRY_RUN"),
+        help="Print the step plan and exit (same as NUMERAIRE_DRY_RUN=1)",
+    )
+    args = parser.parse_args(argv)
+
+    log(f"daily_market_prep start repo={REPO_ROOT}")
+    dev_main = REPO_ROOT / os.environ.get("BUILD_DIR", "build") / "dev_main"
+    db_path = Path(os.environ.get("NUMERAIRE_DB_PATH", str(REPO_ROOT / "db.sqlite3")))
+    if not db_path.is_absolute():
+        db_path = REPO_ROOT / db_path
+    grid_config = os.environ.get("NUMERAIRE_GRID_CONFIG", "configs/option_universe_grid.json")
+
+    if not os.access(dev_main, os.X_OK) and not args.dry_run:
+        _die(f"dev_main not found: {dev_main} (run scripts/build.sh)")
+    if not db_path.is_file():
+        _die(f"database not found: {db_path}")
+    if not _table_exists(db_path, "market_data_prep_scope"):
+        _die("table market_data_prep_scope missing — apply sql/schema_v1.sql and "
+             "sql/seed_market_data_prep_scope.sql")
+
+    plan = build_plan(db_path, str(dev_main), grid_config)
+    cfg = RunnerConfig(
+        max_parallel=max(1, args.max_parallel),
+        polygon_parallel=max(1, args.polygon_parallel),
+        timeout_sec=args.step_timeout_sec if args.step_timeout_sec > 0 else None,
+        retries=max(0, args.retries),
+        dry_run=args.dry_run,
+    )
+    log(f"plan: {len(plan.steps)} steps, scopes={len(plan.scopes)}, "
+        f"max_parallel={cfg.max_parallel}, polygon_parallel={cfg.polygon_parallel}, "
+        f"timeout={cfg.timeout_sec or 'none'}, retries={cfg.retries}")
+    if cfg.dry_run:
+        print_plan(plan)
+        log(f"DRY_RUN: would run {len(plan.steps)} steps")
+        return
+
+    t0 = time.monotonic()
+    asyncio.run(run_plan(plan, cfg))
+    report = timing_report(plan, t0, time.monotonic() - t0)
+    if args.report_json:
+        Path(args.report_json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    failed_scopes = update_prep_status(db_path, plan)
+    # Non-scope branches (FRED curve, book catch-up, futures) count as one failure each,
+    # like the shell script's failed_scopes counter.
+    failed_other = {
+        s.group for s in plan.steps.values() if s.group not in plan.scopes and s.status != "ok"
+    }
+    failed = failed_scopes + len(failed_other)
+    log(f"daily_market_prep done as_of={plan.as_of} scopes={len(plan.scopes)} failed={failed}")
+    if failed > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
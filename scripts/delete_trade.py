@@ -31,6 +31,8 @@ import sqlite3
 import sys
 from pathlib import Path
 
+from ingest_sqlite import connect_writer
+
 # Every table that cascades off a trade, in the order a reader cares about.
 DEPENDENT_TABLES = (
     ("trade_legs", "leg(s)"),
@@ -109,14 +111,13 @@ def main() -> None:
     db_path = args.db_path if args.db_path is not None else Path(default_db_path())
 
     try:
-        conn = sqlite3.connect(str(db_path))
+        conn = connect_writer(db_path)
     except sqlite3.Error as e:
         _die(f"cannot open database {db_path}: {e}")
 
     deleted = 0
     skipped = 0
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         _require_cascade(conn)
 
         for trade_id in args.trade_ids:
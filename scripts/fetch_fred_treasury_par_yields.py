@@ -5,8 +5,10 @@ Fetch US Treasury constant-maturity par yields from FRED (DGS*) and upsert into
 Requires: FRED_API_KEY in environment or repo-root `.env`.
 Optional: FRED_BASE_URL (default https://api.stlouisfed.org/fred).
 
-Transient FRED failures (HTTP 429/502/503/504, timeout) retry with 5s / 15s / 30s
-backoff. A clean response is never retried; 4xx still fails immediately.
+Calls go through the shared ingest client (`ingest_http`) behind the FRED token bucket
+(NUMERAIRE_FRED_RATE_PER_MIN, default 120/min). Transient failures (HTTP 429/502/503/504,
+timeout) retry with jittered exponential backoff (~7.5s / 15s / 30s, or longer when FRED
+sends Retry-After). A clean response is never retried; 4xx still fails immediately.
 
 Example:
   python3 scripts/fetch_fred_treasury_par_yields.py --as-of 2026-05-27
@@ -18,24 +20,26 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import socket
 import sqlite3
 import sys
-import time
-import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import date
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from ingest_cache import CACHE_MODES, response_cache
+from ingest_http import IngestHttpClient, IngestHttpError
+from ingest_ratelimit import RetryPolicy, fred_bucket
+from ingest_sqlite import WriteStats, bulk_write, connect_writer
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CURVE_CONFIG = REPO_ROOT / "configs" / "fred_usd_treasury_par_curve.json"
 DEFAULT_FRED_BASE = "https://api.stlouisfed.org/fred"
-# Transient provider failures only (502 this morning). Success never retries.
-_RETRYABLE_HTTP = {429, 502, 503, 504}
-_RETRY_BACKOFF_SEC = (5, 15, 30)
+# Transient provider failures only (429/502/503/504, timeouts). Success never retries.
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_SEC = 7.5
+_RETRY_CAP_SEC = 30.0
 
 
 def _load_dotenv(path: Path) -> None:
@@ -64,51 +68,16 @@ def _parse_as_of(s: str) -> str:
     return s
 
 
-def _is_retryable_url_error(exc: urllib.error.URLError) -> bool:
-    reason = exc.reason
-    if isinstance(reason, (TimeoutError, socket.timeout, ConnectionError)):
-        return True
-    msg = str(reason).lower()
-    return "timed out" in msg or "temporarily unavailable" in msg
-
-
-def _fred_get_json(url: str, series_id: str) -> dict[str, Any]:
-    """GET one FRED series page. Retry only on gateway / timeout; 4xx dies immediately."""
-    req = urllib.request.Request(url, headers={"User-Agent": "numeraire-fetch-fred/1.0"})
-    attempts = 1 + len(_RETRY_BACKOFF_SEC)
-    for attempt in range(attempts):
-        try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")[:500]
-            retry = e.code in _RETRYABLE_HTTP and attempt < attempts - 1
-            if retry:
-                wait = _RETRY_BACKOFF_SEC[attempt]
-                print(
-                    f"warn: FRED HTTP {e.code} for {series_id}; "
-                    f"retry in {wait}s ({attempt + 1}/{attempts})",
-                    file=sys.stderr,
-                )
-                time.sleep(wait)
-                continue
-            _die(f"FRED HTTP {e.code} for {series_id}: {body}")
-        except urllib.error.URLError as e:
-            retry = _is_retryable_url_error(e) and attempt < attempts - 1
-            if retry:
-                wait = _RETRY_BACKOFF_SEC[attempt]
-                print(
-                    f"warn: FRED request failed for {series_id}: {e}; "
-                    f"retry in {wait}s ({attempt + 1}/{attempts})",
-                    file=sys.stderr,
-                )
-                time.sleep(wait)
-                continue
-            _die(f"FRED request failed for {series_id}: {e}")
-    _die(f"FRED request failed for {series_id}: retries exhausted")
+def _warn_retry(url: str, status: int | None, wait: float, attempt: int, attempts: int) -> None:
+    what = f"HTTP {status}" if status is not None else "request failed"
+    print(
+        f"warn: FRED {what} for {url}; retry in {wait:.1f}s ({attempt}/{attempts})",
+        file=sys.stderr,
+    )
 
 
 def _fred_observation(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     series_id: str,
@@ -124,7 +93,12 @@ def _fred_observation(
         }
     )
     url = f"{base_url.rstrip('/')}/series/observations?{params}"
-    payload = _fred_get_json(url, series_id)
+    try:
+        payload = client.get_json(url)
+    except IngestHttpError as e:
+        if e.status is not None:
+            _die(f"FRED HTTP {e.status} for {series_id}: {e.body}")
+        _die(f"FRED request failed for {series_id}: {e}")
 
     observations = payload.get("observations") or []
     if not observations:
@@ -154,10 +128,12 @@ def _upsert_curve(
     cfg: Mapping[str, Any],
     as_of: str,
     points: Sequence[tuple[Mapping[str, Any], float]],
+    stats: WriteStats | None = None,
 ) -> None:
+    """Curve header + every pillar in one transaction."""
     curve_id = str(cfg["curve_id"])
-    cur = conn.cursor()
-    cur.execute(
+    bulk_write(
+        conn,
         """
         INSERT INTO par_curve_eod (
             curve_id, as_of, currency, curve_kind, source,
@@ -166,29 +142,34 @@ def _upsert_curve(
         ON CONFLICT (curve_id, as_of) DO UPDATE SET
             ingested_at = excluded.ingested_at
         """,
-        (
-            curve_id,
-            as_of,
-            str(cfg.get("currency", "USD")),
-            str(cfg.get("curve_kind", "treasury_par_fred")),
-            str(cfg.get("source", "FRED")),
-            str(cfg.get("day_count", "Actual365Fixed")),
-            str(cfg.get("session_calendar", "America/New_York")),
-        ),
+        [
+            (
+                curve_id,
+                as_of,
+                str(cfg.get("currency", "USD")),
+                str(cfg.get("curve_kind", "treasury_par_fred")),
+                str(cfg.get("source", "FRED")),
+                str(cfg.get("day_count", "Actual365Fixed")),
+                str(cfg.get("session_calendar", "America/New_York")),
+            )
+        ],
+        stats=stats,
+        commit=False,
     )
-    for pillar, quoted_rate in points:
-        cur.execute(
-            """
-            INSERT INTO par_curve_point_eod (
-                curve_id, as_of, tenor, tenor_days, instrument_type,
-                fred_series_id, quoted_rate
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (curve_id, as_of, tenor) DO UPDATE SET
-                tenor_days = excluded.tenor_days,
-                instrument_type = excluded.instrument_type,
-                fred_series_id = excluded.fred_series_id,
-                quoted_rate = excluded.quoted_rate
-            """,
+    bulk_write(
+        conn,
+        """
+        INSERT INTO par_curve_point_eod (
+            curve_id, as_of, tenor, tenor_days, instrument_type,
+            fred_series_id, quoted_rate
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (curve_id, as_of, tenor) DO UPDATE SET
+            tenor_days = excluded.tenor_days,
+            instrument_type = excluded.instrument_type,
+            fred_series_id = excluded.fred_series_id,
+            quoted_rate = excluded.quoted_rate
+        """,
+        [
             (
                 curve_id,
                 as_of,
@@ -197,9 +178,11 @@ def _upsert_curve(
                 str(pillar["instrument_type"]),
                 str(pillar["fred_series_id"]),
                 quoted_rate,
-            ),
-        )
-    conn.commit()
+            )
+            for pillar, quoted_rate in points
+        ],
+        stats=stats,
+    )
 
 
 def main() -> None:
@@ -219,6 +202,13 @@ def main() -> None:
         default=os.environ.get("NUMERAIRE_DB_PATH", "db.sqlite3"),
         help="SQLite path (default: NUMERAIRE_DB_PATH or db.sqlite3)",
     )
+    parser.add_argument(
+        "--http-cache",
+        choices=CACHE_MODES,
+        default=None,
+        help="Response cache: on | off | refresh | record | offline (default "
+        "NUMERAIRE_HTTP_CACHE or on; see ingest_cache)",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Fetch only; do not write DB")
     args = parser.parse_args()
 
@@ -229,17 +219,32 @@ def main() -> None:
 
     base_url = os.environ.get("FRED_BASE_URL", DEFAULT_FRED_BASE).strip() or DEFAULT_FRED_BASE
     cfg = _load_curve_config(Path(args.curve_config))
+    try:
+        cache = response_cache(args.http_cache)
+    except ValueError as e:
+        _die(str(e))
 
     fetched: list[tuple[Mapping[str, Any], float]] = []
     missing: list[str] = []
-    for pillar in cfg["pillars"]:
-        series_id = str(pillar["fred_series_id"])
-        rate = _fred_observation(base_url, api_key, series_id, as_of)
-        if rate is None:
-            missing.append(f"{pillar['tenor']} ({series_id})")
-            continue
-        fetched.append((pillar, rate))
-        print(f"  {pillar['tenor']:>4}  {series_id:8}  {rate:.6f}")
+    with IngestHttpClient(
+        user_agent="numeraire-fetch-fred/1.1",
+        workers=1,
+        bucket=fred_bucket(),
+        retry=RetryPolicy(
+            max_attempts=_RETRY_ATTEMPTS, base_sec=_RETRY_BASE_SEC, cap_sec=_RETRY_CAP_SEC
+        ),
+        on_retry=_warn_retry,
+        cache=cache,
+    ) as client:
+        for pillar in cfg["pillars"]:
+            series_id = str(pillar["fred_series_id"])
+            rate = _fred_observation(client, base_url, api_key, series_id, as_of)
+            if rate is None:
+                missing.append(f"{pillar['tenor']} ({series_id})")
+                continue
+            fetched.append((pillar, rate))
+            print(f"  {pillar['tenor']:>4}  {series_id:8}  {rate:.6f}")
+        print(client.stats_line())
 
     if not fetched:
         _die(f"no FRED observations for as_of={as_of}; missing all pillars")
@@ -255,14 +260,15 @@ def main() -> None:
     if not db_path.is_file():
         _die(f"database not found: {db_path} (apply sql/schema_v1.sql or run dev_main bootstrap)")
 
-    conn = sqlite3.connect(db_path)
+    writes = WriteStats()
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
-        _upsert_curve(conn, cfg, as_of, fetched)
+        _upsert_curve(conn, cfg, as_of, fetched, writes)
     finally:
         conn.close()
 
     print(f"ok: {cfg['curve_id']} @ {as_of} -> {db_path} ({len(fetched)} pillars)")
+    print(writes.line())
 
 
 if __name__ == "__main__":
@@ -8,6 +8,9 @@ later to fetch session bars into `futures_daily_eod`.
 
 Requires: POLYGON_API_KEY in environment or repo-root `.env`.
 Optional: POLYGON_BASE_URL (default https://api.polygon.io).
+Products are fetched concurrently (`--workers`, keep-alive pool in `ingest_http`) under
+the shared Massive futures rate limit (`--rate-per-min`, `ingest_ratelimit`).
+Listing pages are cached on disk for 12h per (product, date) (`--http-cache`, `ingest_cache`).
 
 Examples:
   python3 scripts/fetch_massive_futures_contracts.py --as-of 2026-08-12 --dry-run
@@ -18,18 +21,19 @@ Examples:
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sqlite3
 import sys
-import time
-import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
+from ingest_cache import CACHE_MODES, response_cache
+from ingest_http import IngestHttpClient, default_workers
+from ingest_ratelimit import polygon_futures_bucket
+from ingest_sqlite import WriteStats, bulk_write, connect_writer
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_POLYGON_BASE = "https://api.polygon.io"
@@ -73,22 +77,6 @@ def _url_with_api_key(url: str, api_key: str) -> str:
     return f"{url}{sep}apiKey={urllib.parse.quote(api_key)}"
 
 
-def _http_get_json(url: str, timeout_sec: float = 60.0) -> Mapping[str, Any]:
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "numeraire-fetch-futures-contracts/1.0", "Accept": "application/json"},
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout_sec) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:800]
-        _die(f"HTTP {e.code} for {url.split('?', 1)[0]}: {body}")
-    except urllib.error.URLError as e:
-        _die(f"request failed: {e}")
-    return {}
-
-
 def _universe_product_codes(conn: sqlite3.Connection) -> list[str]:
     cols = {r[1] for r in conn.execute("PRAGMA table_info(universe_instrument)")}
     if "ingest_futures_eod" in cols and "ingest_futures_product" in cols:
@@ -109,6 +97,7 @@ def _universe_product_codes(conn: sqlite3.Connection) -> list[str]:
 
 
 def _fetch_contracts(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     *,
@@ -117,7 +106,6 @@ def _fetch_contracts(
     active_only: bool,
     product_type: str | None,
     limit: int,
-    sleep_sec: float,
 ) -> list[dict[str, Any]]:
     params: dict[str, str] = {
         "product_code": product_code,
@@ -140,20 +128,18 @@ def _fetch_contracts(
     page = 0
     while url:
         page += 1
-        payload = _http_get_json(url)
+        payload = client.get_json(url)
         results = payload.get("results") or []
         if not isinstance(results, list):
-            _die(f"unexpected results type for {product_code} page {page}")
+            raise RuntimeError(f"unexpected results type for {product_code} page {page}")
         for row in results:
             if isinstance(row, dict):
                 out.append(row)
-        print(f"    page {page}: +{len(results)} (total {len(out)})")
+        print(f"    {product_code} page {page}: +{len(results)} (total {len(out)})")
         next_url = payload.get("next_url")
         if not next_url:
             break
         url = _url_with_api_key(str(next_url), api_key)
-        if sleep_sec > 0:
-            time.sleep(sleep_sec)
     return out
 
 
@@ -224,7 +210,11 @@ def _row_from_api(
     )
 
 
-def _upsert_contracts(conn: sqlite3.Connection, rows: Iterable[tuple[Any, ...]]) -> int:
+def _upsert_contracts(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple[Any, ...]],
+    stats: WriteStats | None = None,
+) -> int:
     sql = """
         INSERT INTO futures_contract (
             ticker, listing_as_of, product_code, name, active, type, trading_venue,
@@ -251,13 +241,7 @@ def _upsert_contracts(conn: sqlite3.Connection, rows: Iterable[tuple[Any, ...]])
             source = excluded.source,
             ingested_at = excluded.ingested_at
     """
-    cur = conn.cursor()
-    n = 0
-    for row in rows:
-        cur.execute(sql, row)
-        n += 1
-    conn.commit()
-    return n
+    return bulk_write(conn, sql, rows, stats=stats)
 
 
 def main() -> None:
@@ -288,11 +272,32 @@ def main() -> None:
         help="Contract type filter: single | combo | all (default: single)",
     )
     parser.add_argument("--limit", type=int, default=1000, help="Page size (max 1000)")
+    parser.add_argument(
+        "--rate-per-min",
+        type=float,
+        default=None,
+        help="Max HTTP calls per minute across all workers (0 = unlimited; default from "
+        "NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN / _PLAN, see ingest_ratelimit)",
+    )
     parser.add_argument(
         "--sleep-sec",
         type=float,
-        default=0.0,
-        help="Sleep between HTTP calls (default 0)",
+        default=None,
+        help="Deprecated: at most one call per N seconds (same as --rate-per-min 60/N)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Products fetched concurrently (default {default_workers()} / "
+        "NUMERAIRE_INGEST_WORKERS)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        choices=CACHE_MODES,
+        default=None,
+        help="Response cache: on | off | refresh | record | offline (default "
+        "NUMERAIRE_HTTP_CACHE or on; see ingest_cache)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Fetch only; do not write DB")
     args = parser.parse_args()
@@ -303,6 +308,12 @@ def main() -> None:
         _die("POLYGON_API_KEY is not set (add to .env or export)")
 
     base_url = os.environ.get("POLYGON_BASE_URL", DEFAULT_POLYGON_BASE).strip() or DEFAULT_POLYGON_BASE
+    bucket = polygon_futures_bucket(args.rate_per_min, args.sleep_sec)
+    try:
+        cache = response_cache(args.http_cache)
+    except ValueError as e:
+        _die(str(e))
+    workers = default_workers() if args.workers is None else max(1, int(args.workers))
 
     type_raw = str(args.type).strip().lower()
     if type_raw in ("", "all", "*"):
@@ -318,9 +329,16 @@ def main() -> None:
     if not db_path.is_file():
         _die(f"database not found: {db_path}")
 
-    conn = sqlite3.connect(db_path)
+    client = IngestHttpClient(
+        user_agent="numeraire-fetch-futures-contracts/1.2",
+        timeout_sec=60.0,
+        workers=workers,
+        bucket=bucket,
+        cache=cache,
+    )
+    writes = WriteStats()
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         # Ensure futures_contract exists on DBs that predate this table.
         conn.executescript((REPO_ROOT / "sql" / "schema_v1.sql").read_text(encoding="utf-8"))
 
@@ -334,16 +352,16 @@ def main() -> None:
         print(
             f"fetching futures contracts from {base_url} "
             f"(as_of={as_of}, products={','.join(codes)}, type={product_type or 'all'}, "
-            f"active_only={not args.include_inactive})"
+            f"active_only={not args.include_inactive}, rate={bucket.describe()})"
         )
 
         ingested_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         all_rows: list[tuple[Any, ...]] = []
         counts: dict[str, int] = {}
 
-        for i, code in enumerate(codes):
-            print(f"  {code}:")
-            items = _fetch_contracts(
+        def fetch_product(code: str) -> list[dict[str, Any]]:
+            return _fetch_contracts(
+                client,
                 base_url,
                 api_key,
                 product_code=code,
@@ -351,8 +369,14 @@ def main() -> None:
                 active_only=not args.include_inactive,
                 product_type=product_type,
                 limit=max(1, min(int(args.limit), 1000)),
-                sleep_sec=max(0.0, float(args.sleep_sec)),
             )
+
+        for code, items, err in client.fan_out(fetch_product, codes):
+            if err is not None:
+                if not isinstance(err, RuntimeError):
+                    raise err
+                _die(str(err))
+            print(f"  {code}:")
             rows = [
                 r
                 for r in (
@@ -370,8 +394,6 @@ def main() -> None:
             all_rows.extend(rows)
             sample = [str(r[0]) for r in rows[:8]]
             print(f"    kept {len(rows)} contracts" + (f"  sample: {', '.join(sample)}" if sample else ""))
-            if args.sleep_sec > 0 and i + 1 < len(codes):
-                time.sleep(args.sleep_sec)
 
         if not all_rows:
             _die("no contracts returned for scope")
@@ -384,11 +406,14 @@ def main() -> None:
             print(f"dry-run: would upsert {len(all_rows)} futures_contract rows")
             return
 
-        n = _upsert_contracts(conn, all_rows)
+        n = _upsert_contracts(conn, all_rows, writes)
     finally:
+        client.close()
         conn.close()
 
     print(f"ok: upserted {n} futures_contract rows @ {as_of} -> {db_path}")
+    print(client.stats_line())
+    print(writes.line())
 
 
 if __name__ == "__main__":
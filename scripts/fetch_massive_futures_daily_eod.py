@@ -10,11 +10,23 @@ Sources:
              including official `settlement_price` when published). Preferred for T-1 risk.
   snapshot — `GET /futures/v1/snapshot` (current delayed session). Good for live marks;
              `previous_settlement` is often 0, so it is *not* a historical settle API.
+             Tickers are sent as `ticker.any_of` batches whose size adapts to observed
+             latency and errors; tickers the snapshot does not cover fall back to
+             single-ticker aggs calls (concurrently; `--no-fallback` to skip).
 
 Massive session note (aggs): a session that settles on date D opens the evening before,
 so we query `window_start=D-1` to obtain the bar with `session_end_date=D`.
 
-Requires: POLYGON_API_KEY. Default sleep 0 (Futures Starter+); set sleep for basic tier.
+Requires: POLYGON_API_KEY. Unthrottled by default (Futures Starter+); set `--rate-per-min`
+or NUMERAIRE_POLYGON_FUTURES_PLAN=basic for the basic tier.
+HTTP goes through `ingest_http.IngestHttpClient` (keep-alive pool); `--workers` tickers /
+snapshot batches are fetched concurrently under one shared rate limit (`ingest_ratelimit`).
+
+Incremental: tickers that already have a settled aggs bar for as_of (`settlement_price` not
+NULL, `source='massive'`) are skipped before any request, so cron reruns cost no API quota.
+Missing and provisional (unsettled) bars are still fetched, and so are snapshot rows: they
+are stored as `source='massive_snapshot'` and never count as settled, even when
+`previous_settlement` filled their settle. `--force` refetches everything.
 
 Examples:
   # Official settle for risk T-1 (use listing strip from the next calendar day if needed)
@@ -23,29 +35,35 @@ Examples:
 
   python3 scripts/fetch_massive_futures_daily_eod.py --as-of 2026-08-12 --source snapshot
   python3 scripts/fetch_massive_futures_daily_eod.py --as-of 2026-08-11 --product-code CL --dry-run
+  python3 scripts/fetch_massive_futures_daily_eod.py --as-of 2026-08-11 --force   # refetch settled
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sqlite3
 import sys
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from ingest_cache import CACHE_MODES, response_cache
+from ingest_http import IngestHttpClient, default_workers
+from ingest_ratelimit import polygon_futures_bucket
+from ingest_sqlite import WriteStats, bulk_write, bump_data_generation, connect_writer
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_POLYGON_BASE = "https://api.polygon.io"
 SOURCE = "massive"
-DEFAULT_SLEEP_SEC = 0.0
-SNAPSHOT_TICKER_BATCH = 40
+# Snapshot-path rows: marks, never final, even when previous_settlement filled the settle.
+SNAPSHOT_SOURCE = "massive_snapshot"
+SNAPSHOT_TICKER_BATCH = 40  # first batch size; tuned per run by SnapshotBatchTuner
+SNAPSHOT_BATCH_MIN = 5
+SNAPSHOT_BATCH_MAX = 250  # vendor page limit: a larger `ticker.any_of` would paginate
+SNAPSHOT_TARGET_SEC = 3.0
 
 
 def _load_dotenv(path: Path) -> None:
@@ -85,36 +103,6 @@ def _url_with_api_key(url: str, api_key: str) -> str:
     return f"{url}{sep}apiKey={urllib.parse.quote(api_key)}"
 
 
-def _http_get_json(url: str, timeout_sec: float = 60.0) -> Mapping[str, Any]:
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "numeraire-fetch-futures-daily-eod/1.1", "Accept": "application/json"},
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout_sec) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:800]
-        raise RuntimeError(f"HTTP {e.code} for {url.split('?', 1)[0]}: {body}") from e
-    except urllib.error.URLError as e:
-        raise RuntimeError(f"request failed: {e}") from e
-
-
-def _default_sleep_sec() -> float:
-    for env in (
-        "NUMERAIRE_POLYGON_FUTURES_SLEEP_SEC",
-        "NUMERAIRE_POLYGON_EQUITY_SLEEP_SEC",
-        "NUMERAIRE_POLYGON_SLEEP_SEC_AFTER_CALL",
-    ):
-        raw = os.environ.get(env, "").strip()
-        if raw:
-            try:
-                return max(0.0, float(raw))
-            except ValueError:
-                continue
-    return DEFAULT_SLEEP_SEC
-
-
 def _session_window_start(as_of: str) -> str:
     """Session settling on as_of starts the prior calendar day (Massive docs)."""
     d = date.fromisoformat(as_of)
@@ -148,6 +136,30 @@ def _load_tickers(
     return rows
 
 
+def _settled_tickers(
+    conn: sqlite3.Connection,
+    tickers: Sequence[tuple[str, str]],
+    *,
+    as_of: str,
+    timespan: str = "1session",
+) -> set[str]:
+    """Tickers whose as_of aggs bar already carries a settle (final, not re-fetched).
+
+    A bar without `settlement_price` is provisional (settle not yet published) and stays in
+    the fetch list, as does any snapshot row (`SNAPSHOT_SOURCE`) whatever its settle.
+    """
+    wanted = {t for t, _ in tickers}
+    rows = conn.execute(
+        """
+        SELECT ticker
+        FROM futures_daily_eod
+        WHERE as_of = ? AND timespan = ? AND source = ? AND settlement_price IS NOT NULL
+        """,
+        (as_of, timespan, SOURCE),
+    )
+    return {str(r[0]) for r in rows if str(r[0]) in wanted}
+
+
 def _ns_to_ms(value: Any) -> int | None:
     if value is None:
         return None
@@ -181,6 +193,7 @@ def _bar_to_row(
     expected_as_of: str,
     ingested_at: str,
     timespan: str = "1session",
+    source: str = SOURCE,
 ) -> tuple[Any, ...] | None:
     session_end = str(bar.get("session_end_date") or "")
     if session_end and session_end != expected_as_of:
@@ -221,7 +234,7 @@ def _bar_to_row(
         dollar_f,
         vwap,
         trade_count,
-        SOURCE,
+        source,
         timespan,
         _ns_to_ms(bar.get("window_start")),
         ingested_at,
@@ -288,6 +301,7 @@ def _result_ticker(row: Mapping[str, Any]) -> str:
 
 
 def _fetch_session_bar(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     ticker: str,
@@ -304,7 +318,7 @@ def _fetch_session_bar(
     )
     path = f"/futures/v1/aggs/{urllib.parse.quote(ticker)}"
     url = _url_with_api_key(f"{base_url.rstrip('/')}{path}?{params}", api_key)
-    payload = _http_get_json(url)
+    payload = client.get_json(url)
     results = payload.get("results") or []
     if not isinstance(results, list) or not results:
         return None
@@ -315,46 +329,123 @@ def _fetch_session_bar(
     return first if isinstance(first, dict) else None
 
 
+class SnapshotBatchTuner:
+    """Adaptive `ticker.any_of` batch size from each round's latency and error rate.
+
+    Grows (x2) while every batch in a round is clean and under half the target latency,
+    shrinks (x0.75) when the slowest batch exceeds the target, halves on any failed batch.
+    A failure also caps later growth at the halved size, so a size the vendor rejects (too
+    long a query, a timeout) is not retried every other round.
+    """
+
+    def __init__(
+        self,
+        size: int = SNAPSHOT_TICKER_BATCH,
+        *,
+        lo: int = SNAPSHOT_BATCH_MIN,
+        hi: int = SNAPSHOT_BATCH_MAX,
+        target_sec: float = SNAPSHOT_TARGET_SEC,
+    ) -> None:
+        self.lo = max(1, lo)
+        self.hi = max(self.lo, hi)
+        self.size = min(self.hi, max(self.lo, size))
+        self.target_sec = target_sec
+        self.history = [self.size]
+        self.requests = 0
+        self.failed = 0
+
+    def observe(self, latencies: Sequence[float], failed: int) -> None:
+        """Feed one round: latencies of the successful batches, count of failed ones."""
+        self.requests += len(latencies) + failed
+        self.failed += failed
+        if failed:
+            size = self.size // 2
+            self.hi = max(self.lo, size)
+        elif latencies and max(latencies) > self.target_sec:
+            size = int(self.size * 0.75)
+        elif latencies and max(latencies) < self.target_sec / 2:
+            size = self.size * 2
+        else:
+            size = self.size
+        size = min(self.hi, max(self.lo, size))
+        if size != self.size:
+            self.size = size
+            self.history.append(size)
+
+    def line(self) -> str:
+        sizes = "->".join(str(s) for s in self.history)
+        return f"snapshot: requests={self.requests} failed={self.failed} batch_size={sizes}"
+
+
 def _fetch_snapshots_for_tickers(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     tickers: Sequence[str],
-    *,
-    sleep_sec: float,
-) -> dict[str, Mapping[str, Any]]:
-    """Batch `ticker.any_of` snapshot calls; return map ticker -> result row."""
+    tuner: SnapshotBatchTuner,
+) -> tuple[dict[str, Mapping[str, Any]], list[str]]:
+    """Snapshot rows by ticker, plus the tickers whose batches failed at the minimum size.
+
+    Each round sends up to `workers` batches of the tuner's current size concurrently. Tickers
+    of a failed batch are re-queued and retried at the (now smaller) size.
+    """
     out: dict[str, Mapping[str, Any]] = {}
+    failed: list[str] = []
+    pending = list(tickers)
     root = base_url.rstrip("/")
-    batches = [
-        list(tickers[i : i + SNAPSHOT_TICKER_BATCH])
-        for i in range(0, len(tickers), SNAPSHOT_TICKER_BATCH)
-    ]
-    for bi, batch in enumerate(batches, start=1):
+
+    def fetch_batch(batch: list[str]) -> tuple[Mapping[str, Any], float]:
         params = urllib.parse.urlencode(
             {
                 "ticker.any_of": ",".join(batch),
                 "limit": str(max(len(batch), 100)),
             }
         )
+        t0 = time.monotonic()
         url = _url_with_api_key(f"{root}/futures/v1/snapshot?{params}", api_key)
-        payload = _http_get_json(url)
-        results = payload.get("results") or []
-        got = 0
-        if isinstance(results, list):
-            for row in results:
-                if not isinstance(row, dict):
-                    continue
-                t = _result_ticker(row)
-                if t:
-                    out[t] = row
-                    got += 1
-        print(f"  snapshot batch {bi}/{len(batches)}: asked={len(batch)} got={got}")
-        if sleep_sec > 0 and bi < len(batches):
-            time.sleep(sleep_sec)
-    return out
-
-
-def _upsert_bars(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> int:
+        payload = client.get_json(url)
+        return payload, time.monotonic() - t0
+
+    bi = 0
+    while pending:
+        size = tuner.size
+        take = size * max(1, client.workers)
+        batches = [pending[i : i + size] for i in range(0, min(len(pending), take), size)]
+        pending = pending[take:]
+        latencies: list[float] = []
+        retry: list[str] = []
+        failed_batches = 0
+        for batch, result, err in client.fan_out(fetch_batch, batches):
+            bi += 1
+            if err is not None:
+                if not isinstance(err, RuntimeError):
+                    raise err
+                failed_batches += 1
+                (retry if len(batch) > tuner.lo else failed).extend(batch)
+                print(f"  snapshot batch {bi}: asked={len(batch)} FAILED ({err})", file=sys.stderr)
+                continue
+            assert result is not None
+            payload, seconds = result
+            latencies.append(seconds)
+            results = payload.get("results") or []
+            got = 0
+            if isinstance(results, list):
+                for row in results:
+                    if not isinstance(row, dict):
+                        continue
+                    t = _result_ticker(row)
+                    if t:
+                        out[t] = row
+                        got += 1
+            print(f"  snapshot batch {bi}: asked={len(batch)} got={got} in {seconds:.2f}s")
+        tuner.observe(latencies, failed_batches)
+        pending = retry + pending
+    return out, failed
+
+
+def _upsert_bars(
+    conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]], stats: WriteStats | None = None
+) -> int:
     sql = """
         INSERT INTO futures_daily_eod (
             ticker, product_code, as_of, session_calendar, open, high, low, close,
@@ -378,11 +469,9 @@ def _upsert_bars(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> i
             provider_timestamp_utc_ms = excluded.provider_timestamp_utc_ms,
             ingested_at = excluded.ingested_at
     """
-    cur = conn.cursor()
-    for row in rows:
-        cur.execute(sql, row)
-    conn.commit()
-    return len(rows)
+    if rows:
+        bump_data_generation(conn, "futures_daily_eod", commit=False)
+    return bulk_write(conn, sql, rows, stats=stats)
 
 
 def main() -> None:
@@ -419,11 +508,18 @@ def main() -> None:
         default=os.environ.get("NUMERAIRE_DB_PATH", "db.sqlite3"),
         help="SQLite path (default: NUMERAIRE_DB_PATH or db.sqlite3)",
     )
+    parser.add_argument(
+        "--rate-per-min",
+        type=float,
+        default=None,
+        help="Max HTTP calls per minute across all workers (0 = unlimited; default from "
+        "NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN / _PLAN, see ingest_ratelimit)",
+    )
     parser.add_argument(
         "--sleep-sec",
         type=float,
         default=None,
-        help=f"Sleep after each HTTP call (default {_default_sleep_sec()} / env)",
+        help="Deprecated: at most one call per N seconds (same as --rate-per-min 60/N)",
     )
     parser.add_argument(
         "--max-contracts",
@@ -436,12 +532,42 @@ def main() -> None:
         action="store_true",
         help="Also fetch inactive contracts from futures_contract",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Concurrent HTTP calls (default {default_workers()} / NUMERAIRE_INGEST_WORKERS)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        choices=CACHE_MODES,
+        default=None,
+        help="Response cache: on | off | refresh | record | offline (default "
+        "NUMERAIRE_HTTP_CACHE or on; see ingest_cache)",
+    )
+    parser.add_argument(
+        "--snapshot-batch",
+        type=int,
+        default=SNAPSHOT_TICKER_BATCH,
+        help=f"Snapshot only: first `ticker.any_of` batch size, then tuned from latency / errors "
+        f"({SNAPSHOT_BATCH_MIN}..{SNAPSHOT_BATCH_MAX}; default {SNAPSHOT_TICKER_BATCH})",
+    )
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="Snapshot only: do not fetch single-ticker aggs bars for tickers the snapshot missed",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Refetch tickers that already have a settled bar for --as-of (default: skip them)",
+    )
     parser.add_argument("--dry-run", action="store_true", help="List tickers only")
     parser.add_argument(
         "--commit-every",
         type=int,
-        default=50,
-        help="Commit DB every N successful bars (default 50)",
+        default=500,
+        help="Write bars in batches of N (one executemany + commit per batch; default 500)",
     )
     args = parser.parse_args()
 
@@ -452,7 +578,12 @@ def main() -> None:
         _die("POLYGON_API_KEY is not set (add to .env or export)")
 
     base_url = os.environ.get("POLYGON_BASE_URL", DEFAULT_POLYGON_BASE).strip() or DEFAULT_POLYGON_BASE
-    sleep_sec = _default_sleep_sec() if args.sleep_sec is None else max(0.0, float(args.sleep_sec))
+    bucket = polygon_futures_bucket(args.rate_per_min, args.sleep_sec)
+    try:
+        cache = response_cache(args.http_cache)
+    except ValueError as e:
+        _die(str(e))
+    workers = default_workers() if args.workers is None else max(1, int(args.workers))
     product_codes = _split_csv(args.product_code) if args.product_code.strip() else None
     max_contracts = int(args.max_contracts) if int(args.max_contracts) > 0 else None
 
@@ -471,9 +602,16 @@ def main() -> None:
             file=sys.stderr,
         )
 
-    conn = sqlite3.connect(db_path)
+    client = IngestHttpClient(
+        user_agent="numeraire-fetch-futures-daily-eod/1.3",
+        timeout_sec=60.0,
+        workers=workers,
+        bucket=bucket,
+        cache=cache,
+    )
+    writes = WriteStats()
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         conn.executescript((REPO_ROOT / "sql" / "schema_v1.sql").read_text(encoding="utf-8"))
 
         tickers = _load_tickers(
@@ -489,11 +627,23 @@ def main() -> None:
                 f"(run fetch_massive_futures_contracts.py first)"
             )
 
+        settled = set() if args.force else _settled_tickers(conn, tickers, as_of=as_of)
+        if settled:
+            tickers = [(t, p) for t, p in tickers if t not in settled]
+            print(
+                f"skipping {len(settled)} contracts already settled for as_of={as_of} "
+                f"(--force to refetch)"
+            )
+        if not tickers:
+            print(f"ok: nothing to fetch for as_of={as_of} (all {len(settled)} contracts settled)")
+            return
+
         window_start = _session_window_start(as_of)
         print(
             f"fetching futures marks from {base_url} "
             f"(source={args.source}, as_of={as_of}, listing_as_of={listing_as_of}, "
-            f"window_start={window_start}, contracts={len(tickers)}, sleep_sec={sleep_sec})"
+            f"window_start={window_start}, contracts={len(tickers)}, rate={bucket.describe()}, "
+            f"workers={workers})"
         )
         if args.dry_run:
             for t, p in tickers[:20]:
@@ -509,102 +659,94 @@ def main() -> None:
         errors = 0
         with_settle = 0
         by_product: dict[str, int] = {}
-
+        by_origin = {"snapshot": 0, "single_bar": 0}
+        n = len(tickers)
+
+        def keep(
+            i: int, ticker: str, product_code: str, bar: Mapping[str, Any], origin: str
+        ) -> bool:
+            nonlocal with_settle
+            row = _bar_to_row(
+                bar,
+                ticker=ticker,
+                product_code=product_code,
+                expected_as_of=as_of,
+                ingested_at=ingested_at,
+                source=SNAPSHOT_SOURCE if origin == "snapshot" else SOURCE,
+            )
+            if row is None:
+                print(f"  [{i}/{n}] {ticker}: bar skipped (bad/mismatch)")
+                return False
+            ok_rows.append(row)
+            by_product[product_code] = by_product.get(product_code, 0) + 1
+            by_origin[origin] += 1
+            if row[8] is not None:
+                with_settle += 1
+            settle = row[8]
+            settle_s = f"{settle:.4f}" if isinstance(settle, float) else "n/a"
+            print(f"  [{i}/{n}] {ticker}: close={row[7]:.4f} settle={settle_s} vol={row[10]}")
+            if len(ok_rows) >= max(1, int(args.commit_every)):
+                _upsert_bars(conn, ok_rows, writes)
+                ok_rows.clear()
+            return True
+
+        def fetch_bar(item: tuple[int, str, str]) -> Mapping[str, Any] | None:
+            return _fetch_session_bar(client, base_url, api_key, item[1], as_of=as_of)
+
+        # (position, ticker, product_code) still needing a single-ticker aggs call.
+        single: list[tuple[int, str, str]] = []
+        tuner: SnapshotBatchTuner | None = None
         if args.source == "snapshot":
+            tuner = SnapshotBatchTuner(args.snapshot_batch)
             try:
-                snaps = _fetch_snapshots_for_tickers(
+                snaps, failed = _fetch_snapshots_for_tickers(
+                    client,
                     base_url,
                     api_key,
                     [t for t, _ in tickers],
-                    sleep_sec=sleep_sec,
+                    tuner,
                 )
             except RuntimeError as e:
                 _die(str(e))
+            if failed:
+                print(f"  snapshot: {len(failed)} tickers in failed batches", file=sys.stderr)
 
             for i, (ticker, product_code) in enumerate(tickers, start=1):
                 snap = snaps.get(ticker)
-                if snap is None:
-                    missing += 1
-                    print(f"  [{i}/{len(tickers)}] {ticker}: no snapshot")
-                    continue
-                bar = _snapshot_to_bar(
-                    snap,
-                    expected_as_of=as_of,
-                    settle_field=args.settle_field,
-                )
-                if bar is None:
-                    missing += 1
-                    print(f"  [{i}/{len(tickers)}] {ticker}: snapshot skipped (no OHLC/settle)")
-                    continue
-                row = _bar_to_row(
-                    bar,
-                    ticker=ticker,
-                    product_code=product_code,
-                    expected_as_of=as_of,
-                    ingested_at=ingested_at,
-                )
-                if row is None:
-                    missing += 1
-                    print(f"  [{i}/{len(tickers)}] {ticker}: bar skipped (bad/mismatch)")
-                    continue
-                ok_rows.append(row)
-                by_product[product_code] = by_product.get(product_code, 0) + 1
-                if row[8] is not None:
-                    with_settle += 1
-                settle = row[8]
-                settle_s = f"{settle:.4f}" if isinstance(settle, float) else "n/a"
-                print(
-                    f"  [{i}/{len(tickers)}] {ticker}: close={row[7]:.4f} "
-                    f"settle={settle_s} vol={row[10]}"
-                )
-                if len(ok_rows) >= max(1, int(args.commit_every)):
-                    _upsert_bars(conn, ok_rows)
-                    ok_rows.clear()
-        else:
-            for i, (ticker, product_code) in enumerate(tickers, start=1):
-                try:
-                    bar = _fetch_session_bar(base_url, api_key, ticker, as_of=as_of)
-                except RuntimeError as e:
-                    errors += 1
-                    print(f"  [{i}/{len(tickers)}] {ticker}: ERROR {e}", file=sys.stderr)
-                    if sleep_sec > 0:
-                        time.sleep(sleep_sec)
+                bar = None
+                if snap is not None:
+                    bar = _snapshot_to_bar(
+                        snap,
+                        expected_as_of=as_of,
+                        settle_field=args.settle_field,
+                    )
+                if bar is not None and keep(i, ticker, product_code, bar, "snapshot"):
                     continue
-
-                if bar is None:
+                if args.no_fallback:
                     missing += 1
-                    print(f"  [{i}/{len(tickers)}] {ticker}: no bar")
+                    why = "no snapshot" if snap is None else "snapshot skipped (no OHLC/settle)"
+                    print(f"  [{i}/{n}] {ticker}: {why}")
                 else:
-                    row = _bar_to_row(
-                        bar,
-                        ticker=ticker,
-                        product_code=product_code,
-                        expected_as_of=as_of,
-                        ingested_at=ingested_at,
-                    )
-                    if row is None:
-                        missing += 1
-                        print(f"  [{i}/{len(tickers)}] {ticker}: bar skipped (bad/mismatch)")
-                    else:
-                        ok_rows.append(row)
-                        by_product[product_code] = by_product.get(product_code, 0) + 1
-                        if row[8] is not None:
-                            with_settle += 1
-                        settle = row[8]
-                        settle_s = f"{settle:.4f}" if isinstance(settle, float) else "n/a"
-                        print(
-                            f"  [{i}/{len(tickers)}] {ticker}: close={row[7]:.4f} "
-                            f"settle={settle_s} vol={row[10]}"
-                        )
-                        if len(ok_rows) >= max(1, int(args.commit_every)):
-                            _upsert_bars(conn, ok_rows)
-                            ok_rows.clear()
-
-                if sleep_sec > 0 and i < len(tickers):
-                    time.sleep(sleep_sec)
+                    single.append((i, ticker, product_code))
+            if single:
+                print(f"  falling back to single-ticker aggs for {len(single)} tickers")
+        else:
+            single = [(i, t, p) for i, (t, p) in enumerate(tickers, start=1)]
+
+        for (i, ticker, product_code), bar, err in client.fan_out(fetch_bar, single):
+            if err is not None:
+                if not isinstance(err, RuntimeError):
+                    raise err
+                errors += 1
+                print(f"  [{i}/{n}] {ticker}: ERROR {err}", file=sys.stderr)
+            elif bar is None:
+                missing += 1
+                print(f"  [{i}/{n}] {ticker}: no bar")
+            elif not keep(i, ticker, product_code, bar, "single_bar"):
+                missing += 1
 
         if ok_rows:
-            _upsert_bars(conn, ok_rows)
+            _upsert_bars(conn, ok_rows, writes)
 
         print("summary by product:")
         for code in sorted(by_product):
@@ -612,9 +754,15 @@ def main() -> None:
         print(
             f"ok: wrote bars for as_of={as_of} source={args.source} -> {db_path} "
             f"(ok={sum(by_product.values())}, with_settle={with_settle}, "
-            f"missing={missing}, errors={errors})"
+            f"missing={missing}, errors={errors}, skipped_settled={len(settled)})"
         )
+        print(f"sources: snapshot={by_origin['snapshot']} single_bar={by_origin['single_bar']}")
+        if tuner is not None:
+            print(tuner.line())
+        print(client.stats_line())
+        print(writes.line())
     finally:
+        client.close()
         conn.close()
 
 
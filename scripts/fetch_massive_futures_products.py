@@ -11,6 +11,9 @@ futures, no combo products).
 
 Requires: POLYGON_API_KEY in environment or repo-root `.env`.
 Optional: POLYGON_BASE_URL (default https://api.polygon.io; also https://api.massive.com).
+Throttled by the shared Massive futures rate limit (`--rate-per-min`, `ingest_ratelimit`).
+Pages are cached on disk for a week (`--http-cache`, `ingest_cache`); reruns revalidate
+with a conditional GET instead of re-downloading the catalogue.
 
 Examples:
   python3 scripts/fetch_massive_futures_products.py --dry-run
@@ -21,18 +24,19 @@ Examples:
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sqlite3
 import sys
-import time
-import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
+from ingest_cache import CACHE_MODES, response_cache
+from ingest_http import IngestHttpClient, IngestHttpError
+from ingest_ratelimit import polygon_futures_bucket
+from ingest_sqlite import WriteStats, bulk_write, connect_writer
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_POLYGON_BASE = "https://api.polygon.io"
@@ -69,23 +73,8 @@ def _url_with_api_key(url: str, api_key: str) -> str:
     return f"{url}{sep}apiKey={urllib.parse.quote(api_key)}"
 
 
-def _http_get_json(url: str, timeout_sec: float = 60.0) -> Mapping[str, Any]:
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "numeraire-fetch-futures-products/1.0", "Accept": "application/json"},
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout_sec) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:800]
-        _die(f"HTTP {e.code} for {url.split('?', 1)[0]}: {body}")
-    except urllib.error.URLError as e:
-        _die(f"request failed: {e}")
-    return {}
-
-
 def _fetch_products(
+    client: IngestHttpClient,
     base_url: str,
     api_key: str,
     *,
@@ -93,7 +82,6 @@ def _fetch_products(
     product_type: str | None,
     as_of: str | None,
     limit: int,
-    sleep_sec: float,
 ) -> list[dict[str, Any]]:
     params: dict[str, str] = {
         "limit": str(limit),
@@ -116,7 +104,10 @@ def _fetch_products(
     page = 0
     while url:
         page += 1
-        payload = _http_get_json(url)
+        try:
+            payload = client.get_json(url)
+        except IngestHttpError as e:
+            _die(str(e))
         results = payload.get("results") or []
         if not isinstance(results, list):
             _die(f"unexpected results type on page {page}")
@@ -128,8 +119,6 @@ def _fetch_products(
         if not next_url:
             break
         url = _url_with_api_key(str(next_url), api_key)
-        if sleep_sec > 0:
-            time.sleep(sleep_sec)
     return out
 
 
@@ -182,7 +171,11 @@ def _row_from_api(item: Mapping[str, Any], ingested_at: str) -> tuple[Any, ...]
     )
 
 
-def _upsert_products(conn: sqlite3.Connection, rows: Iterable[tuple[Any, ...]]) -> int:
+def _upsert_products(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple[Any, ...]],
+    stats: WriteStats | None = None,
+) -> int:
     sql = """
         INSERT INTO futures_product (
             product_code, name, asset_class, asset_sub_class, sector, sub_sector,
@@ -210,13 +203,7 @@ def _upsert_products(conn: sqlite3.Connection, rows: Iterable[tuple[Any, ...]])
             source = excluded.source,
             ingested_at = excluded.ingested_at
     """
-    cur = conn.cursor()
-    n = 0
-    for row in rows:
-        cur.execute(sql, row)
-        n += 1
-    conn.commit()
-    return n
+    return bulk_write(conn, sql, rows, stats=stats)
 
 
 def _summarize(items: Sequence[Mapping[str, Any]]) -> None:
@@ -265,11 +252,25 @@ def main() -> None:
         help="SQLite path (default: NUMERAIRE_DB_PATH or db.sqlite3)",
     )
     parser.add_argument("--limit", type=int, default=1000, help="Page size (max 50000)")
+    parser.add_argument(
+        "--rate-per-min",
+        type=float,
+        default=None,
+        help="Max HTTP calls per minute across all workers (0 = unlimited; default from "
+        "NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN / _PLAN, see ingest_ratelimit)",
+    )
     parser.add_argument(
         "--sleep-sec",
         type=float,
-        default=0.0,
-        help="Sleep between paginated HTTP calls (default 0)",
+        default=None,
+        help="Deprecated: at most one call per N seconds (same as --rate-per-min 60/N)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        choices=CACHE_MODES,
+        default=None,
+        help="Response cache: on | off | refresh | record | offline (default "
+        "NUMERAIRE_HTTP_CACHE or on; see ingest_cache)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Fetch only; do not write DB")
     args = parser.parse_args()
@@ -302,19 +303,31 @@ def main() -> None:
             _die(f"--as-of must be YYYY-MM-DD, got {args.as_of!r}")
         as_of = args.as_of.strip()
 
+    bucket = polygon_futures_bucket(args.rate_per_min, args.sleep_sec)
+    try:
+        cache = response_cache(args.http_cache)
+    except ValueError as e:
+        _die(str(e))
     print(
         f"fetching futures products from {base_url} "
-        f"(asset_sub_class={','.join(sub_classes)}, type={product_type or 'all'}, date={as_of})"
-    )
-    items = _fetch_products(
-        base_url,
-        api_key,
-        asset_sub_classes=sub_classes,
-        product_type=product_type,
-        as_of=as_of,
-        limit=max(1, min(int(args.limit), 50000)),
-        sleep_sec=max(0.0, float(args.sleep_sec)),
+        f"(asset_sub_class={','.join(sub_classes)}, type={product_type or 'all'}, date={as_of}, "
+        f"rate={bucket.describe()})"
     )
+    # Catalogue pages chain through next_url, so there is nothing to parallelise; the pooled
+    # client still reuses one keep-alive connection across pages.
+    with IngestHttpClient(
+        user_agent="numeraire-fetch-futures-products/1.2", workers=1, bucket=bucket, cache=cache
+    ) as client:
+        items = _fetch_products(
+            client,
+            base_url,
+            api_key,
+            asset_sub_classes=sub_classes,
+            product_type=product_type,
+            as_of=as_of,
+            limit=max(1, min(int(args.limit), 50000)),
+        )
+        print(client.stats_line())
     if not items:
         _die("no products returned (check plan access / filters)")
 
@@ -338,17 +351,18 @@ def main() -> None:
     if not db_path.is_file():
         _die(f"database not found: {db_path} (apply sql/schema_v1.sql or run dev_main bootstrap)")
 
-    conn = sqlite3.connect(db_path)
+    writes = WriteStats()
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         # Ensure table exists on DBs that predate this catalog.
         schema = (REPO_ROOT / "sql" / "schema_v1.sql").read_text(encoding="utf-8")
         conn.executescript(schema)
-        n = _upsert_products(conn, rows)
+        n = _upsert_products(conn, rows, writes)
     finally:
         conn.close()
 
     print(f"ok: upserted {n} futures_product rows -> {db_path}")
+    print(writes.line())
 
 
 if __name__ == "__main__":
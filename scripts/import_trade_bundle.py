@@ -20,22 +20,38 @@ Examples:
 
   # Jawna lista plików
   python3 scripts/import_trade_bundle.py trades/incoming/a.json trades/incoming/b.json --db db.sqlite3
+
+  # Bulk (migrated book): validate in parallel worker processes, one writer, large transactions
+  python3 scripts/import_trade_bundle.py --bulk --incoming-dir migrated/ --db db.sqlite3
+  python3 scripts/import_trade_bundle.py --jsonl migrated_book.jsonl --workers 8 --db db.sqlite3
+
+Bulk mode prints one OK / SKIP / FAIL line per trade and exits 1 if any bundle FAILed;
+the valid ones are still imported. Per-bundle auto-fill notes are not printed there.
 """
 
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import os
 import re
 import sqlite3
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Iterator, Mapping
+
+from ingest_sqlite import WriteStats, connect_writer
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_INCOMING_DIR = _REPO_ROOT / "trades" / "incoming"
 _TRADE_ID_RE = re.compile(r"^TRD_[A-Za-z0-9_]+$")
+BULK_BATCH_SIZE = 500  # bundles per write transaction in bulk mode
+BULK_INLINE_MAX = 32  # below this, worker start-up costs more than parallel validation saves
 
 REQUIRED_PRODUCT_KEYS = (
     "product_id",
@@ -281,7 +297,14 @@ def load_bundle(
         _die(f"cannot read {path}: {e}")
     except json.JSONDecodeError as e:
         _die(f"invalid JSON in {path}: {e}")
+    return parse_bundle(data, path.name)
 
+
+def parse_bundle(
+    data: Any,
+    name: str,
+) -> tuple[Mapping[str, Any], str, Mapping[str, Any], Mapping[str, Any], list[str]]:
+    """Split and normalize one decoded bundle (`name` labels errors: file or file:line)."""
     root = _require_mapping(data, "root")
     product = dict(_require_mapping(root.get("product"), "product"))
     trade = dict(_require_mapping(root.get("trade"), "trade"))
@@ -289,7 +312,7 @@ def load_bundle(
     has_equity = "equity" in root and root.get("equity") is not None
     has_commodity = "commodity" in root and root.get("commodity") is not None
     if has_equity == has_commodity:
-        _die(f"{path.name}: bundle must contain exactly one of 'equity' or 'commodity'")
+        _die(f"{name}: bundle must contain exactly one of 'equity' or 'commodity'")
 
     if has_commodity:
         extension_label = "commodity"
@@ -432,13 +455,27 @@ def _parse_commission(lg: Mapping[str, Any], quantity: float, leg_id: str) -> fl
     return commission
 
 
-def insert_bundle(
-    conn: sqlite3.Connection,
+@dataclass
+class PreparedBundle:
+    """One validated bundle as ready-to-insert rows (no DB access; picklable for workers)."""
+
+    trade_id: str
+    product_id: str
+    extension_label: str
+    product_row: tuple[Any, ...]
+    extension_row: tuple[Any, ...]
+    trade_row: tuple[Any, ...]
+    leg_rows: list[tuple[Any, ...]]
+    notes: list[str] = field(default_factory=list)
+
+
+def prepare_bundle(
     product: Mapping[str, Any],
     extension_label: str,
     extension: Mapping[str, Any],
     trade: Mapping[str, Any],
-) -> None:
+) -> PreparedBundle:
+    """Validate a loaded bundle and build its rows; exits via `_die` on the first error."""
     pid = product["product_id"]
     instrument_type = extension.get("instrument_type", "plain_vanilla_european_option")
     structured_params = _structured_params_to_text(
@@ -503,25 +540,16 @@ def insert_bundle(
 
     settlement = _parse_settlement(product.get("settlement", None), "product")
 
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT OR IGNORE INTO products (
-            product_id, asset_kind, underlying_id, expiry_date,
-            settlement, currency, contract_size, day_count, calendar
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            pid,
-            asset_kind,
-            str(product["underlying_id"]),
-            expiry_date,
-            settlement,
-            currency,
-            contract_size,
-            str(product["day_count"]),
-            str(product["calendar"]),
-        ),
+    product_row = (
+        pid,
+        asset_kind,
+        str(product["underlying_id"]),
+        expiry_date,
+        settlement,
+        currency,
+        contract_size,
+        str(product["day_count"]),
+        str(product["calendar"]),
     )
 
     if is_commodity:
@@ -542,84 +570,42 @@ def insert_bundle(
             except (TypeError, ValueError):
                 _die(f"commodity.{key}: expected number or null, got {raw!r}")
 
-        cur.execute(
-            """
-            INSERT OR IGNORE INTO products_commodity (
-                product_id, instrument_type, product_code, contract_ticker, contract_month,
-                settlement_date, multiplier, tick_size, tick_value, option_type, strike,
-                exercise_style, option_ticker, underlying_contract_ticker, structured_params
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                pid,
-                str(instrument_type),
-                product_code,
-                contract_ticker,
-                _optional_str(extension, "contract_month"),
-                _optional_str(extension, "settlement_date") or expiry_date,
-                _opt_float("multiplier"),
-                _opt_float("tick_size"),
-                _opt_float("tick_value"),
-                option_type,
-                strike,
-                exercise_style,
-                _optional_str(extension, "option_ticker"),
-                _optional_str(extension, "underlying_contract_ticker"),
-                structured_params,
-            ),
+        extension_row: tuple[Any, ...] = (
+            pid,
+            str(instrument_type),
+            product_code,
+            contract_ticker,
+            _optional_str(extension, "contract_month"),
+            _optional_str(extension, "settlement_date") or expiry_date,
+            _opt_float("multiplier"),
+            _opt_float("tick_size"),
+            _opt_float("tick_value"),
+            option_type,
+            strike,
+            exercise_style,
+            _optional_str(extension, "option_ticker"),
+            _optional_str(extension, "underlying_contract_ticker"),
+            structured_params,
         )
     else:
-        cur.execute(
-            """
-            INSERT OR IGNORE INTO products_equity (
-                product_id, option_type, strike,
-                instrument_type, exercise_style, structured_params
-            ) VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (pid, option_type, strike, str(instrument_type), str(exercise_style), structured_params),
+        extension_row = (
+            pid, option_type, strike, str(instrument_type), str(exercise_style), structured_params
         )
 
     tid = str(trade["trade_id"])
-    booking_timestamp = _optional_str(trade, "booking_timestamp")
-    updated_at = _optional_str(trade, "updated_at")
-    if updated_at is None:
-        cur.execute(
-            """
-            INSERT INTO trades (
-                trade_id, portfolio_id, strategy_type,
-                booking_timestamp, trade_date, updated_at, status
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), ?)
-            """,
-            (
-                tid,
-                str(trade["portfolio_id"]),
-                str(trade["strategy_type"]),
-                booking_timestamp,
-                trade_date,
-                str(trade["status"]),
-            ),
-        )
-    else:
-        cur.execute(
-            """
-            INSERT INTO trades (
-                trade_id, portfolio_id, strategy_type,
-                booking_timestamp, trade_date, updated_at, status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                tid,
-                str(trade["portfolio_id"]),
-                str(trade["strategy_type"]),
-                booking_timestamp,
-                trade_date,
-                updated_at,
-                str(trade["status"]),
-            ),
-        )
+    trade_row = (
+        tid,
+        str(trade["portfolio_id"]),
+        str(trade["strategy_type"]),
+        _optional_str(trade, "booking_timestamp"),
+        trade_date,
+        _optional_str(trade, "updated_at"),  # NULL → datetime('now') at insert
+        str(trade["status"]),
+    )
 
     legs_raw = trade["legs"]
     assert isinstance(legs_raw, list)
+    leg_rows: list[tuple[Any, ...]] = []
     for leg in legs_raw:
         lg = _require_mapping(leg, "leg")
         direction_db = _normalize_leg_direction_db(str(lg["direction"]))
@@ -634,13 +620,7 @@ def insert_bundle(
         exe = _parse_deferred_execution_price(lg, leg_id)
         commission = _parse_commission(lg, qty, leg_id)
 
-        cur.execute(
-            """
-            INSERT INTO trade_legs (
-                leg_id, trade_id, product_id,
-                direction, quantity, execution_price, commission
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        leg_rows.append(
             (
                 str(lg["leg_id"]),
                 tid,
@@ -649,8 +629,200 @@ def insert_bundle(
                 qty,
                 exe,
                 commission,
-            ),
+            )
+        )
+
+    return PreparedBundle(
+        trade_id=tid,
+        product_id=str(pid),
+        extension_label=extension_label,
+        product_row=product_row,
+        extension_row=extension_row,
+        trade_row=trade_row,
+        leg_rows=leg_rows,
+    )
+
+
+def write_bundle(conn: sqlite3.Connection, bundle: PreparedBundle) -> int:
+    """Stage a prepared bundle's rows on `conn` (caller commits); returns rows written."""
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT OR IGNORE INTO products (
+            product_id, asset_kind, underlying_id, expiry_date,
+            settlement, currency, contract_size, day_count, calendar
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        bundle.product_row,
+    )
+    if bundle.extension_label == "commodity":
+        cur.execute(
+            """
+            INSERT OR IGNORE INTO products_commodity (
+                product_id, instrument_type, product_code, contract_ticker, contract_month,
+                settlement_date, multiplier, tick_size, tick_value, option_type, strike,
+                exercise_style, option_ticker, underlying_contract_ticker, structured_params
+            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            """,
+            bundle.extension_row,
         )
+    else:
+        cur.execute(
+            """
+            INSERT OR IGNORE INTO products_equity (
+                product_id, option_type, strike,
+                instrument_type, exercise_style, structured_params
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            bundle.extension_row,
+        )
+    cur.execute(
+        """
+        INSERT INTO trades (
+            trade_id, portfolio_id, strategy_type,
+            booking_timestamp, trade_date, updated_at, status
+        ) VALUES (?, ?, ?, ?, ?, COALESCE(?, datetime('now')), ?)
+        """,
+        bundle.trade_row,
+    )
+    cur.executemany(
+        """
+        INSERT INTO trade_legs (
+            leg_id, trade_id, product_id,
+            direction, quantity, execution_price, commission
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        bundle.leg_rows,
+    )
+    return 3 + len(bundle.leg_rows)
+
+
+def insert_bundle(
+    conn: sqlite3.Connection,
+    product: Mapping[str, Any],
+    extension_label: str,
+    extension: Mapping[str, Any],
+    trade: Mapping[str, Any],
+) -> int:
+    """Validate, then stage product, extension, trade and legs on `conn` (caller commits)."""
+    return write_bundle(conn, prepare_bundle(product, extension_label, extension, trade))
+
+
+# (name, kind, payload): kind "file" → payload is a path, "line" → one JSONL record.
+BulkSource = tuple[str, str, str]
+
+
+def _collect_jsonl_sources(paths: Iterable[Path]) -> list[BulkSource]:
+    out: list[BulkSource] = []
+    for path in paths:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError as e:
+            _die(f"cannot read {path}: {e}")
+        for lineno, line in enumerate(text.splitlines(), start=1):
+            if line.strip():
+                out.append((f"{path.name}:{lineno}", "line", line))
+    return out
+
+
+def _prepare_source(source: BulkSource) -> tuple[str, PreparedBundle | None, str]:
+    """Load + validate one bundle (runs in a worker process): (name, bundle, error)."""
+    name, kind, payload = source
+    err = io.StringIO()
+    try:
+        with redirect_stderr(err):
+            if kind == "file":
+                product, label, extension, trade, notes = load_bundle(Path(payload))
+            else:
+                try:
+                    data = json.loads(payload)
+                except json.JSONDecodeError as e:
+                    _die(f"invalid JSON in {name}: {e}")
+                product, label, extension, trade, notes = parse_bundle(data, name)
+            bundle = prepare_bundle(product, label, extension, trade)
+    except SystemExit:
+        return name, None, err.getvalue().strip() or "invalid bundle"
+    bundle.notes = notes
+    return name, bundle, ""
+
+
+def prepare_sources(
+    sources: list[BulkSource], workers: int
+) -> Iterator[tuple[str, PreparedBundle | None, str]]:
+    """Validate bundles on `workers` processes (pure Python, no DB); results in input order."""
+    if workers <= 1 or len(sources) <= BULK_INLINE_MAX:
+        yield from map(_prepare_source, sources)
+        return
+    chunksize = max(1, len(sources) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_prepare_source, sources, chunksize=chunksize)
+
+
+def import_bulk(
+    conn: sqlite3.Connection,
+    results: Iterable[tuple[str, PreparedBundle | None, str]],
+    *,
+    batch_size: int = BULK_BATCH_SIZE,
+    writes: WriteStats | None = None,
+) -> dict[str, int]:
+    """Single writer: `batch_size` bundles per transaction, a savepoint per bundle.
+
+    A constraint error rolls back only that bundle (SKIP, like the one-by-one import);
+    validation failures never reach the database (FAIL). Returns OK / SKIP / FAIL counts.
+    """
+    counts = {"OK": 0, "SKIP": 0, "FAIL": 0}
+    existing = {str(r[0]) for r in conn.execute("SELECT trade_id FROM trades")}
+    batch: list[tuple[str, PreparedBundle]] = []
+
+    def flush() -> None:
+        if not batch:
+            return
+        lines: list[str] = []
+        rows = 0
+        t0 = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for name, bundle in batch:
+                conn.execute("SAVEPOINT bundle")
+                try:
+                    n_rows = write_bundle(conn, bundle)
+                except sqlite3.IntegrityError as e:
+                    conn.execute("ROLLBACK TO bundle")
+                    conn.execute("RELEASE bundle")
+                    lines.append(f"SKIP: {name} (database constraint: {e})")
+                    counts["SKIP"] += 1
+                    continue
+                conn.execute("RELEASE bundle")
+                rows += n_rows
+                lines.append(
+                    f"OK: {name} -> trade {bundle.trade_id!r} product {bundle.product_id!r} "
+                    f"({bundle.extension_label}, {len(bundle.leg_rows)} leg(s))"
+                )
+                counts["OK"] += 1
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            _die(f"bulk import: SQLite error (batch of {len(batch)} rolled back): {e}")
+        if writes is not None:
+            writes.record(rows, time.perf_counter() - t0)
+        for line in lines:
+            print(line)
+        batch.clear()
+
+    for name, bundle, error in results:
+        if bundle is None:
+            print(f"FAIL: {name}: {error}")
+            counts["FAIL"] += 1
+        elif bundle.trade_id in existing:
+            print(f"SKIP: {name} (trade_id {bundle.trade_id!r} already in database)")
+            counts["SKIP"] += 1
+        else:
+            existing.add(bundle.trade_id)
+            batch.append((name, bundle))
+            if len(batch) >= max(1, batch_size):
+                flush()
+    flush()
+    return counts
 
 
 def main() -> None:
@@ -683,13 +855,41 @@ def main() -> None:
         default=None,
         help=f"SQLite database path (default: env NUMERAIRE_DB_PATH or {default_db_path()!r})",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Validate all bundles in parallel, then insert through one writer in large "
+        "transactions (implied by --jsonl)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=Path,
+        action="append",
+        default=[],
+        help="Bulk: file with one bundle object per line (repeatable)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Bulk: validation processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BULK_BATCH_SIZE,
+        help=f"Bulk: bundles per write transaction (default {BULK_BATCH_SIZE})",
+    )
     args = parser.parse_args()
 
     incoming_dir = args.incoming_dir if args.incoming_dir is not None else DEFAULT_INCOMING_DIR
     import_all = args.import_all or (not args.inputs and args.incoming_dir is not None)
+    bulk = args.bulk or bool(args.jsonl)
 
-    paths = _collect_json_paths(list(args.inputs), incoming_dir, import_all)
-    if not paths:
+    paths: list[Path] = []
+    if args.inputs or import_all or not bulk:
+        paths = _collect_json_paths(list(args.inputs), incoming_dir, import_all)
+    if not paths and not args.jsonl:
         _die(
             "No JSON bundles to import. Pass trade ids (TRD_10005 …), .json paths, and/or --all with --incoming-dir."
         )
@@ -697,14 +897,39 @@ def main() -> None:
     db_path = args.db_path if args.db_path is not None else Path(default_db_path())
 
     try:
-        conn = sqlite3.connect(str(db_path))
+        conn = connect_writer(db_path)
     except sqlite3.Error as e:
         _die(f"cannot open database {db_path}: {e}")
 
+    if bulk:
+        sources: list[BulkSource] = [(p.name, "file", str(p)) for p in paths]
+        sources += _collect_jsonl_sources(args.jsonl)
+        workers = max(1, args.workers)
+        writes = WriteStats()
+        t0 = time.perf_counter()
+        try:
+            counts = import_bulk(
+                conn,
+                prepare_sources(sources, workers),
+                batch_size=args.batch_size,
+                writes=writes,
+            )
+        finally:
+            conn.close()
+        print(
+            f"Done: {counts['OK']} imported, {counts['SKIP']} skipped, {counts['FAIL']} failed "
+            f"-> {db_path} ({len(sources)} bundles, {workers} workers, "
+            f"{time.perf_counter() - t0:.2f}s)"
+        )
+        print(writes.line())
+        if counts["FAIL"]:
+            sys.exit(1)
+        return
+
     imported = 0
     skipped = 0
+    writes = WriteStats()
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         for path in paths:
             product, extension_label, extension, trade, auto_notes = load_bundle(path)
             for note in auto_notes:
@@ -715,9 +940,11 @@ def main() -> None:
                 skipped += 1
                 continue
             try:
-                conn.execute("BEGIN")
-                insert_bundle(conn, product, extension_label, extension, trade)
+                t0 = time.perf_counter()
+                conn.execute("BEGIN IMMEDIATE")
+                n_rows = insert_bundle(conn, product, extension_label, extension, trade)
                 conn.commit()
+                writes.record(n_rows, time.perf_counter() - t0)
             except sqlite3.IntegrityError as e:
                 conn.rollback()
                 print(f"SKIP: {path.name} (database constraint: {e})")
@@ -736,6 +963,7 @@ def main() -> None:
         conn.close()
 
     print(f"Done: {imported} imported, {skipped} skipped -> {db_path}")
+    print(writes.line())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,295 @@
+"""
+On-disk HTTP response cache for the vendor ingest scripts (used by `ingest_http`).
+
+Stdlib only. Reference data — the futures product catalogue and contract listings — changes
+a few times a year, yet every daily run used to re-download every page. With a cache the
+client serves those pages from disk while they are fresh (per-endpoint TTL), and after
+that sends a conditional GET (`If-None-Match` / `If-Modified-Since`). A `304` renews the
+entry without moving the payload again.
+
+Entries are keyed by the normalized URL: credentials (`apiKey`, `api_key`) are stripped
+and query parameters sorted, so the same request hashes the same under any key. The key
+never lands on disk — it is also scrubbed from stored bodies (an echoed `next_url`). One
+JSON file per entry under `<dir>/<host>/<sha[:2]>/<sha>.json`, written atomically (temp
+file + rename), so concurrent workers and killed runs never leave a half-written entry.
+
+Modes (`--http-cache` / NUMERAIRE_HTTP_CACHE):
+  on       cache endpoints that have a TTL (default); everything else goes straight through
+  off      no cache reads or writes
+  refresh  ignore stored entries, refetch and overwrite (TTL'd endpoints)
+  record   like `on`, and also store every other 2xx response (daily bars, FRED quotes)
+  offline  replay from the cache only; never touch the network, a miss is an error —
+           for tests and dev reruns against a recorded run
+
+Env:
+  NUMERAIRE_HTTP_CACHE       mode (default on)
+  NUMERAIRE_HTTP_CACHE_DIR   cache root (default <repo>/.cache/http)
+  NUMERAIRE_HTTP_CACHE_TTL   per-endpoint overrides, e.g. "products=86400,contracts=0"
+                             (seconds; a suffix matches the last path segment)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "http"
+CACHE_MODES = ("on", "off", "refresh", "record", "offline")
+MODE_ENV = "NUMERAIRE_HTTP_CACHE"
+DIR_ENV = "NUMERAIRE_HTTP_CACHE_DIR"
+TTL_ENV = "NUMERAIRE_HTTP_CACHE_TTL"
+
+# Query parameters that carry credentials: never part of a cache key, never written to disk.
+_SECRET_PARAMS = frozenset({"apikey", "api_key"})
+# Same params echoed inside a stored body (e.g. a `next_url`); scripts re-append their key.
+_SECRET_IN_BODY = re.compile(r"[?&](?:apiKey|api_key)=[^&\"\s]*", re.IGNORECASE)
+
+# Path prefix -> seconds a stored response is served without asking the vendor again.
+# Endpoints not listed are only stored in `record` mode (TTL 0: always revalidated online).
+DEFAULT_TTLS: dict[str, int] = {
+    "/futures/v1/products": 7 * 86_400,
+    "/futures/v1/contracts": 12 * 3_600,
+}
+
+
+def normalize_url(url: str) -> str:
+    """`url` with credential params removed and the query sorted (the cache key source)."""
+    parts = urllib.parse.urlsplit(url)
+    query = sorted(
+        (k, v)
+        for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _SECRET_PARAMS
+    )
+    return urllib.parse.urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path or "/",
+            urllib.parse.urlencode(query),
+            "",
+        )
+    )
+
+
+def _parse_ttl_overrides(raw: str) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        key, value = item.split("=", 1)
+        key = key.strip()
+        try:
+            out[key] = max(0, int(float(value)))
+        except ValueError:
+            continue
+    return out
+
+
+def _drop_secret_param(match: re.Match[str]) -> str:
+    # "?apiKey=..&page=2" must keep its "?"; the following "&" then starts the query.
+    return "?" if match.group(0).startswith("?") else ""
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status: int
+    body: bytes
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def age(self, now: float | None = None) -> float:
+        return (time.time() if now is None else now) - self.fetched_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional-request headers for revalidating this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe on-disk cache of 2xx GET bodies keyed by normalized URL."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        mode: str = "on",
+        ttls: Mapping[str, int] | None = None,
+    ) -> None:
+        if mode not in CACHE_MODES:
+            raise ValueError(f"cache mode must be one of {', '.join(CACHE_MODES)}, got {mode!r}")
+        self.root = Path(root)
+        self.mode = mode
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stored = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == "offline"
+
+    def ttl_for(self, url: str) -> int | None:
+        """TTL in seconds for `url`'s endpoint, or None when it is not reference data."""
+        path = urllib.parse.urlsplit(url).path.rstrip("/")
+        best: tuple[int, int] | None = None
+        for prefix, ttl in self.ttls.items():
+            prefix = prefix.rstrip("/")
+            matched = path.startswith(prefix) if prefix.startswith("/") else (
+                path.rsplit("/", 1)[-1] == prefix
+            )
+            if matched and (best is None or len(prefix) > best[0]):
+                best = (len(prefix), ttl)
+        return None if best is None else best[1]
+
+    def cacheable(self, url: str) -> bool:
+        if self.mode in ("record", "offline"):
+            return True
+        return self.mode in ("on", "refresh") and self.ttl_for(url) is not None
+
+    def path_for(self, url: str) -> Path:
+        key = normalize_url(url)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        host = urllib.parse.urlsplit(key).netloc.replace(":", "_") or "_"
+        return self.root / host / digest[:2] / f"{digest}.json"
+
+    # -- lookup ----------------------------------------------------------------
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """Stored entry for `url` (fresh or stale); None on miss or in `refresh` mode."""
+        if not self.cacheable(url) or self.mode == "refresh":
+            return None
+        path = self.path_for(url)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            return CacheEntry(
+                url=str(raw["url"]),
+                status=int(raw["status"]),
+                body=str(raw["body"]).encode("utf-8"),
+                fetched_at=float(raw["fetched_at"]),
+                etag=raw.get("etag"),
+                last_modified=raw.get("last_modified"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def is_fresh(self, url: str, entry: CacheEntry) -> bool:
+        if self.offline:
+            return True
+        ttl = self.ttl_for(url)
+        return ttl is not None and entry.age() < ttl
+
+    # -- bookkeeping -------------------------------------------------------------
+
+    def note_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def note_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def store(self, url: str, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        """Persist a 2xx response (headers lower-cased, as `ingest_http` returns them)."""
+        if not self.cacheable(url) or self.offline:
+            return
+        if "no-store" in (headers.get("cache-control") or "").lower():
+            return
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return
+        text = _SECRET_IN_BODY.sub(_drop_secret_param, text)
+        self._write(
+            url,
+            CacheEntry(
+                url=normalize_url(url),
+                status=status,
+                body=text.encode("utf-8"),
+                fetched_at=time.time(),
+                etag=headers.get("etag"),
+                last_modified=headers.get("last-modified"),
+            ),
+            text,
+        )
+        with self._lock:
+            self.stored += 1
+
+    def renew(self, url: str, entry: CacheEntry, headers: Mapping[str, str]) -> None:
+        """Record a `304 Not Modified`: same body, new fetch time (and validators if sent)."""
+        entry.fetched_at = time.time()
+        entry.etag = headers.get("etag") or entry.etag
+        entry.last_modified = headers.get("last-modified") or entry.last_modified
+        self._write(url, entry, entry.body.decode("utf-8"))
+        with self._lock:
+            self.revalidated += 1
+
+    def _write(self, url: str, entry: CacheEntry, text: str) -> None:
+        path = self.path_for(url)
+        tmp: str | None = None
+        payload = {
+            "url": entry.url,
+            "status": entry.status,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "body": text,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError:
+            # A read-only or full cache dir must never fail the ingest itself.
+            if tmp is not None and os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def describe(self) -> str:
+        return f"{self.mode} ({self.root})" if self.enabled else "off"
+
+    def stats_line(self) -> str:
+        return (
+            f"cache: mode={self.mode} hits={self.hits} revalidated={self.revalidated} "
+            f"misses={self.misses} stored={self.stored}"
+        )
+
+
+def response_cache(mode: str | None = None, root: str | Path | None = None) -> ResponseCache:
+    """Cache configured from CLI values first, then NUMERAIRE_HTTP_CACHE* env, then defaults."""
+    resolved = (mode or os.environ.get(MODE_ENV, "") or "on").strip().lower()
+    if resolved not in CACHE_MODES:
+        raise ValueError(
+            f"{MODE_ENV} must be one of {', '.join(CACHE_MODES)}, got {resolved!r}"
+        )
+    cache_dir = root or os.environ.get(DIR_ENV, "").strip() or DEFAULT_CACHE_DIR
+    ttls = dict(DEFAULT_TTLS)
+    for key, ttl in _parse_ttl_overrides(os.environ.get(TTL_ENV, "")).items():
+        # "products=..." overrides the default "/futures/v1/products" rule in place.
+        named = [p for p in ttls if not key.startswith("/") and p.rsplit("/", 1)[-1] == key]
+        for prefix in named or [key]:
+            ttls[prefix] = ttl
+    return ResponseCache(cache_dir, mode=resolved, ttls=ttls)
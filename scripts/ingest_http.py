@@ -0,0 +1,334 @@
+"""
+Shared HTTP client for the vendor ingest scripts (Massive/Polygon futures today).
+
+Stdlib only, like the scripts that import it. Four things the per-script
+`urllib.request.urlopen` helpers could not do:
+
+  * keep-alive — connections are pooled per (scheme, host, port) and reused, so a
+    run over hundreds of tickers pays one TLS handshake per worker, not per call;
+  * bounded concurrency — `fan_out` runs independent calls (one per ticker, one per
+    listing date, …) on a small thread pool and hands results back to the caller's
+    thread in input order, so SQLite writes stay single-threaded;
+  * one throttle — every call takes a token from the provider's `TokenBucket` and
+    transient failures retry under a `RetryPolicy` (see `ingest_ratelimit`), so the
+    plan's rate holds however many workers run, and time spent throttled is reported;
+  * an optional on-disk `ResponseCache` (see `ingest_cache`) — fresh reference pages are
+    served without a call (or a token), stale ones revalidate with a conditional GET, and
+    `offline` mode replays a recorded run with no network at all.
+
+Scripts sit next to this module, so `python3 scripts/<name>.py` imports it directly.
+
+Env:
+  NUMERAIRE_INGEST_WORKERS   default concurrency for `fan_out` (default 4)
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import os
+import queue
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar
+
+from ingest_cache import ResponseCache
+from ingest_ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+
+DEFAULT_WORKERS = 4
+WORKERS_ENV = "NUMERAIRE_INGEST_WORKERS"
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+# A pooled keep-alive socket the server already closed surfaces as one of these on reuse.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# (redacted url, status or None for transport failures, wait seconds, attempt, max attempts)
+RetryHook = Callable[[str, "int | None", float, int, int], None]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class IngestHttpError(RuntimeError):
+    """Non-2xx response or transport failure (message matches the old per-script errors)."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        body: str = "",
+        transient: bool = False,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.body = body
+        self.transient = transient
+
+
+def default_workers() -> int:
+    raw = os.environ.get(WORKERS_ENV, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return DEFAULT_WORKERS
+
+
+def redact_url(url: str) -> str:
+    """URL without its query string (never log the apiKey)."""
+    return url.split("?", 1)[0]
+
+
+class IngestHttpClient:
+    """Pooled keep-alive GET-JSON client; safe to share across `fan_out` worker threads."""
+
+    def __init__(
+        self,
+        *,
+        user_agent: str,
+        timeout_sec: float = 60.0,
+        workers: int | None = None,
+        bucket: TokenBucket | None = None,
+        retry: RetryPolicy | None = None,
+        on_retry: RetryHook | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self.user_agent = user_agent
+        self.cache = cache if cache is not None and cache.enabled else None
+        self.bucket = bucket if bucket is not None else TokenBucket("http", None)
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.on_retry = on_retry
+        self.timeout_sec = float(timeout_sec)
+        self.workers = max(1, int(workers)) if workers is not None else default_workers()
+        self._pools: dict[tuple[str, str, int], queue.LifoQueue[http.client.HTTPConnection]] = {}
+        self._pools_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.requests = 0
+        self.connections_opened = 0
+        self._stats_lock = threading.Lock()
+
+    # -- connection pool ---------------------------------------------------------
+
+    def _pool(self, key: tuple[str, str, int]) -> queue.LifoQueue[http.client.HTTPConnection]:
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = queue.LifoQueue()
+                self._pools[key] = pool
+            return pool
+
+    def _checkout(self, key: tuple[str, str, int]) -> http.client.HTTPConnection:
+        try:
+            return self._pool(key).get_nowait()
+        except queue.Empty:
+            pass
+        scheme, host, port = key
+        with self._stats_lock:
+            self.connections_opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout_sec)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout_sec)
+
+    def _checkin(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        self._pool(key).put(conn)
+
+    # -- requests ----------------------------------------------------------------
+
+    def _request(
+        self, url: str, extra_headers: Mapping[str, str] | None = None
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower() or "https"
+        if scheme not in ("http", "https"):
+            raise IngestHttpError(f"request failed: unsupported scheme in {redact_url(url)}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+
+        for attempt in (1, 2):
+            conn = self._checkout(key)
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if attempt == 1:
+                    continue  # server dropped an idle keep-alive socket; GET is safe to resend
+                raise IngestHttpError(f"request failed: {e}", transient=True) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise IngestHttpError(f"request failed: {e}", transient=True) from e
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            with self._stats_lock:
+                self.requests += 1
+            if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, body
+        raise AssertionError("unreachable")
+
+    def _throttled_request(
+        self, url: str, extra_headers: Mapping[str, str] | None = None
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        """`_request` behind the bucket, retrying 429 / 5xx-gateway / transport failures."""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                status, headers, body = self._request(url, extra_headers)
+            except IngestHttpError as e:
+                if not e.transient or not self.retry.should_retry(None, attempt):
+                    raise
+                status, headers, body = None, {}, b""
+                wait = self.retry.delay(attempt)
+            else:
+                if status not in self.retry.retry_statuses or not self.retry.should_retry(
+                    status, attempt
+                ):
+                    return status, headers, body
+                retry_after = parse_retry_after(headers.get("retry-after"))
+                wait = self.retry.delay(attempt, retry_after)
+                if status == 429:
+                    self.bucket.pause(wait)  # the quota is shared: hold every worker
+            attempt += 1
+            if self.on_retry is not None:
+                self.on_retry(redact_url(url), status, wait, attempt, self.retry.max_attempts)
+            self.retry.sleep(wait)
+
+    def _cached_request(self, url: str) -> tuple[int, Mapping[str, str], bytes]:
+        """`_throttled_request` through the response cache (hit, 304 revalidation, store)."""
+        cache = self.cache
+        if cache is None or not cache.cacheable(url):
+            return self._throttled_request(url)
+        entry = cache.lookup(url)
+        if entry is not None and cache.is_fresh(url, entry):
+            cache.note_hit()
+            return entry.status, {}, entry.body
+        if cache.offline:
+            cache.note_miss()
+            raise IngestHttpError(f"offline: no cached response for {redact_url(url)}")
+
+        validators = entry.validators() if entry is not None else None
+        status, headers, body = self._throttled_request(url, validators)
+        if status == 304 and entry is not None:
+            cache.renew(url, entry, headers)
+            return entry.status, headers, entry.body
+        cache.note_miss()
+        if 200 <= status < 300:
+            cache.store(url, status, headers, body)
+        return status, headers, body
+
+    def get_json(self, url: str) -> Mapping[str, Any]:
+        """GET `url` and decode JSON; raises `IngestHttpError` on non-2xx / transport failure."""
+        current = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, headers, body = self._cached_request(current)
+            if status in _REDIRECT_CODES and headers.get("location"):
+                current = urllib.parse.urljoin(current, headers["location"])
+                continue
+            if status < 200 or status >= 300:
+                text = body.decode("utf-8", errors="replace")[:800]
+                raise IngestHttpError(
+                    f"HTTP {status} for {redact_url(current)}: {text}", status=status, body=text
+                )
+            try:
+                return json.loads(body.decode("utf-8"))
+            except ValueError as e:
+                raise IngestHttpError(f"bad JSON from {redact_url(current)}: {e}") from e
+        raise IngestHttpError(f"too many redirects for {redact_url(url)}")
+
+    # -- concurrency -------------------------------------------------------------
+
+    def fan_out(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+    ) -> Iterator[tuple[T, R | None, BaseException | None]]:
+        """Run `fn(item)` on up to `workers` threads; yield `(item, result, error)` in input order.
+
+        Exceptions from `fn` are returned, not raised, so one bad ticker never aborts a run.
+        With one worker everything runs inline on the caller's thread.
+        """
+        items = list(items)
+        if self.workers <= 1 or len(items) <= 1:
+            for item in items:
+                try:
+                    yield item, fn(item), None
+                except Exception as e:  # noqa: BLE001 — handed back to the caller
+                    yield item, None, e
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="ingest-http"
+            )
+        futures = [(item, self._executor.submit(fn, item)) for item in items]
+        try:
+            for item, future in futures:
+                try:
+                    yield item, future.result(), None
+                except Exception as e:  # noqa: BLE001
+                    yield item, None, e
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    @property
+    def throttled_sec(self) -> float:
+        """Seconds spent waiting on the bucket plus backing off between retries."""
+        return self.bucket.waited_sec + self.retry.backoff_sec
+
+    def stats_line(self) -> str:
+        line = (
+            f"http: requests={self.requests} connections={self.connections_opened} "
+            f"workers={self.workers} rate={self.bucket.describe()} "
+            f"retries={self.retry.retries} throttled={self.throttled_sec:.1f}s "
+            f"(bucket {self.bucket.waited_sec:.1f}s, backoff {self.retry.backoff_sec:.1f}s)"
+        )
+        if self.cache is not None:
+            line = f"{line}\n{self.cache.stats_line()}"
+        return line
+
+    def __enter__(self) -> IngestHttpClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,222 @@
+"""
+Rate limiting and retry backoff for the vendor ingest scripts.
+
+One `TokenBucket` per provider replaces the old sleep-after-every-call throttle: calls go out
+as fast as the plan allows (bursting when the quota is idle) and workers only wait when the
+bucket is empty. A 429 with `Retry-After` pauses the whole bucket, so every worker backs off,
+not just the one that was refused. Transient failures (429 / 502 / 503 / 504 / timeouts)
+retry with exponential backoff and jitter via `RetryPolicy`.
+
+Both record the time they spend waiting so scripts can report it next to their counts.
+
+Provider limits resolve from env, most specific first (see `polygon_futures_rate_per_min`):
+  NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN   explicit calls/minute (0 = unlimited)
+  NUMERAIRE_POLYGON_FUTURES_SLEEP_SEC      legacy: one call per N seconds
+  NUMERAIRE_POLYGON_FUTURES_PLAN           basic|free (5/min) or starter|unlimited
+  NUMERAIRE_POLYGON_SLEEP_SEC_AFTER_CALL   legacy fallback
+  NUMERAIRE_FRED_RATE_PER_MIN              FRED (default 120/min, the documented cap)
+"""
+
+from __future__ import annotations
+
+import email.utils
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+POLYGON_BASIC_PER_MIN = 5.0
+FRED_DEFAULT_PER_MIN = 120.0
+RETRYABLE_HTTP = frozenset({429, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate_per_sec` sustained, up to `burst` back-to-back calls.
+
+    `rate_per_sec=None` means unlimited — `acquire` never waits (but `pause` still applies).
+    """
+
+    def __init__(self, name: str, rate_per_sec: float | None, burst: float = 1.0) -> None:
+        self.name = name
+        self.rate_per_sec = rate_per_sec if rate_per_sec and rate_per_sec > 0 else None
+        self.burst = max(1.0, float(burst))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.waited_sec = 0.0
+        self.acquired = 0
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate_per_sec is None
+
+    def _reserve(self) -> float:
+        """Take one token (possibly going into debt); return how long the caller must wait."""
+        now = time.monotonic()
+        with self._lock:
+            self.acquired += 1
+            wait = max(0.0, self._paused_until - now)
+            if self.rate_per_sec is None:
+                return wait
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens < 0.0:
+                wait = max(wait, -self._tokens / self.rate_per_sec)
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a call may go out; return seconds waited."""
+        wait = self._reserve()
+        if wait > 0.0:
+            time.sleep(wait)
+            with self._lock:
+                self.waited_sec += wait
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (server said Retry-After)."""
+        if seconds <= 0.0:
+            return
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def describe(self) -> str:
+        if self.rate_per_sec is None:
+            return f"{self.name}=unlimited"
+        return f"{self.name}={self.rate_per_sec * 60.0:g}/min burst={self.burst:g}"
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with equal jitter: attempt k waits in [d/2, d], d = min(cap, base*2^k).
+
+    `Retry-After` (seconds or HTTP date) overrides the computed delay when it is longer.
+    """
+
+    max_attempts: int = 4
+    base_sec: float = 1.0
+    cap_sec: float = 30.0
+    retry_statuses: frozenset[int] = RETRYABLE_HTTP
+    backoff_sec: float = field(default=0.0, init=False)
+    retries: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def should_retry(self, status: int | None, attempt: int) -> bool:
+        """`status=None` is a transport failure (timeout, reset), always worth one more try."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        ceiling = min(self.cap_sec, self.base_sec * (2.0**attempt))
+        jittered = ceiling / 2.0 + random.uniform(0.0, ceiling / 2.0)
+        if retry_after is not None:
+            return max(jittered, retry_after)
+        return jittered
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+        with self._lock:
+            self.backoff_sec += seconds
+            self.retries += 1
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """`Retry-After` as seconds from now (delta-seconds or HTTP-date); None if absent/bad."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _env_float(name: str) -> float | None:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return None
+
+
+def per_min_from_sleep(sleep_sec: float) -> float | None:
+    """Legacy `--sleep-sec N` → one call per N seconds (None when N is 0: unlimited)."""
+    return 60.0 / sleep_sec if sleep_sec > 0 else None
+
+
+def polygon_futures_rate_per_min(
+    rate_per_min: float | None = None, sleep_sec: float | None = None
+) -> float | None:
+    """Calls/minute for Massive futures (None = unlimited); mirrors the C++ futures throttle.
+
+    CLI values win (`--rate-per-min`, then the legacy `--sleep-sec`), then the env chain above.
+    """
+    if rate_per_min is not None:
+        return max(0.0, rate_per_min) or None
+    if sleep_sec is not None:
+        return per_min_from_sleep(max(0.0, sleep_sec))
+    explicit = _env_float("NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN")
+    if explicit is not None:
+        return explicit or None
+    sleep_env = _env_float("NUMERAIRE_POLYGON_FUTURES_SLEEP_SEC")
+    if sleep_env is not None:
+        return per_min_from_sleep(sleep_env)
+    plan = os.environ.get("NUMERAIRE_POLYGON_FUTURES_PLAN", "").strip().lower()
+    if plan in ("basic", "free"):
+        return POLYGON_BASIC_PER_MIN
+    if plan in ("starter", "unlimited"):
+        return None
+    sleep_env = _env_float("NUMERAIRE_POLYGON_SLEEP_SEC_AFTER_CALL")
+    if sleep_env is not None:
+        return per_min_from_sleep(sleep_env)
+    return None  # Futures Starter is the common path in this repo.
+
+
+def make_bucket(name: str, per_min: float | None) -> TokenBucket:
+    """Bucket for `per_min` calls/minute; bursts up to one second's worth (at least one call)."""
+    if per_min is None or per_min <= 0:
+        return TokenBucket(name, None)
+    rate = per_min / 60.0
+    return TokenBucket(name, rate, burst=max(1.0, rate))
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def provider_bucket(name: str, per_min: float | None) -> TokenBucket:
+    """Process-wide bucket per provider, so every client in one run shares the quota."""
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = make_bucket(name, per_min)
+            _buckets[name] = bucket
+        return bucket
+
+
+def polygon_futures_bucket(
+    rate_per_min: float | None = None, sleep_sec: float | None = None
+) -> TokenBucket:
+    return provider_bucket(
+        "polygon_futures", polygon_futures_rate_per_min(rate_per_min, sleep_sec)
+    )
+
+
+def fred_bucket() -> TokenBucket:
+    per_min = _env_float("NUMERAIRE_FRED_RATE_PER_MIN")
+    return provider_bucket("fred", FRED_DEFAULT_PER_MIN if per_min is None else per_min)
@@ -0,0 +1,141 @@
+"""
+Shared SQLite write path for the ingest / import scripts.
+
+Stdlib only. Three pieces every writer script uses instead of its own `sqlite3.connect` +
+row-at-a-time `cur.execute` loop:
+
+  * `connect_writer` — opens the DB tuned for batch writes: `journal_mode=WAL` (readers —
+    Django, dev_main — keep reading while a backfill writes, instead of waiting on the
+    rollback-journal lock), `synchronous=NORMAL` (durable at checkpoints; safe with WAL),
+    a 64 MiB page cache, in-memory temp tables and a `busy_timeout` so two writers queue
+    instead of failing with "database is locked".
+  * `bulk_write` — one `executemany` per batch inside an explicit transaction, timed into
+    a `WriteStats` so scripts can report rows/sec next to their HTTP stats.
+  * `bump_data_generation` — advances the `data_generation` counter of the tables a script
+    wrote, which the Journal's reference-data cache keys on.
+
+WAL is a property of the database file: once any writer switches it, every later
+connection (C++ included) uses it too.
+
+Env:
+  NUMERAIRE_SQLITE_BUSY_TIMEOUT_MS   writer busy timeout (default 30000)
+  NUMERAIRE_SQLITE_CACHE_MB          page cache per writer connection (default 64)
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+DEFAULT_BUSY_TIMEOUT_MS = 30_000
+DEFAULT_CACHE_MB = 64
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            pass
+    return default
+
+
+def connect_writer(db_path: str | Path, *, foreign_keys: bool = True) -> sqlite3.Connection:
+    """Open `db_path` for batch writes (WAL, synchronous=NORMAL, big cache, busy_timeout)."""
+    busy_ms = _env_int("NUMERAIRE_SQLITE_BUSY_TIMEOUT_MS", DEFAULT_BUSY_TIMEOUT_MS)
+    conn = sqlite3.connect(str(db_path), timeout=busy_ms / 1000.0)
+    conn.execute(f"PRAGMA busy_timeout = {busy_ms}")
+    # Falls back to the current mode silently where WAL is unavailable (e.g. network FS).
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    cache_kib = _env_int("NUMERAIRE_SQLITE_CACHE_MB", DEFAULT_CACHE_MB) * 1024
+    conn.execute(f"PRAGMA cache_size = -{cache_kib}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    if foreign_keys:
+        conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+class WriteStats:
+    """Rows / batches / seconds spent inside `bulk_write` (thread-safe; one per script run)."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.batches = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, rows: int, seconds: float) -> None:
+        with self._lock:
+            self.rows += rows
+            self.batches += 1
+            self.seconds += seconds
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def line(self) -> str:
+        return (
+            f"sqlite: rows={self.rows} batches={self.batches} write={self.seconds:.2f}s "
+            f"({self.rows_per_sec:,.0f} rows/s)"
+        )
+
+
+def bulk_write(
+    conn: sqlite3.Connection,
+    sql: str,
+    rows: Iterable[Sequence[Any]],
+    *,
+    stats: WriteStats | None = None,
+    commit: bool = True,
+) -> int:
+    """`executemany(sql, rows)` in one transaction; returns the number of rows sent.
+
+    Joins a transaction the caller already opened (e.g. checkpoint rows staged first) so
+    both land in the same commit; otherwise opens `BEGIN IMMEDIATE` itself. `commit=False`
+    leaves the transaction open for further `bulk_write` calls. Rolls back on error.
+    """
+    batch = rows if isinstance(rows, list) else list(rows)
+    if not batch:
+        if commit and conn.in_transaction:
+            conn.commit()
+        return 0
+    t0 = time.perf_counter()
+    try:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(sql, batch)
+        if commit:
+            conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    if stats is not None:
+        stats.record(len(batch), time.perf_counter() - t0)
+    return len(batch)
+
+
+def bump_data_generation(conn: sqlite3.Connection, *tables: str, commit: bool = True) -> None:
+    """Advance `data_generation` for each table (cached Journal lookups recompute).
+
+    Joins a transaction the caller already opened, like `bulk_write`; with `commit=False`
+    the bump lands in the same commit as the rows it announces.
+    """
+    conn.executemany(
+        """
+        INSERT INTO data_generation (table_name, generation) VALUES (?, 1)
+        ON CONFLICT (table_name) DO UPDATE SET
+            generation = generation + 1,
+            bumped_at = datetime('now')
+        """,
+        [(table,) for table in tables],
+    )
+    if commit:
+        conn.commit()
@@ -22,6 +22,8 @@ from datetime import date
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from ingest_sqlite import connect_writer
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CURVE_CONFIG = REPO_ROOT / "configs" / "eur_euro_rates_par_curve.json"
@@ -210,9 +212,8 @@ def main() -> None:
     if not db_path.is_file():
         _die(f"database not found: {db_path} (apply sql/schema_v1.sql or run dev_main bootstrap)")
 
-    conn = sqlite3.connect(db_path)
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         _ensure_schema_patches(conn)
         _upsert_curve(conn, cfg, as_of, points)
     finally:
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialized dashboard snapshot (`book_summary_eod` + `book_summary_breakdown_eod`).
+
+The Journal dashboard used to aggregate every official `trade_leg_mtm_eod` row on each page
+load: a DISTINCT over all as_of dates, then totals, per-engine, per-book and per-strategy
+group-bys (joined to `trades`) and exposure counts. This script computes those numbers once
+per as_of, after the batch that wrote the marks, so the page reads a handful of rows however
+many years of marks accumulate. Its as_of picker lists the summarised days and probes only
+official days newer than the last one: an older day missing here stays hidden until `--all`
+backfills it.
+
+`daily_book_mtm.py` calls `refresh_book_summary` for its as_of after MTM + exposure; run this
+by hand after a manual `dev_main` rerun, or with `--all` to backfill. Each as_of is replaced
+in one transaction. A date without official marks loses its snapshot.
+
+Usage:
+  python3 scripts/refresh_book_summary.py                      # latest as_of with marks
+  python3 scripts/refresh_book_summary.py --as-of 2026-08-11
+  python3 scripts/refresh_book_summary.py --all --db db.sqlite3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+from datetime import date
+from pathlib import Path
+
+from ingest_sqlite import connect_writer
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _die(msg: str) -> None:
+    print(f"error: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def refresh_book_summary(conn: sqlite3.Connection, as_of: str) -> bool:
+    """Replace the snapshot for `as_of` (own transaction); False when it has no official marks."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        totals = conn.execute(
+            """
+            SELECT COUNT(*), SUM(pv_total), SUM(pnl_daily), SUM(delta_total), SUM(vega_total),
+                   SUM(theta_total), MAX(calculated_at)
+            FROM trade_leg_mtm_eod
+            WHERE as_of = ? AND is_official = 1
+            """,
+            (as_of,),
+        ).fetchone()
+        conn.execute("DELETE FROM book_summary_breakdown_eod WHERE as_of = ?", (as_of,))
+        conn.execute("DELETE FROM book_summary_eod WHERE as_of = ?", (as_of,))
+        if not totals[0]:
+            conn.commit()
+            return False
+        exposure = conn.execute(
+            """
+            SELECT COUNT(*), MAX(num_paths), MAX(calculated_at)
+            FROM trade_leg_exposure_eod
+            WHERE as_of = ?
+            """,
+            (as_of,),
+        ).fetchone()
+        conn.execute(
+            """
+            INSERT INTO book_summary_eod (
+                as_of, legs, pv_total, pnl_daily, delta_total, vega_total, theta_total,
+                mtm_calculated_at, exposure_rows, exposure_paths, exposure_calculated_at
+            ) VALUES (?,?,?,?,?,?,?,?,?,?,?)
+            """,
+            (as_of, *totals, *exposure),
+        )
+        # Same groupings the dashboard used to run live (inner join to trades for books).
+        conn.execute(
+            """
+            INSERT INTO book_summary_breakdown_eod (
+                as_of, dimension, portfolio_id, group_key, legs, pv_total
+            )
+            SELECT ?, 'engine', '', pricing_engine, COUNT(*), SUM(pv_total)
+            FROM trade_leg_mtm_eod
+            WHERE as_of = ? AND is_official = 1
+            GROUP BY pricing_engine
+            """,
+            (as_of, as_of),
+        )
+        conn.execute(
+            """
+            INSERT INTO book_summary_breakdown_eod (
+                as_of, dimension, portfolio_id, group_key, legs, pv_total
+            )
+            SELECT ?, 'book', '', t.portfolio_id, COUNT(*), SUM(m.pv_total)
+            FROM trade_leg_mtm_eod m
+            JOIN trades t ON t.trade_id = m.trade_id
+            WHERE m.as_of = ? AND m.is_official = 1
+            GROUP BY t.portfolio_id
+            """,
+            (as_of, as_of),
+        )
+        conn.execute(
+            """
+            INSERT INTO book_summary_breakdown_eod (
+                as_of, dimension, portfolio_id, group_key, legs, pv_total
+            )
+            SELECT ?, 'strategy', t.portfolio_id, t.strategy_type, COUNT(*), SUM(m.pv_total)
+            FROM trade_leg_mtm_eod m
+            JOIN trades t ON t.trade_id = m.trade_id
+            WHERE m.as_of = ? AND m.is_official = 1
+            GROUP BY t.portfolio_id, t.strategy_type
+            """,
+            (as_of, as_of),
+        )
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    return True
+
+
+def official_as_of_dates(conn: sqlite3.Connection) -> list[str]:
+    return [
+        str(r[0])
+        for r in conn.execute(
+            "SELECT DISTINCT as_of FROM trade_leg_mtm_eod WHERE is_official = 1 ORDER BY as_of"
+        )
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild book_summary_eod (Journal dashboard snapshot) from official marks."
+    )
+    parser.add_argument("--as-of", default="", help="YYYY-MM-DD (default: latest official as_of)")
+    parser.add_argument("--all", action="store_true", help="Rebuild every as_of with marks")
+    parser.add_argument(
+        "--db",
+        dest="db_path",
+        default=os.environ.get("NUMERAIRE_DB_PATH", "db.sqlite3"),
+        help="SQLite path (default: NUMERAIRE_DB_PATH or db.sqlite3)",
+    )
+    args = parser.parse_args()
+
+    if args.as_of:
+        try:
+            date.fromisoformat(args.as_of)
+        except ValueError:
+            _die(f"--as-of must be YYYY-MM-DD, got {args.as_of!r}")
+    db_path = Path(args.db_path)
+    if not db_path.is_absolute():
+        db_path = (Path.cwd() / db_path).resolve()
+    if not db_path.is_file():
+        _die(f"database not found: {db_path}")
+
+    conn = connect_writer(db_path)
+    try:
+        conn.executescript((REPO_ROOT / "sql" / "schema_v1.sql").read_text(encoding="utf-8"))
+        if args.all:
+            dates = official_as_of_dates(conn)
+        elif args.as_of:
+            dates = [args.as_of]
+        else:
+            dates = official_as_of_dates(conn)[-1:]
+        if not dates:
+            print("no official marks in trade_leg_mtm_eod — nothing to summarise")
+            return
+        for as_of in dates:
+            ok = refresh_book_summary(conn, as_of)
+            print(f"  {as_of}: {'refreshed' if ok else 'no official marks (snapshot removed)'}")
+        print(f"ok: book summary for {len(dates)} as_of date(s) -> {db_path}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Rebuild the portfolio exposure rollups (`portfolio_exposure_rollup_eod`, `_pillar_eod`,
+`_trade_eod`) from `trade_leg_exposure_eod`.
+
+The Journal exposure page summed leg EE / PFE per pillar (and per trade at a pillar) over
+every leg row of the portfolio on each request, and listed portfolios / as_of dates with
+DISTINCT scans of the whole table. This script does those group-bys once per as_of, after
+the exposure batch, so the page reads one row per pillar (or per trade at a pillar).
+
+`daily_book_mtm.py` calls `refresh_exposure_rollup` for its as_of after exposure; run this
+by hand after a manual `dev_main --simulate --persist-exposure`, or with `--all` to
+backfill. Each as_of is replaced for every portfolio in one transaction.
+
+Usage:
+  python3 scripts/refresh_exposure_rollup.py                      # latest as_of with exposure
+  python3 scripts/refresh_exposure_rollup.py --as-of 2026-08-11
+  python3 scripts/refresh_exposure_rollup.py --all --db db.sqlite3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+from datetime import date
+from pathlib import Path
+
+from ingest_sqlite import connect_writer
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+ROLLUP_TABLES = (
+    "portfolio_exposure_trade_eod",
+    "portfolio_exposure_pillar_eod",
+    "portfolio_exposure_rollup_eod",
+)
+
+
+def _die(msg: str) -> None:
+    print(f"error: {msg}", file=sys.stderr)
+    sys.exit(1)
+
+
+def refresh_exposure_rollup(conn: sqlite3.Connection, as_of: str) -> int:
+    """Replace every portfolio's rollup for `as_of` (own transaction); returns portfolios."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for table in ROLLUP_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE as_of = ?", (as_of,))
+        (calculated_at,) = conn.execute(
+            "SELECT MAX(calculated_at) FROM trade_leg_exposure_eod WHERE as_of = ?", (as_of,)
+        ).fetchone()
+        if calculated_at is None:
+            conn.commit()
+            return 0
+        # Same groupings journal.exposure runs live (inner join to trades for the portfolio).
+        conn.execute(
+            """
+            INSERT INTO portfolio_exposure_rollup_eod (
+                as_of, portfolio_id, exposure_rows, trades, legs, num_paths, mc_seed,
+                engines, scopes, exposure_calculated_at
+            )
+            SELECT ?, t.portfolio_id, COUNT(*), COUNT(DISTINCT e.trade_id),
+                   COUNT(DISTINCT e.leg_id), MAX(e.num_paths), MAX(e.mc_seed),
+                   json_group_array(DISTINCT e.pricing_engine),
+                   json_group_array(DISTINCT e.scope_key), ?
+            FROM trade_leg_exposure_eod e
+            JOIN trades t ON t.trade_id = e.trade_id
+            WHERE e.as_of = ?
+            GROUP BY t.portfolio_id
+            """,
+            (as_of, calculated_at, as_of),
+        )
+        conn.execute(
+            """
+            INSERT INTO portfolio_exposure_pillar_eod (
+                as_of, portfolio_id, pillar_id, grid_step, year_fraction, exposure_date,
+                ee, pfe_95, pfe_975
+            )
+            SELECT ?, t.portfolio_id, e.pillar_id, e.grid_step, e.year_fraction,
+                   e.exposure_date, SUM(e.ee), SUM(e.pfe_95), SUM(e.pfe_975)
+            FROM trade_leg_exposure_eod e
+            JOIN trades t ON t.trade_id = e.trade_id
+            WHERE e.as_of = ?
+            GROUP BY t.portfolio_id, e.pillar_id, e.grid_step, e.year_fraction, e.exposure_date
+            """,
+            (as_of, as_of),
+        )
+        conn.execute(
+            """
+            INSERT INTO portfolio_exposure_trade_eod (
+                as_of, portfolio_id, pillar_id, trade_id, legs, ee, pfe_95, pfe_975
+            )
+            SELECT ?, t.portfolio_id, e.pillar_id, e.trade_id, COUNT(DISTINCT e.leg_id),
+                   SUM(e.ee), SUM(e.pfe_95), SUM(e.pfe_975)
+            FROM trade_leg_exposure_eod e
+            JOIN trades t ON t.trade_id = e.trade_id
+            WHERE e.as_of = ?
+            GROUP BY t.portfolio_id, e.pillar_id, e.trade_id
+            """,
+            (as_of, as_of),
+        )
+        (portfolios,) = conn.execute(
+            "SELECT COUNT(*) FROM portfolio_exposure_rollup_eod WHERE as_of = ?", (as_of,)
+        ).fetchone()
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    return portfolios
+
+
+def exposure_as_of_dates(conn: sqlite3.Connection) -> list[str]:
+    return [
+        str(r[0])
+        for r in conn.execute("SELECT DISTINCT as_of FROM trade_leg_exposure_eod ORDER BY as_of")
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild portfolio exposure rollups (Journal exposure page) from leg rows."
+    )
+    parser.add_argument("--as-of", default="", help="YYYY-MM-DD (default: latest exposure as_of)")
+    parser.add_argument("--all", action="store_true", help="Rebuild every as_of with exposure")
+    parser.add_argument(
+        "--db",
+        dest="db_path",
+        default=os.environ.get("NUMERAIRE_DB_PATH", "db.sqlite3"),
+        help="SQLite path (default: NUMERAIRE_DB_PATH or db.sqlite3)",
+    )
+    args = parser.parse_args()
+
+    if args.as_of:
+        try:
+            date.fromisoformat(args.as_of)
+        except ValueError:
+            _die(f"--as-of must be YYYY-MM-DD, got {args.as_of!r}")
+    db_path = Path(args.db_path)
+    if not db_path.is_absolute():
+        db_path = (Path.cwd() / db_path).resolve()
+    if not db_path.is_file():
+        _die(f"database not found: {db_path}")
+
+    conn = connect_writer(db_path)
+    try:
+        conn.executescript((REPO_ROOT / "sql" / "schema_v1.sql").read_text(encoding="utf-8"))
+        if args.all:
+            dates = exposure_as_of_dates(conn)
+        elif args.as_of:
+            dates = [args.as_of]
+        else:
+            dates = exposure_as_of_dates(conn)[-1:]
+        if not dates:
+            print("no rows in trade_leg_exposure_eod — nothing to roll up")
+            return
+        for as_of in dates:
+            n = refresh_exposure_rollup(conn, as_of)
+            print(f"  {as_of}: {f'{n} portfolio(s)' if n else 'no exposure (rollup removed)'}")
+        print(f"ok: exposure rollup for {len(dates)} as_of date(s) -> {db_path}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
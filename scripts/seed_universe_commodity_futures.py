@@ -26,6 +26,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from ingest_sqlite import connect_writer
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONFIG = REPO_ROOT / "configs" / "universe_commodity_futures.json"
@@ -214,9 +216,8 @@ def main() -> None:
     if not db_path.is_file():
         _die(f"database not found: {db_path}")
 
-    conn = sqlite3.connect(db_path)
+    conn = connect_writer(db_path)
     try:
-        conn.execute("PRAGMA foreign_keys = ON")
         _ensure_futures_flag_columns(conn)
 
         prepared: list[dict[str, Any]] = []
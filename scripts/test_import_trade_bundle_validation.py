@@ -4,11 +4,12 @@
 from __future__ import annotations
 
 import io
+import json
 import sqlite3
 import sys
 import tempfile
 import unittest
-from contextlib import redirect_stderr
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -65,7 +66,7 @@ class ImportExpiryValidationTest(unittest.TestCase):
             stderr = io.StringIO()
             with redirect_stderr(stderr):
                 with self.assertRaises(SystemExit) as ctx:
-                    itb.insert_bundle(conn, product, equity, trade)
+                    itb.insert_bundle(conn, product, "equity", equity, trade)
             self.assertEqual(ctx.exception.code, 1)
             msg = stderr.getvalue()
             self.assertIn("expiry_date", msg)
@@ -78,7 +79,7 @@ class ImportExpiryValidationTest(unittest.TestCase):
         conn = sqlite3.connect(":memory:")
         try:
             _bootstrap_schema(conn)
-            itb.insert_bundle(conn, product, equity, trade)
+            itb.insert_bundle(conn, product, "equity", equity, trade)
             row = conn.execute(
                 "SELECT expiry_date FROM products WHERE product_id = ?",
                 (product["product_id"],),
@@ -93,13 +94,60 @@ class ImportExpiryValidationTest(unittest.TestCase):
         conn = sqlite3.connect(":memory:")
         try:
             _bootstrap_schema(conn)
-            itb.insert_bundle(conn, product, equity, trade)
+            itb.insert_bundle(conn, product, "equity", equity, trade)
             row = conn.execute("SELECT 1 FROM trades WHERE trade_id = ?", (trade["trade_id"],)).fetchone()
             self.assertIsNotNone(row)
         finally:
             conn.close()
 
 
+class BulkImportTest(unittest.TestCase):
+    def _source(self, name: str, trade_id: str, **trade: object) -> itb.BulkSource:
+        product, equity, base = _minimal_bundle(expiry_date="2027-03-20", trade_date="2026-05-11")
+        base.update(trade_id=trade_id, **trade)
+        base["legs"] = [dict(base["legs"][0], leg_id=f"{trade_id}_L1")]
+        return name, "line", json.dumps({"product": product, "equity": equity, "trade": base})
+
+    def test_ok_skip_fail_per_trade(self) -> None:
+        sources = [
+            self._source("a:1", "TRD_BULK_A"),
+            self._source("a:2", "TRD_BULK_B", trade_date="not-a-date"),
+            self._source("a:3", "TRD_BULK_A"),
+            ("a:4", "line", "{broken"),
+            self._source("a:5", "TRD_BULK_C"),
+        ]
+        conn = sqlite3.connect(":memory:")
+        try:
+            _bootstrap_schema(conn)
+            out = io.StringIO()
+            with redirect_stdout(out):
+                counts = itb.import_bulk(conn, itb.prepare_sources(sources, 1), batch_size=2)
+            self.assertEqual(counts, {"OK": 2, "SKIP": 1, "FAIL": 2})
+            self.assertIn("FAIL: a:2: trade.trade_date", out.getvalue())
+            self.assertIn("SKIP: a:3", out.getvalue())
+            trades = [r[0] for r in conn.execute("SELECT trade_id FROM trades ORDER BY 1")]
+            self.assertEqual(trades, ["TRD_BULK_A", "TRD_BULK_C"])
+        finally:
+            conn.close()
+
+    def test_constraint_error_rolls_back_only_that_bundle(self) -> None:
+        # Second trade reuses the first one's leg_id: trade_legs PK violation mid-batch.
+        first = self._source("b:1", "TRD_BULK_D")
+        clash = json.loads(self._source("b:2", "TRD_BULK_E")[2])
+        clash["trade"]["legs"][0]["leg_id"] = "TRD_BULK_D_L1"
+        sources = [first, ("b:2", "line", json.dumps(clash)), self._source("b:3", "TRD_BULK_F")]
+        conn = sqlite3.connect(":memory:")
+        try:
+            _bootstrap_schema(conn)
+            with redirect_stdout(io.StringIO()):
+                counts = itb.import_bulk(conn, itb.prepare_sources(sources, 1))
+            self.assertEqual(counts, {"OK": 2, "SKIP": 1, "FAIL": 0})
+            trades = [r[0] for r in conn.execute("SELECT trade_id FROM trades ORDER BY 1")]
+            self.assertEqual(trades, ["TRD_BULK_D", "TRD_BULK_F"])
+        finally:
+            conn.close()
+
+
 def _bootstrap_schema(conn: sqlite3.Connection) -> None:
     schema_path = _REPO_ROOT / "sql" / "schema_v1.sql"
     conn.executescript(schema_path.read_text(encoding="utf-8"))
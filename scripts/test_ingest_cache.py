@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Unit tests for ingest_cache (keys, TTLs, ETag revalidation, offline replay; stdlib unittest)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT / "scripts"))
+
+import ingest_cache as ic  # noqa: E402
+from ingest_http import IngestHttpClient, IngestHttpError  # noqa: E402
+
+_ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls: list[tuple[str, str | None]] = []
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 — http.server API
+        _Handler.calls.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == _ETAG:
+            self.send_response(304)
+            self.send_header("ETag", _ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(
+            {"results": [{"product_code": "CL"}], "next_url": "http://x/p?cursor=2&apiKey=SECRET"}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", _ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class NormalizeUrlTests(unittest.TestCase):
+    def test_strips_credentials_and_sorts_query(self) -> None:
+        a = ic.normalize_url("https://API.polygon.io/futures/v1/products?sort=a&apiKey=k1&limit=5")
+        b = ic.normalize_url("https://api.polygon.io/futures/v1/products?limit=5&sort=a&apiKey=k2")
+        self.assertEqual(a, b)
+        self.assertNotIn("apiKey", a)
+        self.assertNotIn("api_key", ic.normalize_url("https://x/fred/series?api_key=s&id=DGS1MO"))
+
+    def test_ttl_longest_prefix_wins(self) -> None:
+        ttls = {"/futures/v1": 10, "/futures/v1/products": 20}
+        cache = ic.ResponseCache("/nonexistent", ttls=ttls)
+        self.assertEqual(cache.ttl_for("https://h/futures/v1/products?limit=1"), 20)
+        self.assertEqual(cache.ttl_for("https://h/futures/v1/contracts"), 10)
+        self.assertIsNone(cache.ttl_for("https://h/fred/series/observations"))
+        self.assertFalse(cache.cacheable("https://h/fred/series/observations"))
+
+    def test_env_ttl_override_by_last_segment(self) -> None:
+        env = {ic.TTL_ENV: "products=60", ic.MODE_ENV: "record"}
+        with mock.patch.dict(os.environ, env):
+            cache = ic.response_cache(root="/nonexistent")
+        self.assertEqual(cache.mode, "record")
+        self.assertEqual(cache.ttl_for("https://h/futures/v1/products"), 60)
+        self.assertTrue(cache.cacheable("https://h/futures/v1/aggs/CLZ6"))
+
+
+class ClientCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        _Handler.calls.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _get(self, mode: str, ttl: int, key: str = "k") -> dict:
+        cache = ic.ResponseCache(self.tmp.name, mode=mode, ttls={"/futures/v1/products": ttl})
+        with IngestHttpClient(user_agent="t", workers=1, cache=cache) as client:
+            payload = client.get_json(f"{self.base}/futures/v1/products?limit=1&apiKey={key}")
+        return {"payload": payload, "cache": cache, "requests": client.requests}
+
+    def test_fresh_entry_served_without_a_request(self) -> None:
+        first = self._get("on", ttl=3600)
+        second = self._get("on", ttl=3600, key="other-key")
+        self.assertEqual(first["requests"], 1)
+        self.assertEqual(second["requests"], 0)
+        self.assertEqual(second["cache"].hits, 1)
+        self.assertEqual(second["payload"]["results"], [{"product_code": "CL"}])
+
+    def test_stale_entry_revalidates_with_etag(self) -> None:
+        self._get("on", ttl=0)
+        again = self._get("on", ttl=0)
+        self.assertEqual(_Handler.calls[-1][1], _ETAG)
+        self.assertEqual(again["cache"].revalidated, 1)
+        self.assertEqual(again["payload"]["results"], [{"product_code": "CL"}])
+
+    def test_api_key_never_written_to_disk(self) -> None:
+        self._get("on", ttl=3600, key="SECRET")
+        stored = "".join(p.read_text() for p in Path(self.tmp.name).rglob("*.json"))
+        self.assertTrue(stored)
+        self.assertNotIn("SECRET", stored)
+        self.assertIn("cursor=2", stored)
+
+    def test_offline_replays_and_misses_loudly(self) -> None:
+        self._get("on", ttl=3600)
+        calls = len(_Handler.calls)
+        replay = self._get("offline", ttl=0)
+        self.assertEqual(len(_Handler.calls), calls)
+        self.assertEqual(replay["requests"], 0)
+        cache = ic.ResponseCache(self.tmp.name, mode="offline")
+        with IngestHttpClient(user_agent="t", workers=1, cache=cache) as client:
+            with self.assertRaises(IngestHttpError):
+                client.get_json(f"{self.base}/futures/v1/aggs/CLZ6")
+
+    def test_off_mode_bypasses_cache(self) -> None:
+        self._get("off", ttl=3600)
+        self._get("off", ttl=3600)
+        self.assertEqual(len(_Handler.calls), 2)
+        self.assertEqual(list(Path(self.tmp.name).rglob("*.json")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
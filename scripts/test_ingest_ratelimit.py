@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Unit tests for ingest_ratelimit (token bucket, backoff, env resolution; stdlib unittest)."""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT / "scripts"))
+
+import ingest_ratelimit as rl  # noqa: E402
+
+_ENV_KEYS = (
+    "NUMERAIRE_POLYGON_FUTURES_RATE_PER_MIN",
+    "NUMERAIRE_POLYGON_FUTURES_SLEEP_SEC",
+    "NUMERAIRE_POLYGON_FUTURES_PLAN",
+    "NUMERAIRE_POLYGON_SLEEP_SEC_AFTER_CALL",
+)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_then_paced(self) -> None:
+        bucket = rl.TokenBucket("t", rate_per_sec=10.0, burst=2)
+        with mock.patch.object(rl.time, "sleep") as sleep:
+            waits = [bucket.acquire() for _ in range(4)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.1, delta=0.01)
+        self.assertAlmostEqual(waits[3], 0.2, delta=0.01)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertAlmostEqual(bucket.waited_sec, 0.3, delta=0.02)
+
+    def test_unlimited_never_waits_but_honours_pause(self) -> None:
+        bucket = rl.TokenBucket("t", rate_per_sec=None)
+        with mock.patch.object(rl.time, "sleep"):
+            self.assertEqual(bucket.acquire(), 0.0)
+            bucket.pause(2.0)
+            self.assertAlmostEqual(bucket.acquire(), 2.0, delta=0.05)
+        self.assertTrue(bucket.unlimited)
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_should_retry(self) -> None:
+        policy = rl.RetryPolicy(max_attempts=3)
+        self.assertTrue(policy.should_retry(429, 0))
+        self.assertTrue(policy.should_retry(None, 1))
+        self.assertFalse(policy.should_retry(429, 2))
+        self.assertFalse(policy.should_retry(404, 0))
+        self.assertFalse(policy.should_retry(500, 0))
+
+    def test_delay_is_jittered_exponential_and_capped(self) -> None:
+        policy = rl.RetryPolicy(base_sec=1.0, cap_sec=4.0)
+        for attempt, ceiling in ((0, 1.0), (1, 2.0), (2, 4.0), (5, 4.0)):
+            for _ in range(50):
+                d = policy.delay(attempt)
+                self.assertGreaterEqual(d, ceiling / 2.0)
+                self.assertLessEqual(d, ceiling)
+
+    def test_retry_after_wins_when_longer(self) -> None:
+        policy = rl.RetryPolicy(base_sec=1.0, cap_sec=4.0)
+        self.assertEqual(policy.delay(0, retry_after=10.0), 10.0)
+        self.assertLessEqual(policy.delay(0, retry_after=0.0), 1.0)
+
+
+class ParseRetryAfterTests(unittest.TestCase):
+    def test_seconds_and_http_date(self) -> None:
+        self.assertEqual(rl.parse_retry_after("7"), 7.0)
+        self.assertIsNone(rl.parse_retry_after(None))
+        self.assertIsNone(rl.parse_retry_after("soon"))
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        parsed = rl.parse_retry_after(format_datetime(when, usegmt=True))
+        self.assertIsNotNone(parsed)
+        self.assertAlmostEqual(parsed, 30.0, delta=2.0)
+
+
+class PolygonFuturesRateTests(unittest.TestCase):
+    def _rate(self, env: dict[str, str], **kwargs: float) -> float | None:
+        clean = {k: v for k, v in os.environ.items() if k not in _ENV_KEYS}
+        with mock.patch.dict(os.environ, {**clean, **env}, clear=True):
+            return rl.polygon_futures_rate_per_min(**kwargs)
+
+    def test_default_is_unlimited(self) -> None:
+        self.assertIsNone(self._rate({}))
+
+    def test_plan_and_legacy_sleep(self) -> None:
+        self.assertEqual(self._rate({"NUMERAIRE_POLYGON_FUTURES_PLAN": "basic"}), 5.0)
+        self.assertIsNone(self._rate({"NUMERAIRE_POLYGON_FUTURES_PLAN": "starter"}))
+        self.assertEqual(self._rate({"NUMERAIRE_POLYGON_FUTURES_SLEEP_SEC": "12"}), 5.0)
+        self.assertEqual(self._rate({"NUMERAIRE_POLYGON_SLEEP_SEC_AFTER_CALL": "30"}), 2.0)
+
+    def test_cli_overrides_env(self) -> None:
+        env = {"NUMERAIRE_POLYGON_FUTURES_PLAN": "basic"}
+        self.assertEqual(self._rate(env, rate_per_min=100.0), 100.0)
+        self.assertIsNone(self._rate(env, rate_per_min=0.0))
+        self.assertEqual(self._rate(env, sleep_sec=6.0), 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
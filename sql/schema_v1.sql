@@ -406,6 +406,26 @@ CREATE INDEX IF NOT EXISTS idx_futures_contract_listing_active
     ON futures_contract (listing_as_of, active);
 CREATE INDEX IF NOT EXISTS idx_futures_contract_product_settlement
     ON futures_contract (product_code, listing_as_of, settlement_date);
+-- Completed units of long-running ingest jobs (`scripts/backfill_massive_futures_eod_range.py`).
+--
+-- One row per unit of work that has been fetched *and* written: written in the same transaction
+-- as the unit's data rows, so a crash never records a unit whose rows were lost. `--resume`
+-- skips units covered by a row here; failed units never get one and are retried.
+--
+-- `job` — e.g. futures_eod_range.
+-- `unit_kind` / `unit_key` — contracts + product_code (listing snapshot) or aggs + ticker.
+-- `window_start` / `window_end` — inclusive date range the unit covered (session_end dates for
+--     aggs; the listing day twice for contract snapshots).
+CREATE TABLE IF NOT EXISTS ingest_checkpoint (
+    job TEXT NOT NULL,
+    unit_kind TEXT NOT NULL,
+    unit_key TEXT NOT NULL,
+    window_start TEXT NOT NULL,
+    window_end TEXT NOT NULL,
+    rows_written INTEGER NOT NULL DEFAULT 0,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (job, unit_kind, unit_key, window_start, window_end)
+);
 -- Option contract definitions from provider reference (e.g. Polygon `v3/reference/options/contracts`).
 --
 -- `listing_as_of` — parametr `as_of` w zapytaniu: dzień kalendarzowy snapshotu łańcucha / katalogu
@@ -535,9 +555,11 @@ CREATE TABLE IF NOT EXISTS trade_leg_mtm_eod (
     FOREIGN KEY (leg_id) REFERENCES trade_legs (leg_id) ON DELETE CASCADE,
     UNIQUE (leg_id, as_of, pricing_engine)
 );
--- `idx_trade_leg_mtm_eod_official` (one official mark per leg and day) is created by
--- ApplySchemaPatches, not here: this file also runs against databases predating
--- `is_official`, where indexing that column would fail before the patch can add it.
+-- `idx_trade_leg_mtm_eod_official` (one official mark per leg and day) and
+-- `idx_trade_leg_mtm_eod_official_asof` (dashboard as_of probe and snapshot stamp) are
+-- created by ApplySchemaPatches, not here: this file also runs against databases
+-- predating `is_official`, where indexing that column would fail before the patch can
+-- add it.
 CREATE INDEX IF NOT EXISTS idx_trade_leg_mtm_eod_leg_asof_engine ON trade_leg_mtm_eod (leg_id, as_of, pricing_engine);
 CREATE INDEX IF NOT EXISTS idx_trade_leg_mtm_eod_asof ON trade_leg_mtm_eod (as_of);
 CREATE INDEX IF NOT EXISTS idx_trade_leg_mtm_eod_trade_asof ON trade_leg_mtm_eod (trade_id, as_of);
@@ -619,6 +641,9 @@ CREATE INDEX IF NOT EXISTS idx_trade_leg_exposure_eod_leg_asof ON trade_leg_expo
 CREATE INDEX IF NOT EXISTS idx_trade_leg_exposure_eod_trade_asof ON trade_leg_exposure_eod (trade_id, as_of);
 CREATE INDEX IF NOT EXISTS idx_trade_leg_exposure_eod_scope_asof ON trade_leg_exposure_eod (scope_key, as_of);
 CREATE INDEX IF NOT EXISTS idx_trade_leg_exposure_eod_asof ON trade_leg_exposure_eod (as_of);
+-- Rollup staleness check (MAX(calculated_at) for one as_of) without scanning the day.
+CREATE INDEX IF NOT EXISTS idx_trade_leg_exposure_eod_asof_calc
+    ON trade_leg_exposure_eod (as_of, calculated_at);
 CREATE TABLE IF NOT EXISTS trade_leg_exposure_eod_archive (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     batch_run_id TEXT NOT NULL,
@@ -644,6 +669,109 @@ CREATE TABLE IF NOT EXISTS trade_leg_exposure_eod_archive (
 );
 CREATE INDEX IF NOT EXISTS idx_exposure_archive_batch_run ON trade_leg_exposure_eod_archive (batch_run_id);
 CREATE INDEX IF NOT EXISTS idx_exposure_archive_leg_asof ON trade_leg_exposure_eod_archive (leg_id, as_of, pillar_id, batch_run_id);
+-- ---------------------------------------------------------------------------
+-- Materialized Journal dashboard snapshot per as_of: official-mark totals, per-engine /
+-- per-book / per-strategy breakdowns and exposure counts. Derived data only — rebuilt by
+-- scripts/refresh_book_summary.py (run at the end of daily_book_mtm) from
+-- trade_leg_mtm_eod + trades + trade_leg_exposure_eod; safe to delete and rebuild (--all).
+-- The row is current while MAX(calculated_at) and COUNT(*) of the day's official marks
+-- still equal (`mtm_calculated_at`, `legs`), and those of its exposure rows still equal
+-- (`exposure_calculated_at`, `exposure_rows`). A manual rerun moves the stamp and a
+-- deleted trade the count; moving a trade to another book or strategy clears
+-- `mtm_calculated_at` (trigger below). A stale row makes the dashboard aggregate live.
+CREATE TABLE IF NOT EXISTS book_summary_eod (
+    as_of TEXT PRIMARY KEY,
+    legs INTEGER NOT NULL,
+    pv_total REAL,
+    pnl_daily REAL,
+    delta_total REAL,
+    vega_total REAL,
+    theta_total REAL,
+    exposure_rows INTEGER NOT NULL DEFAULT 0,
+    exposure_paths INTEGER,
+    mtm_calculated_at TEXT,
+    exposure_calculated_at TEXT,
+    refreshed_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+-- dimension: engine (group_key = pricing_engine), book (group_key = portfolio_id) or
+-- strategy (portfolio_id + group_key = strategy_type).
+CREATE TABLE IF NOT EXISTS book_summary_breakdown_eod (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    as_of TEXT NOT NULL,
+    dimension TEXT NOT NULL CHECK (dimension IN ('engine', 'book', 'strategy')),
+    portfolio_id TEXT NOT NULL DEFAULT '',
+    group_key TEXT NOT NULL,
+    legs INTEGER NOT NULL,
+    pv_total REAL,
+    FOREIGN KEY (as_of) REFERENCES book_summary_eod (as_of) ON DELETE CASCADE,
+    UNIQUE (as_of, dimension, portfolio_id, group_key)
+);
+CREATE TRIGGER IF NOT EXISTS trg_trades_book_summary_stale
+AFTER UPDATE OF portfolio_id, strategy_type ON trades
+BEGIN
+    UPDATE book_summary_eod SET mtm_calculated_at = NULL
+    WHERE as_of IN (SELECT as_of FROM trade_leg_mtm_eod WHERE trade_id = NEW.trade_id);
+END;
+-- ---------------------------------------------------------------------------
+-- Portfolio exposure rollups per as_of (Journal exposure page). Derived data only — rebuilt
+-- by scripts/refresh_exposure_rollup.py (run at the end of daily_book_mtm) from
+-- trade_leg_exposure_eod + trades; safe to delete and rebuild (--all).
+--   portfolio_exposure_rollup_eod  one row per (as_of, portfolio): counts, paths, seed,
+--                                  engines / scopes (JSON arrays)
+--   portfolio_exposure_pillar_eod  leg EE / PFE summed per (as_of, portfolio, pillar)
+--   portfolio_exposure_trade_eod   the same per trade at each pillar (attribution)
+-- `exposure_calculated_at` is MAX(calculated_at) over the whole as_of at refresh time. The
+-- day's rollups are current while that and SUM(exposure_rows) still equal MAX / COUNT of
+-- its leg rows: a later exposure batch moves the stamp and a deleted trade the count;
+-- moving a trade to another portfolio clears the stamp (trigger below). Stale days are
+-- aggregated live.
+CREATE TABLE IF NOT EXISTS portfolio_exposure_rollup_eod (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    as_of TEXT NOT NULL,
+    portfolio_id TEXT NOT NULL,
+    exposure_rows INTEGER NOT NULL,
+    trades INTEGER NOT NULL,
+    legs INTEGER NOT NULL,
+    num_paths INTEGER,
+    mc_seed INTEGER,
+    engines TEXT NOT NULL DEFAULT '[]',
+    scopes TEXT NOT NULL DEFAULT '[]',
+    exposure_calculated_at TEXT,
+    refreshed_at TEXT NOT NULL DEFAULT (datetime('now')),
+    UNIQUE (as_of, portfolio_id)
+);
+CREATE TABLE IF NOT EXISTS portfolio_exposure_pillar_eod (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    as_of TEXT NOT NULL,
+    portfolio_id TEXT NOT NULL,
+    pillar_id TEXT NOT NULL,
+    grid_step INTEGER NOT NULL,
+    year_fraction REAL NOT NULL,
+    exposure_date TEXT NOT NULL,
+    ee REAL NOT NULL,
+    pfe_95 REAL NOT NULL,
+    pfe_975 REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_portfolio_exposure_pillar_asof
+    ON portfolio_exposure_pillar_eod (as_of, portfolio_id, grid_step);
+CREATE TABLE IF NOT EXISTS portfolio_exposure_trade_eod (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    as_of TEXT NOT NULL,
+    portfolio_id TEXT NOT NULL,
+    pillar_id TEXT NOT NULL,
+    trade_id TEXT NOT NULL,
+    legs INTEGER NOT NULL,
+    ee REAL NOT NULL,
+    pfe_95 REAL NOT NULL,
+    pfe_975 REAL NOT NULL,
+    UNIQUE (as_of, portfolio_id, pillar_id, trade_id)
+);
+CREATE TRIGGER IF NOT EXISTS trg_trades_exposure_rollup_stale
+AFTER UPDATE OF portfolio_id ON trades
+BEGIN
+    UPDATE portfolio_exposure_rollup_eod SET exposure_calculated_at = NULL
+    WHERE as_of IN (SELECT as_of FROM trade_leg_exposure_eod WHERE trade_id = NEW.trade_id);
+END;
 -- -------------------------------------------------------
 -- End-of-day OHLC for listed options (e.g. Polygon `v2/aggs` `1/day` on `O:NDXP…`).
 --
@@ -880,3 +1008,51 @@ CREATE TABLE IF NOT EXISTS historical_calibration_cholesky (
     FOREIGN KEY (calibration_id) REFERENCES historical_calibration (calibration_id) ON DELETE CASCADE,
     CHECK (col_j <= row_i)
 );
+-- ---------------------------------------------------------------------------
+-- Data generation stamps: one counter per source table behind the Journal's cached
+-- reference lookups (catalogue, books / strategies, curve / surface / futures / equity
+-- lists). A writer bumps the table it changed; the web `refdata` cache keys on the
+-- counters, so the next page render recomputes. Bumped by:
+--   trades, catalog_instrument_type  triggers below (every writer, C++ included)
+--   market EOD tables                daily_market_prep.py after its steps; the futures
+--                                    ingest scripts with each batch of bars
+--                                    (scripts/ingest_sqlite.bump_data_generation)
+CREATE TABLE IF NOT EXISTS data_generation (
+    table_name TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0,
+    bumped_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE TRIGGER IF NOT EXISTS trg_trades_generation_insert AFTER INSERT ON trades
+BEGIN
+    INSERT INTO data_generation (table_name, generation) VALUES ('trades', 1)
+    ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1, bumped_at = datetime('now');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_trades_generation_update
+AFTER UPDATE OF portfolio_id, strategy_type ON trades
+BEGIN
+    INSERT INTO data_generation (table_name, generation) VALUES ('trades', 1)
+    ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1, bumped_at = datetime('now');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_trades_generation_delete AFTER DELETE ON trades
+BEGIN
+    INSERT INTO data_generation (table_name, generation) VALUES ('trades', 1)
+    ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1, bumped_at = datetime('now');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_catalog_instrument_type_generation_insert
+AFTER INSERT ON catalog_instrument_type
+BEGIN
+    INSERT INTO data_generation (table_name, generation) VALUES ('catalog_instrument_type', 1)
+    ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1, bumped_at = datetime('now');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_catalog_instrument_type_generation_update
+AFTER UPDATE ON catalog_instrument_type
+BEGIN
+    INSERT INTO data_generation (table_name, generation) VALUES ('catalog_instrument_type', 1)
+    ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1, bumped_at = datetime('now');
+END;
+CREATE TRIGGER IF NOT EXISTS trg_catalog_instrument_type_generation_delete
+AFTER DELETE ON catalog_instrument_type
+BEGIN
+    INSERT INTO data_generation (table_name, generation) VALUES ('catalog_instrument_type', 1)
+    ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1, bumped_at = datetime('now');
+END;
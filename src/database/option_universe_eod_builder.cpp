@@ -190,7 +190,8 @@ OptionUniverseBuildStats BuildOptionUniverseEod(const OptionUniverseBuildParams&
     }
     const double spot = *spot_opt;
 
-    SQLite::Database db(params.database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+    SQLite::Database db(params.database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE,
+                        kSqliteWriterBusyTimeoutMs);
     db.exec("PRAGMA foreign_keys = ON;");
 
     const std::vector<CatalogRow> catalog = LoadCatalog(db, params.listing_as_of, params.underlying_ticker);
@@ -1,4 +1,5 @@
 #include <numeraire/database/sqlite_discount_curve_repository.hpp>
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 
 #include <SQLiteCpp/SQLiteCpp.h>
@@ -11,7 +12,7 @@ SqliteDiscountCurveRepository::SqliteDiscountCurveRepository(std::string databas
 void SqliteDiscountCurveRepository::UpsertCurve(const DiscountCurveEodHeaderWrite& header,
                                                 const std::vector<DiscountCurvePointWrite>& points) {
     try {
-        SQLite::Database db(database_file_path_, SQLite::OPEN_READWRITE);
+        SQLite::Database db(database_file_path_, SQLite::OPEN_READWRITE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON");
         SQLite::Transaction txn(db);
 
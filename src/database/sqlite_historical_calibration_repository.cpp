@@ -1,5 +1,6 @@
 #include <numeraire/database/sqlite_historical_calibration_repository.hpp>
 
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 
 #include <SQLiteCpp/SQLiteCpp.h>
@@ -15,7 +16,7 @@ long SqliteHistoricalCalibrationRepository::UpsertSnapshot(
         const std::vector<HistoricalCalibrationCorrelationWrite>& correlations,
         const std::vector<HistoricalCalibrationCholeskyWrite>& cholesky) {
     try {
-        SQLite::Database db(database_file_path_, SQLite::OPEN_READWRITE);
+        SQLite::Database db(database_file_path_, SQLite::OPEN_READWRITE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON");
         SQLite::Transaction txn(db);
 
@@ -74,6 +74,10 @@ void ApplySchemaPatches(SQLite::Database& db) {
     // Only on the live table: the archive keeps every run, each with its own official mark.
     db.exec("CREATE UNIQUE INDEX IF NOT EXISTS idx_trade_leg_mtm_eod_official "
             "ON trade_leg_mtm_eod (leg_id, as_of) WHERE is_official = 1");
+    // Covers the dashboard's as_of probe (official days after the newest snapshot) and its
+    // snapshot stamp (MAX(calculated_at), COUNT(*) of one day) without touching the table.
+    db.exec("CREATE INDEX IF NOT EXISTS idx_trade_leg_mtm_eod_official_asof "
+            "ON trade_leg_mtm_eod (as_of, is_official, calculated_at)");
 }
 
 [[nodiscard]] std::string ReadEntireFile(const std::filesystem::path& path) {
@@ -98,7 +102,8 @@ void BootstrapTradeDatabaseSchema(const std::filesystem::path& database_path,
     const std::string sql = ReadEntireFile(schema_sql_path);
 
     try {
-        SQLite::Database db(database_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(database_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE,
+                            kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
         db.exec(sql);
         ApplySchemaPatches(db);
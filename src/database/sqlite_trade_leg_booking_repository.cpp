@@ -2,6 +2,7 @@
 
 #include <memory>
 #include <numeraire/database/sqlite_trade_leg_booking_repository.hpp>
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 #include <string>
 
@@ -56,8 +57,8 @@ struct SqliteTradeLegBookingRepository::Impl {
 SqliteTradeLegBookingRepository::SqliteTradeLegBookingRepository(const std::string& database_file_path)
     : impl_(std::make_unique<Impl>()) {
     try {
-        impl_->db =
-                std::make_unique<SQLite::Database>(database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        impl_->db = std::make_unique<SQLite::Database>(
+                database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         impl_->db->exec("PRAGMA foreign_keys = ON;");
         impl_->update_leg_by_leg_id =
                 std::make_unique<SQLite::Statement>(*impl_->db, kUpdateLegByLegIdSql);
@@ -4,6 +4,7 @@
 #include <chrono>
 #include <memory>
 #include <numeraire/database/sqlite_trade_leg_exposure_repository.hpp>
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 #include <string>
 
@@ -60,8 +61,8 @@ struct SqliteTradeLegExposureRepository::Impl {
 SqliteTradeLegExposureRepository::SqliteTradeLegExposureRepository(const std::string& database_file_path)
     : impl_(std::make_unique<Impl>()) {
     try {
-        impl_->db =
-                std::make_unique<SQLite::Database>(database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        impl_->db = std::make_unique<SQLite::Database>(
+                database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         impl_->db->exec("PRAGMA foreign_keys = ON;");
         impl_->archive_insert = std::make_unique<SQLite::Statement>(*impl_->db, kArchiveInsertSql);
         impl_->upsert = std::make_unique<SQLite::Statement>(*impl_->db, kUpsertSql);
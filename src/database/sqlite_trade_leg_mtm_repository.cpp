@@ -5,6 +5,7 @@
 #include <cstdint>
 #include <memory>
 #include <numeraire/database/sqlite_trade_leg_mtm_repository.hpp>
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 #include <string>
 #include <string_view>
@@ -131,8 +132,8 @@ struct SqliteTradeLegMtmRepository::Impl {
 SqliteTradeLegMtmRepository::SqliteTradeLegMtmRepository(const std::string& database_file_path)
     : impl_(std::make_unique<Impl>()) {
     try {
-        impl_->db =
-                std::make_unique<SQLite::Database>(database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        impl_->db = std::make_unique<SQLite::Database>(
+                database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         impl_->db->exec("PRAGMA foreign_keys = ON;");
         impl_->archive_insert = std::make_unique<SQLite::Statement>(*impl_->db, kArchiveInsertSql);
         impl_->upsert = std::make_unique<SQLite::Statement>(*impl_->db, kUpsertSql);
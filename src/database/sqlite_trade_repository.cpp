@@ -1,5 +1,6 @@
 #include <numeraire/database/sqlite_trade_repository.hpp>
 
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 #include <numeraire/utils/string.hpp>
 
@@ -327,7 +328,7 @@ SqliteTradeRepository::SqliteTradeRepository(std::string database_file_path)
         : impl_(std::make_unique<Impl>()) {
     try {
         impl_->db = std::make_unique<SQLite::Database>(
-                database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+                database_file_path, SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         impl_->db->exec("PRAGMA foreign_keys = ON;");
         impl_->select_catalog =
                 std::make_unique<SQLite::Statement>(*impl_->db, kSelectCatalogSql);
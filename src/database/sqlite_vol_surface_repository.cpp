@@ -1,4 +1,5 @@
 #include <numeraire/database/sqlite_vol_surface_repository.hpp>
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/utils/exception.hpp>
 
 #include <SQLiteCpp/SQLiteCpp.h>
@@ -11,7 +12,7 @@ SqliteVolSurfaceRepository::SqliteVolSurfaceRepository(std::string database_file
 long SqliteVolSurfaceRepository::UpsertSurface(const VolSurfaceEodHeaderWrite& header,
                                                const std::vector<VolSurfacePointWrite>& points) {
     try {
-        SQLite::Database db(database_file_path_, SQLite::OPEN_READWRITE);
+        SQLite::Database db(database_file_path_, SQLite::OPEN_READWRITE, kSqliteWriterBusyTimeoutMs);
         SQLite::Transaction txn(db);
 
         long surface_id = 0;
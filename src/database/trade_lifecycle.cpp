@@ -1,5 +1,6 @@
 #include <numeraire/database/trade_lifecycle.hpp>
 
+#include <numeraire/database/sqlite_schema.hpp>
 #include <numeraire/database/sqlite_trade_leg_booking_repository.hpp>
 #include <numeraire/database/trade_booking_rules.hpp>
 #include <numeraire/schedule/date.hpp>
@@ -59,7 +60,7 @@ TradeLifecycleResult ApplyTradeLifecycleAsOf(const std::string& database_file_pa
 
     TradeLifecycleResult result;
     try {
-        SQLite::Database db(database_file_path, SQLite::OPEN_READWRITE);
+        SQLite::Database db(database_file_path, SQLite::OPEN_READWRITE, kSqliteWriterBusyTimeoutMs);
         result.expired_trade_ids = FindMaturedLiveTradeIds(db, as_of_iso, portfolio_id);
         if (result.expired_trade_ids.empty()) {
             return result;
@@ -20,6 +20,7 @@
 namespace numeraire::market_data_providers {
 
 using numeraire::database::BootstrapTradeDatabaseSchema;
+using numeraire::database::kSqliteWriterBusyTimeoutMs;
 using numeraire::market_data_providers::polygon_ingest::AsOfIsoFromPolygonBarMs;
 using numeraire::market_data_providers::polygon_ingest::DataSourceLabelForBaseUrl;
 using numeraire::market_data_providers::polygon_ingest::FetchJsonPage;
@@ -233,7 +234,7 @@ int TryRunPolygonDailyEodFetch(const int argc, char** argv, const numeraire::uti
     Logger::NumInfo("equity_daily_eod ingest → SQLite {}", db_path.string());
 
     try {
-        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
 
         for (const std::string& t : tickers) {
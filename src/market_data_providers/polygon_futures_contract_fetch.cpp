@@ -21,6 +21,7 @@
 namespace numeraire::market_data_providers {
 
 using numeraire::database::BootstrapTradeDatabaseSchema;
+using numeraire::database::kSqliteWriterBusyTimeoutMs;
 using numeraire::utils::Logger;
 using numeraire::utils::ResolveDatabasePath;
 using numeraire::market_data_providers::polygon_ingest::DataSourceLabelForBaseUrl;
@@ -346,7 +347,7 @@ int TryRunPolygonFuturesContractFetch(const int argc, char** argv, const numerai
     Logger::NumInfo("futures_contract ingest → SQLite {}", db_path.string());
 
     try {
-        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
 
         if (product_codes.empty()) {
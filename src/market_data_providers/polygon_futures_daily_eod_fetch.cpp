@@ -24,6 +24,7 @@
 namespace numeraire::market_data_providers {
 
 using numeraire::database::BootstrapTradeDatabaseSchema;
+using numeraire::database::kSqliteWriterBusyTimeoutMs;
 using numeraire::utils::Logger;
 using numeraire::utils::ResolveDatabasePath;
 using numeraire::market_data_providers::polygon_ingest::DataSourceLabelForBaseUrl;
@@ -433,7 +434,7 @@ int TryRunPolygonFuturesDailyEodFetch(const int argc, char** argv, const numerai
     Logger::NumInfo("futures_daily_eod ingest → SQLite {}", db_path.string());
 
     try {
-        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
 
         const auto tickers = LoadContractTickers(db, listing_as_of, product_codes, active_only);
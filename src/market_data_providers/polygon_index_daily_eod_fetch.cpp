@@ -19,6 +19,7 @@
 namespace numeraire::market_data_providers {
 
 using numeraire::database::BootstrapTradeDatabaseSchema;
+using numeraire::database::kSqliteWriterBusyTimeoutMs;
 using numeraire::utils::Logger;
 using numeraire::utils::ResolveDatabasePath;
 using numeraire::market_data_providers::polygon_ingest::AsOfIsoFromPolygonBarMs;
@@ -228,7 +229,7 @@ int TryRunPolygonIndexDailyEodFetch(const int argc, char** argv, const numeraire
     Logger::NumInfo("index_daily_eod ingest → SQLite {}", db_path.string());
 
     try {
-        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
 
         for (const std::string& t : tickers) {
@@ -20,6 +20,7 @@
 namespace numeraire::market_data_providers {
 
 using numeraire::database::BootstrapTradeDatabaseSchema;
+using numeraire::database::kSqliteWriterBusyTimeoutMs;
 using numeraire::utils::Logger;
 using numeraire::utils::ResolveDatabasePath;
 using numeraire::market_data_providers::polygon_ingest::DataSourceLabelForBaseUrl;
@@ -502,7 +503,7 @@ int TryRunPolygonOptionContractFetch(const int argc, char** argv, const numerair
     }
 
     try {
-        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
 
         std::string day = from_iso;
@@ -20,6 +20,7 @@
 namespace numeraire::market_data_providers {
 
 using numeraire::database::BootstrapTradeDatabaseSchema;
+using numeraire::database::kSqliteWriterBusyTimeoutMs;
 using numeraire::utils::Logger;
 using numeraire::utils::ResolveDatabasePath;
 using numeraire::market_data_providers::polygon_ingest::AsOfIsoFromPolygonBarMs;
@@ -337,7 +338,7 @@ int TryRunPolygonOptionDailyPriceEodFetch(const int argc, char** argv, const num
                     throttle_sec);
 
     try {
-        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE);
+        SQLite::Database db(db_path.string(), SQLite::OPEN_READWRITE | SQLite::OPEN_CREATE, kSqliteWriterBusyTimeoutMs);
         db.exec("PRAGMA foreign_keys = ON;");
 
         std::vector<std::string> tickers = explicit_tickers;
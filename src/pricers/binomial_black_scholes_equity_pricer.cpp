@@ -130,9 +130,61 @@ constexpr const char* kBinomialStepsConfigKey = "pricing.binomial.default_steps"
     return g;
 }
 
+[[nodiscard]] bool IsPlainCrr(const quant::BinomialTreeSettings& settings) {
+    return settings.method == quant::BinomialTreeMethod::kCoxRossRubinstein && !settings.richardson;
+}
+
+[[nodiscard]] const char* MethodName(const quant::BinomialTreeMethod method) {
+    return method == quant::BinomialTreeMethod::kLeisenReimer ? "leisen_reimer" : "crr";
+}
+
+[[nodiscard]] double AcceleratedNpv(const OptionType kind,
+                                    const ExerciseStyle exercise,
+                                    const double spot,
+                                    const double strike,
+                                    const double r,
+                                    const double q,
+                                    const double vol,
+                                    const double tau,
+                                    const std::size_t n_steps,
+                                    const quant::BinomialTreeSettings& settings) {
+    return quant::BinomialVanillaValuation(kind, exercise, spot, strike, r, q, vol, tau, n_steps, settings).npv;
+}
+
+/// Delta / gamma / theta from the tree; only vega and rho need repricing (4 trees instead of 8).
+[[nodiscard]] core::PricingGreeks TreeGreeks(const OptionType kind,
+                                             const ExerciseStyle exercise,
+                                             const double spot,
+                                             const double strike,
+                                             const double r,
+                                             const double q,
+                                             const double vol,
+                                             const double tau,
+                                             const quant::BinomialVanillaResult& base,
+                                             const std::size_t n_steps,
+                                             const quant::BinomialTreeSettings& settings) {
+    core::PricingGreeks g;
+    g.delta = base.delta;
+    g.gamma = base.gamma;
+    g.theta = base.theta;
+
+    const double dv = kVolAbsBump;
+    const double v_up = AcceleratedNpv(kind, exercise, spot, strike, r, q, vol + dv, tau, n_steps, settings);
+    const double v_dn =
+            AcceleratedNpv(kind, exercise, spot, strike, r, q, std::max(vol - dv, 0.0), tau, n_steps, settings);
+    g.vega = (v_up - v_dn) / (2.0 * dv);
+
+    const double dr = kRateAbsBump;
+    const double r_up = AcceleratedNpv(kind, exercise, spot, strike, r + dr, q, vol, tau, n_steps, settings);
+    const double r_dn = AcceleratedNpv(kind, exercise, spot, strike, r - dr, q, vol, tau, n_steps, settings);
+    g.rho = (r_up - r_dn) / (2.0 * dr);
+    return g;
+}
+
 [[nodiscard]] core::PricingResult PriceVanilla(const products::VanillaEquityOptionProduct& vanilla,
                                                const core::IMarketData& market,
-                                               const std::size_t n_steps) {
+                                               const std::size_t n_steps,
+                                               const quant::BinomialTreeSettings& settings) {
     const ExerciseStyle exercise = vanilla.Exercise();
     if (exercise != ExerciseStyle::kEuropean && exercise != ExerciseStyle::kAmerican) {
         throw ValidationError("BinomialBlackScholesEquityPricer supports European or American exercise only");
@@ -154,6 +206,23 @@ constexpr const char* kBinomialStepsConfigKey = "pricing.binomial.default_steps"
     }
 
     const double vol = market.ImpliedVolatility(vanilla.UnderlyingId(), strike, tau, kind);
+    if (!IsPlainCrr(settings)) {
+        const quant::BinomialVanillaResult base =
+                quant::BinomialVanillaValuation(kind, exercise, spot, strike, r, q, vol, tau, n_steps, settings);
+        result.SetNpv(base.npv);
+        result.SetGreeks(base.has_greeks
+                                 ? TreeGreeks(kind, exercise, spot, strike, r, q, vol, tau, base, n_steps, settings)
+                                 : BumpGreeks(kind, exercise, spot, strike, r, q, vol, tau, base.npv, n_steps));
+
+        core::PricingMetadata meta;
+        meta.diagnostics = "crr_n_steps=" + std::to_string(n_steps) + "; tree_method=" + MethodName(settings.method) +
+                           "; tree_richardson=" + (settings.richardson ? "1" : "0") +
+                           "; tree_fine_steps=" + std::to_string(base.n_steps) +
+                           "; tree_greeks=" + (base.has_greeks ? "1" : "0");
+        result.SetMetadata(std::move(meta));
+        return result;
+    }
+
     const double npv = TreeNpv(kind, exercise, spot, strike, r, q, vol, tau, n_steps);
     result.SetNpv(npv);
     result.SetGreeks(BumpGreeks(kind, exercise, spot, strike, r, q, vol, tau, npv, n_steps));
@@ -172,6 +241,10 @@ BinomialBlackScholesEquityPricer::BinomialBlackScholesEquityPricer()
 BinomialBlackScholesEquityPricer::BinomialBlackScholesEquityPricer(const std::size_t n_steps)
     : n_steps_(ClampSteps(n_steps)) {}
 
+BinomialBlackScholesEquityPricer::BinomialBlackScholesEquityPricer(const std::size_t n_steps,
+                                                                   const quant::BinomialTreeSettings settings)
+    : n_steps_(ClampSteps(n_steps)), settings_(settings) {}
+
 numeraire::PricingEngineType BinomialBlackScholesEquityPricer::EngineKind() const {
     return numeraire::PricingEngineType::kBinomialTree;
 }
@@ -179,7 +252,7 @@ numeraire::PricingEngineType BinomialBlackScholesEquityPricer::EngineKind() cons
 core::PricingResult BinomialBlackScholesEquityPricer::Price(const core::IProduct& product,
                                                             const core::IMarketData& market) const {
     if (const auto* vanilla = dynamic_cast<const products::VanillaEquityOptionProduct*>(&product)) {
-        return PriceVanilla(*vanilla, market, n_steps_);
+        return PriceVanilla(*vanilla, market, n_steps_, settings_);
     }
     throw ValidationError("BinomialBlackScholesEquityPricer requires VanillaEquityOptionProduct");
 }
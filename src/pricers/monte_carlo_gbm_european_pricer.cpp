@@ -10,6 +10,7 @@
 #include <numeraire/simulation/exposure_time_grid.hpp>
 #include <numeraire/simulation/gbm_evolution.hpp>
 #include <numeraire/simulation/gbm_spec.hpp>
+#include <numeraire/simulation/normal_random.hpp>
 #include <numeraire/simulation/random_engine.hpp>
 #include <numeraire/simulation/scenario_buffer.hpp>
 #include <numeraire/utils/config.hpp>
@@ -17,6 +18,7 @@
 
 #include <algorithm>
 #include <array>
+#include <bit>
 #include <cmath>
 #include <cstdio>
 #include <cstdlib>
@@ -102,6 +104,18 @@ constexpr const char* kSeedConfigKey = "pricing.monte_carlo_pricer.default_seed"
     return std::string(buf.data());
 }
 
+/// Two replications is the minimum for a spread, hence a randomised-QMC standard error.
+[[nodiscard]] std::size_t ClampReplications(const std::size_t replications) {
+    return std::max<std::size_t>(2, replications);
+}
+
+/// Undiscounted payoff mean and its standard error over `num_paths` draws.
+struct PayoffEstimate {
+    double mean{0.0};
+    double std_error{0.0};
+    std::size_t num_paths{0};
+};
+
 /// Valuation date and expiry only — one exact GBM step straight to maturity.
 [[nodiscard]] simulation::ExposureTimeGrid TerminalGrid(const schedule::Date& valuation_date,
                                                         const schedule::Date& expiry_date,
@@ -118,10 +132,85 @@ constexpr const char* kSeedConfigKey = "pricing.monte_carlo_pricer.default_seed"
     return grid;
 }
 
+[[nodiscard]] PayoffEstimate PseudoRandomPayoffEstimate(const OptionType kind,
+                                                        const double spot,
+                                                        const double strike,
+                                                        const double r,
+                                                        const double q,
+                                                        const double vol,
+                                                        const simulation::ExposureTimeGrid& grid,
+                                                        const std::size_t num_paths,
+                                                        const std::uint64_t seed) {
+    simulation::ScenarioBuffer buffer(1U, 2U, num_paths);
+    simulation::MersenneTwisterEngine engine(seed);
+    const simulation::SingleFactorGbmSpec spec{spot, r, q, vol};
+    simulation::EvolveSingleFactorGbm(buffer, grid, spec, engine);
+
+    double sum = 0.0;
+    double sum_squares = 0.0;
+    const std::span<const double> terminal = buffer.Slab(0U, 1U);
+    for (const double spot_at_expiry : terminal) {
+        const double payoff = Payoff(kind, spot_at_expiry, strike);
+        sum += payoff;
+        sum_squares += payoff * payoff;
+    }
+
+    const double n = static_cast<double>(num_paths);
+    const double mean = sum / n;
+    // Unbiased sample variance of the payoff; the mean of n draws is sqrt(n) tighter.
+    const double variance = std::max((sum_squares - (n * mean * mean)) / (n - 1.0), 0.0);
+    return PayoffEstimate{mean, std::sqrt(variance / n), num_paths};
+}
+
+/// Sobol points per scramble: the even share of the budget rounded down to a power of
+/// two. Only power-of-two prefixes keep one point per dyadic cell, the balance QMC
+/// accuracy rests on. Same rule as the web sampler (`journal.monte_carlo`).
+[[nodiscard]] std::size_t SobolPointsPerReplication(const std::size_t num_paths, const std::size_t replications) {
+    return std::bit_floor(std::max<std::size_t>(1, num_paths / replications));
+}
+
+/// Randomised QMC: the path budget is split over independent scrambles of the same
+/// Sobol points. Each scramble gives an unbiased estimate; their spread is the error.
+[[nodiscard]] PayoffEstimate SobolPayoffEstimate(const OptionType kind,
+                                                 const double spot,
+                                                 const double strike,
+                                                 const double r,
+                                                 const double q,
+                                                 const double vol,
+                                                 const double tau,
+                                                 const std::size_t num_paths,
+                                                 const std::uint64_t seed,
+                                                 const std::size_t replications) {
+    const std::size_t per_replication = SobolPointsPerReplication(num_paths, replications);
+    const double drift = (r - q - (0.5 * vol * vol)) * tau;
+    const double vol_sqrt_tau = vol * std::sqrt(tau);
+
+    double sum = 0.0;
+    double sum_squares = 0.0;
+    for (std::size_t rep = 0; rep < replications; ++rep) {
+        simulation::ScrambledSobolEngine engine(seed, rep);
+        double payoff_sum = 0.0;
+        for (std::size_t i = 0; i < per_replication; ++i) {
+            const double z = simulation::InverseCumulativeNormal(engine.NextUniform());
+            payoff_sum += Payoff(kind, spot * std::exp(drift + (vol_sqrt_tau * z)), strike);
+        }
+        const double replication_mean = payoff_sum / static_cast<double>(per_replication);
+        sum += replication_mean;
+        sum_squares += replication_mean * replication_mean;
+    }
+
+    const double m = static_cast<double>(replications);
+    const double mean = sum / m;
+    const double variance = std::max((sum_squares - (m * mean * mean)) / (m - 1.0), 0.0);
+    return PayoffEstimate{mean, std::sqrt(variance / m), per_replication * replications};
+}
+
 [[nodiscard]] core::PricingResult PriceEuropean(const products::VanillaEquityOptionProduct& vanilla,
                                                 const core::IMarketData& market,
                                                 const std::size_t num_paths,
-                                                const std::uint64_t seed) {
+                                                const std::uint64_t seed,
+                                                const MonteCarloSampler sampler,
+                                                const std::size_t qmc_replications) {
     if (vanilla.Exercise() != ExerciseStyle::kEuropean) {
         throw ValidationError("MonteCarloGbmEuropeanPricer supports European exercise only");
     }
@@ -147,36 +236,33 @@ constexpr const char* kSeedConfigKey = "pricing.monte_carlo_pricer.default_seed"
 
     const double vol = market.ImpliedVolatility(vanilla.UnderlyingId(), strike, tau, kind);
 
-    simulation::ScenarioBuffer buffer(1U, 2U, num_paths);
-    simulation::MersenneTwisterEngine engine(seed);
-    const simulation::SingleFactorGbmSpec spec{spot, r, q, vol};
-    simulation::EvolveSingleFactorGbm(
-            buffer, TerminalGrid(market.ValuationDate(), vanilla.ExpiryDate(), tau), spec, engine);
-
-    double sum = 0.0;
-    double sum_squares = 0.0;
-    const std::span<const double> terminal = buffer.Slab(0U, 1U);
-    for (const double spot_at_expiry : terminal) {
-        const double payoff = Payoff(kind, spot_at_expiry, strike);
-        sum += payoff;
-        sum_squares += payoff * payoff;
-    }
+    const PayoffEstimate estimate =
+            sampler == MonteCarloSampler::kSobol
+                    ? SobolPayoffEstimate(kind, spot, strike, r, q, vol, tau, num_paths, seed, qmc_replications)
+                    : PseudoRandomPayoffEstimate(kind,
+                                                 spot,
+                                                 strike,
+                                                 r,
+                                                 q,
+                                                 vol,
+                                                 TerminalGrid(market.ValuationDate(), vanilla.ExpiryDate(), tau),
+                                                 num_paths,
+                                                 seed);
 
-    const double n = static_cast<double>(num_paths);
-    const double mean = sum / n;
-    // Unbiased sample variance of the payoff; the mean of n draws is sqrt(n) tighter.
-    const double variance = std::max((sum_squares - (n * mean * mean)) / (n - 1.0), 0.0);
     const double discount = std::exp(-r * tau);
-    const double npv = discount * mean;
-    const double std_error = discount * std::sqrt(variance / n);
+    const double npv = discount * estimate.mean;
+    const double std_error = discount * estimate.std_error;
 
     result.SetNpv(npv);
 
-    std::string diagnostics = "mc_paths=" + std::to_string(num_paths) + "; mc_seed=" + std::to_string(seed) +
-                              "; mc_std_err=" + FormatDouble(std_error);
+    std::string diagnostics = "mc_paths=" + std::to_string(estimate.num_paths) +
+                              "; mc_seed=" + std::to_string(seed) + "; mc_std_err=" + FormatDouble(std_error);
     if (npv > 0.0) {
         diagnostics += "; mc_std_err_pct=" + FormatDouble(100.0 * std_error / npv);
     }
+    if (sampler == MonteCarloSampler::kSobol) {
+        diagnostics += "; mc_sampler=sobol; mc_qmc_replications=" + std::to_string(qmc_replications);
+    }
     meta.diagnostics = std::move(diagnostics);
     result.SetMetadata(std::move(meta));
     return result;
@@ -187,8 +273,21 @@ constexpr const char* kSeedConfigKey = "pricing.monte_carlo_pricer.default_seed"
 MonteCarloGbmEuropeanPricer::MonteCarloGbmEuropeanPricer()
     : num_paths_(ResolveDefaultPaths()), seed_(ResolveDefaultSeed()) {}
 
-MonteCarloGbmEuropeanPricer::MonteCarloGbmEuropeanPricer(const std::size_t num_paths, const std::uint64_t seed)
-    : num_paths_(ClampPaths(num_paths)), seed_(seed) {}
+MonteCarloGbmEuropeanPricer::MonteCarloGbmEuropeanPricer(const std::size_t num_paths,
+                                                         const std::uint64_t seed,
+                                                         const MonteCarloSampler sampler,
+                                                         const std::size_t qmc_replications)
+    : num_paths_(ClampPaths(num_paths)),
+      seed_(seed),
+      sampler_(sampler),
+      qmc_replications_(ClampReplications(qmc_replications)) {}
+
+std::size_t MonteCarloGbmEuropeanPricer::SimulatedPaths() const {
+    if (sampler_ == MonteCarloSampler::kSobol) {
+        return SobolPointsPerReplication(num_paths_, qmc_replications_) * qmc_replications_;
+    }
+    return num_paths_;
+}
 
 numeraire::PricingEngineType MonteCarloGbmEuropeanPricer::EngineKind() const {
     return numeraire::PricingEngineType::kMonteCarlo;
@@ -197,7 +296,7 @@ numeraire::PricingEngineType MonteCarloGbmEuropeanPricer::EngineKind() const {
 core::PricingResult MonteCarloGbmEuropeanPricer::Price(const core::IProduct& product,
                                                        const core::IMarketData& market) const {
     if (const auto* vanilla = dynamic_cast<const products::VanillaEquityOptionProduct*>(&product)) {
-        return PriceEuropean(*vanilla, market, num_paths_, seed_);
+        return PriceEuropean(*vanilla, market, num_paths_, seed_, sampler_, qmc_replications_);
     }
     throw ValidationError("MonteCarloGbmEuropeanPricer requires VanillaEquityOptionProduct");
 }
@@ -23,6 +23,124 @@ namespace {
     return spot0 * std::pow(u, up_moves) * std::pow(d, step - up_moves);
 }
 
+/// Peizer–Pratt method-2 inversion: binomial probability matching \(N(z)\) on an odd \(n\)-step tree.
+[[nodiscard]] double PeizerPrattInversion(const double z, const double n) {
+    const double t = z / (n + 1.0 / 3.0 + 0.1 / (n + 1.0));
+    const double half_width = 0.5 * std::sqrt(1.0 - std::exp(-t * t * (n + 1.0 / 6.0)));
+    return z >= 0.0 ? 0.5 + half_width : 0.5 - half_width;
+}
+
+struct Lattice {
+    double u = 0.0;
+    double d = 0.0;
+    double p = 0.0;
+    double disc = 0.0;
+    double dt = 0.0;
+};
+
+[[nodiscard]] Lattice MakeLattice(const BinomialTreeMethod method,
+                                  const double spot,
+                                  const double strike,
+                                  const double r,
+                                  const double q,
+                                  const double vol,
+                                  const double tau,
+                                  const int n) {
+    Lattice lat;
+    lat.dt = tau / static_cast<double>(n);
+    lat.disc = std::exp(-r * lat.dt);
+    const double growth = std::exp((r - q) * lat.dt);
+    if (method == BinomialTreeMethod::kLeisenReimer) {
+        const double vol_sqrt_tau = vol * std::sqrt(tau);
+        const double d1 = (std::log(spot / strike) + (r - q + 0.5 * vol * vol) * tau) / vol_sqrt_tau;
+        const double d2 = d1 - vol_sqrt_tau;
+        const double p = PeizerPrattInversion(d2, static_cast<double>(n));
+        const double p_bar = PeizerPrattInversion(d1, static_cast<double>(n));
+        lat.p = p;
+        lat.u = growth * p_bar / p;
+        lat.d = (growth - p * lat.u) / (1.0 - p);
+        return lat;
+    }
+    lat.u = std::exp(vol * std::sqrt(lat.dt));
+    lat.d = 1.0 / lat.u;
+    lat.p = std::min(1.0, std::max(0.0, (growth - lat.d) / (lat.u - lat.d)));
+    return lat;
+}
+
+/// One rollback over `buffer` (resized to n+1, reused across calls); greeks from steps 1 and 2.
+[[nodiscard]] BinomialVanillaResult RollBack(const OptionType kind,
+                                             const bool american,
+                                             const double spot,
+                                             const double strike,
+                                             const Lattice& lat,
+                                             const int n,
+                                             std::vector<double>& buffer) {
+    buffer.resize(static_cast<std::size_t>(n) + 1U);
+    double* v = buffer.data();
+    const double ud = lat.u / lat.d;
+    const double pu = lat.disc * lat.p;
+    const double pd = lat.disc * (1.0 - lat.p);
+
+    double s = spot * std::pow(lat.d, n);
+    for (int i = 0; i <= n; ++i) {
+        v[i] = Payoff(kind, s, strike);
+        s *= ud;
+    }
+
+    double step2[3] = {0.0, 0.0, 0.0};
+    double step1[2] = {0.0, 0.0};
+    if (n == 2) {
+        // The rollback starts at step 1: the step-2 nodes are the terminal payoffs.
+        std::copy(v, v + 3, step2);
+    }
+    for (int step = n - 1; step >= 0; --step) {
+        if (american) {
+            s = spot * std::pow(lat.d, step);
+            for (int i = 0; i <= step; ++i) {
+                v[i] = std::max(Payoff(kind, s, strike), pu * v[i + 1] + pd * v[i]);
+                s *= ud;
+            }
+        } else {
+            for (int i = 0; i <= step; ++i) {
+                v[i] = pu * v[i + 1] + pd * v[i];
+            }
+        }
+        if (step == 2) {
+            std::copy(v, v + 3, step2);
+        } else if (step == 1) {
+            std::copy(v, v + 2, step1);
+        }
+    }
+
+    BinomialVanillaResult out;
+    out.npv = v[0];
+    out.n_steps = static_cast<std::size_t>(n);
+
+    const double s_u = spot * lat.u;
+    const double s_d = spot * lat.d;
+    const double s_uu = s_u * lat.u;
+    const double s_ud = s_u * lat.d;
+    const double s_dd = s_d * lat.d;
+    out.delta = (step1[1] - step1[0]) / (s_u - s_d);
+    const double delta_up = (step2[2] - step2[1]) / (s_uu - s_ud);
+    const double delta_dn = (step2[1] - step2[0]) / (s_ud - s_dd);
+    out.gamma = (delta_up - delta_dn) / (0.5 * (s_uu - s_dd));
+    // V(S_ud, 2dt) - V(S0, 0), with the spot move S_ud - S0 taken out by a 2nd-order expansion.
+    const double ds = s_ud - spot;
+    out.theta = (step2[1] - out.npv - out.delta * ds - 0.5 * out.gamma * ds * ds) / (2.0 * lat.dt);
+    out.has_greeks = true;
+    return out;
+}
+
+[[nodiscard]] int EffectiveSteps(const BinomialTreeMethod method, const std::size_t n_steps) {
+    // Greeks need nodes at step 2; Leisen–Reimer is defined on odd trees only.
+    int n = static_cast<int>(std::max<std::size_t>(n_steps, 2U));
+    if (method == BinomialTreeMethod::kLeisenReimer && n % 2 == 0) {
+        ++n;
+    }
+    return n;
+}
+
 }  // namespace
 
 double CoxRossRubinsteinVanillaPrice(const OptionType option_type,
@@ -100,6 +218,55 @@ double CoxRossRubinsteinVanillaPrice(const OptionType option_type,
     return v[0];
 }
 
+BinomialVanillaResult BinomialVanillaValuation(const OptionType option_type,
+                                               const ExerciseStyle exercise,
+                                               const double spot,
+                                               const double strike,
+                                               const double risk_free_rate,
+                                               const double dividend_yield,
+                                               const double volatility,
+                                               const double time_to_expiry_years,
+                                               const std::size_t n_steps,
+                                               const BinomialTreeSettings settings) {
+    if (spot <= 0.0 || strike <= 0.0 || time_to_expiry_years <= 0.0 || volatility <= 0.0 || n_steps < 2) {
+        BinomialVanillaResult out;
+        out.npv = CoxRossRubinsteinVanillaPrice(option_type, exercise, spot, strike, risk_free_rate, dividend_yield,
+                                                volatility, time_to_expiry_years, n_steps);
+        out.n_steps = n_steps;
+        return out;
+    }
+
+    const bool american = exercise == ExerciseStyle::kAmerican;
+    const int n1 = EffectiveSteps(settings.method, n_steps);
+    std::vector<double> buffer;
+    buffer.reserve(static_cast<std::size_t>(settings.richardson ? 2 * n1 + 2 : n1 + 1));
+
+    const Lattice coarse_lat = MakeLattice(settings.method, spot, strike, risk_free_rate, dividend_yield, volatility,
+                                           time_to_expiry_years, n1);
+    const BinomialVanillaResult coarse = RollBack(option_type, american, spot, strike, coarse_lat, n1, buffer);
+    if (!settings.richardson) {
+        return coarse;
+    }
+
+    const int n2 = settings.method == BinomialTreeMethod::kLeisenReimer ? 2 * n1 + 1 : 2 * n1;
+    const Lattice fine_lat = MakeLattice(settings.method, spot, strike, risk_free_rate, dividend_yield, volatility,
+                                         time_to_expiry_years, n2);
+    const BinomialVanillaResult fine = RollBack(option_type, american, spot, strike, fine_lat, n2, buffer);
+
+    const double w = 1.0 / (static_cast<double>(n2) / static_cast<double>(n1) - 1.0);
+    const auto extrapolate = [w](const double x_coarse, const double x_fine) {
+        return x_fine + w * (x_fine - x_coarse);
+    };
+    BinomialVanillaResult out;
+    out.npv = extrapolate(coarse.npv, fine.npv);
+    out.delta = extrapolate(coarse.delta, fine.delta);
+    out.gamma = extrapolate(coarse.gamma, fine.gamma);
+    out.theta = extrapolate(coarse.theta, fine.theta);
+    out.n_steps = static_cast<std::size_t>(n2);
+    out.has_greeks = true;
+    return out;
+}
+
 CrrTreeDump CoxRossRubinsteinVanillaTree(const OptionType option_type,
                                          const ExerciseStyle exercise,
                                          const double spot,
@@ -1,5 +1,6 @@
 #include <numeraire/simulation/random_engine.hpp>
 
+#include <bit>
 #include <cstdint>
 #include <limits>
 #include <random>
@@ -20,6 +21,11 @@ constexpr std::uint64_t kLow32Mask = 0xFFFFFFFFULL;
     return std::mt19937(sequence);
 }
 
+/// Sobol direction numbers for dimension one: v_j = 2^(32 - j).
+[[nodiscard]] std::uint32_t DirectionNumber(const int j) {
+    return 1U << (ScrambledSobolEngine::kBits - 1 - j);
+}
+
 }  // namespace
 
 MersenneTwisterEngine::MersenneTwisterEngine(const std::uint64_t seed, const std::uint64_t stream_index)
@@ -40,4 +46,43 @@ void MersenneTwisterEngine::FillUniform(std::span<double> out) {
     }
 }
 
+ScrambledSobolEngine::ScrambledSobolEngine(const std::uint64_t seed, const std::uint64_t replication) {
+    // Scramble bits come from the same seeded stream pattern as the pseudo-random engine.
+    std::mt19937 bits = SeedMersenne(seed, replication);
+    for (int j = 0; j < kBits; ++j) {
+        // Row j keeps its diagonal bit and takes random bits strictly above it
+        // (earlier, more significant digits), so the matrix is invertible.
+        const std::uint32_t diagonal = 1U << (kBits - 1 - j);
+        const std::uint32_t above = j == 0 ? 0U : ~((diagonal << 1U) - 1U);
+        scramble_rows_[static_cast<std::size_t>(j)] = diagonal | (static_cast<std::uint32_t>(bits()) & above);
+    }
+    digital_shift_ = static_cast<std::uint32_t>(bits());
+}
+
+double ScrambledSobolEngine::NextUniform() {
+    // Gray-code update: point i differs from point i-1 in one direction number.
+    if (index_ > 0) {
+        state_ ^= DirectionNumber(std::countr_zero(index_));
+    }
+    ++index_;
+
+    // Output digit j = parity of (row j AND input digits) over GF(2).
+    std::uint32_t scrambled = 0;
+    for (int j = 0; j < kBits; ++j) {
+        const std::uint32_t row = scramble_rows_[static_cast<std::size_t>(j)];
+        const auto parity = static_cast<std::uint32_t>(std::popcount(state_ & row) & 1);
+        scrambled |= parity << (kBits - 1 - j);
+    }
+    scrambled ^= digital_shift_;
+
+    constexpr double kScale = 1.0 / 4294967296.0;  // 2^-32
+    return (static_cast<double>(scrambled) + 0.5) * kScale;
+}
+
+void ScrambledSobolEngine::FillUniform(std::span<double> out) {
+    for (double& value : out) {
+        value = NextUniform();
+    }
+}
+
 }  // namespace numeraire::simulation
@@ -155,6 +155,43 @@ TEST(BinomialBlackScholesEquityPricerTest, AmericanProducesBumpGreeks) {
     EXPECT_GT(*res.Greeks()->gamma, 0.0);
 }
 
+TEST(BinomialBlackScholesEquityPricerTest, LeisenReimerRichardsonMatchesFineCrrWithTreeGreeks) {
+    const numeraire::schedule::Date trade{.year = 2025, .month = 1, .day = 1};
+    const numeraire::schedule::Date expiry{.year = 2025, .month = 7, .day = 1};
+    const numeraire::products::VanillaEquityOptionProduct put("AAPL", numeraire::OptionType::kPut,
+                                                              numeraire::ExerciseStyle::kAmerican, 100.0, trade,
+                                                              expiry);
+
+    MapMarket market;
+    market.SetSpot("AAPL", 100.0);
+    market.SetRate(0.04);
+    market.SetDivYield(0.0);
+    market.SetVol(0.22);
+
+    const numeraire::pricers::BinomialBlackScholesEquityPricer fine(2000);
+    const numeraire::pricers::BinomialBlackScholesEquityPricer fast(
+            numeraire::pricers::BinomialBlackScholesEquityPricer::kAcceleratedSteps,
+            {.method = numeraire::quant::BinomialTreeMethod::kLeisenReimer, .richardson = true});
+    const auto ref = fine.Price(put, market);
+    const auto res = fast.Price(put, market);
+    ASSERT_TRUE(ref.Npv().has_value());
+    ASSERT_TRUE(res.Npv().has_value());
+    EXPECT_NEAR(*res.Npv(), *ref.Npv(), 5.0e-3);
+
+    ASSERT_TRUE(res.Greeks().has_value());
+    ASSERT_TRUE(ref.Greeks().has_value());
+    EXPECT_NEAR(*res.Greeks()->delta, *ref.Greeks()->delta, 2.0e-3);
+    EXPECT_NEAR(*res.Greeks()->gamma, *ref.Greeks()->gamma, 5.0e-4);
+    EXPECT_NEAR(*res.Greeks()->vega, *ref.Greeks()->vega, 5.0e-2);
+    EXPECT_NEAR(*res.Greeks()->rho, *ref.Greeks()->rho, 1.5e-1);
+    EXPECT_LT(*res.Greeks()->theta, 0.0);
+
+    ASSERT_TRUE(res.Metadata().has_value());
+    ASSERT_TRUE(res.Metadata()->diagnostics.has_value());
+    EXPECT_NE(res.Metadata()->diagnostics->find("tree_method=leisen_reimer"), std::string::npos);
+    EXPECT_NE(res.Metadata()->diagnostics->find("tree_fine_steps=51"), std::string::npos);
+}
+
 TEST(BinomialBlackScholesEquityPricerTest, ZeroTimeIsIntrinsic) {
     const numeraire::schedule::Date d{.year = 2025, .month = 6, .day = 1};
     const numeraire::products::VanillaEquityOptionProduct call("AAPL", numeraire::OptionType::kCall,
@@ -199,3 +199,60 @@ TEST(MonteCarloGbmEuropeanPricerTest, ZeroTimeIsIntrinsic) {
     ASSERT_TRUE(res.Npv().has_value());
     EXPECT_NEAR(*res.Npv(), 12.0, 1.0e-12);
 }
+
+TEST(MonteCarloGbmEuropeanPricerTest, SobolSamplerConvergesToAnalytic) {
+    const auto call = OneYearCall();
+    MapMarket market;
+    ConfigureAtmMarket(market);
+
+    const numeraire::pricers::AnalyticBlackScholesEquityPricer analytic;
+    const numeraire::pricers::MonteCarloGbmEuropeanPricer sobol(65536, 20240501,
+                                                                numeraire::pricers::MonteCarloSampler::kSobol);
+    const auto a = analytic.Price(call, market);
+    const auto m = sobol.Price(call, market);
+    ASSERT_TRUE(a.Npv().has_value());
+    ASSERT_TRUE(m.Npv().has_value());
+
+    // 16 scrambles of 4096 points: QMC error is far below the ~0.07 pseudo-random
+    // standard error at this budget.
+    EXPECT_NEAR(*m.Npv(), *a.Npv(), 0.01);
+}
+
+TEST(MonteCarloGbmEuropeanPricerTest, SobolDiagnosticsCarrySamplerAndReplications) {
+    const auto call = OneYearCall();
+    MapMarket market;
+    ConfigureAtmMarket(market);
+
+    const numeraire::pricers::MonteCarloGbmEuropeanPricer pricer(10000, 7, numeraire::pricers::MonteCarloSampler::kSobol,
+                                                                 8);
+    const auto res = pricer.Price(call, market);
+    ASSERT_TRUE(res.Metadata().has_value());
+    ASSERT_TRUE(res.Metadata()->diagnostics.has_value());
+    const std::string& diag = *res.Metadata()->diagnostics;
+    // 10000 / 8 = 1250 rounds down to 1024 points per scramble: 8192 paths are used.
+    EXPECT_NE(diag.find("mc_paths=8192;"), std::string::npos);
+    EXPECT_EQ(pricer.NumPaths(), 10000U);
+    EXPECT_EQ(pricer.SimulatedPaths(), 8192U);
+    EXPECT_NE(diag.find("mc_sampler=sobol"), std::string::npos);
+    EXPECT_NE(diag.find("mc_qmc_replications=8"), std::string::npos);
+    EXPECT_NE(diag.find("mc_std_err="), std::string::npos);
+}
+
+TEST(MonteCarloGbmEuropeanPricerTest, SobolDefaultsAndModestBudgetAccuracy) {
+    const auto call = OneYearCall();
+    MapMarket market;
+    ConfigureAtmMarket(market);
+
+    const numeraire::pricers::AnalyticBlackScholesEquityPricer analytic;
+    const auto reference = analytic.Price(call, market);
+    ASSERT_TRUE(reference.Npv().has_value());
+
+    const numeraire::pricers::MonteCarloGbmEuropeanPricer sobol(16384, 11,
+                                                                numeraire::pricers::MonteCarloSampler::kSobol);
+    const auto s = sobol.Price(call, market);
+    ASSERT_TRUE(s.Npv().has_value());
+    // Pseudo-random at 16k paths has a ~0.14 standard error; Sobol lands well inside that.
+    EXPECT_LT(std::abs(*s.Npv() - *reference.Npv()), 0.02);
+    EXPECT_EQ(sobol.Sampler(), numeraire::pricers::MonteCarloSampler::kSobol);
+    EXPECT_EQ(sobol.QmcReplications(), numeraire::pricers::MonteCarloGbmEuropeanPricer::kDefaultQmcReplications);
+}
@@ -11,8 +11,12 @@ namespace {
 
 using numeraire::ExerciseStyle;
 using numeraire::OptionType;
+using numeraire::quant::BinomialTreeMethod;
+using numeraire::quant::BinomialTreeSettings;
+using numeraire::quant::BinomialVanillaValuation;
 using numeraire::quant::CoxRossRubinsteinVanillaPrice;
 using numeraire::quant::CoxRossRubinsteinVanillaTree;
+using numeraire::quant::EuropeanVanillaAllGreeks;
 using numeraire::quant::EuropeanVanillaPrice;
 
 }  // namespace
@@ -111,3 +115,112 @@ TEST(CoxRossRubinsteinTest, TreeDumpRootMatchesPriceAndNodeCount) {
     EXPECT_GT(dump.u, 1.0);
     EXPECT_LT(dump.d, 1.0);
 }
+
+TEST(BinomialVanillaValuationTest, PlainCrrMatchesScalarPricer) {
+    const double scalar = CoxRossRubinsteinVanillaPrice(OptionType::kPut, ExerciseStyle::kAmerican, 100.0, 100.0, 0.05,
+                                                        0.0, 0.25, 1.0, 200);
+    const auto tree = BinomialVanillaValuation(OptionType::kPut, ExerciseStyle::kAmerican, 100.0, 100.0, 0.05, 0.0,
+                                               0.25, 1.0, 200, BinomialTreeSettings{});
+    EXPECT_NEAR(tree.npv, scalar, 1.0e-12);
+    EXPECT_EQ(tree.n_steps, 200U);
+    EXPECT_TRUE(tree.has_greeks);
+}
+
+TEST(BinomialVanillaValuationTest, LeisenReimerRoundsEvenStepsUpToOdd) {
+    const auto tree = BinomialVanillaValuation(OptionType::kCall, ExerciseStyle::kEuropean, 100.0, 100.0, 0.05, 0.0,
+                                               0.2, 1.0, 24, {.method = BinomialTreeMethod::kLeisenReimer});
+    EXPECT_EQ(tree.n_steps, 25U);
+}
+
+TEST(BinomialVanillaValuationTest, LeisenReimerEuropeanIsCloseToBlackScholesAtSmallN) {
+    constexpr double spot = 100.0;
+    constexpr double strike = 105.0;
+    constexpr double r = 0.04;
+    constexpr double q = 0.01;
+    constexpr double vol = 0.22;
+    constexpr double tau = 0.75;
+
+    const double bs = EuropeanVanillaPrice(OptionType::kCall, spot, strike, r, q, vol, tau);
+    const auto lr = BinomialVanillaValuation(OptionType::kCall, ExerciseStyle::kEuropean, spot, strike, r, q, vol,
+                                             tau, 51, {.method = BinomialTreeMethod::kLeisenReimer});
+    const double crr = CoxRossRubinsteinVanillaPrice(OptionType::kCall, ExerciseStyle::kEuropean, spot, strike, r, q,
+                                                     vol, tau, 51);
+    EXPECT_NEAR(lr.npv, bs, 1.0e-3);
+    EXPECT_LT(std::abs(lr.npv - bs), std::abs(crr - bs));
+}
+
+TEST(BinomialVanillaValuationTest, TreeGreeksMatchBlackScholesForEuropean) {
+    constexpr double spot = 100.0;
+    constexpr double strike = 100.0;
+    constexpr double r = 0.05;
+    constexpr double q = 0.02;
+    constexpr double vol = 0.25;
+    constexpr double tau = 1.0;
+
+    const auto bs = EuropeanVanillaAllGreeks(OptionType::kPut, spot, strike, r, q, vol, tau);
+    const auto lr = BinomialVanillaValuation(OptionType::kPut, ExerciseStyle::kEuropean, spot, strike, r, q, vol, tau,
+                                             101, {.method = BinomialTreeMethod::kLeisenReimer});
+    ASSERT_TRUE(lr.has_greeks);
+    EXPECT_NEAR(lr.delta, bs.delta, 1.0e-3);
+    EXPECT_NEAR(lr.gamma, bs.gamma, 1.0e-4);
+    EXPECT_NEAR(lr.theta, bs.theta, 2.0e-2);
+}
+
+TEST(BinomialVanillaValuationTest, RichardsonAmericanPutAtSmallNBeatsPlainCrrAt200) {
+    constexpr double spot = 100.0;
+    constexpr double strike = 100.0;
+    constexpr double r = 0.05;
+    constexpr double q = 0.0;
+    constexpr double vol = 0.25;
+    constexpr double tau = 1.0;
+
+    const auto reference = BinomialVanillaValuation(OptionType::kPut, ExerciseStyle::kAmerican, spot, strike, r, q,
+                                                    vol, tau, 4001, {.method = BinomialTreeMethod::kLeisenReimer});
+    const auto fast =
+            BinomialVanillaValuation(OptionType::kPut, ExerciseStyle::kAmerican, spot, strike, r, q, vol, tau, 25,
+                                     {.method = BinomialTreeMethod::kLeisenReimer, .richardson = true});
+    const double crr200 = CoxRossRubinsteinVanillaPrice(OptionType::kPut, ExerciseStyle::kAmerican, spot, strike, r,
+                                                        q, vol, tau, 200);
+    EXPECT_EQ(fast.n_steps, 51U);
+    EXPECT_NEAR(fast.npv, reference.npv, 2.0e-3);
+    EXPECT_LT(std::abs(fast.npv - reference.npv), std::abs(crr200 - reference.npv));
+    EXPECT_NEAR(fast.delta, reference.delta, 1.0e-3);
+    EXPECT_NEAR(fast.gamma, reference.gamma, 1.0e-4);
+    EXPECT_LT(fast.delta, 0.0);
+    EXPECT_GT(fast.gamma, 0.0);
+}
+
+TEST(BinomialVanillaValuationTest, DegenerateInputsSkipTreeGreeks) {
+    const auto expired = BinomialVanillaValuation(OptionType::kCall, ExerciseStyle::kAmerican, 110.0, 100.0, 0.05, 0.0,
+                                                  0.2, 0.0, 25, {.method = BinomialTreeMethod::kLeisenReimer});
+    EXPECT_NEAR(expired.npv, 10.0, 1.0e-12);
+    EXPECT_FALSE(expired.has_greeks);
+}
+
+TEST(BinomialVanillaValuationTest, TwoStepTreeReadsGreeksOffTerminalNodes) {
+    constexpr double spot = 100.0;
+    constexpr double strike = 90.0;
+    constexpr double r = 0.05;
+    constexpr double q = 0.0;
+    constexpr double vol = 0.25;
+    constexpr double tau = 0.5;
+
+    const auto tree = BinomialVanillaValuation(OptionType::kCall, ExerciseStyle::kEuropean, spot, strike, r, q, vol,
+                                               tau, 2, BinomialTreeSettings{});
+    ASSERT_TRUE(tree.has_greeks);
+    EXPECT_EQ(tree.n_steps, 2U);
+
+    // With n = 2 the step-2 nodes are the payoffs at S u^2, S ud = S, S d^2.
+    const double dt = tau / 2.0;
+    const double u = std::exp(vol * std::sqrt(dt));
+    const double d = 1.0 / u;
+    const double s_uu = spot * u * u;
+    const double s_dd = spot * d * d;
+    const double v_uu = s_uu - strike;
+    const double v_ud = spot - strike;
+    const double v_dd = std::max(s_dd - strike, 0.0);
+    const double gamma = ((v_uu - v_ud) / (s_uu - spot) - (v_ud - v_dd) / (spot - s_dd)) / (0.5 * (s_uu - s_dd));
+    EXPECT_NEAR(tree.gamma, gamma, 1.0e-12);
+    EXPECT_GT(tree.gamma, 0.0);
+    EXPECT_NEAR(tree.theta, (v_ud - tree.npv) / (2.0 * dt), 1.0e-10);
+}
@@ -90,4 +90,27 @@ TEST(StandardNormalGeneratorTest, FillSlabStatisticalSanity) {
     EXPECT_NEAR(sum_sq / n, 1.0, 0.08);
 }
 
+TEST(InverseCumulativeNormalTest, KnownQuantiles) {
+    using numeraire::simulation::InverseCumulativeNormal;
+    EXPECT_NEAR(InverseCumulativeNormal(0.5), 0.0, 1.0e-15);
+    EXPECT_NEAR(InverseCumulativeNormal(0.975), 1.959963984540054, 1.0e-12);
+    EXPECT_NEAR(InverseCumulativeNormal(0.01), -2.326347874040841, 1.0e-12);
+    EXPECT_NEAR(InverseCumulativeNormal(1.0e-10), -6.361340902404056, 1.0e-9);
+}
+
+TEST(InverseCumulativeNormalTest, RoundTripsThroughCdf) {
+    using numeraire::simulation::InverseCumulativeNormal;
+    for (const double u : {1.0e-6, 0.02425, 0.1, 0.3, 0.7, 0.9, 0.97575, 1.0 - 1.0e-6}) {
+        const double z = InverseCumulativeNormal(u);
+        EXPECT_NEAR(0.5 * std::erfc(-z / std::sqrt(2.0)), u, 1.0e-14 + (1.0e-12 * u));
+    }
+}
+
+TEST(InverseCumulativeNormalTest, AntisymmetricAroundOneHalf) {
+    using numeraire::simulation::InverseCumulativeNormal;
+    for (const double u : {0.001, 0.05, 0.25, 0.4}) {
+        EXPECT_NEAR(InverseCumulativeNormal(u), -InverseCumulativeNormal(1.0 - u), 1.0e-12);
+    }
+}
+
 }  // namespace
@@ -8,8 +8,9 @@
 namespace {
 
 using numeraire::simulation::MersenneTwisterEngine;
+using numeraire::simulation::ScrambledSobolEngine;
 
-std::vector<double> Draw(MersenneTwisterEngine& engine, const std::size_t count) {
+std::vector<double> Draw(numeraire::simulation::IRandomEngine& engine, const std::size_t count) {
     std::vector<double> out(count);
     for (double& value : out) {
         value = engine.NextUniform();
@@ -69,4 +70,50 @@ TEST(MersenneTwisterEngineTest, SampleMeanApproxOneHalf) {
     EXPECT_NEAR(mean, 0.5, 0.005);
 }
 
+TEST(ScrambledSobolEngineTest, SameSeedAndReplicationReproducible) {
+    ScrambledSobolEngine a(42, 3);
+    ScrambledSobolEngine b(42, 3);
+    EXPECT_EQ(Draw(a, 1000), Draw(b, 1000));
+}
+
+TEST(ScrambledSobolEngineTest, ReplicationsAreIndependentScrambles) {
+    ScrambledSobolEngine a(42, 0);
+    ScrambledSobolEngine b(42, 1);
+    ScrambledSobolEngine c(43, 0);
+    const auto first = Draw(a, 256);
+    EXPECT_NE(first, Draw(b, 256));
+    EXPECT_NE(first, Draw(c, 256));
+}
+
+TEST(ScrambledSobolEngineTest, UniformsStrictlyInsideUnitInterval) {
+    ScrambledSobolEngine engine(7, 0);
+    for (std::size_t i = 0; i < 100000; ++i) {
+        const double u = engine.NextUniform();
+        EXPECT_GT(u, 0.0);
+        EXPECT_LT(u, 1.0);
+    }
+}
+
+TEST(ScrambledSobolEngineTest, FillMatchesSequential) {
+    ScrambledSobolEngine a(99, 2);
+    ScrambledSobolEngine b(99, 2);
+    std::vector<double> filled(16);
+    a.FillUniform(filled);
+    EXPECT_EQ(filled, Draw(b, 16));
+}
+
+TEST(ScrambledSobolEngineTest, PowerOfTwoPrefixIsStratified) {
+    // A scrambled (0, 1)-sequence keeps the net property: the first 2^m points put
+    // exactly one point in each dyadic cell of width 2^-m.
+    ScrambledSobolEngine engine(2024, 5);
+    constexpr std::size_t kCells = 1024;
+    std::vector<int> hits(kCells, 0);
+    for (const double u : Draw(engine, kCells)) {
+        ++hits[static_cast<std::size_t>(u * static_cast<double>(kCells))];
+    }
+    for (const int count : hits) {
+        EXPECT_EQ(count, 1);
+    }
+}
+
 }  // namespace
@@ -1,6 +1,9 @@
 """European Black–Scholes–Merton (per-share), aligned with mathematical_background.md.
 
 Sandbox / what-if only — not the official C++ MTM path.
+
+``black_scholes`` prices one option; ``black_scholes_batch`` prices a broadcast grid
+(spot ladders × tenors for the labs) with NumPy, same edge cases as the scalar path.
 """
 
 from __future__ import annotations
@@ -8,6 +11,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 
 def _norm_cdf(x: float) -> float:
     return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
@@ -113,6 +118,172 @@ def black_scholes(
     return BsResult(pv_unit=pv, delta=delta, gamma=gamma, vega=vega, theta=theta, rho=rho)
 
 
+# West (2005) double-precision rational approximation of N(x) — NumPy has no erf and
+# the web env deliberately avoids SciPy. Matches math.erf-based _norm_cdf to ~1e-15.
+_CDF_P = (
+    3.52624965998911e-02,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+    220.206867912376,
+)
+_CDF_Q = (
+    8.83883476483184e-02,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+    440.413735824752,
+)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+def norm_cdf_array(x: np.ndarray) -> np.ndarray:
+    """Elementwise standard normal CDF (West's approximation, see above)."""
+    ax = np.abs(x)
+    expo = np.exp(-0.5 * ax * ax)
+    num = np.zeros_like(ax)
+    for c in _CDF_P:
+        num = num * ax + c
+    den = np.zeros_like(ax)
+    for c in _CDF_Q:
+        den = den * ax + c
+    inner = expo * num / den
+    # Continued fraction for the far tail (|x| ≥ 10/√2).
+    cf = ax + 0.65
+    for c in (4.0, 3.0, 2.0, 1.0):
+        cf = ax + c / cf
+    tail = expo / cf / _SQRT_2PI
+    lower = np.where(ax < 7.07106781186547, inner, tail)
+    lower = np.where(ax > 37.0, 0.0, lower)
+    return np.where(x > 0, 1.0 - lower, lower)
+
+
+def _norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+@dataclass(frozen=True)
+class BsBatch:
+    """Struct-of-arrays twin of ``BsResult``; every field has the broadcast shape."""
+
+    pv_unit: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray  # per calendar year
+    rho: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.pv_unit.shape
+
+    def at(self, index) -> BsResult:
+        """Scalar view of one grid point (e.g. the chart mark)."""
+        return BsResult(
+            pv_unit=float(self.pv_unit[index]),
+            delta=float(self.delta[index]),
+            gamma=float(self.gamma[index]),
+            vega=float(self.vega[index]),
+            theta=float(self.theta[index]),
+            rho=float(self.rho[index]),
+        )
+
+
+def black_scholes_batch(
+    spot,
+    strike,
+    tau,
+    vol,
+    rate,
+    div,
+    is_call,
+) -> BsBatch:
+    """Price a broadcast grid of European vanillas (per share of underlying).
+
+    Arguments are scalars or array-likes that NumPy can broadcast together, so a
+    ``spots[None, :]`` × ``taus[:, None]`` pair prices a whole chart in one pass.
+    τ ≤ 0 and σ ≤ 0 lanes follow ``black_scholes`` exactly.
+    """
+    s, k, t, sig, r, q, call = np.broadcast_arrays(
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(tau, dtype=float),
+        np.asarray(vol, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(div, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+
+    if not (np.all(s > 0) and np.all(k > 0)):
+        raise ValueError('spot and strike must be positive')
+
+    expired = t <= 0
+    flat = ~expired & (sig <= 0)
+    live = ~expired & ~flat
+
+    # Park dead lanes on harmless inputs so log/sqrt/divide stay finite; their
+    # outputs are overwritten by the edge-case branches below.
+    t_l = np.where(live, t, 1.0)
+    sig_l = np.where(live, sig, 1.0)
+    sqrt_t = np.sqrt(t_l)
+    sig_sqrt_t = sig_l * sqrt_t
+    d1 = (np.log(s / k) + (r - q + 0.5 * sig_l * sig_l) * t_l) / sig_sqrt_t
+    d2 = d1 - sig_sqrt_t
+    eq = np.exp(-q * t_l)
+    er = np.exp(-r * t_l)
+    nd1 = norm_cdf_array(d1)
+    nd2 = norm_cdf_array(d2)
+    nmd1 = norm_cdf_array(-d1)
+    nmd2 = norm_cdf_array(-d2)
+    pdf_d1 = _norm_pdf_array(d1)
+    decay = -s * pdf_d1 * sig_l * eq / (2.0 * sqrt_t)
+
+    pv = np.where(call, s * eq * nd1 - k * er * nd2, k * er * nmd2 - s * eq * nmd1)
+    delta = np.where(call, eq * nd1, -eq * nmd1)
+    theta = np.where(
+        call,
+        decay - r * k * er * nd2 + q * s * eq * nd1,
+        decay + r * k * er * nmd2 - q * s * eq * nmd1,
+    )
+    rho = np.where(call, k * t_l * er * nd2, -k * t_l * er * nmd2)
+    gamma = eq * pdf_d1 / (s * sig_sqrt_t)
+    vega = s * eq * pdf_d1 * sqrt_t
+
+    dead = ~live
+    if np.any(dead):
+        zero = np.zeros_like(pv)
+        gamma = np.where(dead, zero, gamma)
+        vega = np.where(dead, zero, vega)
+        theta = np.where(dead, zero, theta)
+        rho = np.where(dead, zero, rho)
+
+        # σ → 0: discounted forward intrinsic, greeks zeroed (as the scalar path).
+        t_f = np.where(flat, t, 0.0)
+        forward = s * np.exp((r - q) * t_f)
+        flat_pv = np.exp(-r * t_f) * np.where(
+            call, np.maximum(forward - k, 0.0), np.maximum(k - forward, 0.0)
+        )
+        pv = np.where(flat, flat_pv, pv)
+        delta = np.where(flat, zero, delta)
+
+        # τ ≤ 0: intrinsic on spot, digital delta with the ATM 0.5 / −0.5 convention.
+        intrinsic = np.where(call, np.maximum(s - k, 0.0), np.maximum(k - s, 0.0))
+        dig = np.where(
+            call,
+            np.where(s > k, 1.0, np.where(s < k, 0.0, 0.5)),
+            np.where(s < k, -1.0, np.where(s > k, 0.0, -0.5)),
+        )
+        pv = np.where(expired, intrinsic, pv)
+        delta = np.where(expired, dig, delta)
+
+    return BsBatch(pv_unit=pv, delta=delta, gamma=gamma, vega=vega, theta=theta, rho=rho)
+
+
 def position_sign(direction: str) -> float:
     d = (direction or '').strip().upper()
     if d == 'SHORT':
@@ -41,6 +41,7 @@ from journal.models import (
     TradeLegMtmEod,
     UniverseInstrument,
 )
+from journal.refdata import forget_data_generations, refdata_cached
 
 IMPORT_TIMEOUT_SEC = 60
 BOOKING_TIMEOUT_SEC = 300
@@ -380,6 +381,7 @@ def commodity_product_code(underlying_id: str) -> str:
 
 
 
+@refdata_cached('trades')
 def portfolio_suggestions() -> list[str]:
     return sorted(
         {
@@ -390,6 +392,7 @@ def portfolio_suggestions() -> list[str]:
     )
 
 
+@refdata_cached('trades')
 def strategy_suggestions() -> list[str]:
     return sorted(
         {
@@ -660,6 +663,7 @@ def run_import(bundle_path: Path) -> CommandResult:
     stdout, stderr = proc.stdout or '', proc.stderr or ''
     lines = stdout.splitlines()
     if any(line.startswith('OK:') for line in lines):
+        forget_data_generations()
         return CommandResult(True, 'Trade imported as PENDING.', stdout, stderr)
 
     skipped = next((line for line in lines if line.startswith('SKIP:')), '')
@@ -762,6 +766,7 @@ def run_delete(trade_id: str) -> CommandResult:
     # Same contract as the importer: a no-op exits 0 too, so the markers decide.
     done = next((line for line in lines if line.startswith('OK:')), '')
     if done:
+        forget_data_generations()
         return CommandResult(True, done[len('OK:'):].strip(), stdout, stderr)
 
     skipped = next((line for line in lines if line.startswith('SKIP:')), '')
@@ -7,6 +7,7 @@ from datetime import date
 from typing import Any
 
 from journal.models import FuturesContract, FuturesDailyEod
+from journal.refdata import refdata_cached
 
 _MONTH_CODES = {
     'F': 1,
@@ -25,6 +26,7 @@ _MONTH_CODES = {
 _TICKER_RE = re.compile(r'^([A-Z]{1,4})([FGHJKMNQUVXZ])(\d{1,2})$')
 
 
+@refdata_cached('futures_daily_eod')
 def list_futures_product_codes() -> list[str]:
     return list(
         FuturesDailyEod.objects.order_by()
@@ -11,6 +11,7 @@ from journal.models import (
     ParCurveEod,
     ParCurvePointEod,
 )
+from journal.refdata import refdata_cached
 
 _TIME_TOL = 1e-12
 
@@ -89,6 +90,7 @@ def curve_discount_for_maturity(as_of: date, time_years: float) -> dict | None:
     }
 
 
+@refdata_cached('discount_curve_eod')
 def list_curve_ids() -> list[str]:
     return list(
         DiscountCurveEod.objects.order_by()
@@ -5,6 +5,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class ForwardResult:
@@ -36,3 +38,38 @@ def equity_forward(
     # τ = T − t → Θ = −∂V/∂τ = q S e^{-qτ} − r K e^{-rτ}
     theta = q * s * eq - r * k * er
     return ForwardResult(pv_unit=pv, delta=delta, theta=theta)
+
+
+@dataclass(frozen=True)
+class ForwardBatch:
+    """Struct-of-arrays twin of ``ForwardResult``; every field has the broadcast shape."""
+
+    pv_unit: np.ndarray
+    delta: np.ndarray
+    theta: np.ndarray  # per calendar year
+
+
+def equity_forward_batch(spot, forward_price, tau, rate, div) -> ForwardBatch:
+    """``equity_forward`` broadcast over NumPy-compatible inputs (what-if shock grids)."""
+    s = np.asarray(spot, dtype=float)
+    k, t = float(forward_price), float(tau)
+    r = np.asarray(rate, dtype=float)
+    q = np.asarray(div, dtype=float)
+    if np.any(s <= 0):
+        raise ValueError('spot must be positive')
+
+    shape = np.broadcast_shapes(s.shape, r.shape, q.shape)
+    if t <= 0:
+        return ForwardBatch(
+            pv_unit=np.broadcast_to(s - k, shape),
+            delta=np.ones(shape),
+            theta=np.zeros(shape),
+        )
+
+    eq = np.exp(-q * t)
+    er = np.exp(-r * t)
+    return ForwardBatch(
+        pv_unit=np.broadcast_to(s * eq - k * er, shape),
+        delta=np.broadcast_to(eq, shape),
+        theta=np.broadcast_to(q * s * eq - r * k * er, shape),
+    )
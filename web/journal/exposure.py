@@ -1,29 +1,134 @@
-"""Portfolio / trade exposure helpers over ``trade_leg_exposure_eod``."""
+"""Portfolio / trade exposure helpers over ``trade_leg_exposure_eod``.
+
+Portfolio pages read the rollups written by ``scripts/refresh_exposure_rollup.py``
+(one row per pillar, or per trade at a pillar) and aggregate leg rows live only for
+days newer than the last rollup, or whose leg rows no longer match the rollup stamp
+(re-simulated, a trade deleted or moved to another portfolio since).
+"""
 
 from __future__ import annotations
 
+import json
 from datetime import date
 
+from django.db import OperationalError
 from django.db.models import Count, Max, Sum
 
-from journal.models import Trade, TradeLegExposureEod
+from journal.models import (
+    PortfolioExposurePillarEod,
+    PortfolioExposureRollupEod,
+    PortfolioExposureTradeEod,
+    Trade,
+    TradeLegExposureEod,
+)
 
 
-def list_exposure_as_of(portfolio_id: str | None = None) -> list[date]:
-    qs = TradeLegExposureEod.objects.order_by()
+def _rollup_dates(portfolio_id: str | None = None) -> list[date]:
+    """Rolled-up as_of dates, newest first ([] when the rollup table does not exist yet)."""
+    qs = PortfolioExposureRollupEod.objects.order_by()
     if portfolio_id:
-        qs = qs.filter(trade__portfolio_id=portfolio_id)
+        qs = qs.filter(portfolio_id=portfolio_id)
+    try:
+        return list(qs.values_list('as_of', flat=True).distinct().order_by('-as_of'))
+    except OperationalError:
+        return []
+
+
+def _newest_rollup() -> date | None:
+    """Newest rolled-up as_of (one step on the ``(as_of, portfolio_id)`` unique index)."""
+    try:
+        return PortfolioExposureRollupEod.objects.aggregate(newest=Max('as_of'))['newest']
+    except OperationalError:
+        return None
+
+
+def _unrolled_as_of(newest: date | None) -> list[date]:
+    """Exposure days after ``newest`` (the newest rollup), newest first.
+
+    A range on ``idx_trade_leg_exposure_eod_asof`` rather than a DISTINCT over every leg
+    row; only without any rollup does it scan the whole index. An older day whose rollup is
+    missing needs ``refresh_exposure_rollup.py --all``.
+    """
+    qs = TradeLegExposureEod.objects.order_by()
+    if newest is not None:
+        qs = qs.filter(as_of__gt=newest)
     return list(qs.values_list('as_of', flat=True).distinct().order_by('-as_of'))
 
 
-def list_exposure_portfolios() -> list[str]:
-    return list(
-        Trade.objects.filter(exposure_rows__isnull=False)
-        .order_by()
-        .values_list('portfolio_id', flat=True)
-        .distinct()
-        .order_by('portfolio_id')
+def _stale_rollup_as_of() -> list[date]:
+    """Rolled-up days whose stamp a trade moving portfolio cleared (trigger on ``trades``)."""
+    try:
+        return list(
+            PortfolioExposureRollupEod.objects.filter(exposure_calculated_at__isnull=True)
+            .order_by()
+            .values_list('as_of', flat=True)
+            .distinct()
+        )
+    except OperationalError:
+        return []
+
+
+def _rollup_is_current(as_of: date) -> bool:
+    """True when the leg rows of ``as_of`` still match its rollup stamp.
+
+    Stamp: MAX(calculated_at) and the leg row count, one aggregate on
+    ``idx_trade_leg_exposure_eod_asof_calc``. A rerun moves the first, a deleted trade the
+    second; a trade moved to another portfolio clears the stamp.
+    """
+    try:
+        rollup = PortfolioExposureRollupEod.objects.filter(as_of=as_of).aggregate(
+            stamp=Max('exposure_calculated_at'), rows=Sum('exposure_rows')
+        )
+    except OperationalError:
+        return False
+    if rollup['stamp'] is None:
+        return False
+    live = TradeLegExposureEod.objects.filter(as_of=as_of).aggregate(
+        latest=Max('calculated_at'), rows=Count('pk')
     )
+    return (live['latest'], live['rows']) == (rollup['stamp'], rollup['rows'])
+
+
+def list_exposure_as_of(portfolio_id: str | None = None) -> list[date]:
+    """Rolled-up days plus exposure days newer than the newest rollup, newest first.
+
+    For one portfolio, days whose rollup a portfolio move made stale are checked against
+    the leg rows too (the moved trade's new portfolio has no rollup row there).
+    """
+    dates = set(_rollup_dates(portfolio_id))
+    unrolled = _unrolled_as_of(_newest_rollup())
+    if not portfolio_id:
+        return sorted(dates.union(unrolled), reverse=True)
+    live = [*unrolled, *_stale_rollup_as_of()]
+    if live:
+        dates.update(
+            TradeLegExposureEod.objects.filter(as_of__in=live, trade__portfolio_id=portfolio_id)
+            .order_by()
+            .values_list('as_of', flat=True)
+            .distinct()
+        )
+    return sorted(dates, reverse=True)
+
+
+def list_exposure_portfolios() -> list[str]:
+    """Portfolios with a rollup, plus those with leg rows on unrolled or stale days."""
+    newest = _newest_rollup()
+    portfolios: set[str] = set()
+    if newest is not None:
+        portfolios.update(
+            PortfolioExposureRollupEod.objects.order_by()
+            .values_list('portfolio_id', flat=True)
+            .distinct()
+        )
+    live = [*_unrolled_as_of(newest), *_stale_rollup_as_of()]
+    if live:
+        portfolios.update(
+            Trade.objects.filter(exposure_rows__as_of__in=live)
+            .order_by()
+            .values_list('portfolio_id', flat=True)
+            .distinct()
+        )
+    return sorted(portfolios)
 
 
 def portfolio_exposure_profile(
@@ -39,7 +144,63 @@ def portfolio_exposure_profile(
 
     ``by_trade`` is attribution **at one pillar** (same tenor as the chart /
     pillar table), not a sum across the time grid.
+
+    Read from the rollup tables when ``as_of`` is current there, else aggregated live.
     """
+    if _rollup_is_current(as_of):
+        return _rollup_portfolio_profile(as_of, portfolio_id, pillar_id)
+    return _live_portfolio_profile(as_of, portfolio_id, pillar_id)
+
+
+def _rollup_portfolio_profile(
+    as_of: date, portfolio_id: str, pillar_id: str | None
+) -> dict | None:
+    header = PortfolioExposureRollupEod.objects.filter(
+        as_of=as_of, portfolio_id=portfolio_id
+    ).first()
+    if header is None:
+        return None
+
+    meta = {
+        'rows': header.exposure_rows,
+        'trades': header.trades,
+        'legs': header.legs,
+        'paths': header.num_paths,
+        'seed': header.mc_seed,
+    }
+    pillars = list(
+        PortfolioExposurePillarEod.objects.filter(as_of=as_of, portfolio_id=portfolio_id)
+        .values(
+            'pillar_id', 'grid_step', 'year_fraction', 'exposure_date',
+            'ee', 'pfe_95', 'pfe_975',
+        )
+        .order_by('grid_step', 'pillar_id')
+    )
+    pillar_ids = [p['pillar_id'] for p in pillars]
+    selected = pillar_id if pillar_id in pillar_ids else (pillar_ids[0] if pillar_ids else None)
+
+    by_trade = []
+    if selected is not None:
+        by_trade = list(
+            PortfolioExposureTradeEod.objects.filter(
+                as_of=as_of, portfolio_id=portfolio_id, pillar_id=selected
+            )
+            .values('trade_id', 'ee', 'pfe_95', 'pfe_975', 'legs')
+            .order_by('-pfe_95', 'trade_id')
+        )
+    return _portfolio_profile(
+        meta,
+        sorted(json.loads(header.engines)),
+        sorted(json.loads(header.scopes)),
+        pillars,
+        selected,
+        by_trade,
+    )
+
+
+def _live_portfolio_profile(
+    as_of: date, portfolio_id: str, pillar_id: str | None
+) -> dict | None:
     qs = TradeLegExposureEod.objects.filter(as_of=as_of, trade__portfolio_id=portfolio_id)
     if not qs.exists():
         return None
@@ -79,7 +240,17 @@ def portfolio_exposure_profile(
             )
             .order_by('-pfe_95', 'trade_id')
         )
+    return _portfolio_profile(meta, engines, scopes, pillars, selected, by_trade)
+
 
+def _portfolio_profile(
+    meta: dict,
+    engines: list[str],
+    scopes: list[str],
+    pillars: list[dict],
+    selected: str | None,
+    by_trade: list[dict],
+) -> dict:
     chart = [
         {
             'pillar': p['pillar_id'],
@@ -97,7 +268,7 @@ def portfolio_exposure_profile(
         'engines': engines,
         'scopes': scopes,
         'pillars': pillars,
-        'pillar_ids': pillar_ids,
+        'pillar_ids': [p['pillar_id'] for p in pillars],
         'attribution_pillar': selected,
         'by_trade': by_trade,
         'chart': chart,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
-from journal.black_scholes import black_scholes
+import numpy as np
+
+from journal.black_scholes import BsBatch, black_scholes_batch
 
 # Calendar-day tenors (Act/365).
 MATURITIES = (
@@ -74,64 +77,59 @@ def _spot_grid(strike: float, n: int) -> list[float]:
     return [round(lo + i * step, 6) for i in range(n + 1)]
 
 
-def _series_vs_spot(params: GreeksLabParams, tenor_days: int, spots: list[float]) -> dict:
-    """Analytic BS greeks along a spot grid at fixed τ."""
-    tau = tenor_days / DAYS_PER_YEAR
-    xs: list[float] = []
-    delta: list[float] = []
-    gamma: list[float] = []
-    vega: list[float] = []
-    theta: list[float] = []  # per calendar day
-    for s in spots:
-        try:
-            g = black_scholes(
-                s,
-                params.strike,
-                tau,
-                params.vol,
-                params.rate,
-                params.div,
-                is_call=params.is_call,
-            )
-        except (ValueError, OverflowError):
-            continue
-        xs.append(s)
-        delta.append(g.delta)
-        gamma.append(g.gamma)
-        vega.append(g.vega)
-        theta.append(g.theta / DAYS_PER_YEAR)
+def _series_from_row(tenor_days: int, spots: np.ndarray, grid: BsBatch, row: int) -> dict:
+    """One tenor row of the batch grid; non-finite points are dropped like the old per-call skip."""
+    ok = np.isfinite(grid.delta[row]) & np.isfinite(grid.gamma[row])
+    ok &= np.isfinite(grid.vega[row]) & np.isfinite(grid.theta[row])
     return {
         'tenor_days': tenor_days,
-        'x': xs,
-        'delta': delta,
-        'gamma': gamma,
-        'vega': vega,
-        'theta': theta,
+        'x': spots[ok].tolist(),
+        'delta': grid.delta[row][ok].tolist(),
+        'gamma': grid.gamma[row][ok].tolist(),
+        'vega': grid.vega[row][ok].tolist(),
+        'theta': (grid.theta[row][ok] / DAYS_PER_YEAR).tolist(),  # per calendar day
     }
 
 
+def _greeks_grid(params: GreeksLabParams, spots, taus) -> BsBatch:
+    return black_scholes_batch(
+        spots,
+        params.strike,
+        taus,
+        params.vol,
+        params.rate,
+        params.div,
+        params.is_call,
+    )
+
+
+def _series_vs_spot(params: GreeksLabParams, tenor_days: int, spots: list[float]) -> dict:
+    """Analytic BS greeks along a spot grid at fixed τ."""
+    xs = np.asarray(spots, dtype=float)
+    grid = _greeks_grid(params, xs[None, :], np.array([[tenor_days / DAYS_PER_YEAR]]))
+    return _series_from_row(tenor_days, xs, grid, 0)
+
+
 def build_greeks_vs_spot(params: GreeksLabParams) -> dict:
     spots = _spot_grid(params.strike, params.n_points)
+    xs = np.asarray(spots, dtype=float)
+    tenors = [days for _, days in MATURITIES]
+    taus = np.asarray(tenors, dtype=float) / DAYS_PER_YEAR
+
+    # Whole chart (tenor × spot) and the reference-spot table in two batch calls.
+    grid = _greeks_grid(params, xs[None, :], taus[:, None])
+    mark = _greeks_grid(params, params.spot, taus)
+
     series = []
-    for label, days in MATURITIES:
-        s = _series_vs_spot(params, days, spots)
+    for row, (label, days) in enumerate(MATURITIES):
+        s = _series_from_row(days, xs, grid, row)
         s['label'] = label
         series.append(s)
 
     table = []
-    for s in series:
-        tau = s['tenor_days'] / DAYS_PER_YEAR
-        try:
-            g = black_scholes(
-                params.spot,
-                params.strike,
-                tau,
-                params.vol,
-                params.rate,
-                params.div,
-                is_call=params.is_call,
-            )
-        except (ValueError, OverflowError):
+    for row, s in enumerate(series):
+        g = mark.at(row)
+        if not all(map(math.isfinite, (g.delta, g.gamma, g.vega, g.theta))):
             continue
         table.append(
             {
@@ -18,7 +18,8 @@ MAX_INSTRUMENTS = 3
 MAX_STEPS = 10
 T_LABELS = tuple(f't{i}' for i in range(1, MAX_STEPS + 1))
 ALLOWED_CODES = frozenset({'PVE', 'PVA', 'EQS', 'EQF'})
-_CRR_DEFAULT_STEPS = 200
+# PVA legs: base N of the Leisen–Reimer + Richardson tree (see quant_lab._AMERICAN_TREE_STEPS).
+_AMERICAN_TREE_STEPS = 25
 _T_RE = re.compile(r'^t(\d+)$')
 
 INSTRUMENT_CHOICES = (
@@ -177,7 +178,7 @@ def _normalize_instrument(raw: Any, index: int) -> dict[str, Any]:
         out['option_side'] = side
 
     if code == 'PVA':
-        n_steps = raw.get('n_steps', _CRR_DEFAULT_STEPS)
+        n_steps = raw.get('n_steps', _AMERICAN_TREE_STEPS)
         try:
             n_steps_i = int(n_steps)
         except (TypeError, ValueError) as exc:
@@ -240,7 +241,7 @@ def _price_leg(instrument: dict[str, Any], market: dict[str, Any]) -> QuantLabQu
             tau,
             lab_product='vanilla',
             exercise='american',
-            n_steps=int(instrument.get('n_steps', _CRR_DEFAULT_STEPS)),
+            n_steps=int(instrument.get('n_steps', _AMERICAN_TREE_STEPS)),
         )
     if code == 'EQF':
         return price_sandbox(params, tau, lab_product='forward', exercise='n/a')
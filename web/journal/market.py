@@ -3,9 +3,11 @@
 from datetime import date
 from typing import Any
 
-from django.db.models import Count, Max, Min, QuerySet
+from django.db.models import Count, F, Max, Min, QuerySet, Window
+from django.db.models.functions import RowNumber
 
 from journal.models import EquityDailyEod, FuturesDailyEod, IndexDailyEod
+from journal.refdata import refdata_cached
 
 # Product.underlying_id uses bare symbols (NDX); index bars use Polygon tickers (I:NDX).
 _INDEX_ALIASES = {
@@ -105,41 +107,41 @@ def resolve_underlier(ticker: str) -> tuple[str, str, QuerySet] | None:
     return None
 
 
+@refdata_cached('equity_daily_eod', 'index_daily_eod')
 def list_underliers() -> list[dict]:
-    """Catalog of tickers present in equity/index daily EOD tables."""
+    """Catalog of tickers present in equity/index daily EOD tables.
+
+    One query per table: window aggregates per ticker, filtered to each ticker's latest
+    bar (newest ``as_of``, then highest id) for close / currency / source.
+    """
     rows: list[dict] = []
     for kind, model in (('equity', EquityDailyEod), ('index', IndexDailyEod)):
-        summaries = (
+        per_ticker = {'partition_by': [F('ticker')]}
+        latest_bars = (
             model.objects.filter(timespan='1d', adjusted=1)
-            .values('ticker')
             .annotate(
-                bars=Count('id'),
-                first_as_of=Min('as_of'),
-                last_as_of=Max('as_of'),
+                bars=Window(Count('id'), **per_ticker),
+                first_as_of=Window(Min('as_of'), **per_ticker),
+                last_as_of=Window(Max('as_of'), **per_ticker),
+                recency=Window(
+                    RowNumber(), order_by=[F('as_of').desc(), F('id').desc()], **per_ticker
+                ),
             )
+            .filter(recency=1)
+            .values('ticker', 'bars', 'first_as_of', 'last_as_of', 'close', 'currency', 'source')
             .order_by('ticker')
         )
-        for summary in summaries:
-            latest = (
-                model.objects.filter(
-                    ticker=summary['ticker'],
-                    timespan='1d',
-                    adjusted=1,
-                    as_of=summary['last_as_of'],
-                )
-                .order_by('-id')
-                .first()
-            )
+        for bar in latest_bars:
             rows.append(
                 {
                     'kind': kind,
-                    'ticker': summary['ticker'],
-                    'bars': summary['bars'],
-                    'first_as_of': summary['first_as_of'],
-                    'last_as_of': summary['last_as_of'],
-                    'last_close': latest.close if latest else None,
-                    'currency': latest.currency if latest else None,
-                    'source': latest.source if latest else None,
+                    'ticker': bar['ticker'],
+                    'bars': bar['bars'],
+                    'first_as_of': bar['first_as_of'],
+                    'last_as_of': bar['last_as_of'],
+                    'last_close': bar['close'],
+                    'currency': bar['currency'],
+                    'source': bar['source'],
                 }
             )
     rows.sort(key=lambda r: (r['kind'], r['ticker']))
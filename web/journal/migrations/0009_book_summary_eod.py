@@ -0,0 +1,56 @@
+# Generated manually for the materialized dashboard snapshot (schema owned by sql/schema_v1.sql).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('journal', '0008_products_commodity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookSummaryEod',
+            fields=[
+                ('as_of', models.DateField(primary_key=True, serialize=False)),
+                ('legs', models.IntegerField()),
+                ('pv_total', models.FloatField(blank=True, null=True)),
+                ('pnl_daily', models.FloatField(blank=True, null=True)),
+                ('delta_total', models.FloatField(blank=True, null=True)),
+                ('vega_total', models.FloatField(blank=True, null=True)),
+                ('theta_total', models.FloatField(blank=True, null=True)),
+                ('exposure_rows', models.IntegerField()),
+                ('exposure_paths', models.IntegerField(blank=True, null=True)),
+                ('mtm_calculated_at', models.TextField(blank=True, null=True)),
+                ('exposure_calculated_at', models.TextField(blank=True, null=True)),
+                ('refreshed_at', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Book summary (EOD)',
+                'verbose_name_plural': 'Book summaries (EOD)',
+                'db_table': 'book_summary_eod',
+                'ordering': ['-as_of'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='BookSummaryBreakdownEod',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('as_of', models.DateField()),
+                ('dimension', models.TextField()),
+                ('portfolio_id', models.TextField()),
+                ('group_key', models.TextField()),
+                ('legs', models.IntegerField()),
+                ('pv_total', models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Book summary breakdown (EOD)',
+                'verbose_name_plural': 'Book summary breakdowns (EOD)',
+                'db_table': 'book_summary_breakdown_eod',
+                'ordering': ['as_of', 'dimension', '-legs', 'group_key'],
+                'managed': False,
+            },
+        ),
+    ]
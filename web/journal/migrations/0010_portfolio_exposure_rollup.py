@@ -0,0 +1,80 @@
+# Generated manually for the portfolio exposure rollups (schema owned by sql/schema_v1.sql).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('journal', '0009_book_summary_eod'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioExposureRollupEod',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('as_of', models.DateField()),
+                ('portfolio_id', models.TextField()),
+                ('exposure_rows', models.IntegerField()),
+                ('trades', models.IntegerField()),
+                ('legs', models.IntegerField()),
+                ('num_paths', models.IntegerField(blank=True, null=True)),
+                ('mc_seed', models.IntegerField(blank=True, null=True)),
+                ('engines', models.TextField()),
+                ('scopes', models.TextField()),
+                ('exposure_calculated_at', models.TextField(blank=True, null=True)),
+                ('refreshed_at', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Portfolio exposure rollup (EOD)',
+                'verbose_name_plural': 'Portfolio exposure rollups (EOD)',
+                'db_table': 'portfolio_exposure_rollup_eod',
+                'ordering': ['-as_of', 'portfolio_id'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PortfolioExposurePillarEod',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('as_of', models.DateField()),
+                ('portfolio_id', models.TextField()),
+                ('pillar_id', models.TextField()),
+                ('grid_step', models.IntegerField()),
+                ('year_fraction', models.FloatField()),
+                ('exposure_date', models.DateField()),
+                ('ee', models.FloatField()),
+                ('pfe_95', models.FloatField()),
+                ('pfe_975', models.FloatField()),
+            ],
+            options={
+                'verbose_name': 'Portfolio exposure pillar (EOD)',
+                'verbose_name_plural': 'Portfolio exposure pillars (EOD)',
+                'db_table': 'portfolio_exposure_pillar_eod',
+                'ordering': ['-as_of', 'portfolio_id', 'grid_step', 'pillar_id'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PortfolioExposureTradeEod',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('as_of', models.DateField()),
+                ('portfolio_id', models.TextField()),
+                ('pillar_id', models.TextField()),
+                ('trade_id', models.TextField()),
+                ('legs', models.IntegerField()),
+                ('ee', models.FloatField()),
+                ('pfe_95', models.FloatField()),
+                ('pfe_975', models.FloatField()),
+            ],
+            options={
+                'verbose_name': 'Portfolio exposure by trade (EOD)',
+                'verbose_name_plural': 'Portfolio exposure by trade (EOD)',
+                'db_table': 'portfolio_exposure_trade_eod',
+                'ordering': ['-as_of', 'portfolio_id', 'pillar_id', '-pfe_95'],
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated manually for the reference-data cache stamps (schema owned by sql/schema_v1.sql).
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('journal', '0010_portfolio_exposure_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataGeneration',
+            fields=[
+                ('table_name', models.TextField(primary_key=True, serialize=False)),
+                ('generation', models.IntegerField()),
+                ('bumped_at', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Data generation',
+                'verbose_name_plural': 'Data generations',
+                'db_table': 'data_generation',
+                'ordering': ['table_name'],
+                'managed': False,
+            },
+        ),
+    ]
@@ -201,6 +201,154 @@ class TradeLegExposureEod(models.Model):
         return f'{self.leg_id} @ {self.as_of} / {self.pillar_id}'
 
 
+class BookSummaryEod(models.Model):
+    """Dashboard snapshot per as_of, rebuilt by `scripts/refresh_book_summary.py`."""
+
+    as_of = models.DateField(primary_key=True)
+    legs = models.IntegerField()
+    pv_total = models.FloatField(blank=True, null=True)
+    pnl_daily = models.FloatField(blank=True, null=True)
+    delta_total = models.FloatField(blank=True, null=True)
+    vega_total = models.FloatField(blank=True, null=True)
+    theta_total = models.FloatField(blank=True, null=True)
+    exposure_rows = models.IntegerField()
+    exposure_paths = models.IntegerField(blank=True, null=True)
+    # MAX(calculated_at) of the official marks / exposure rows summarised; with `legs` /
+    # `exposure_rows` the stamp a current row must still match. NULL mtm_calculated_at:
+    # a trade changed book or strategy since the refresh.
+    mtm_calculated_at = models.TextField(blank=True, null=True)
+    exposure_calculated_at = models.TextField(blank=True, null=True)
+    refreshed_at = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = 'book_summary_eod'
+        ordering = ['-as_of']
+        verbose_name = 'Book summary (EOD)'
+        verbose_name_plural = 'Book summaries (EOD)'
+
+    def __str__(self):
+        return f'book summary @ {self.as_of}'
+
+
+class BookSummaryBreakdownEod(models.Model):
+    """Legs + PV per engine, book or (book, strategy) for one `BookSummaryEod`."""
+
+    id = models.AutoField(primary_key=True)
+    as_of = models.DateField()
+    dimension = models.TextField()  # engine | book | strategy
+    portfolio_id = models.TextField()  # strategy rows only; '' otherwise
+    group_key = models.TextField()
+    legs = models.IntegerField()
+    pv_total = models.FloatField(blank=True, null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'book_summary_breakdown_eod'
+        ordering = ['as_of', 'dimension', '-legs', 'group_key']
+        verbose_name = 'Book summary breakdown (EOD)'
+        verbose_name_plural = 'Book summary breakdowns (EOD)'
+
+    def __str__(self):
+        return f'{self.dimension}:{self.group_key} @ {self.as_of}'
+
+
+class PortfolioExposureRollupEod(models.Model):
+    """Exposure batch meta per (as_of, portfolio); `scripts/refresh_exposure_rollup.py`."""
+
+    id = models.AutoField(primary_key=True)
+    as_of = models.DateField()
+    portfolio_id = models.TextField()
+    exposure_rows = models.IntegerField()
+    trades = models.IntegerField()
+    legs = models.IntegerField()
+    num_paths = models.IntegerField(blank=True, null=True)
+    mc_seed = models.IntegerField(blank=True, null=True)
+    engines = models.TextField()  # JSON array
+    scopes = models.TextField()  # JSON array
+    # MAX(calculated_at) over the as_of when rolled up; newer or fewer leg rows mean a stale
+    # rollup. NULL: a trade moved portfolio since (trigger on trades).
+    exposure_calculated_at = models.TextField(blank=True, null=True)
+    refreshed_at = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = 'portfolio_exposure_rollup_eod'
+        ordering = ['-as_of', 'portfolio_id']
+        verbose_name = 'Portfolio exposure rollup (EOD)'
+        verbose_name_plural = 'Portfolio exposure rollups (EOD)'
+
+    def __str__(self):
+        return f'{self.portfolio_id} @ {self.as_of}'
+
+
+class PortfolioExposurePillarEod(models.Model):
+    """Leg EE / PFE summed per (as_of, portfolio, pillar)."""
+
+    id = models.AutoField(primary_key=True)
+    as_of = models.DateField()
+    portfolio_id = models.TextField()
+    pillar_id = models.TextField()
+    grid_step = models.IntegerField()
+    year_fraction = models.FloatField()
+    exposure_date = models.DateField()
+    ee = models.FloatField()
+    pfe_95 = models.FloatField()
+    pfe_975 = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'portfolio_exposure_pillar_eod'
+        ordering = ['-as_of', 'portfolio_id', 'grid_step', 'pillar_id']
+        verbose_name = 'Portfolio exposure pillar (EOD)'
+        verbose_name_plural = 'Portfolio exposure pillars (EOD)'
+
+    def __str__(self):
+        return f'{self.portfolio_id} @ {self.as_of} / {self.pillar_id}'
+
+
+class PortfolioExposureTradeEod(models.Model):
+    """Leg EE / PFE summed per trade at one pillar (attribution)."""
+
+    id = models.AutoField(primary_key=True)
+    as_of = models.DateField()
+    portfolio_id = models.TextField()
+    pillar_id = models.TextField()
+    trade_id = models.TextField()
+    legs = models.IntegerField()
+    ee = models.FloatField()
+    pfe_95 = models.FloatField()
+    pfe_975 = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'portfolio_exposure_trade_eod'
+        ordering = ['-as_of', 'portfolio_id', 'pillar_id', '-pfe_95']
+        verbose_name = 'Portfolio exposure by trade (EOD)'
+        verbose_name_plural = 'Portfolio exposure by trade (EOD)'
+
+    def __str__(self):
+        return f'{self.trade_id} @ {self.as_of} / {self.pillar_id}'
+
+
+class DataGeneration(models.Model):
+    """Per-table change counter bumped by writers; keys the `refdata` cache (journal.refdata)."""
+
+    table_name = models.TextField(primary_key=True)
+    generation = models.IntegerField()
+    bumped_at = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = 'data_generation'
+        ordering = ['table_name']
+        verbose_name = 'Data generation'
+        verbose_name_plural = 'Data generations'
+
+    def __str__(self):
+        return f'{self.table_name} #{self.generation}'
+
+
 class VolSurfaceEod(models.Model):
     surface_id = models.AutoField(primary_key=True)
     underlying_id = models.TextField()
@@ -1,15 +1,66 @@
 """One-step GBM Monte Carlo for European vanilla (sandbox what-if).
 
 Risk-neutral: ``S_T = S exp((r-q-½σ²)τ + σ√τ Z)``, payoff discounted by ``e^{-rτ}``.
-Antithetic normals for variance reduction. Pure Python — not the C++ CCR path engine.
+Antithetic normals for variance reduction. NumPy (PCG64), drawn in fixed-size chunks so
+memory stays bounded at ``MAX_MC_PATHS`` — not the C++ CCR path engine.
+
+``sampler='sobol'`` swaps the pseudo-random normals for randomised QMC: scrambled 1-D
+Sobol points (one exact step to T, so a Brownian bridge has nothing to reorder) mapped
+through the inverse normal CDF, repeated over independent scrambles whose spread gives
+the standard error. Each scramble runs a power-of-two point count, so the paths actually
+simulated (``McResult.n_paths``) can fall short of the request.
+
+Reconciliation against the analytic price can lean on two extra tricks. ``control_variate``
+regresses the payoff on two controls with known means — the discounted terminal spot
+(``S e^{-qτ}``) and a same-side vanilla struck at the forward (its Black–Scholes price) —
+and reports the adjusted PV and its standard error next to the plain ones.
+``moment_match`` rescales each block of normals to unit sample variance (antithetic
+pairing already pins the mean at zero).
+
+Normal draws depend only on ``(seed, n_paths)`` (plus the scramble count for Sobol), so
+runs up to ``NORMAL_CACHE_MAX_PAIRS`` normals sit in a small per-process LRU. Every leg
+and every shocked / baseline run with the same seed reads the same read-only buffer: MC
+ΔPVs are paired (common random numbers) and repeat requests skip the RNG entirely.
+Larger runs draw the same stream chunk by chunk, uncached.
 """
 
 from __future__ import annotations
 
+import functools
 import math
-import random
 from dataclasses import dataclass
 
+import numpy as np
+
+from journal.black_scholes import black_scholes, norm_cdf_array
+
+# Antithetic pairs per Welford block. Block edges sit at fixed offsets in the normal
+# stream, so a seeded run gives the same bits whatever ``chunk_pairs`` is.
+_BLOCK_PAIRS = 4_096
+DEFAULT_CHUNK_PAIRS = 8 * _BLOCK_PAIRS
+
+SAMPLERS = ('pseudo', 'sobol')
+DEFAULT_QMC_REPLICATIONS = 16
+
+_SOBOL_BITS = 32
+
+# Normal buffers kept per process. Only runs up to NORMAL_CACHE_MAX_PAIRS normals
+# (512 kB each) are cached, so the LRU tops out near 16 MB; larger runs draw chunk by
+# chunk and never hold the whole stream.
+NORMAL_CACHE_SIZE = 32
+NORMAL_CACHE_MAX_PAIRS = 65_536
+
+# Acklam's rational approximation to Φ⁻¹ (|rel err| < 1.2e-9 before the Halley step).
+_ICDF_A = (-3.969683028665376e01, 2.209460984245205e02, -2.759285104469687e02,
+           1.383577518672690e02, -3.066479806614716e01, 2.506628277459239e00)
+_ICDF_B = (-5.447609879822406e01, 1.615858368580409e02, -1.556989798598866e02,
+           6.680131188771972e01, -1.328068155288572e01)
+_ICDF_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e00,
+           -2.549732539343734e00, 4.374664141464968e00, 2.938163982698783e00)
+_ICDF_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e00,
+           3.754408661907416e00)
+_ICDF_P_LOW = 0.02425
+
 
 @dataclass(frozen=True)
 class McResult:
@@ -17,6 +68,303 @@ class McResult:
     stderr: float  # std error of the discounted mean (per share)
     n_paths: int
     seed: int
+    # Control-variate estimate and its own std error (``control_variate=True`` only).
+    cv_pv_unit: float | None = None
+    cv_stderr: float | None = None
+
+
+@dataclass
+class _Moments:
+    """Running count / mean / M2 with Chan et al.'s parallel Welford merge."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def merge(self, count: int, mean: float, m2: float) -> None:
+        if count <= 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def merge_samples(self, x: np.ndarray) -> None:
+        """Fold ``x`` in block by block (full blocks vectorised, then the tail)."""
+        full = (x.size // _BLOCK_PAIRS) * _BLOCK_PAIRS
+        if full:
+            blocks = x[:full].reshape(-1, _BLOCK_PAIRS)
+            means = blocks.mean(axis=1)
+            m2s = ((blocks - means[:, None]) ** 2).sum(axis=1)
+            for mean, m2 in zip(means.tolist(), m2s.tolist()):
+                self.merge(_BLOCK_PAIRS, mean, m2)
+        if full < x.size:
+            tail = x[full:]
+            mean = float(tail.mean())
+            self.merge(tail.size, mean, float(((tail - mean) ** 2).sum()))
+
+    @property
+    def stderr(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count * (self.count - 1)))
+
+
+@dataclass
+class _CoMoments:
+    """Vector twin of ``_Moments``: running mean and co-moment matrix of sample rows."""
+
+    dim: int
+    count: int = 0
+    mean: np.ndarray | None = None
+    m2: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        self.mean = np.zeros(self.dim)
+        self.m2 = np.zeros((self.dim, self.dim))
+
+    def merge(self, count: int, mean: np.ndarray, m2: np.ndarray) -> None:
+        if count <= 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + np.outer(delta, delta) * (self.count * count / total)
+        self.count = total
+
+    def merge_samples(self, x: np.ndarray) -> None:
+        """Fold rows of ``x`` (shape ``(n, dim)``) in on the same block edges as ``_Moments``."""
+        for start in range(0, x.shape[0], _BLOCK_PAIRS):
+            block = x[start:start + _BLOCK_PAIRS]
+            mean = block.mean(axis=0)
+            centred = block - mean
+            self.merge(block.shape[0], mean, centred.T @ centred)
+
+    def control_variate(self, control_means: np.ndarray) -> tuple[float, float]:
+        """Regression-adjusted mean of column 0 on the other columns, and its std error."""
+        sxx = self.m2[1:, 1:]
+        sxy = self.m2[1:, 0]
+        beta = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        adjusted = float(self.mean[0] - beta @ (self.mean[1:] - control_means))
+        dof = self.count - 1 - (self.dim - 1)
+        if dof < 1:
+            return adjusted, 0.0
+        resid = max(float(self.m2[0, 0] - sxy @ beta), 0.0)
+        return adjusted, math.sqrt(resid / dof / self.count)
+
+
+def _moment_match(z: np.ndarray) -> np.ndarray:
+    """Rescale each ``_BLOCK_PAIRS`` slice of ``z`` so ``{z, -z}`` has unit variance.
+
+    ``z`` must start on a block edge (chunks do), which keeps results chunk-invariant.
+    Samples in a block stop being independent, so the reported stderr is approximate.
+    """
+    out = z.copy()
+    for start in range(0, z.size, _BLOCK_PAIRS):
+        block = out[start:start + _BLOCK_PAIRS]
+        if block.size >= 2:
+            block /= math.sqrt(float(np.mean(block * block)))
+    return out
+
+
+def _vanilla_payoff(st: np.ndarray, strike: float, is_call: bool) -> np.ndarray:
+    return np.maximum(st - strike, 0.0) if is_call else np.maximum(strike - st, 0.0)
+
+
+@dataclass(frozen=True)
+class _Controls:
+    """Known-mean controls: discounted ``S_T`` and a vanilla struck at the forward."""
+
+    forward_strike: float
+    means: np.ndarray
+
+    @classmethod
+    def build(
+        cls, spot: float, tau: float, vol: float, rate: float, div: float, *, is_call: bool
+    ) -> _Controls:
+        fwd = spot * math.exp((rate - div) * tau)
+        bs = black_scholes(spot, fwd, tau, vol, rate, div, is_call=is_call)
+        return cls(forward_strike=fwd, means=np.array([spot * math.exp(-div * tau), bs.pv_unit]))
+
+    def columns(self, st: np.ndarray, *, df: float, is_call: bool) -> list[np.ndarray]:
+        return [df * st, df * _vanilla_payoff(st, self.forward_strike, is_call)]
+
+
+def _discounted_pair_payoffs(
+    z: np.ndarray,
+    *,
+    spot: float,
+    strike: float,
+    drift: float,
+    vol_sqrt: float,
+    df: float,
+    is_call: bool,
+) -> np.ndarray:
+    """Discounted antithetic pair averages for one chunk of normals."""
+    st_pos = spot * np.exp(drift + vol_sqrt * z)
+    st_neg = spot * np.exp(drift - vol_sqrt * z)
+    if is_call:
+        pay = 0.5 * (np.maximum(st_pos - strike, 0.0) + np.maximum(st_neg - strike, 0.0))
+    else:
+        pay = 0.5 * (np.maximum(strike - st_pos, 0.0) + np.maximum(strike - st_neg, 0.0))
+    return df * pay
+
+
+def _pair_control_rows(
+    z: np.ndarray,
+    *,
+    spot: float,
+    strike: float,
+    drift: float,
+    vol_sqrt: float,
+    df: float,
+    is_call: bool,
+    controls: _Controls,
+) -> np.ndarray:
+    """Rows ``(payoff, controls...)`` of antithetic pair averages, all discounted."""
+    st_pos = spot * np.exp(drift + vol_sqrt * z)
+    st_neg = spot * np.exp(drift - vol_sqrt * z)
+    pay = 0.5 * df * (
+        _vanilla_payoff(st_pos, strike, is_call) + _vanilla_payoff(st_neg, strike, is_call)
+    )
+    pos = controls.columns(st_pos, df=df, is_call=is_call)
+    neg = controls.columns(st_neg, df=df, is_call=is_call)
+    return np.column_stack([pay] + [0.5 * (a + b) for a, b in zip(pos, neg)])
+
+
+def _polyval(coeffs: tuple[float, ...], x: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(x)
+    for c in coeffs:
+        out = out * x + c
+    return out
+
+
+def inverse_norm_cdf(u: np.ndarray) -> np.ndarray:
+    """Standard normal quantile for ``u`` in ``(0, 1)``: Acklam + one Halley step."""
+    u = np.asarray(u, dtype=float)
+    # Work in the lower half and reflect, so the Halley residual never loses digits
+    # to ``1 - Φ(z)`` cancellation.
+    p = np.minimum(u, 1.0 - u)
+    tail = p < _ICDF_P_LOW
+    safe_p = np.where(tail, p, _ICDF_P_LOW)
+    t = np.sqrt(-2.0 * np.log(safe_p))
+    z_tail = _polyval(_ICDF_C, t) / (_polyval(_ICDF_D, t) * t + 1.0)
+    v = p - 0.5
+    w = v * v
+    z_mid = _polyval(_ICDF_A, w) * v / (_polyval(_ICDF_B, w) * w + 1.0)
+    z = np.where(tail, z_tail, z_mid)
+    e = norm_cdf_array(z) - p
+    step = e * math.sqrt(2.0 * math.pi) * np.exp(0.5 * z * z)
+    z = z - step / (1.0 + 0.5 * z * step)
+    return np.where(u > 0.5, -z, z)
+
+
+def sobol_uniforms(n: int, *, seed: int, replication: int) -> np.ndarray:
+    """First ``n`` points of the 1-D Sobol sequence under one random scramble.
+
+    Matoušek's linear matrix scramble (random lower-triangular, unit diagonal) plus a
+    digital shift, drawn from ``PCG64((seed, replication))``. Every power-of-two prefix
+    keeps one point per dyadic cell; points sit mid-cell so ``Φ⁻¹`` never sees 0 or 1.
+    """
+    rng = np.random.Generator(np.random.PCG64([int(seed), int(replication)]))
+    bits = _SOBOL_BITS
+    # Row j (MSB first) has its diagonal bit set plus random bits to its left.
+    rows = [
+        (1 << (bits - 1 - j)) | (int(rng.integers(0, 1 << j)) << (bits - j))
+        for j in range(bits)
+    ]
+    shift = int(rng.integers(0, 1 << bits, dtype=np.uint64))
+    # Dimension 1 is the base-2 van der Corput sequence: input bit b of the index lands
+    # at output position b from the MSB, so the scrambled point is an XOR of matrix columns.
+    columns = [
+        sum(1 << (bits - 1 - j) for j in range(bits) if rows[j] >> (bits - 1 - b) & 1)
+        for b in range(bits)
+    ]
+    index = np.arange(int(n), dtype=np.uint64)
+    y = np.full(index.shape, shift, dtype=np.uint64)
+    for b in range(min(bits, max(1, int(n)).bit_length())):
+        y ^= np.where((index >> np.uint64(b)) & np.uint64(1), np.uint64(columns[b]), np.uint64(0))
+    return (y.astype(float) + 0.5) / float(1 << bits)
+
+
+@functools.lru_cache(maxsize=NORMAL_CACHE_SIZE)
+def _pseudo_normals(seed: int, n_pairs: int) -> np.ndarray:
+    """The seeded PCG64 normal stream for one run (read-only, shared)."""
+    z = np.random.Generator(np.random.PCG64(seed)).standard_normal(n_pairs)
+    z.setflags(write=False)
+    return z
+
+
+@functools.lru_cache(maxsize=NORMAL_CACHE_SIZE)
+def _sobol_normals(seed: int, per_rep: int, reps: int) -> np.ndarray:
+    """``Φ⁻¹`` of each scramble's Sobol points, shape ``(reps, per_rep)`` (read-only)."""
+    z = np.stack([
+        inverse_norm_cdf(sobol_uniforms(per_rep, seed=seed, replication=rep))
+        for rep in range(reps)
+    ])
+    z.setflags(write=False)
+    return z
+
+
+def normal_buffer_stats() -> dict[str, dict[str, int]]:
+    """Hit / miss / size counters of the per-process normal buffers."""
+    out = {}
+    for name, fn in (('pseudo', _pseudo_normals), ('sobol', _sobol_normals)):
+        info = fn.cache_info()
+        out[name] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
+    return out
+
+
+def _monte_carlo_sobol(
+    *,
+    spot: float,
+    strike: float,
+    drift: float,
+    vol_sqrt: float,
+    df: float,
+    is_call: bool,
+    n_paths: int,
+    seed: int,
+    replications: int,
+    controls: _Controls | None,
+    moment_match: bool,
+) -> McResult:
+    """Randomised QMC: equal-size scrambles; stderr is the spread of their means.
+
+    Each scramble takes the largest power of two that fits its share of ``n_paths``
+    (only full power-of-two prefixes keep Sobol's balance), so ``n_paths`` on the result
+    can be below the request. With controls, each scramble is adjusted on its own
+    regression, and the adjusted stderr is likewise the spread of the adjusted means.
+    """
+    reps = max(2, int(replications))
+    per_rep = 1 << (max(1, n_paths // reps).bit_length() - 1)
+    means = np.empty(reps)
+    cv_means = np.empty(reps)
+    if per_rep * reps <= NORMAL_CACHE_MAX_PAIRS:
+        normals = _sobol_normals(seed, per_rep, reps)
+    else:
+        normals = _sobol_normals.__wrapped__(seed, per_rep, reps)
+    for rep in range(reps):
+        z = normals[rep]
+        if moment_match and z.size >= 2:
+            z = (z - z.mean()) / z.std()
+        st = spot * np.exp(drift + vol_sqrt * z)
+        pay = df * _vanilla_payoff(st, strike, is_call)
+        means[rep] = float(pay.mean())
+        if controls is not None:
+            co = _CoMoments(3)
+            co.merge_samples(np.column_stack([pay] + controls.columns(st, df=df, is_call=is_call)))
+            cv_means[rep] = co.control_variate(controls.means)[0]
+    root_reps = math.sqrt(reps)
+    return McResult(
+        pv_unit=float(means.mean()),
+        stderr=float(means.std(ddof=1)) / root_reps,
+        n_paths=per_rep * reps,
+        seed=seed,
+        cv_pv_unit=float(cv_means.mean()) if controls is not None else None,
+        cv_stderr=float(cv_means.std(ddof=1)) / root_reps if controls is not None else None,
+    )
 
 
 def monte_carlo_vanilla(
@@ -30,6 +378,11 @@ def monte_carlo_vanilla(
     is_call: bool,
     n_paths: int = 20_000,
     seed: int = 42,
+    chunk_pairs: int = DEFAULT_CHUNK_PAIRS,
+    sampler: str = 'pseudo',
+    qmc_replications: int = DEFAULT_QMC_REPLICATIONS,
+    control_variate: bool = False,
+    moment_match: bool = False,
 ) -> McResult:
     s, k = float(spot), float(strike)
     t, sig = float(tau), float(vol)
@@ -40,34 +393,74 @@ def monte_carlo_vanilla(
 
     if s <= 0 or k <= 0:
         raise ValueError('spot and strike must be positive')
+    if sampler not in SAMPLERS:
+        raise ValueError(f'sampler must be one of {", ".join(SAMPLERS)}')
 
     if t <= 0:
         intrinsic = max(s - k, 0.0) if is_call else max(k - s, 0.0)
+        if control_variate:
+            return McResult(
+                pv_unit=intrinsic, stderr=0.0, n_paths=0, seed=seed,
+                cv_pv_unit=intrinsic, cv_stderr=0.0,
+            )
         return McResult(pv_unit=intrinsic, stderr=0.0, n_paths=0, seed=seed)
 
-    rng = random.Random(int(seed))
     drift = (r - q - 0.5 * sig * sig) * t
     vol_sqrt = sig * math.sqrt(t)
     df = math.exp(-r * t)
+    controls = _Controls.build(s, t, sig, r, q, is_call=is_call) if control_variate else None
 
-    # Welford online mean / M2 over antithetic pair averages (unbiased stderr of mean).
-    mean = 0.0
-    m2 = 0.0
-    count = 0
-
-    for _ in range(n_pairs):
-        z = rng.gauss(0.0, 1.0)
-        st_pos = s * math.exp(drift + vol_sqrt * z)
-        st_neg = s * math.exp(drift - vol_sqrt * z)
-        if is_call:
-            pay = 0.5 * (max(st_pos - k, 0.0) + max(st_neg - k, 0.0))
+    if sampler == 'sobol':
+        return _monte_carlo_sobol(
+            spot=s, strike=k, drift=drift, vol_sqrt=vol_sqrt, df=df, is_call=is_call,
+            n_paths=n, seed=int(seed), replications=qmc_replications,
+            controls=controls, moment_match=moment_match,
+        )
+
+    # One stream per (seed, n_pairs): drawing it whole equals drawing it chunk by chunk,
+    # so big runs stream from a fresh generator instead of pinning a cached buffer.
+    normals = _pseudo_normals(int(seed), n_pairs) if n_pairs <= NORMAL_CACHE_MAX_PAIRS else None
+    rng = None if normals is not None else np.random.Generator(np.random.PCG64(int(seed)))
+
+    # Round chunks up to whole blocks so only the final chunk can end mid-block.
+    blocks_per_chunk = max(1, -(-int(chunk_pairs) // _BLOCK_PAIRS))
+    chunk = blocks_per_chunk * _BLOCK_PAIRS
+
+    # Welford mean / M2 over antithetic pair averages (unbiased stderr of mean); with
+    # controls, the co-moment matrix of (payoff, controls) instead.
+    moments = _Moments()
+    co_moments = _CoMoments(3) if controls is not None else None
+    done = 0
+    while done < n_pairs:
+        m = min(chunk, n_pairs - done)
+        z = normals[done:done + m] if normals is not None else rng.standard_normal(m)
+        if moment_match:
+            z = _moment_match(z)
+        if co_moments is not None:
+            rows = _pair_control_rows(
+                z, spot=s, strike=k, drift=drift, vol_sqrt=vol_sqrt, df=df, is_call=is_call,
+                controls=controls,
+            )
+            co_moments.merge_samples(rows)
+            moments.merge_samples(rows[:, 0])
         else:
-            pay = 0.5 * (max(k - st_pos, 0.0) + max(k - st_neg, 0.0))
-        x = df * pay
-        count += 1
-        delta = x - mean
-        mean += delta / count
-        m2 += delta * (x - mean)
-
-    stderr = math.sqrt(m2 / (count * (count - 1))) if count > 1 else 0.0
-    return McResult(pv_unit=mean, stderr=stderr, n_paths=n_pairs * 2, seed=int(seed))
+            moments.merge_samples(
+                _discounted_pair_payoffs(
+                    z, spot=s, strike=k, drift=drift, vol_sqrt=vol_sqrt, df=df, is_call=is_call
+                )
+            )
+        done += m
+
+    if co_moments is None:
+        return McResult(
+            pv_unit=moments.mean, stderr=moments.stderr, n_paths=n_pairs * 2, seed=int(seed)
+        )
+    cv_pv, cv_stderr = co_moments.control_variate(controls.means)
+    return McResult(
+        pv_unit=moments.mean,
+        stderr=moments.stderr,
+        n_paths=n_pairs * 2,
+        seed=int(seed),
+        cv_pv_unit=cv_pv,
+        cv_stderr=cv_stderr,
+    )
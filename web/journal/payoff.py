@@ -10,6 +10,8 @@ import json
 import re
 from typing import Any
 
+import numpy as np
+
 from journal.black_scholes import position_sign
 
 SPOT_RANGE_FRAC = 0.30
@@ -84,6 +86,27 @@ def unit_payoff(
     raise ValueError(f'unsupported payoff kind {kind!r}')
 
 
+def unit_payoff_batch(
+    *,
+    kind: str,
+    is_call: bool,
+    strike: float,
+    spots,
+    cash_payout: float = 1.0,
+) -> np.ndarray:
+    """``unit_payoff`` over a whole spot grid in one NumPy pass."""
+    s = np.asarray(spots, dtype=float)
+    k = float(strike)
+    if kind == 'vanilla':
+        return np.maximum(s - k, 0.0) if is_call else np.maximum(k - s, 0.0)
+    itm = (s > k) if is_call else (s < k)
+    if kind == 'cash_or_nothing':
+        return np.where(itm, float(cash_payout), 0.0)
+    if kind == 'asset_or_nothing':
+        return np.where(itm, s, 0.0)
+    raise ValueError(f'unsupported payoff kind {kind!r}')
+
+
 def _spot_grid(center: float, n: int = N_POINTS) -> list[float]:
     lo = center * (1.0 - SPOT_RANGE_FRAC)
     hi = center * (1.0 + SPOT_RANGE_FRAC)
@@ -124,17 +147,16 @@ def build_leg_payoff(
         eps = max(center * 1e-4, 1e-6)
         spots = sorted(set(spots + [center - eps, center, center + eps]))
 
-    ys = [
+    ys = (
         scale
-        * unit_payoff(
+        * unit_payoff_batch(
             kind=kind,
             is_call=is_call,
             strike=float(strike),
-            spot=s,
+            spots=spots,
             cash_payout=cash,
         )
-        for s in spots
-    ]
+    ).tolist()
 
     labels = {
         'vanilla': 'vanilla',
@@ -3,21 +3,37 @@
 Not persisted. Dropdown = catalog codes (PVE, AON, BIN, EQF, …); inputs appear only
 after a pick. Point price via C++ (`numeraire_cpp`); greeks charts still Python BS
 shapes for vanillas only.
+
+Quotes, charts and tree dumps are memoised in the ``quant_lab`` Django cache, keyed on
+the normalised inputs that determine them (LRU + TTL come from the backend), so a
+refresh or legend toggle does not rerun MC or a 200-step tree.
 """
 
 from __future__ import annotations
 
+import hashlib
 import math
 import re
 from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+from django.core.cache import caches
 
-from journal.black_scholes import BsResult, black_scholes
+from journal.black_scholes import BsResult, black_scholes, black_scholes_batch
 from journal.greeks_lab import GreeksLabParams, build_greeks_vs_spot, params_from_get
 from journal.models import CatalogInstrumentType
-from journal.payoff import unit_payoff
+from journal.payoff import unit_payoff_batch
+from journal.refdata import refdata_cached
 
 DAYS_PER_YEAR = 365.0
 
+# Result memo: Django cache alias (settings.CACHES) and key namespace. Bump the
+# version when a pricer change should invalidate everything already cached.
+_CACHE_ALIAS = 'quant_lab'
+_CACHE_PREFIX = 'qlab:v2'
+_CACHE_STATS = ('hits', 'misses')
+
 # Payoff vs PV chart (European vanilla): spot grid ±30% around K.
 _VALUE_CHART_RANGE = 0.30
 _VALUE_CHART_POINTS = 81
@@ -155,9 +171,15 @@ _AMERICAN_VANILLA_FIELDS = (
 _CRR_TREE_MAX_STEPS = 8
 _CRR_DEFAULT_STEPS = 200
 _CRR_LAB_TREE_DEFAULT = 3
+# American quotes above the drawable tree size use Leisen–Reimer + Richardson over (N, 2N+1)
+# with greeks read off the tree; N=25 is at least as accurate as plain CRR at 200 steps.
+# Small N stays plain CRR so the quote matches the educational tree dump.
+_AMERICAN_TREE_STEPS = 25
 _MC_PATH_CHOICES = (10_000, 50_000, 100_000)
 _MC_DEFAULT_PATHS = 10_000
 _MC_DEFAULT_SEED = 42
+# pseudo = Mersenne Twister; sobol = randomised QMC (scrambled Sobol, 16 scrambles).
+_MC_SAMPLER_CHOICES = ('pseudo', 'sobol')
 _CRR_TREE_DRAW_MIN = 2
 _CRR_TREE_DRAW_MAX = 10
 _CRR_TREE_DRAW_DEFAULT = 3
@@ -239,10 +261,69 @@ class QuantLabQuote:
     n_steps: int | None = None
     mc_paths: int | None = None
     mc_seed: int | None = None
+    mc_sampler: str | None = None
     mc_std_err: float | None = None
     diagnostics: str | None = None
 
 
+def _canon(value: Any) -> str:
+    """Stable text for a key part: floats to 12 significant digits (form noise)."""
+    if value is None:
+        return '-'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (int, float)):
+        return format(float(value), '.12g')
+    return str(value).strip().lower()
+
+
+def _point_key(params: GreeksLabParams, tau: float) -> tuple:
+    return (
+        params.spot, params.strike, params.vol, params.rate, params.div, tau, params.is_call
+    )
+
+
+def _count(stat: str) -> None:
+    cache = caches[_CACHE_ALIAS]
+    key = f'{_CACHE_PREFIX}:stats:{stat}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        # First event (or evicted): seed the counter. A racing worker may lose one tick.
+        cache.set(key, 1, timeout=None)
+
+
+def _lab_cached(kind: str, parts: tuple, compute: Callable[[], Any]) -> Any:
+    """``compute()`` memoised under ``(kind, *parts)``; failed quotes are not stored."""
+    raw = '|'.join(_canon(p) for p in (kind, *parts))
+    key = f'{_CACHE_PREFIX}:{kind}:{hashlib.sha1(raw.encode()).hexdigest()}'
+    cache = caches[_CACHE_ALIAS]
+    hit = cache.get(key)
+    if hit is not None:
+        _count('hits')
+        return hit
+    _count('misses')
+    value = compute()
+    if value is not None and not (isinstance(value, QuantLabQuote) and not value.ok):
+        cache.set(key, value)
+    return value
+
+
+def quant_lab_cache_stats() -> dict[str, Any]:
+    """Hit / miss counters of the result memo (shared when the backend is)."""
+    cache = caches[_CACHE_ALIAS]
+    values = cache.get_many([f'{_CACHE_PREFIX}:stats:{s}' for s in _CACHE_STATS])
+    hits = int(values.get(f'{_CACHE_PREFIX}:stats:hits') or 0)
+    misses = int(values.get(f'{_CACHE_PREFIX}:stats:misses') or 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': (hits / total) if total else None,
+        'backend': type(cache).__name__,
+    }
+
+
 def _title_from_maps_to(maps_to: str) -> str:
     """plain_vanilla_european_option → Plain Vanilla European Option."""
     return (maps_to or '').replace('_', ' ').strip().title()
@@ -364,13 +445,33 @@ def _choice_asset_class(choice: InventoryChoice) -> str:
 
 def list_inventory_choices(*, asset_class: str | None = None) -> list[InventoryChoice]:
     try:
-        rows = list(
-            CatalogInstrumentType.objects.filter(is_active=True).order_by('sort_order', 'code')
-        )
+        out = _catalog_choices()
     except Exception:
-        rows = []
+        out = []
+
+    if not any(c.code == 'EFT' for c in out):
+        out.append(
+            InventoryChoice(
+                code='EFT',
+                label='EFT — Listed Future Outright',
+                maps_to='commodity_futures_outright',
+                family='FUTURE',
+                is_vanilla=False,
+                exercise='n/a',
+                param_kind='futures',
+            )
+        )
+
+    wanted = (asset_class or '').strip().lower()
+    if wanted in {'equity', 'commodity'}:
+        out = [c for c in out if _choice_asset_class(c) == wanted]
+    return out
+
+
+@refdata_cached('catalog_instrument_type')
+def _catalog_choices() -> list[InventoryChoice]:
     out: list[InventoryChoice] = []
-    for cat in rows:
+    for cat in CatalogInstrumentType.objects.filter(is_active=True).order_by('sort_order', 'code'):
         maps = (cat.maps_to_instrument_type or '').strip()
         code = (cat.code or '').strip().upper()
         if not code:
@@ -388,23 +489,6 @@ def list_inventory_choices(*, asset_class: str | None = None) -> list[InventoryC
                 param_kind=_param_kind(code, family, maps),
             )
         )
-
-    if not any(c.code == 'EFT' for c in out):
-        out.append(
-            InventoryChoice(
-                code='EFT',
-                label='EFT — Listed Future Outright',
-                maps_to='commodity_futures_outright',
-                family='FUTURE',
-                is_vanilla=False,
-                exercise='n/a',
-                param_kind='futures',
-            )
-        )
-
-    wanted = (asset_class or '').strip().lower()
-    if wanted in {'equity', 'commodity'}:
-        out = [c for c in out if _choice_asset_class(c) == wanted]
     return out
 
 
@@ -544,6 +628,11 @@ def _parse_mc_paths(get, default: int = _MC_DEFAULT_PATHS) -> int:
     return min(_MC_PATH_CHOICES, key=lambda c: abs(c - v))
 
 
+def _parse_mc_sampler(get) -> str:
+    raw = str(get.get('mc_sampler') or '').strip().lower()
+    return raw if raw in _MC_SAMPLER_CHOICES else _MC_SAMPLER_CHOICES[0]
+
+
 def _parse_tree_steps(get, default: int = _CRR_TREE_DRAW_DEFAULT) -> int:
     raw = get.get('tree_steps')
     if raw is None or str(raw).strip() == '':
@@ -609,6 +698,7 @@ def resolve_lab_params(get) -> tuple[GreeksLabParams | None, float, dict]:
         'n_steps': _parse_n_steps(get, steps_default),
         'mc_paths': _parse_mc_paths(get, _MC_DEFAULT_PATHS),
         'mc_seed': _MC_DEFAULT_SEED,
+        'mc_sampler': _parse_mc_sampler(get),
         'tree_steps': _parse_tree_steps(get, _CRR_TREE_DRAW_DEFAULT),
         'draw_tree': draw_tree,
         'tau': tau,
@@ -632,6 +722,7 @@ def _quote_from_raw(raw: dict) -> QuantLabQuote:
     diag_s = str(diagnostics) if diagnostics is not None else None
     mc_paths = raw.get('mc_paths')
     mc_seed = raw.get('mc_seed')
+    mc_sampler = raw.get('mc_sampler')
     return QuantLabQuote(
         ok=True,
         engine_label=str(raw.get('engine') or 'c++_pricer'),
@@ -646,6 +737,7 @@ def _quote_from_raw(raw: dict) -> QuantLabQuote:
         n_steps=int(n_steps) if n_steps is not None else None,
         mc_paths=int(mc_paths) if mc_paths is not None else None,
         mc_seed=int(mc_seed) if mc_seed is not None else None,
+        mc_sampler=str(mc_sampler) if mc_sampler is not None else None,
         mc_std_err=_parse_mc_std_err(diag_s),
         diagnostics=diag_s,
     )
@@ -665,24 +757,33 @@ def _quote_from_cpp_vanilla(
     exercise: str,
     *,
     n_steps: int = 0,
+    accelerated: bool = False,
 ) -> QuantLabQuote | None:
     mod = _try_import_cpp()
     if mod is None:
         return None
     ex = (exercise or 'european').strip().lower()
     steps = int(n_steps) if ex == 'american' else 0
+    args = (
+        float(params.spot),
+        float(params.strike),
+        float(params.vol),
+        float(params.rate),
+        float(params.div),
+        float(tau),
+        bool(params.is_call),
+        ex,
+        steps,
+    )
     try:
-        raw = mod.price_vanilla(
-            float(params.spot),
-            float(params.strike),
-            float(params.vol),
-            float(params.rate),
-            float(params.div),
-            float(tau),
-            bool(params.is_call),
-            ex,
-            steps,
-        )
+        if accelerated and ex == 'american':
+            try:
+                raw = mod.price_vanilla(*args, tree='leisen_reimer', richardson=True)
+            except TypeError:
+                # Module built before the accelerated tree: plain CRR at the same N.
+                raw = mod.price_vanilla(*args)
+        else:
+            raw = mod.price_vanilla(*args)
     except Exception as exc:  # noqa: BLE001 — surface to lab UI
         return _cpp_error(exc)
     return _quote_from_raw(raw)
@@ -722,10 +823,13 @@ def _quote_from_cpp_vanilla_mc(
     *,
     num_paths: int = _MC_DEFAULT_PATHS,
     seed: int = _MC_DEFAULT_SEED,
+    sampler: str = 'pseudo',
 ) -> QuantLabQuote | None:
     mod = _try_import_cpp()
     if mod is None or not hasattr(mod, 'price_vanilla_mc'):
         return None
+    # Only name the sampler when it is not the default, so older builds still price.
+    extra = {'sampler': sampler} if sampler != 'pseudo' else {}
     try:
         raw = mod.price_vanilla_mc(
             float(params.spot),
@@ -737,6 +841,7 @@ def _quote_from_cpp_vanilla_mc(
             bool(params.is_call),
             int(num_paths),
             int(seed),
+            **extra,
         )
     except Exception as exc:  # noqa: BLE001
         return _cpp_error(exc)
@@ -936,14 +1041,43 @@ def price_sandbox(
     lab_product: str,
     exercise: str,
     cash_payout: float = 1.0,
-    n_steps: int = _CRR_DEFAULT_STEPS,
+    n_steps: int = _AMERICAN_TREE_STEPS,
+) -> QuantLabQuote:
+    """Point price via production C++ pricers; Python BS fallback only for EU vanilla.
+
+    ``n_steps`` only matters for American vanillas: above the drawable tree size it is the
+    base N of the Leisen–Reimer + Richardson engine, otherwise plain CRR steps.
+    """
+    return _lab_cached(
+        'quote',
+        (lab_product, exercise, *_point_key(params, tau), cash_payout, n_steps),
+        lambda: _price_sandbox(
+            params,
+            tau,
+            lab_product=lab_product,
+            exercise=exercise,
+            cash_payout=cash_payout,
+            n_steps=n_steps,
+        ),
+    )
+
+
+def _price_sandbox(
+    params: GreeksLabParams,
+    tau: float,
+    *,
+    lab_product: str,
+    exercise: str,
+    cash_payout: float,
+    n_steps: int,
 ) -> QuantLabQuote:
-    """Point price via production C++ pricers; Python BS fallback only for EU vanilla."""
     product = (lab_product or '').strip().lower()
 
     if product == 'vanilla':
         ex = (exercise or 'european').strip().lower()
-        cpp = _quote_from_cpp_vanilla(params, tau, ex, n_steps=n_steps)
+        cpp = _quote_from_cpp_vanilla(
+            params, tau, ex, n_steps=n_steps, accelerated=n_steps > _CRR_TREE_MAX_STEPS
+        )
         if cpp is not None:
             return cpp
         if ex == 'american':
@@ -1012,23 +1146,20 @@ def build_payoff_value_chart(
 ) -> dict | None:
     """Payoff at T vs PV today along a spot grid (European vanilla only).
 
-    Payoff is pure Python; PV uses C++ ``price_vanilla`` when available,
-    else Python BS fallback. Full reprice per spot (not delta). Also returns
+    Payoff is NumPy; PV uses one C++ ``price_vanilla_batch`` call when available,
+    else one ``black_scholes_batch`` call over the grid. Full reprice per spot (not delta). Also returns
     the delta-tangent at the mark spot: V(S₀)+Δ·(S−S₀) — the gap to PV is Γ.
     """
     if tau < 0.0 or params.strike <= 0.0:
         return None
 
     spots = _value_spot_grid(params.strike)
-    payoffs = [
-        unit_payoff(
-            kind='vanilla',
-            is_call=params.is_call,
-            strike=params.strike,
-            spot=s,
-        )
-        for s in spots
-    ]
+    payoffs = unit_payoff_batch(
+        kind='vanilla',
+        is_call=params.is_call,
+        strike=params.strike,
+        spots=spots,
+    ).tolist()
 
     mod = _try_import_cpp()
     values: list[float] = []
@@ -1036,7 +1167,31 @@ def build_payoff_value_chart(
     mark_pv: float | None = None
     mark_delta: float | None = None
 
-    if mod is not None and hasattr(mod, 'price_vanilla'):
+    if mod is not None and hasattr(mod, 'price_vanilla_batch'):
+        engine = 'c++_analytic_bs'
+        try:
+            # Grid + mark in one GIL-free C++ call: the mark is the last lane.
+            raw = mod.price_vanilla_batch(
+                np.append(np.asarray(spots, dtype=float), float(params.spot)),
+                float(params.strike),
+                float(params.vol),
+                float(params.rate),
+                float(params.div),
+                float(tau),
+                bool(params.is_call),
+            )
+            npv = np.asarray(raw['npv'], dtype=float)
+            values = npv[:-1].tolist()
+            mark_pv = float(npv[-1])
+            delta = float(raw['delta'][-1])
+            mark_delta = delta if math.isfinite(delta) else None
+        except Exception:  # noqa: BLE001
+            values = []
+            mark_pv = None
+            mark_delta = None
+            engine = 'python_bs_fallback'
+    elif mod is not None and hasattr(mod, 'price_vanilla'):
+        # Module built before the batch entry points: one call per spot.
         engine = 'c++_analytic_bs'
         try:
             for s in spots:
@@ -1074,31 +1229,25 @@ def build_payoff_value_chart(
 
     if not values:
         engine = 'python_bs_fallback'
+        # Grid + mark in one batch: the mark is appended as the last lane.
+        lanes = np.append(np.asarray(spots, dtype=float), float(params.spot))
         try:
-            for s in spots:
-                g = black_scholes(
-                    s,
-                    params.strike,
-                    tau,
-                    params.vol,
-                    params.rate,
-                    params.div,
-                    is_call=params.is_call,
-                )
-                values.append(float(g.pv_unit))
-            mark_g = black_scholes(
-                params.spot,
+            grid = black_scholes_batch(
+                lanes,
                 params.strike,
                 tau,
                 params.vol,
                 params.rate,
                 params.div,
-                is_call=params.is_call,
+                params.is_call,
             )
-            mark_pv = float(mark_g.pv_unit)
-            mark_delta = float(mark_g.delta)
-        except (ValueError, OverflowError):
+        except ValueError:
+            return None
+        if not np.all(np.isfinite(grid.pv_unit)):
             return None
+        values = grid.pv_unit[:-1].tolist()
+        mark_pv = float(grid.pv_unit[-1])
+        mark_delta = float(grid.delta[-1])
 
     if mark_pv is None or mark_delta is None:
         return None
@@ -1151,6 +1300,7 @@ def build_quant_lab(get, *, asset_class: str = 'equity') -> dict:
     n_steps = int(meta.get('n_steps') or _CRR_DEFAULT_STEPS)
     mc_paths = int(meta.get('mc_paths') or _MC_DEFAULT_PATHS)
     mc_seed = int(meta.get('mc_seed') or _MC_DEFAULT_SEED)
+    mc_sampler = str(meta.get('mc_sampler') or _MC_SAMPLER_CHOICES[0])
     is_eu_vanilla = product == 'vanilla' and exercise == 'european'
     is_am_vanilla = product == 'vanilla' and exercise == 'american'
 
@@ -1169,23 +1319,44 @@ def build_quant_lab(get, *, asset_class: str = 'equity') -> dict:
             cash_payout=float(meta.get('cash_payout') or 1.0),
             n_steps=n_steps,
         )
+        point = _point_key(params, tau)
         if is_eu_vanilla:
-            quote_mc = _quote_from_cpp_vanilla_mc(
-                params, tau, num_paths=mc_paths, seed=mc_seed
+            quote_mc = _lab_cached(
+                'mc',
+                (*point, mc_paths, mc_seed, mc_sampler),
+                lambda: _quote_from_cpp_vanilla_mc(
+                    params, tau, num_paths=mc_paths, seed=mc_seed, sampler=mc_sampler
+                ),
+            )
+            quote_crr = _lab_cached(
+                'crr',
+                (*point, n_steps),
+                lambda: _quote_from_cpp_vanilla_binomial(
+                    params, tau, 'european', n_steps=n_steps
+                ),
             )
-            quote_crr = _quote_from_cpp_vanilla_binomial(
-                params, tau, 'european', n_steps=n_steps
+            charts = _lab_cached(
+                'greeks', (*point, params.n_points), lambda: build_greeks_vs_spot(params)
+            )
+            payoff_value_chart = _lab_cached(
+                'payoff_value', point, lambda: build_payoff_value_chart(params, tau)
             )
-            charts = build_greeks_vs_spot(params)
-            payoff_value_chart = build_payoff_value_chart(params, tau)
             if meta.get('draw_tree'):
                 tree_steps = int(meta.get('tree_steps') or _CRR_TREE_DRAW_DEFAULT)
-                crr_tree = _dump_crr_tree(params, tau, 'european', tree_steps)
+                crr_tree = _lab_cached(
+                    'tree',
+                    (*point, 'european', tree_steps),
+                    lambda: _dump_crr_tree(params, tau, 'european', tree_steps),
+                )
                 crr_params = _crr_params_from_tree(crr_tree)
         if is_am_vanilla and quote and quote.ok:
             steps_used = quote.n_steps if quote.n_steps is not None else n_steps
             if _CRR_TREE_DRAW_MIN <= steps_used <= _CRR_TREE_MAX_STEPS:
-                crr_tree = _dump_crr_tree(params, tau, exercise, steps_used)
+                crr_tree = _lab_cached(
+                    'tree',
+                    (*point, exercise, steps_used),
+                    lambda: _dump_crr_tree(params, tau, exercise, steps_used),
+                )
             crr_params = _crr_params_from_tree(crr_tree) or _compute_crr_params(
                 vol=float(params.vol),
                 rate=float(params.rate),
@@ -1230,6 +1401,7 @@ def build_quant_lab(get, *, asset_class: str = 'equity') -> dict:
         'crr_minus_bs': _pv_diff(quote_crr, quote),
         'is_eu_vanilla': is_eu_vanilla,
         'mc_path_choices': _MC_PATH_CHOICES,
+        'mc_sampler_choices': _MC_SAMPLER_CHOICES,
         'crr_tree_draw_min': _CRR_TREE_DRAW_MIN,
         'crr_tree_draw_max': _CRR_TREE_DRAW_MAX,
         'crr_tree_draw_default': _CRR_TREE_DRAW_DEFAULT,
@@ -1247,4 +1419,5 @@ def build_quant_lab(get, *, asset_class: str = 'equity') -> dict:
         'crr_tree_max_steps': _CRR_TREE_MAX_STEPS,
         'payoff_value_chart': payoff_value_chart,
         'show_payoff_value': payoff_value_chart is not None,
+        'cache_stats': quant_lab_cache_stats(),
     }
@@ -0,0 +1,91 @@
+"""Cross-request cache for reference-data lookups.
+
+Catalogue choices, book / strategy suggestions and curve / surface / futures / ticker
+lists are read on almost every page, but only change after an ingest, the daily batch or
+a booking. ``refdata_cached`` keeps them in the ``refdata`` Django cache (settings.CACHES),
+keyed on the ``data_generation`` counter of each table the lookup reads. Writers bump that
+counter (triggers on ``trades`` / ``catalog_instrument_type``, ``daily_market_prep.py`` and
+the futures ingest scripts for market tables), so the next render computes under a new key
+and stale entries simply age out.
+
+The counters are one small query, re-read at most every
+``NUMERAIRE_REFDATA_GENERATION_TTL`` seconds per process. The cache TTL bounds how long a
+write that does not bump (e.g. a manual ``dev_main`` ingest) stays unseen.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from django.core.cache import caches
+from django.db import OperationalError
+
+from journal.models import DataGeneration
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_CACHE_ALIAS = 'refdata'
+_CACHE_PREFIX = 'refdata:v1'
+_GENERATION_TTL_SEC = float(os.environ.get('NUMERAIRE_REFDATA_GENERATION_TTL', '2'))
+_MISSING = object()
+
+_generations_lock = threading.Lock()
+_generations: tuple[float, dict[str, int]] | None = None
+
+
+def data_generations() -> dict[str, int]:
+    """``table_name -> generation`` (tables never bumped are absent)."""
+    global _generations
+    now = time.monotonic()
+    with _generations_lock:
+        if _generations is not None and now - _generations[0] < _GENERATION_TTL_SEC:
+            return _generations[1]
+    try:
+        current = dict(DataGeneration.objects.values_list('table_name', 'generation'))
+    except OperationalError:
+        # DB predates the table: keys never change and the cache TTL alone expires entries.
+        current = {}
+    with _generations_lock:
+        _generations = (now, current)
+    return current
+
+
+def forget_data_generations() -> None:
+    """Re-read the counters on the next lookup (after this process wrote a stamped table)."""
+    global _generations
+    with _generations_lock:
+        _generations = None
+
+
+def refdata_cached(*tables: str) -> Callable[[F], F]:
+    """Memoise a lookup that reads ``tables``; arguments are part of the key.
+
+    ``fn.uncached`` bypasses the cache. Exceptions are not cached.
+    """
+
+    def decorate(fn: F) -> F:
+        name = f'{fn.__module__}.{fn.__qualname__}'
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            generations = data_generations()
+            stamp = '.'.join(str(generations.get(t, 0)) for t in tables)
+            raw = repr((args, sorted(kwargs.items())))
+            key = f'{_CACHE_PREFIX}:{name}:{stamp}:{hashlib.sha1(raw.encode()).hexdigest()}'
+            cache = caches[_CACHE_ALIAS]
+            hit = cache.get(key, _MISSING)
+            if hit is not _MISSING:
+                return hit
+            value = fn(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        wrapper.uncached = fn  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -0,0 +1,195 @@
+"""Per-request wall time and SQL instrumentation for Journal views.
+
+``RequestMetricsMiddleware`` samples ``REQUEST_METRICS_SAMPLE_RATE`` of requests. For a
+sampled request it wraps every database connection (``execute_wrapper``) to count
+statements, sum their time and keep the slowest few. The sample then goes into an
+in-process ring buffer of the last ``REQUEST_METRICS_BUFFER`` requests, which the staff
+page (``RequestMetricsView``) summarises per view.
+
+Staff (or any user under DEBUG) also get a ``Server-Timing`` header on sampled responses,
+so browser dev tools show app / SQL time next to the network timings.
+
+The buffer is per process: each gunicorn worker shows its own traffic. Queries run on
+other threads (e.g. the what-if pool) use their own connections and are not counted.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connections
+
+_SQL_PREVIEW_CHARS = 400
+
+_buffer_lock = threading.Lock()
+_buffer: deque[RequestSample] | None = None
+
+
+@dataclass(frozen=True)
+class SlowStatement:
+    ms: float
+    alias: str
+    sql: str
+
+
+@dataclass(frozen=True)
+class RequestSample:
+    at: datetime
+    method: str
+    path: str
+    view: str
+    status: int
+    wall_ms: float
+    sql_count: int
+    sql_ms: float
+    slowest: tuple[SlowStatement, ...]
+
+
+@dataclass
+class _QueryTimer:
+    """``execute_wrapper`` that tallies statements for one request."""
+
+    keep: int
+    count: int = 0
+    seconds: float = 0.0
+    _slowest: list[tuple[float, int, str, str]] = field(default_factory=list)
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict):
+        t0 = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.count += 1
+            self.seconds += elapsed
+            if self.keep > 0:
+                # Min-heap of the `keep` slowest; count breaks ties so str never compares.
+                item = (elapsed, self.count, context['connection'].alias, sql)
+                if len(self._slowest) < self.keep:
+                    heapq.heappush(self._slowest, item)
+                elif elapsed > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, item)
+
+    def slowest(self) -> tuple[SlowStatement, ...]:
+        return tuple(
+            SlowStatement(ms=s * 1000.0, alias=alias, sql=sql[:_SQL_PREVIEW_CHARS])
+            for s, _, alias, sql in sorted(self._slowest, reverse=True)
+        )
+
+
+def _samples() -> deque[RequestSample]:
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = deque(maxlen=max(1, int(getattr(settings, 'REQUEST_METRICS_BUFFER', 500))))
+        return _buffer
+
+
+def record(sample: RequestSample) -> None:
+    buffer = _samples()
+    with _buffer_lock:
+        buffer.append(sample)
+
+
+def recent_samples() -> list[RequestSample]:
+    """Buffered samples, newest first."""
+    buffer = _samples()
+    with _buffer_lock:
+        return list(reversed(buffer))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[int(q) - 1]
+
+
+def summarize_by_view(samples: list[RequestSample]) -> list[dict]:
+    """Per view: hits, wall p50 / p95 / max, mean and max SQL count, mean SQL time."""
+    by_view: dict[str, list[RequestSample]] = {}
+    for sample in samples:
+        by_view.setdefault(sample.view, []).append(sample)
+    rows = []
+    for view, group in by_view.items():
+        wall = sorted(s.wall_ms for s in group)
+        rows.append(
+            {
+                'view': view,
+                'hits': len(group),
+                'wall_p50': _percentile(wall, 50),
+                'wall_p95': _percentile(wall, 95),
+                'wall_max': wall[-1],
+                'sql_count_mean': statistics.fmean(s.sql_count for s in group),
+                'sql_count_max': max(s.sql_count for s in group),
+                'sql_ms_mean': statistics.fmean(s.sql_ms for s in group),
+            }
+        )
+    rows.sort(key=lambda r: (-r['wall_p95'], r['view']))
+    return rows
+
+
+def slowest_statements(samples: list[RequestSample], limit: int = 20) -> list[dict]:
+    """The slowest statements across the buffer, with the view that ran them."""
+    items = [(stmt, s) for s in samples for stmt in s.slowest]
+    items.sort(key=lambda pair: -pair[0].ms)
+    return [
+        {'ms': stmt.ms, 'alias': stmt.alias, 'sql': stmt.sql, 'view': s.view, 'at': s.at}
+        for stmt, s in items[:limit]
+    ]
+
+
+def _view_name(request) -> str:
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else '(unresolved)'
+
+
+class RequestMetricsMiddleware:
+    """Sample request wall time + SQL count / time into the ring buffer (see module doc)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = float(getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 1.0))
+        self.keep_slowest = int(getattr(settings, 'REQUEST_METRICS_SLOW_QUERIES', 5))
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        timer = _QueryTimer(keep=self.keep_slowest)
+        t0 = time.perf_counter()
+        with ExitStack() as stack:
+            for conn in connections.all(initialized_only=False):
+                stack.enter_context(conn.execute_wrapper(timer))
+            response = self.get_response(request)
+        wall = time.perf_counter() - t0
+
+        sample = RequestSample(
+            at=datetime.now(timezone.utc),
+            method=request.method,
+            path=request.path,
+            view=_view_name(request),
+            status=response.status_code,
+            wall_ms=wall * 1000.0,
+            sql_count=timer.count,
+            sql_ms=timer.seconds * 1000.0,
+            slowest=timer.slowest(),
+        )
+        record(sample)
+
+        user = getattr(request, 'user', None)
+        if settings.DEBUG or (user is not None and user.is_staff):
+            response['Server-Timing'] = (
+                f'app;dur={sample.wall_ms:.1f}, '
+                f'db;dur={sample.sql_ms:.1f};desc="{sample.sql_count} queries"'
+            )
+        return response
@@ -6,8 +6,10 @@ import math
 from datetime import date
 
 from journal.models import VolSurfaceEod, VolSurfacePointEod
+from journal.refdata import refdata_cached
 
 
+@refdata_cached('vol_surface_eod')
 def list_surface_underlyings(surface_kind: str = 'implied_bs_eod') -> list[str]:
     return list(
         VolSurfaceEod.objects.filter(surface_kind=surface_kind)
@@ -18,6 +18,11 @@ urlpatterns = [
         views.TradePriceBookingView.as_view(),
         name='trade_price_booking',
     ),
+    path(
+        'trades/<str:trade_id>/whatif-grid.json',
+        views.TradeWhatIfGridView.as_view(),
+        name='trade_whatif_grid',
+    ),
     path(
         'trades/<str:trade_id>/delete/',
         views.TradeDeleteView.as_view(),
@@ -60,4 +65,5 @@ urlpatterns = [
         views.RatesConversionLabView.as_view(),
         name='rates_conversion_lab',
     ),
+    path('ops/requests/', views.RequestMetricsView.as_view(), name='request_metrics'),
 ]
@@ -1,9 +1,13 @@
+import dataclasses
 import json
+import os
 import re
 from datetime import date as date_cls
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_not_required
+from django.contrib.auth.mixins import UserPassesTestMixin
 from django.db import OperationalError
 from django.db.models import Count, Max, Prefetch, Sum
 from django.http import Http404, JsonResponse
@@ -61,6 +65,8 @@ from journal.market import (
 )
 from journal.payoff import build_trade_payoff_chart
 from journal.models import (
+    BookSummaryBreakdownEod,
+    BookSummaryEod,
     CatalogInstrumentType,
     DiscountCurveEod,
     Product,
@@ -82,10 +88,14 @@ from journal.whatif import (
     capabilities_for_equity,
     inputs_are_shocked,
     merge_trade_capabilities,
+    parse_whatif_grid,
     parse_whatif_inputs,
     run_trade_whatif,
+    run_trade_whatif_grid,
 )
+from journal.whatif_pool import request_deadline as whatif_request_deadline
 from journal.rates_conversion_lab import build_rates_conversion_lab
+from journal.request_metrics import recent_samples, slowest_statements, summarize_by_view
 
 
 def _parse_as_of(raw: str, available: list) -> date_cls | None:
@@ -102,6 +112,26 @@ def _parse_as_of(raw: str, available: list) -> date_cls | None:
     return None
 
 
+def _trade_mark_as_of(trade: Trade, raw: str) -> tuple[list[date_cls], date_cls | None]:
+    """Official mark days of ``trade`` (newest first) and the requested one, else the latest."""
+    available = list(
+        official_mtm()
+        .filter(trade=trade)
+        .order_by()
+        .values_list('as_of', flat=True)
+        .distinct()
+        .order_by('-as_of')
+    )
+    as_of = _parse_as_of(raw, available)
+    if as_of is None and available:
+        as_of = available[0]
+    return available, as_of
+
+
+def _official_mtm_by_leg(trade: Trade, as_of: date_cls) -> dict[str, TradeLegMtmEod]:
+    return {row.leg_id: row for row in official_mtm().filter(trade=trade, as_of=as_of)}
+
+
 def _remark_flags(remarks: str | None) -> list[str]:
     if not remarks:
         return []
@@ -151,22 +181,17 @@ class DashboardView(TemplateView):
         return context
 
     def _batch_summary(self):
-        available_as_of = list(
-            official_mtm()
-            .order_by()
-            .values_list('as_of', flat=True)
-            .distinct()
-            .order_by('-as_of')
-        )
+        available_as_of = self._available_as_of()
 
         requested = self.request.GET.get('as_of', '').strip()
         as_of = _parse_as_of(requested, available_as_of)
         if as_of is None and available_as_of:
             as_of = available_as_of[0]
 
-        mtm = official_mtm().filter(as_of=as_of) if as_of else None
+        book = None
+        if as_of is not None:
+            book = self._snapshot(as_of) or self._live_book(as_of)
 
-        exposure_qs = TradeLegExposureEod.objects.filter(as_of=as_of) if as_of else TradeLegExposureEod.objects.none()
         surfaces_qs = (
             VolSurfaceEod.objects.filter(as_of=as_of).order_by('underlying_id')
             if as_of
@@ -208,6 +233,111 @@ class DashboardView(TemplateView):
         return {
             'as_of': as_of,
             'available_as_of': available_as_of,
+            **(book or {
+                'mtm': {},
+                'engines': [],
+                'books': [],
+                'exposure': {'as_of': None, 'rows': 0, 'paths': None},
+            }),
+            'trade_status': list(
+                Trade.objects.order_by()
+                .values('status')
+                .annotate(count=Count('trade_id'))
+                .order_by('status')
+            ),
+            'surfaces': list(surfaces_qs[:20]),
+            'curves': curves,
+            'curves_meta': curves_meta,
+        }
+
+    @staticmethod
+    def _available_as_of() -> list:
+        """Mark days, newest first: `book_summary_eod` plus official days not summarised yet.
+
+        A DISTINCT over every official mark grows with history; the snapshot table has one
+        row per day, and only official days after its newest row are probed (a covering
+        range on `idx_trade_leg_mtm_eod_official_asof`). Without any snapshot (fresh DB, table not
+        created yet) fall back to the full DISTINCT. Run `refresh_book_summary.py --all` to
+        backfill a gap older than the newest snapshot.
+        """
+        try:
+            dates = list(BookSummaryEod.objects.values_list('as_of', flat=True).order_by('-as_of'))
+        except OperationalError:
+            dates = []
+        unsummarised = official_mtm().order_by()
+        if dates:
+            unsummarised = unsummarised.filter(as_of__gt=dates[0])
+        newer = unsummarised.values_list('as_of', flat=True).distinct().order_by('-as_of')
+        return list(newer) + dates
+
+    @staticmethod
+    def _snapshot(as_of):
+        """Totals and breakdowns precomputed by `refresh_book_summary.py`, or None.
+
+        None when the day was never summarised, or its official marks or exposure rows no
+        longer match the stamp taken at refresh (MAX(calculated_at) and row count, one
+        covering-index aggregate each), or a trade changed book / strategy since (trigger
+        clears `mtm_calculated_at`); the caller then aggregates live.
+        """
+        try:
+            summary = BookSummaryEod.objects.filter(as_of=as_of).first()
+        except OperationalError:
+            return None
+        if summary is None or summary.mtm_calculated_at is None:
+            return None
+        marks = official_mtm().filter(as_of=as_of).aggregate(m=Max('calculated_at'), n=Count('pk'))
+        if (marks['m'], marks['n']) != (summary.mtm_calculated_at, summary.legs):
+            return None
+        exposure = TradeLegExposureEod.objects.filter(as_of=as_of).aggregate(
+            m=Max('calculated_at'), n=Count('pk')
+        )
+        if (exposure['m'], exposure['n']) != (
+            summary.exposure_calculated_at,
+            summary.exposure_rows,
+        ):
+            return None
+
+        engines, books, strategies = [], [], {}
+        for row in BookSummaryBreakdownEod.objects.filter(as_of=as_of).order_by(
+            '-legs', 'group_key'
+        ):
+            item = {'legs': row.legs, 'pv_total': row.pv_total}
+            if row.dimension == 'engine':
+                engines.append({'pricing_engine': row.group_key, **item})
+            elif row.dimension == 'book':
+                books.append({'portfolio_id': row.group_key, **item})
+            else:
+                strategies.setdefault(row.portfolio_id, []).append(
+                    {'strategy_type': row.group_key, **item}
+                )
+        total_legs = sum(e['legs'] for e in engines)
+        for engine in engines:
+            engine['share'] = (100.0 * engine['legs'] / total_legs) if total_legs else 0.0
+        for book in books:
+            book['strategies'] = strategies.get(book['portfolio_id'], [])
+        return {
+            'mtm': {
+                'legs': summary.legs,
+                'pv_total': summary.pv_total,
+                'pnl_daily': summary.pnl_daily,
+                'delta_total': summary.delta_total,
+                'vega_total': summary.vega_total,
+                'theta_total': summary.theta_total,
+            },
+            'engines': engines,
+            'books': books,
+            'exposure': {
+                'as_of': as_of if summary.exposure_rows else None,
+                'rows': summary.exposure_rows,
+                'paths': summary.exposure_paths,
+            },
+        }
+
+    @classmethod
+    def _live_book(cls, as_of):
+        """Same numbers as `_snapshot`, aggregated from the mark and exposure tables."""
+        mtm = official_mtm().filter(as_of=as_of)
+        return {
             'mtm': mtm.aggregate(
                 legs=Count('pk'),
                 pv_total=Sum('pv_total'),
@@ -215,23 +345,14 @@ class DashboardView(TemplateView):
                 delta_total=Sum('delta_total'),
                 vega_total=Sum('vega_total'),
                 theta_total=Sum('theta_total'),
-            ) if mtm is not None else {},
-            'engines': self._mtm_breakdown(mtm, 'pricing_engine') if mtm is not None else [],
-            'books': self._books_breakdown(mtm) if mtm is not None else [],
-            'trade_status': list(
-                Trade.objects.order_by()
-                .values('status')
-                .annotate(count=Count('trade_id'))
-                .order_by('status')
             ),
-            'exposure': exposure_qs.aggregate(
+            'engines': cls._mtm_breakdown(mtm, 'pricing_engine'),
+            'books': cls._books_breakdown(mtm),
+            'exposure': TradeLegExposureEod.objects.filter(as_of=as_of).aggregate(
                 as_of=Max('as_of'),
                 rows=Count('pk'),
                 paths=Max('num_paths'),
             ),
-            'surfaces': list(surfaces_qs[:20]),
-            'curves': curves,
-            'curves_meta': curves_meta,
         }
 
     @staticmethod
@@ -510,26 +631,13 @@ class TradeDetailView(DetailView):
         trade = context['trade']
         legs = list(trade.legs.all())
 
-        available_as_of = list(
-            official_mtm()
-            .filter(trade=trade)
-            .order_by()
-            .values_list('as_of', flat=True)
-            .distinct()
-            .order_by('-as_of')
-        )
-        as_of = _parse_as_of(self.request.GET.get('as_of', ''), available_as_of)
-        if as_of is None and available_as_of:
-            as_of = available_as_of[0]
+        available_as_of, as_of = _trade_mark_as_of(trade, self.request.GET.get('as_of', ''))
         # Before the first mark, Market still needs a session day — use trade_date so
         # Price booking can show the futures/equity bundle that will price the trade.
         if as_of is None and trade.trade_date is not None:
             as_of = trade.trade_date
 
-        mtm_by_leg = {}
-        if as_of is not None and available_as_of and as_of in available_as_of:
-            for row in official_mtm().filter(trade=trade, as_of=as_of):
-                mtm_by_leg[row.leg_id] = row
+        mtm_by_leg = _official_mtm_by_leg(trade, as_of) if as_of in available_as_of else {}
 
         # Engines that priced the same leg for comparison only. Products covered by a
         # single engine produce nothing here, and the template then skips the panel.
@@ -731,20 +839,44 @@ class TradeDetailView(DetailView):
                 shocked = parse_whatif_inputs(
                     self.request.GET, baseline, caps=trade_caps
                 )
-                result = run_trade_whatif(market_rows, shocked, caps=trade_caps)
-                replay = run_trade_whatif(market_rows, baseline, caps=trade_caps)
+                deadline = whatif_request_deadline()
+                result = run_trade_whatif(
+                    market_rows, shocked, caps=trade_caps, deadline=deadline
+                )
+                # Replay at the baseline market with the shocked run's MC settings, so
+                # both MC PVs read the same normal buffer and their difference is paired.
+                replay = run_trade_whatif(
+                    market_rows,
+                    dataclasses.replace(
+                        shocked,
+                        spot=baseline.spot,
+                        vol=baseline.vol,
+                        rate=baseline.rate,
+                        div=baseline.div,
+                        tau=baseline.tau,
+                    ),
+                    caps=trade_caps,
+                    deadline=deadline,
+                )
                 replay_gap = None
                 if (
                     replay.get('whatif_pv_total') is not None
                     and replay.get('baseline_pv_total') is not None
                 ):
                     replay_gap = replay['whatif_pv_total'] - replay['baseline_pv_total']
+                mc_delta_pv = None
+                if (
+                    result.get('mc_pv_total') is not None
+                    and replay.get('mc_pv_total') is not None
+                ):
+                    mc_delta_pv = result['mc_pv_total'] - replay['mc_pv_total']
                 whatif_ctx = {
                     'baseline': baseline,
                     'inputs': shocked,
                     'result': result,
                     'caps': trade_caps,
                     'replay_gap': replay_gap,
+                    'mc_delta_pv': mc_delta_pv,
                     'active': inputs_are_shocked(baseline, shocked, trade_caps),
                 }
 
@@ -777,6 +909,66 @@ class TradeDetailView(DetailView):
         return context
 
 
+class TradeWhatIfGridView(View):
+    """GET → JSON PV / ΔPV cubes over a spot × vol × rate shock grid (no DB writes).
+
+    Centred on the trade's official MTM inputs @ ``as_of`` (latest by default), moved by
+    any ``wf_*`` overrides; ladders come from ``grid_spot`` / ``grid_vol`` / ``grid_rate``.
+    """
+
+    def get(self, request, trade_id, *args, **kwargs):
+        trade = (
+            Trade.objects.filter(trade_id=trade_id)
+            .prefetch_related(
+                Prefetch(
+                    'legs',
+                    queryset=TradeLeg.objects.select_related('product', 'product__equity'),
+                )
+            )
+            .first()
+        )
+        if trade is None:
+            raise Http404(f'Unknown trade {trade_id}')
+
+        _, as_of = _trade_mark_as_of(trade, request.GET.get('as_of', ''))
+        if as_of is None:
+            return JsonResponse({'ok': False, 'error': 'trade has no official MTM'}, status=404)
+
+        mtm_by_leg = _official_mtm_by_leg(trade, as_of)
+        market_rows = [
+            {
+                'leg': leg,
+                'equity': getattr(leg.product, 'equity', None),
+                'mtm': mtm_by_leg.get(leg.leg_id),
+            }
+            for leg in trade.legs.all()
+        ]
+        primary = next((r for r in market_rows if r['mtm'] is not None), None)
+        baseline = baseline_inputs_from_mtm(primary['mtm']) if primary else None
+        if baseline is None:
+            return JsonResponse({'ok': False, 'error': 'no MTM inputs @ as_of'}, status=404)
+
+        trade_caps = merge_trade_capabilities(
+            [capabilities_for_equity(row['equity']) for row in market_rows]
+        )
+        try:
+            centre = parse_whatif_inputs(request.GET, baseline, caps=trade_caps)
+            spot_shocks, vol_shocks, rate_shocks = parse_whatif_grid(request.GET)
+        except ValueError as exc:
+            return JsonResponse({'ok': False, 'error': str(exc)}, status=400)
+
+        result = run_trade_whatif_grid(
+            market_rows,
+            centre,
+            spot_shocks=spot_shocks,
+            vol_shocks=vol_shocks,
+            rate_shocks=rate_shocks,
+        )
+        return JsonResponse(
+            {'ok': True, 'trade_id': trade.trade_id, 'as_of': as_of.isoformat(), **result}
+        )
+
+
 class UnderlierListView(TemplateView):
     """Catalog of equity / index daily closes available in the batch DB."""
 
@@ -1027,14 +1219,7 @@ class ExposureView(TemplateView):
                 else None
             )
 
-            latest_mtm = (
-                official_mtm()
-                .order_by()
-                .values_list('as_of', flat=True)
-                .distinct()
-                .order_by('-as_of')
-                .first()
-            )
+            latest_mtm = official_mtm().aggregate(latest=Max('as_of'))['latest']
             lag_days = None
             if as_of is not None and latest_mtm is not None:
                 lag_days = (latest_mtm - as_of).days
@@ -1300,3 +1485,32 @@ class RatesConversionLabView(TemplateView):
         context = super().get_context_data(**kwargs)
         context.update(build_rates_conversion_lab(self.request.GET))
         return context
+
+
+class RequestMetricsView(UserPassesTestMixin, TemplateView):
+    """Staff only — sampled view timings / SQL counts from this worker's ring buffer."""
+
+    template_name = 'journal/request_metrics.html'
+    recent_limit = 100
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        samples = recent_samples()
+        view = self.request.GET.get('view', '').strip()
+        recent = [s for s in samples if s.view == view] if view else samples
+        context.update(
+            {
+                'by_view': summarize_by_view(samples),
+                'slowest': slowest_statements(recent),
+                'recent': recent[: self.recent_limit],
+                'selected_view': view,
+                'sample_count': len(samples),
+                'sample_rate': getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 1.0),
+                'buffer_size': getattr(settings, 'REQUEST_METRICS_BUFFER', 500),
+                'worker_pid': os.getpid(),
+            }
+        )
+        return context
@@ -4,71 +4,43 @@ Capabilities follow product shape:
 
 * **linear** (equity forward) — closed-form only; no IV / MC
 * **non-linear** (vanilla EU) — analytic BS + optional GBM MC
+
+Single-leg pricing lives in ``journal.whatif_leg``; ``run_trade_whatif`` prices the legs
+through ``journal.whatif_pool``. ``run_trade_whatif_grid`` is the ladder view: analytic PV
+over a spot × vol × rate shock grid in one broadcast pass (no MC).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Literal
-
-from journal.black_scholes import black_scholes, scale_unit
-from journal.equity_forward import equity_forward
-from journal.monte_carlo import monte_carlo_vanilla
-
-ProductKind = Literal['linear', 'nonlinear', 'unsupported']
-
-DEFAULT_MC_PATHS = 20_000
-MAX_MC_PATHS = 100_000
-DEFAULT_MC_SEED = 42
-
-
-@dataclass(frozen=True)
-class ProductCapabilities:
-    kind: ProductKind
-    label: str
-    uses_vol: bool
-    uses_mc: bool
-    uses_option_greeks: bool  # vega column meaningful
-    analytic_name: str
-
-
-CAPS_VANILLA = ProductCapabilities(
-    kind='nonlinear',
-    label='non-linear · vanilla EU',
-    uses_vol=True,
-    uses_mc=True,
-    uses_option_greeks=True,
-    analytic_name='Black–Scholes',
-)
-
-CAPS_FORWARD = ProductCapabilities(
-    kind='linear',
-    label='linear · equity forward',
-    uses_vol=False,
-    uses_mc=False,
-    uses_option_greeks=False,
-    analytic_name='forward closed-form',
-)
-
-CAPS_UNSUPPORTED = ProductCapabilities(
-    kind='unsupported',
-    label='unsupported in what-if',
-    uses_vol=False,
-    uses_mc=False,
-    uses_option_greeks=False,
-    analytic_name='—',
+from typing import Any
+
+import numpy as np
+
+from journal.black_scholes import black_scholes_batch, position_sign
+from journal.equity_forward import equity_forward_batch
+from journal.monte_carlo import SAMPLERS as MC_SAMPLERS
+from journal.whatif_leg import (
+    CAPS_FORWARD,
+    CAPS_UNSUPPORTED,
+    CAPS_VANILLA,
+    DEFAULT_MC_PATHS,
+    DEFAULT_MC_SEED,
+    MC_DEADLINE_REASON,
+    ProductCapabilities,
+    WhatIfInputs,
+    capabilities_for_equity,
+    rel_error,
 )
+from journal.whatif_pool import price_legs
 
+MAX_MC_PATHS = 100_000
 
-def capabilities_for_equity(equity) -> ProductCapabilities:
-    if equity is None:
-        return CAPS_UNSUPPORTED
-    key = (equity.instrument_type or '').strip().lower()
-    if key == 'plain_vanilla_european_option':
-        return CAPS_VANILLA
-    if key == 'equity_forward':
-        return CAPS_FORWARD
-    return CAPS_UNSUPPORTED
+# Shock ladders: spot in % of base spot, vol in vol points, rate in bp.
+DEFAULT_GRID_SPOT = (-30.0, 30.0, 41)
+DEFAULT_GRID_VOL = (-10.0, 10.0, 21)
+DEFAULT_GRID_RATE = (0.0, 0.0, 1)
+MAX_GRID_AXIS = 201
+MAX_GRID_CELLS = 250_000
 
 
 def merge_trade_capabilities(caps_list: list[ProductCapabilities]) -> ProductCapabilities:
@@ -91,53 +63,16 @@ def merge_trade_capabilities(caps_list: list[ProductCapabilities]) -> ProductCap
     )
 
 
-@dataclass
-class WhatIfInputs:
-    spot: float
-    vol: float
-    rate: float
-    div: float
-    tau: float
-    mc_paths: int = DEFAULT_MC_PATHS
-    mc_seed: int = DEFAULT_MC_SEED
-    run_mc: bool = True
-
-
-def _rel_error(diff: float | None, base: float | None) -> float | None:
-    if diff is None or base is None:
-        return None
-    denom = abs(float(base))
-    if denom < 1e-12:
-        return None
-    return float(diff) / denom
-
-
-@dataclass
-class WhatIfLegResult:
-    leg_id: str
-    supported: bool
-    reason: str
-    caps: ProductCapabilities
-    baseline_pv_total: float | None
-    whatif_pv_unit: float | None
-    whatif_pv_total: float | None
-    delta_pv: float | None
-    whatif_delta_total: float | None
-    whatif_vega_total: float | None
-    whatif_theta_day: float | None
-    mc_pv_unit: float | None = None
-    mc_pv_total: float | None = None
-    mc_stderr_total: float | None = None
-    mc_minus_analytic: float | None = None
-    mc_rel_error: float | None = None
-
-
 def _parse_float(raw: str | None, default: float) -> float:
     if raw is None or str(raw).strip() == '':
         return default
     return float(raw)
 
 
+def _parse_flag(raw: str | None) -> bool:
+    return str(raw or '').strip().lower() in ('1', 'true', 'on', 'yes')
+
+
 def _parse_int(raw: str | None, default: int, *, lo: int, hi: int) -> int:
     if raw is None or str(raw).strip() == '':
         return default
@@ -179,6 +114,11 @@ def parse_whatif_inputs(
             get.get('wf_mc_paths'), DEFAULT_MC_PATHS, lo=100, hi=MAX_MC_PATHS
         ),
         mc_seed=_parse_int(get.get('wf_mc_seed'), DEFAULT_MC_SEED, lo=0, hi=2_147_483_647),
+        mc_sampler=(
+            get.get('wf_mc_sampler') if get.get('wf_mc_sampler') in MC_SAMPLERS else 'pseudo'
+        ),
+        mc_control_variate=_parse_flag(get.get('wf_mc_cv')),
+        mc_moment_match=_parse_flag(get.get('wf_mc_mm')),
         run_mc=run_mc,
     )
 
@@ -190,154 +130,6 @@ def inputs_are_shocked(baseline: WhatIfInputs, shocked: WhatIfInputs, caps: Prod
     return any(abs(getattr(shocked, f) - getattr(baseline, f)) > 1e-12 for f in fields)
 
 
-def _unsupported(leg_id: str, reason: str, mtm, caps: ProductCapabilities) -> WhatIfLegResult:
-    return WhatIfLegResult(
-        leg_id=leg_id,
-        supported=False,
-        reason=reason,
-        caps=caps,
-        baseline_pv_total=getattr(mtm, 'pv_total', None),
-        whatif_pv_unit=None,
-        whatif_pv_total=None,
-        delta_pv=None,
-        whatif_delta_total=None,
-        whatif_vega_total=None,
-        whatif_theta_day=None,
-    )
-
-
-def _finish_leg(
-    *,
-    leg,
-    mtm,
-    caps: ProductCapabilities,
-    pv_unit: float,
-    delta_unit: float,
-    vega_unit: float,
-    theta_unit: float,
-    mc_pv_unit: float | None = None,
-    mc_stderr_unit: float | None = None,
-) -> WhatIfLegResult:
-    qty = float(leg.quantity)
-    mult = float(leg.product.contract_size)
-    direction = leg.direction
-    pv_total = scale_unit(direction, qty, mult, pv_unit)
-    baseline = float(mtm.pv_total) if mtm is not None else None
-    delta_pv = (pv_total - baseline) if baseline is not None else None
-
-    mc_pv_total = None
-    mc_stderr_total = None
-    mc_minus_analytic = None
-    mc_rel = None
-    if mc_pv_unit is not None:
-        mc_pv_total = scale_unit(direction, qty, mult, mc_pv_unit)
-        if mc_stderr_unit is not None:
-            mc_stderr_total = abs(scale_unit(direction, qty, mult, mc_stderr_unit))
-        mc_minus_analytic = mc_pv_total - pv_total
-        mc_rel = _rel_error(mc_minus_analytic, pv_total)
-
-    return WhatIfLegResult(
-        leg_id=leg.leg_id,
-        supported=True,
-        reason='',
-        caps=caps,
-        baseline_pv_total=baseline,
-        whatif_pv_unit=pv_unit,
-        whatif_pv_total=pv_total,
-        delta_pv=delta_pv,
-        whatif_delta_total=scale_unit(direction, qty, mult, delta_unit),
-        whatif_vega_total=(
-            scale_unit(direction, qty, mult, vega_unit) if caps.uses_option_greeks else None
-        ),
-        whatif_theta_day=scale_unit(direction, qty, mult, theta_unit) / 365.0,
-        mc_pv_unit=mc_pv_unit,
-        mc_pv_total=mc_pv_total,
-        mc_stderr_total=mc_stderr_total,
-        mc_minus_analytic=mc_minus_analytic,
-        mc_rel_error=mc_rel,
-    )
-
-
-def price_leg(leg, equity, mtm, inputs: WhatIfInputs) -> WhatIfLegResult:
-    caps = capabilities_for_equity(equity)
-    leg_id = leg.leg_id
-
-    if caps.kind == 'unsupported':
-        itype = getattr(equity, 'instrument_type', None) or 'unknown'
-        return _unsupported(leg_id, f'No what-if engine for {itype}', mtm, caps)
-
-    if equity is None or equity.strike is None:
-        return _unsupported(leg_id, 'Missing strike', mtm, caps)
-
-    strike = float(equity.strike)
-
-    if caps.kind == 'linear':
-        try:
-            fwd = equity_forward(
-                inputs.spot, strike, inputs.tau, inputs.rate, inputs.div
-            )
-        except (ValueError, OverflowError) as exc:
-            return _unsupported(leg_id, str(exc), mtm, caps)
-        return _finish_leg(
-            leg=leg,
-            mtm=mtm,
-            caps=caps,
-            pv_unit=fwd.pv_unit,
-            delta_unit=fwd.delta,
-            vega_unit=0.0,
-            theta_unit=fwd.theta,
-        )
-
-    # non-linear vanilla
-    side = (equity.option_type or '').strip().lower()
-    is_call = side in ('call', 'c')
-    if side not in ('call', 'c', 'put', 'p'):
-        return _unsupported(leg_id, f'Unknown option_type={equity.option_type!r}', mtm, caps)
-
-    try:
-        unit = black_scholes(
-            inputs.spot,
-            strike,
-            inputs.tau,
-            inputs.vol,
-            inputs.rate,
-            inputs.div,
-            is_call=is_call,
-        )
-    except (ValueError, OverflowError) as exc:
-        return _unsupported(leg_id, str(exc), mtm, caps)
-
-    mc_pv_unit = None
-    mc_stderr_unit = None
-    if inputs.run_mc and caps.uses_mc:
-        try:
-            mc = monte_carlo_vanilla(
-                inputs.spot,
-                strike,
-                inputs.tau,
-                inputs.vol,
-                inputs.rate,
-                inputs.div,
-                is_call=is_call,
-                n_paths=inputs.mc_paths,
-                seed=inputs.mc_seed,
-            )
-            mc_pv_unit = mc.pv_unit
-            mc_stderr_unit = mc.stderr
-        except (ValueError, OverflowError):
-            pass
-
-    return _finish_leg(
-        leg=leg,
-        mtm=mtm,
-        caps=caps,
-        pv_unit=unit.pv_unit,
-        delta_unit=unit.delta,
-        vega_unit=unit.vega,
-        theta_unit=unit.theta,
-        mc_pv_unit=mc_pv_unit,
-        mc_stderr_unit=mc_stderr_unit,
-    )
 
 
 def run_trade_whatif(
@@ -345,10 +137,14 @@ def run_trade_whatif(
     inputs: WhatIfInputs,
     *,
     caps: ProductCapabilities,
+    deadline: float | None = None,
 ) -> dict[str, Any]:
-    legs_out = [
-        price_leg(row['leg'], row['equity'], row['mtm'], inputs) for row in market_rows
-    ]
+    """Reprice every leg at ``inputs``; MC legs may fan out to the warm process pool.
+
+    ``deadline`` is an absolute ``time.monotonic()``; MC legs still running past it are
+    repriced analytically and counted in ``mc_deadline_skipped``.
+    """
+    legs_out = price_legs(market_rows, inputs, deadline=deadline)
 
     supported = [r for r in legs_out if r.supported and r.whatif_pv_total is not None]
     baseline_sum = sum(
@@ -358,8 +154,11 @@ def run_trade_whatif(
     mc_legs = [r for r in supported if r.mc_pv_total is not None]
     mc_sum = sum(r.mc_pv_total for r in mc_legs) if mc_legs else None  # type: ignore[misc]
     mc_stderr = None
+    mc_raw_stderr = None
     if mc_legs:
         mc_stderr = sum((r.mc_stderr_total or 0.0) ** 2 for r in mc_legs) ** 0.5
+        if any(r.mc_raw_stderr_total is not None for r in mc_legs):
+            mc_raw_stderr = sum((r.mc_raw_stderr_total or 0.0) ** 2 for r in mc_legs) ** 0.5
 
     return {
         'legs': legs_out,
@@ -370,15 +169,167 @@ def run_trade_whatif(
         'delta_pv': (whatif_sum - baseline_sum) if supported else None,
         'mc_pv_total': mc_sum if caps.uses_mc else None,
         'mc_stderr_total': mc_stderr if caps.uses_mc else None,
+        'mc_raw_stderr_total': mc_raw_stderr if caps.uses_mc else None,
         'mc_minus_analytic': (
             (mc_sum - whatif_sum) if (caps.uses_mc and mc_sum is not None) else None
         ),
         'mc_rel_error': (
-            _rel_error(mc_sum - whatif_sum, whatif_sum)
+            rel_error(mc_sum - whatif_sum, whatif_sum)
             if (caps.uses_mc and mc_sum is not None)
             else None
         ),
-        'mc_paths': inputs.mc_paths if (caps.uses_mc and inputs.run_mc) else 0,
+        'mc_paths': max((r.mc_paths for r in mc_legs), default=0) if caps.uses_mc else 0,
         'mc_seed': inputs.mc_seed if (caps.uses_mc and inputs.run_mc) else None,
+        'mc_sampler': inputs.mc_sampler if (caps.uses_mc and inputs.run_mc) else None,
+        'mc_control_variate': bool(caps.uses_mc and inputs.run_mc and inputs.mc_control_variate),
+        'mc_deadline_skipped': sum(1 for r in legs_out if r.reason == MC_DEADLINE_REASON),
         'replay_error': None,
     }
+
+
+def parse_shock_ladder(raw: str | None, default: tuple[float, float, int]) -> np.ndarray:
+    """``'lo:hi:n'`` (inclusive linspace) or ``'a,b,c'``; empty → ``default``."""
+    text = (raw or '').strip()
+    if not text:
+        lo, hi, n = default
+        return np.linspace(lo, hi, n)
+    try:
+        if ':' in text:
+            lo_s, hi_s, n_s = text.split(':')
+            n = int(n_s)
+            if not 1 <= n <= MAX_GRID_AXIS:
+                raise ValueError(f'ladder size must be 1..{MAX_GRID_AXIS}')
+            bounds = np.array([float(lo_s), float(hi_s)])
+            if not np.all(np.isfinite(bounds)):
+                raise ValueError('shocks must be finite')
+            return np.linspace(bounds[0], bounds[1], n)
+        values = np.array([float(x) for x in text.split(',') if x.strip()])
+        if not np.all(np.isfinite(values)):
+            raise ValueError('shocks must be finite')
+    except ValueError as exc:
+        raise ValueError(f'bad shock ladder {text!r}: {exc}') from exc
+    if not 1 <= values.size <= MAX_GRID_AXIS:
+        raise ValueError(f'ladder size must be 1..{MAX_GRID_AXIS}')
+    return values
+
+
+def parse_whatif_grid(get) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read ``grid_spot`` (%), ``grid_vol`` (vol pts) and ``grid_rate`` (bp) ladders."""
+    spot = parse_shock_ladder(get.get('grid_spot'), DEFAULT_GRID_SPOT)
+    vol = parse_shock_ladder(get.get('grid_vol'), DEFAULT_GRID_VOL)
+    rate = parse_shock_ladder(get.get('grid_rate'), DEFAULT_GRID_RATE)
+    if spot.size * vol.size * rate.size > MAX_GRID_CELLS:
+        raise ValueError(f'grid larger than {MAX_GRID_CELLS} cells')
+    if np.any(spot <= -100.0):
+        raise ValueError('spot shocks must stay above -100%')
+    return spot, vol, rate
+
+
+def _leg_unit_cube(
+    equity,
+    caps: ProductCapabilities,
+    spots: np.ndarray,
+    vols: np.ndarray,
+    rates: np.ndarray,
+    inputs: WhatIfInputs,
+) -> np.ndarray:
+    """Per-share PV over the ``(spot, vol, rate)`` grid for one leg."""
+    strike = float(equity.strike)
+    s = spots[:, None, None]
+    sig = vols[None, :, None]
+    r = rates[None, None, :]
+    if caps.kind == 'linear':
+        pv = equity_forward_batch(s, strike, inputs.tau, r, inputs.div).pv_unit
+        return np.broadcast_to(pv, (spots.size, vols.size, rates.size))
+    side = (equity.option_type or '').strip().lower()
+    if side not in ('call', 'c', 'put', 'p'):
+        raise ValueError(f'Unknown option_type={equity.option_type!r}')
+    batch = black_scholes_batch(
+        s, strike, inputs.tau, sig, r, inputs.div, side in ('call', 'c')
+    )
+    return batch.pv_unit
+
+
+def run_trade_whatif_grid(
+    market_rows: list[dict[str, Any]],
+    baseline: WhatIfInputs,
+    *,
+    spot_shocks: np.ndarray,
+    vol_shocks: np.ndarray,
+    rate_shocks: np.ndarray,
+) -> dict[str, Any]:
+    """Analytic PV / ΔPV cubes over a spot × vol × rate shock grid, per leg and trade.
+
+    Cubes are indexed ``[spot, vol, rate]``; ΔPV is against the unshocked analytic PV
+    (the same engine at the base point), so the ladder shows pure shock P&L. Vol is
+    floored at zero. Linear legs are flat along the vol axis.
+    """
+    spots = baseline.spot * (1.0 + np.asarray(spot_shocks, dtype=float) / 100.0)
+    vols = np.maximum(baseline.vol + np.asarray(vol_shocks, dtype=float) / 100.0, 0.0)
+    rates = baseline.rate + np.asarray(rate_shocks, dtype=float) / 10_000.0
+    shape = (spots.size, vols.size, rates.size)
+    base_point = (np.array([baseline.spot]), np.array([baseline.vol]), np.array([baseline.rate]))
+
+    legs_out = []
+    trade_pv = np.zeros(shape)
+    trade_base = 0.0
+    supported = 0
+    for row in market_rows:
+        leg, equity = row['leg'], row['equity']
+        caps = capabilities_for_equity(equity)
+        entry: dict[str, Any] = {'leg_id': leg.leg_id, 'supported': False, 'reason': ''}
+        if caps.kind == 'unsupported':
+            itype = getattr(equity, 'instrument_type', None) or 'unknown'
+            entry['reason'] = f'No what-if engine for {itype}'
+        elif equity.strike is None:
+            entry['reason'] = 'Missing strike'
+        else:
+            try:
+                unit = _leg_unit_cube(equity, caps, spots, vols, rates, baseline)
+                base_unit = float(_leg_unit_cube(equity, caps, *base_point, baseline)[0, 0, 0])
+            except (ValueError, OverflowError) as exc:
+                entry['reason'] = str(exc)
+            else:
+                scale = (
+                    position_sign(leg.direction)
+                    * float(leg.quantity)
+                    * float(leg.product.contract_size)
+                )
+                pv = scale * unit
+                base_pv = scale * base_unit
+                trade_pv += pv
+                trade_base += base_pv
+                supported += 1
+                entry.update(
+                    supported=True,
+                    base_pv=base_pv,
+                    pv=pv.tolist(),
+                    dpv=(pv - base_pv).tolist(),
+                )
+        legs_out.append(entry)
+
+    return {
+        'shape': list(shape),
+        'axes': {
+            'spot_shock_pct': np.asarray(spot_shocks, dtype=float).tolist(),
+            'spot': spots.tolist(),
+            'vol_shock_pts': np.asarray(vol_shocks, dtype=float).tolist(),
+            'vol': vols.tolist(),
+            'rate_shock_bp': np.asarray(rate_shocks, dtype=float).tolist(),
+            'rate': rates.tolist(),
+        },
+        'baseline': {
+            'spot': baseline.spot,
+            'vol': baseline.vol,
+            'rate': baseline.rate,
+            'div': baseline.div,
+            'tau': baseline.tau,
+        },
+        'legs': legs_out,
+        'supported_count': supported,
+        'trade': {
+            'base_pv': trade_base if supported else None,
+            'pv': trade_pv.tolist() if supported else None,
+            'dpv': (trade_pv - trade_base).tolist() if supported else None,
+        },
+    }
@@ -0,0 +1,339 @@
+"""Per-leg what-if pricing, shared by the serial path and the what-if process pool.
+
+``price_leg`` reprices one leg at ``WhatIfInputs`` (closed-form forward, or Black–Scholes
+plus optional MC for vanillas). The pool ships legs to its workers as the frozen
+snapshots below, so this module stays free of Django and ORM imports.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from journal.black_scholes import black_scholes, scale_unit
+from journal.equity_forward import equity_forward
+from journal.monte_carlo import monte_carlo_vanilla
+
+ProductKind = Literal['linear', 'nonlinear', 'unsupported']
+
+DEFAULT_MC_PATHS = 20_000
+DEFAULT_MC_SEED = 42
+
+# ``WhatIfLegResult.reason`` of a leg repriced analytically because its MC missed the
+# request deadline.
+MC_DEADLINE_REASON = 'MC skipped: what-if deadline reached'
+
+
+@dataclass(frozen=True)
+class ProductCapabilities:
+    kind: ProductKind
+    label: str
+    uses_vol: bool
+    uses_mc: bool
+    uses_option_greeks: bool  # vega column meaningful
+    analytic_name: str
+
+
+CAPS_VANILLA = ProductCapabilities(
+    kind='nonlinear',
+    label='non-linear · vanilla EU',
+    uses_vol=True,
+    uses_mc=True,
+    uses_option_greeks=True,
+    analytic_name='Black–Scholes',
+)
+
+CAPS_FORWARD = ProductCapabilities(
+    kind='linear',
+    label='linear · equity forward',
+    uses_vol=False,
+    uses_mc=False,
+    uses_option_greeks=False,
+    analytic_name='forward closed-form',
+)
+
+CAPS_UNSUPPORTED = ProductCapabilities(
+    kind='unsupported',
+    label='unsupported in what-if',
+    uses_vol=False,
+    uses_mc=False,
+    uses_option_greeks=False,
+    analytic_name='—',
+)
+
+
+def capabilities_for_equity(equity) -> ProductCapabilities:
+    if equity is None:
+        return CAPS_UNSUPPORTED
+    key = (equity.instrument_type or '').strip().lower()
+    if key == 'plain_vanilla_european_option':
+        return CAPS_VANILLA
+    if key == 'equity_forward':
+        return CAPS_FORWARD
+    return CAPS_UNSUPPORTED
+
+
+@dataclass
+class WhatIfInputs:
+    spot: float
+    vol: float
+    rate: float
+    div: float
+    tau: float
+    mc_paths: int = DEFAULT_MC_PATHS
+    mc_seed: int = DEFAULT_MC_SEED
+    mc_sampler: str = 'pseudo'
+    mc_control_variate: bool = False
+    mc_moment_match: bool = False
+    run_mc: bool = True
+
+
+def rel_error(diff: float | None, base: float | None) -> float | None:
+    if diff is None or base is None:
+        return None
+    denom = abs(float(base))
+    if denom < 1e-12:
+        return None
+    return float(diff) / denom
+
+
+@dataclass
+class WhatIfLegResult:
+    leg_id: str
+    supported: bool
+    reason: str
+    caps: ProductCapabilities
+    baseline_pv_total: float | None
+    whatif_pv_unit: float | None
+    whatif_pv_total: float | None
+    delta_pv: float | None
+    whatif_delta_total: float | None
+    whatif_vega_total: float | None
+    whatif_theta_day: float | None
+    mc_pv_unit: float | None = None
+    mc_pv_total: float | None = None
+    mc_stderr_total: float | None = None
+    # Plain MC stderr when the PV above is control-variate adjusted.
+    mc_raw_stderr_total: float | None = None
+    mc_minus_analytic: float | None = None
+    mc_rel_error: float | None = None
+    # Paths the MC actually simulated (Sobol rounds each scramble to a power of two).
+    mc_paths: int = 0
+
+
+def _unsupported(leg_id: str, reason: str, mtm, caps: ProductCapabilities) -> WhatIfLegResult:
+    return WhatIfLegResult(
+        leg_id=leg_id,
+        supported=False,
+        reason=reason,
+        caps=caps,
+        baseline_pv_total=getattr(mtm, 'pv_total', None),
+        whatif_pv_unit=None,
+        whatif_pv_total=None,
+        delta_pv=None,
+        whatif_delta_total=None,
+        whatif_vega_total=None,
+        whatif_theta_day=None,
+    )
+
+
+def _finish_leg(
+    *,
+    leg,
+    mtm,
+    caps: ProductCapabilities,
+    pv_unit: float,
+    delta_unit: float,
+    vega_unit: float,
+    theta_unit: float,
+    mc_pv_unit: float | None = None,
+    mc_stderr_unit: float | None = None,
+    mc_raw_stderr_unit: float | None = None,
+    mc_paths: int = 0,
+) -> WhatIfLegResult:
+    qty = float(leg.quantity)
+    mult = float(leg.product.contract_size)
+    direction = leg.direction
+    pv_total = scale_unit(direction, qty, mult, pv_unit)
+    baseline = float(mtm.pv_total) if mtm is not None else None
+    delta_pv = (pv_total - baseline) if baseline is not None else None
+
+    mc_pv_total = None
+    mc_stderr_total = None
+    mc_raw_stderr_total = None
+    mc_minus_analytic = None
+    mc_rel = None
+    if mc_pv_unit is not None:
+        mc_pv_total = scale_unit(direction, qty, mult, mc_pv_unit)
+        if mc_stderr_unit is not None:
+            mc_stderr_total = abs(scale_unit(direction, qty, mult, mc_stderr_unit))
+        if mc_raw_stderr_unit is not None:
+            mc_raw_stderr_total = abs(scale_unit(direction, qty, mult, mc_raw_stderr_unit))
+        mc_minus_analytic = mc_pv_total - pv_total
+        mc_rel = rel_error(mc_minus_analytic, pv_total)
+
+    return WhatIfLegResult(
+        leg_id=leg.leg_id,
+        supported=True,
+        reason='',
+        caps=caps,
+        baseline_pv_total=baseline,
+        whatif_pv_unit=pv_unit,
+        whatif_pv_total=pv_total,
+        delta_pv=delta_pv,
+        whatif_delta_total=scale_unit(direction, qty, mult, delta_unit),
+        whatif_vega_total=(
+            scale_unit(direction, qty, mult, vega_unit) if caps.uses_option_greeks else None
+        ),
+        whatif_theta_day=scale_unit(direction, qty, mult, theta_unit) / 365.0,
+        mc_pv_unit=mc_pv_unit,
+        mc_pv_total=mc_pv_total,
+        mc_stderr_total=mc_stderr_total,
+        mc_raw_stderr_total=mc_raw_stderr_total,
+        mc_minus_analytic=mc_minus_analytic,
+        mc_rel_error=mc_rel,
+        mc_paths=mc_paths,
+    )
+
+
+def price_leg(leg, equity, mtm, inputs: WhatIfInputs) -> WhatIfLegResult:
+    caps = capabilities_for_equity(equity)
+    leg_id = leg.leg_id
+
+    if caps.kind == 'unsupported':
+        itype = getattr(equity, 'instrument_type', None) or 'unknown'
+        return _unsupported(leg_id, f'No what-if engine for {itype}', mtm, caps)
+
+    if equity is None or equity.strike is None:
+        return _unsupported(leg_id, 'Missing strike', mtm, caps)
+
+    strike = float(equity.strike)
+
+    if caps.kind == 'linear':
+        try:
+            fwd = equity_forward(
+                inputs.spot, strike, inputs.tau, inputs.rate, inputs.div
+            )
+        except (ValueError, OverflowError) as exc:
+            return _unsupported(leg_id, str(exc), mtm, caps)
+        return _finish_leg(
+            leg=leg,
+            mtm=mtm,
+            caps=caps,
+            pv_unit=fwd.pv_unit,
+            delta_unit=fwd.delta,
+            vega_unit=0.0,
+            theta_unit=fwd.theta,
+        )
+
+    # non-linear vanilla
+    side = (equity.option_type or '').strip().lower()
+    is_call = side in ('call', 'c')
+    if side not in ('call', 'c', 'put', 'p'):
+        return _unsupported(leg_id, f'Unknown option_type={equity.option_type!r}', mtm, caps)
+
+    try:
+        unit = black_scholes(
+            inputs.spot,
+            strike,
+            inputs.tau,
+            inputs.vol,
+            inputs.rate,
+            inputs.div,
+            is_call=is_call,
+        )
+    except (ValueError, OverflowError) as exc:
+        return _unsupported(leg_id, str(exc), mtm, caps)
+
+    mc_pv_unit = None
+    mc_stderr_unit = None
+    mc_raw_stderr_unit = None
+    mc_paths = 0
+    if inputs.run_mc and caps.uses_mc:
+        try:
+            mc = monte_carlo_vanilla(
+                inputs.spot,
+                strike,
+                inputs.tau,
+                inputs.vol,
+                inputs.rate,
+                inputs.div,
+                is_call=is_call,
+                n_paths=inputs.mc_paths,
+                seed=inputs.mc_seed,
+                sampler=inputs.mc_sampler,
+                control_variate=inputs.mc_control_variate,
+                moment_match=inputs.mc_moment_match,
+            )
+            if mc.cv_pv_unit is not None:
+                # Reconcile on the adjusted estimate; keep the plain stderr alongside.
+                mc_pv_unit = mc.cv_pv_unit
+                mc_stderr_unit = mc.cv_stderr
+                mc_raw_stderr_unit = mc.stderr
+            else:
+                mc_pv_unit = mc.pv_unit
+                mc_stderr_unit = mc.stderr
+            mc_paths = mc.n_paths
+        except (ValueError, OverflowError):
+            pass
+
+    return _finish_leg(
+        leg=leg,
+        mtm=mtm,
+        caps=caps,
+        pv_unit=unit.pv_unit,
+        delta_unit=unit.delta,
+        vega_unit=unit.vega,
+        theta_unit=unit.theta,
+        mc_pv_unit=mc_pv_unit,
+        mc_stderr_unit=mc_stderr_unit,
+        mc_raw_stderr_unit=mc_raw_stderr_unit,
+        mc_paths=mc_paths,
+    )
+
+
+@dataclass(frozen=True)
+class ProductSnapshot:
+    contract_size: float
+
+
+@dataclass(frozen=True)
+class LegSnapshot:
+    leg_id: str
+    quantity: float
+    direction: str
+    product: ProductSnapshot
+
+
+@dataclass(frozen=True)
+class EquitySnapshot:
+    instrument_type: str | None
+    option_type: str | None
+    strike: float | None
+
+
+@dataclass(frozen=True)
+class MtmSnapshot:
+    pv_total: float | None
+
+
+def snapshot_row(
+    row: dict[str, Any],
+) -> tuple[LegSnapshot, EquitySnapshot | None, MtmSnapshot | None]:
+    """Picklable copies of exactly the fields ``price_leg`` reads."""
+    leg, equity, mtm = row['leg'], row['equity'], row['mtm']
+    leg_snap = LegSnapshot(
+        leg_id=leg.leg_id,
+        quantity=leg.quantity,
+        direction=leg.direction,
+        product=ProductSnapshot(contract_size=leg.product.contract_size),
+    )
+    equity_snap = None
+    if equity is not None:
+        equity_snap = EquitySnapshot(
+            instrument_type=equity.instrument_type,
+            option_type=equity.option_type,
+            strike=equity.strike,
+        )
+    mtm_snap = MtmSnapshot(pv_total=mtm.pv_total) if mtm is not None else None
+    return leg_snap, equity_snap, mtm_snap
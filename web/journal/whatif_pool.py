@@ -0,0 +1,150 @@
+"""Process-pool fan-out for what-if leg repricing.
+
+MC legs are CPU-bound NumPy loops, so threads would serialise on the GIL; a small
+``ProcessPoolExecutor`` (spawn context — never fork a threaded web server) is created on
+first use and kept warm for the life of the process. Legs are shipped as plain snapshots
+(no ORM objects cross the process boundary) and priced by the same ``price_leg`` the
+serial path uses, with the same seeds, so results are bit-identical either way.
+
+A per-request deadline bounds the wait: legs whose MC has not come back in time are
+repriced analytically in-process and flagged, rather than holding the request hostage.
+``Future.cancel`` only drops legs still queued; a leg already running in a worker cannot
+be interrupted. When one is left running, the pool is retired (no new work, workers exit
+once their current leg ends) and the next request starts a fresh one, so stranded legs
+(each capped at ``MAX_MC_PATHS``) never queue ahead of later requests.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from typing import Any
+
+from django.conf import settings
+
+from journal.whatif_leg import (
+    MC_DEADLINE_REASON,
+    WhatIfInputs,
+    WhatIfLegResult,
+    capabilities_for_equity,
+    price_leg,
+    snapshot_row,
+)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _price_leg_worker(leg, equity, mtm, inputs: WhatIfInputs) -> WhatIfLegResult:
+    return price_leg(leg, equity, mtm, inputs)
+
+
+def pool_workers() -> int:
+    """``WHATIF_POOL_WORKERS`` (0/1 disables the pool); defaults to min(4, CPUs)."""
+    default = min(4, os.cpu_count() or 1)
+    return max(0, int(getattr(settings, 'WHATIF_POOL_WORKERS', default)))
+
+
+def request_deadline() -> float:
+    """Absolute ``time.monotonic()`` deadline for one request's what-if pricing."""
+    return time.monotonic() + float(getattr(settings, 'WHATIF_DEADLINE_SEC', 10.0))
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _pool
+
+
+def _discard_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _retire_pool(pool: ProcessPoolExecutor) -> None:
+    """Stop handing work to ``pool``; its workers exit once their current legs finish."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def _analytic_only(row: dict[str, Any], inputs: WhatIfInputs) -> WhatIfLegResult:
+    result = price_leg(row['leg'], row['equity'], row['mtm'], replace(inputs, run_mc=False))
+    if result.supported:
+        result.reason = MC_DEADLINE_REASON
+    return result
+
+
+def price_legs(
+    market_rows: list[dict[str, Any]],
+    inputs: WhatIfInputs,
+    *,
+    deadline: float | None = None,
+) -> list[WhatIfLegResult]:
+    """Price every row with ``price_leg``, fanning MC legs out when it pays off."""
+    mc_rows = [
+        i for i, row in enumerate(market_rows)
+        if inputs.run_mc and capabilities_for_equity(row['equity']).uses_mc
+    ]
+    workers = pool_workers()
+    if len(mc_rows) < 2 or workers < 2:
+        out = []
+        for row in market_rows:
+            if deadline is not None and inputs.run_mc and time.monotonic() >= deadline:
+                out.append(_analytic_only(row, inputs))
+            else:
+                out.append(price_leg(row['leg'], row['equity'], row['mtm'], inputs))
+        return out
+
+    try:
+        pool = _get_pool(workers)
+        futures = {
+            i: pool.submit(_price_leg_worker, *snapshot_row(market_rows[i]), inputs)
+            for i in mc_rows
+        }
+    except (BrokenProcessPool, RuntimeError):
+        _discard_pool()
+        return [
+            price_leg(row['leg'], row['equity'], row['mtm'], inputs) for row in market_rows
+        ]
+
+    # Analytic-only legs are cheap; price them here while the pool runs MC.
+    out: list[WhatIfLegResult | None] = [None] * len(market_rows)
+    for i, row in enumerate(market_rows):
+        if i not in futures:
+            out[i] = price_leg(row['leg'], row['equity'], row['mtm'], inputs)
+
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    wait(futures.values(), timeout=timeout)
+    stranded = False
+    for i, future in futures.items():
+        row = market_rows[i]
+        if not future.done():
+            stranded |= not future.cancel() and not future.done()
+            out[i] = _analytic_only(row, inputs)
+            continue
+        try:
+            out[i] = future.result()
+        except BrokenProcessPool:
+            _discard_pool()
+            out[i] = price_leg(row['leg'], row['equity'], row['mtm'], inputs)
+        except CancelledError:
+            # Another request discarded the pool under this leg.
+            out[i] = price_leg(row['leg'], row['equity'], row['mtm'], inputs)
+    if stranded:
+        _retire_pool(pool)
+    return out
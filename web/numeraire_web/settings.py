@@ -43,6 +43,18 @@ ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1').sp
 APP_VERSION = os.environ.get('NUMERAIRE_APP_VERSION', '0.5.7')
 APP_VERSION_LABEL = os.environ.get('NUMERAIRE_APP_VERSION_LABEL', 'beta')
 
+# Trade what-if: MC legs fan out to a warm process pool (0 or 1 = price serially), and
+# one request waits at most this long for MC before falling back to analytic only.
+WHATIF_POOL_WORKERS = int(os.environ.get('NUMERAIRE_WHATIF_WORKERS', min(4, os.cpu_count() or 1)))
+WHATIF_DEADLINE_SEC = float(os.environ.get('NUMERAIRE_WHATIF_DEADLINE_SEC', '10'))
+
+# Request metrics (journal.request_metrics): share of requests timed with their SQL count /
+# time (0 = off), how many recent samples each worker keeps for the staff page at
+# /ops/requests/, and how many of the slowest statements each sample keeps.
+REQUEST_METRICS_SAMPLE_RATE = float(os.environ.get('NUMERAIRE_REQUEST_METRICS_SAMPLE', '1.0'))
+REQUEST_METRICS_BUFFER = int(os.environ.get('NUMERAIRE_REQUEST_METRICS_BUFFER', '500'))
+REQUEST_METRICS_SLOW_QUERIES = int(os.environ.get('NUMERAIRE_REQUEST_METRICS_SLOW_QUERIES', '5'))
+
 
 # Application definition
 
@@ -57,6 +69,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its wall time covers every other middleware (sampled; see settings above).
+    'journal.request_metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -137,7 +151,9 @@ DATABASES = {
     'numeraire': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': _numeraire_db_path(),
-        # EOD batches hold a write lock while running (journal_mode is `delete`).
+        # The Python ingest writers switch this file to journal_mode=WAL
+        # (scripts/ingest_sqlite.py), so reads no longer wait on a running batch; the
+        # timeout still covers C++ batch writers on a DB that has not been switched yet.
         'OPTIONS': {'timeout': 15},
     },
 }
@@ -145,6 +161,46 @@ DATABASES = {
 DATABASE_ROUTERS = ['numeraire_web.db_router.NumeraireRouter']
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+#   quant_lab - memoised Quant Lab quotes / charts / tree dumps. Local memory is LRU +
+#               TTL per process; point NUMERAIRE_QUANT_LAB_CACHE_BACKEND / _LOCATION at
+#               a shared backend (e.g. django.core.cache.backends.redis.RedisCache with
+#               an allkeys-lru server) to share results across gunicorn workers.
+#   refdata   - reference lookups (catalogue, books, curve / surface / ticker lists),
+#               keyed on data_generation stamps (journal.refdata). Local memory is per
+#               worker; NUMERAIRE_REFDATA_CACHE_BACKEND=
+#               django.core.cache.backends.filebased.FileBasedCache with a directory in
+#               NUMERAIRE_REFDATA_CACHE_LOCATION shares one copy across workers. The TTL only
+#               bounds staleness after a write that did not bump its stamp.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'numeraire-default',
+    },
+    'quant_lab': {
+        'BACKEND': os.environ.get(
+            'NUMERAIRE_QUANT_LAB_CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache',
+        ),
+        'LOCATION': os.environ.get('NUMERAIRE_QUANT_LAB_CACHE_LOCATION', 'numeraire-quant-lab'),
+        'TIMEOUT': int(os.environ.get('NUMERAIRE_QUANT_LAB_CACHE_TTL', '900')),
+        'OPTIONS': {'MAX_ENTRIES': 2000},
+    },
+    'refdata': {
+        'BACKEND': os.environ.get(
+            'NUMERAIRE_REFDATA_CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache',
+        ),
+        'LOCATION': os.environ.get('NUMERAIRE_REFDATA_CACHE_LOCATION', 'numeraire-refdata'),
+        'TIMEOUT': int(os.environ.get('NUMERAIRE_REFDATA_CACHE_TTL', '300')),
+        'OPTIONS': {'MAX_ENTRIES': 500},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -78,7 +78,7 @@
       active_from: lastMarketT(),
       option_side: 'call',
       strike: 100,
-      n_steps: 200,
+      n_steps: 25,
     };
   }
 
@@ -197,7 +197,7 @@
         leg.strike = parseFloat(card.querySelector('[data-f=strike]').value);
       }
       if (needsSteps(code)) {
-        leg.n_steps = parseInt(card.querySelector('[data-f=n_steps]').value, 10) || 200;
+        leg.n_steps = parseInt(card.querySelector('[data-f=n_steps]').value, 10) || 25;
       }
       return leg;
     });
@@ -286,7 +286,7 @@
         '"></label>' +
         '<label data-show="PVA"><span>N steps</span>' +
         '<input class="form-control form-control-sm" type="number" step="1" data-f="n_steps" value="' +
-        (leg.n_steps != null ? leg.n_steps : 200) +
+        (leg.n_steps != null ? leg.n_steps : 25) +
         '"></label>' +
         '</div>';
       els.legs.appendChild(card);